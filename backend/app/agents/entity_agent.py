@@ -3,41 +3,203 @@ Entity Recognition Agent - Slot Filling 전용 처리기
 """
 
 import json
-import re
+import logging
 from typing import Dict, Any, List, Optional, Tuple
 from langchain_core.messages import HumanMessage
 from ..graph.chains import json_llm, generative_llm
 from ..config.prompt_loader import load_yaml_file
-from pathlib import Path
+from ..graph.keyword_matcher import build_matcher
+from ..graph.korean_extraction import korean_extractor, convert_korean_number
+from ..graph import fast_path
+from ..graph.fast_path import fast_path_stats
+
+logger = logging.getLogger(__name__)
+
+# Boolean 필드를 위한 간단한 패턴 (extract_with_patterns)
+BOOLEAN_POSITIVE_MATCHER = build_matcher(["네", "예", "응", "맞아", "맞습니다", "확인", "동의", "ok", "okay", "ㅇㅇ", "ㅇㅋ", 
+                                          "어", "그래", "좋아", "알겠", "등록", "추가", "신청", "할게", "해줘", "해주세요"])
+BOOLEAN_NEGATIVE_MATCHER = build_matcher(["아니", "아뇨", "아니요", "아니에요", "안", "싫", "no", "ㄴㄴ", "필요없", "안할"])
+BOOLEAN_PATTERN_FIELDS = frozenset(["confirm_personal_info", "use_lifelong_account", "use_internet_banking", 
+                                    "additional_withdrawal_account", "use_check_card", "postpaid_transport",
+                                    "same_password_as_account", "card_usage_alert", "withdrawal_account_registration",
+                                    "important_transaction_alert", "withdrawal_alert", "overseas_ip_restriction",
+                                    "card_password_same_as_account", "limit_account_agreement"])
+
+# 유사도 매칭 프롬프트 공용 분석 규칙 / 점수 기준
+SIMILARITY_SCORING_GUIDE = """
+**분석 규칙:**
+1. 사용자 입력의 의도와 의미를 정확히 파악하세요
+2. 각 선택지와의 의미적 유사성을 분석하세요
+3. 문맥을 고려하여 가장 적절한 매칭을 찾으세요
+4. 동의어, 유사 표현, 축약어 등을 고려하세요
+
+**유사도 점수 기준:**
+- 1.0: 완전히 동일하거나 명확히 같은 의미
+- 0.8-0.9: 매우 유사하며 같은 의도로 볼 수 있음
+- 0.6-0.7: 유사하나 약간의 차이가 있음
+- 0.4-0.5: 관련은 있으나 차이가 큼
+- 0.0-0.3: 거의 관련 없음
+"""
+
+
+# 아래 프롬프트들은 고정 지시문/출력 형식/예시를 앞에 두고 턴별 값(단계, 필드, 사용자 발화)을 맨 뒤에 붙임
+# → 같은 prefix가 반복되어 OpenAI 자동 프롬프트 캐시(1024 토큰 이상 prefix)가 적중
+
+# 의도 분석 (_llm_intent_analysis) 고정 지시문
+INTENT_ANALYSIS_INSTRUCTIONS = """당신은 한국 은행의 친절한 상담원입니다. 고객의 말을 자연스럽게 이해하고 의도를 파악해주세요.
+상담 단계, 질문, 수집할 필드와 고객 발화는 마지막 [현재 상황]에 있습니다.
+
+고객이 오타를 내거나 이상하게 표현해도 문맥상 의도를 파악해주세요.
+
+분석할 내용:
+1. 고객의 전반적인 의도
+   - 긍정: 동의, 승낙, 확인 ("네", "예", "좋아요", "똑같이 해줘", "그대로 해줘" 등)
+   - 부정: 거부, 반대 ("아니요", "싫어요" 등)
+   - 정보제공: 구체적인 정보 제공 (이름, 금액, 날짜 등)
+   - 질문: 설명 요청, 의문 표현 ("뭐예요?", "왜요?" 등)
+   - 혼란: 현재 단계와 관련 없는 말, 이해 못함 표현
+   - 수정요청: 정보 변경 요청
+   - 기타: 분류하기 어려운 경우
+
+2. 고객이 제공하려는 정보 추출 (복수 정보 포함, [현재 상황]의 필드 힌트 참고)
+   - 예시: "16일마다 이메일로" → statement_delivery_date: "16", statement_delivery_method: "email"
+   - 예시: "5만원 이상 알려줘" → card_usage_alert: "above_50000"
+   - 특별 규칙: "~만" 표현이 있고 boolean 필드들이 있으면, 언급된 것만 true, 나머지는 false
+     예: "해외아이피만 해줘" → overseas_ip_restriction: true, important_transaction_alert: false, withdrawal_alert: false
+     예: "중요거래만" → important_transaction_alert: true, withdrawal_alert: false, overseas_ip_restriction: false
+   
+3. 특수 표현 처리
+   - "똑같이 해줘", "그대로 해줘" → 현재 제시된 기본값/동일하게 설정을 수락
+   - "네", "응", "어" → 현재 질문에 긍정적 답변
+
+4. 오타나 이상한 표현의 의도 추측
+5. 시나리오에서 벗어난 발화인지 판단
+
+JSON 형식으로 출력:
+{
+  "intent": "긍정/부정/정보제공/질문/혼란/수정요청/기타",
+  "confidence": 0.0-1.0,
+  "extracted_info": {
+    // 추출된 모든 정보를 필드명: 값 형태로 기록
+    // 날짜는 숫자만 추출 (예: "16일" → "16")
+    // 선택값은 정확한 키값으로 변환
+  },
+  "clarification_needed": false,
+  "scenario_deviation": false,
+  "deviation_topic": "",
+  "interpreted_meaning": "오타 수정 후 의도",
+  "suggested_response": "자연스러운 응답 제안"
+}
+"""
+
+# 통합 추출 (extract_entities) 고정 지시문
+UNIFIED_EXTRACTION_INSTRUCTIONS = """사용자 발화에서 명시적으로 언급된 정보만 추출하세요. 절대 추론하거나 기본값을 넣지 마세요.
+추출 가능한 필드들과 사용자 발화는 마지막에 있습니다.
+
+추출 규칙:
+1. 사용자가 직접 말한 내용만 추출 (추론 금지)
+2. 언급하지 않은 필드는 절대 추출하지 말 것
+3. boolean 타입: 명시적 언급만
+   - 긍정: 네/예/응/어/그래/좋아/알겠/등록/추가/신청/할게/해줘/해주세요/맞아/확인 → true
+   - 부정: 아니/아니요/안/싫/필요없/안할/안해 → false
+   - withdrawal_account_registration의 경우 "등록해줘", "추가해줘" 등도 true로 처리
+   - 특별 규칙: "~만" 표현이 있으면 언급된 항목만 true, 나머지 boolean 필드는 false
+     예: "해외아이피만 해줘" → overseas_ip_restriction: true, important_transaction_alert: false, withdrawal_alert: false
+     예: "중요거래만 알려줘" → important_transaction_alert: true, withdrawal_alert: false, overseas_ip_restriction: false
+4. number 타입: 한국어 숫자 정확히 변환
+   - "오백만원" → 500 (만원 단위)
+   - "일일" 또는 "1일" → 1일 이체한도
+   - "일회" 또는 "1회" → 1회 이체한도
+5. choice 타입: 제공된 선택지 중에서만 선택
+
+중요: 
+- 1회/1일 이체한도는 반드시 구분할 것
+- 사용자가 말하지 않은 정보는 빈 값으로 둘 것
+- "일일 오백만원"이라고 하면 transfer_limit_per_day: 500만 추출
+
+응답 형식 (JSON):
+{
+  "extracted_fields": {
+    "field_key": "value"  // 실제로 언급된 것만
+  },
+  "confidence": 0.0-1.0
+}
+"""
+
+# 의도 분석 + 유연한 추출 (extract_entities_flexibly) 고정 지시문
+FLEXIBLE_EXTRACTION_INSTRUCTIONS = """사용자의 발화를 이해하고 의도를 파악한 뒤 필요한 정보를 추출해주세요. 오타나 이상한 표현도 문맥상 이해해주세요.
+현재 단계, 추출해야 할 필드와 사용자 발화는 마지막 [현재 상황]에 있습니다.
+
+의도 분류:
+- 긍정: 동의, 승낙, 확인 ("네", "좋아요", "똑같이 해줘", "그대로 해줘" 등)
+- 부정: 거부, 반대 ("아니요", "싫어요" 등)
+- 정보제공: 구체적인 정보 제공 (이름, 금액, 날짜 등)
+- 질문: 설명 요청, 의문 표현 ("뭐예요?", "왜요?" 등)
+- 혼란: 현재 단계와 관련 없는 말, 이해 못함 표현
+- 수정요청: 정보 변경 요청
+- 기타: 분류하기 어려운 경우
+
+추출 원칙:
+1. 사용자가 명시적으로 언급한 정보를 추출
+2. 오타나 축약어도 문맥상 이해 (예: "넴" → "네", "ㅇㅇ" → "응/네", "뺴고" → "빼고")
+3. 유사한 표현도 인정 (예: "맞아요" → "네", "틀려요" → "아니요")
+4. 대명사나 지시어는 이전 AI 질문의 맥락을 참고 (예: "그걸로 해줘" → AI가 제시한 선택지)
+5. choice 필드는 의미상 가장 가까운 선택지로 매칭
+6. "~만" 표현이 있고 boolean 필드들이 있으면, 언급된 것만 true/해당값, 나머지는 false
+   예: "해외아이피만" → overseas_ip_restriction: true, 다른 boolean 필드들: false
+7. 날짜는 숫자만 추출 (예: "16일" → "16")
+8. 애매한 경우 confidence를 낮게 설정
+
+출력 형식:
+{
+  "intent": "긍정/부정/정보제공/질문/혼란/수정요청/기타",
+  "intent_confidence": 0.0-1.0,
+  "interpreted_meaning": "오타 수정 후 의도",
+  "clarification_needed": false,
+  "scenario_deviation": false,
+  "deviation_topic": "",
+  "suggested_response": "자연스러운 응답 제안",
+  "extracted_entities": {
+    "field_key": "추출된 값",
+    ...
+  },
+  "confidence": 0.0-1.0,
+  "typo_corrections": {"원래표현": "수정된표현"},
+  "ambiguous_fields": ["애매한 필드들"],
+  "reasoning": "추출 과정 설명"
+}
+"""
 
 
 class EntityRecognitionAgent:
-    """Slot Filling을 위한 엔티티 인식 및 추출 전용 에이전트"""
+    """
+    Slot Filling을 위한 엔티티 인식 및 추출 전용 에이전트
+    - 여러 세션이 공유하는 전역 인스턴스이므로 요청별 상태를 보관하지 않음
+      (의도 분석 등 결과는 반환값으로만 전달, __slots__로 속성 추가 방지)
+    """
+    __slots__ = (
+        "extraction_prompt", "validation_prompt", "similarity_prompt", "batch_similarity_prompt",
+        "similarity_threshold", "retry_threshold",
+    )
     
     def __init__(self):
         self.extraction_prompt = self._get_extraction_prompt()
         self.validation_prompt = self._get_validation_prompt()
         self.similarity_prompt = self._get_similarity_matching_prompt()
-        # entity_extraction_prompts.yaml 파일 로드
-        config_dir = Path(__file__).parent.parent / "config"
-        self.entity_prompts = load_yaml_file(str(config_dir / "entity_extraction_prompts.yaml"))
-        
+        self.batch_similarity_prompt = self._get_batch_similarity_matching_prompt()
         # 유사도 임계값 설정
         self.similarity_threshold = 0.7  # 70% 이상의 유사도만 매칭으로 인정
         self.retry_threshold = 0.3      # 30% 미만은 재질문 필요
-        
-        # 마지막 의도 분석 결과 저장
-        self.last_intent_analysis = None
+    
+    @property
+    def entity_prompts(self) -> Dict[str, Any]:
+        """entity_extraction_prompts.yaml (config_registry 캐시)"""
+        return load_yaml_file("entity_extraction_prompts.yaml")
     
     def _get_extraction_prompt(self) -> str:
         """엔티티 추출 프롬프트"""
         return """당신은 은행 상담에서 고객의 발화로부터 정확한 정보를 추출하는 전문가입니다.
 
-**현재 상황:**
-- 수집해야 할 정보: {required_fields}
-- 고객 발화: "{user_input}"
-- 추가 추출 가이드: {extraction_prompts}
-
 **추출 규칙:**
 1. 고객이 명시적으로 언급한 정보만 추출하세요.
 2. 추측하거나 암시적인 정보는 추출하지 마세요.
@@ -72,15 +234,17 @@ class EntityRecognitionAgent:
   "confidence": 0.95,
   "unclear_fields": [],
   "reasoning": "고객이 명확히 성함과 연락처를 제공했습니다"
-}}"""
+}}
+
+**현재 상황:**
+- 수집해야 할 정보: {required_fields}
+- 추가 추출 가이드: {extraction_prompts}
+- 고객 발화: "{user_input}\""""
 
     def _get_validation_prompt(self) -> str:
         """추출된 정보 검증 프롬프트"""
         return """추출된 정보의 유효성을 검증하세요.
 
-**추출된 정보:** {extracted_entities}
-**필드 정의:** {field_definitions}
-
 **검증 규칙:**
 1. choice 타입: 제공된 선택지에 포함되는지 확인
 2. number 타입: 숫자 형식이 올바른지 확인  
@@ -98,30 +262,18 @@ class EntityRecognitionAgent:
     ...
   }},
   "need_clarification": ["field_key1", "field_key2"]
-}}"""
+}}
+
+**필드 정의:** {field_definitions}
+**추출된 정보:** {extracted_entities}"""
     
     def _get_similarity_matching_prompt(self) -> str:
         """의미 기반 유사도 매칭 프롬프트"""
         return """당신은 사용자의 입력과 선택지 간의 의미적 유사성을 판단하는 전문가입니다.
 
 **작업:**
-사용자 입력: "{user_input}"
-필드 정보: {field_info}
-선택 가능한 값들: {choices}
-
-**분석 규칙:**
-1. 사용자 입력의 의도와 의미를 정확히 파악하세요
-2. 각 선택지와의 의미적 유사성을 분석하세요
-3. 문맥을 고려하여 가장 적절한 매칭을 찾으세요
-4. 동의어, 유사 표현, 축약어 등을 고려하세요
-
-**유사도 점수 기준:**
-- 1.0: 완전히 동일하거나 명확히 같은 의미
-- 0.8-0.9: 매우 유사하며 같은 의도로 볼 수 있음
-- 0.6-0.7: 유사하나 약간의 차이가 있음
-- 0.4-0.5: 관련은 있으나 차이가 큼
-- 0.0-0.3: 거의 관련 없음
-
+마지막에 주어진 선택 가능한 값들 중 사용자 입력과 가장 유사한 선택지를 찾으세요.
+""" + SIMILARITY_SCORING_GUIDE + """
 **출력 형식:**
 {{
   "best_match": "가장 유사한 선택지",
@@ -130,7 +282,35 @@ class EntityRecognitionAgent:
   "alternative_matches": [
     {{"value": "대안 선택지", "score": 0.0-1.0}}
   ]
-}}"""
+}}
+
+필드 정보: {field_info}
+선택 가능한 값들: {choices}
+사용자 입력: "{user_input}\""""
+
+    def _get_batch_similarity_matching_prompt(self) -> str:
+        """여러 choice 필드를 한 번에 매칭하는 유사도 프롬프트"""
+        return """당신은 사용자의 입력과 선택지 간의 의미적 유사성을 판단하는 전문가입니다.
+
+**작업:**
+마지막의 필드 목록에서 각 필드마다 선택 가능한 값들 중 사용자 입력과 가장 유사한 선택지를 찾으세요.
+""" + SIMILARITY_SCORING_GUIDE + """
+**출력 형식:** (필드 목록의 모든 key에 대해 작성)
+{{
+  "matches": {{
+    "field_key": {{
+      "best_match": "가장 유사한 선택지",
+      "similarity_score": 0.0-1.0,
+      "reasoning": "매칭 이유 설명",
+      "alternative_matches": [
+        {{"value": "대안 선택지", "score": 0.0-1.0}}
+      ]
+    }}
+  }}
+}}
+
+필드 목록: {fields}
+사용자 입력: "{user_input}\""""
 
     async def analyze_user_intent(
         self,
@@ -141,16 +321,51 @@ class EntityRecognitionAgent:
     ) -> Dict[str, Any]:
         """사용자 의도를 자연스럽게 분석 - 오타나 이상한 표현도 처리"""
         
-        print(f"\n🔍 [LLM_INTENT_ANALYSIS] 사용자 의도 분석 시작")
-        print(f"   📝 사용자 입력: \"{user_input}\"")
-        print(f"   📍 현재 단계: {current_stage}")
-        print(f"   💬 현재 질문: {stage_info.get('prompt', '')[:100]}...")
+        logger.debug("\n🔍 [LLM_INTENT_ANALYSIS] 사용자 의도 분석 시작")
+        logger.debug("   📝 사용자 입력: \"%s\"", user_input)
+        logger.debug("   📍 현재 단계: %s", current_stage)
+        logger.debug("   💬 현재 질문: %s...", stage_info.get('prompt', '')[:100])
+        
+        # 단답/정확한 선택지/숫자·날짜·연락처는 규칙으로 결정 (LLM 호출 생략)
+        fast_result = fast_path.resolve(user_input, stage_info)
+        fast_path_stats.record("analyze_user_intent", fast_result)
+        if fast_result is not None:
+            logger.debug("   ⚡ [FAST_PATH] %s: %s %s - LLM 호출 생략\n", fast_result.rule, fast_result.intent, fast_result.fields)
+            fast_path_stats.maybe_shadow(
+                "analyze_user_intent", user_input, fast_result,
+                lambda: self._shadow_intent_analysis(user_input, current_stage, stage_info)
+            )
+            return fast_result.as_intent_analysis(user_input)
         
-        # 현재 단계에서 수집할 필드 정보 구성
-        fields_to_collect = stage_info.get('fields_to_collect', [])
-        field_hints = []
+        try:
+            result = await self._llm_intent_analysis(user_input, current_stage, stage_info)
+            
+            logger.debug("   🎯 분석된 의도: %s", result.get('intent'))
+            logger.debug("   📊 신뢰도: %.2f", result.get('confidence', 0))
+            logger.debug("   💭 해석된 의미: %s", result.get('interpreted_meaning'))
+            if result.get('extracted_info'):
+                logger.debug("   📋 추출된 정보: %s", result.get('extracted_info'))
+            if result.get('clarification_needed'):
+                logger.warning("   ⚠️ 명확한 확인 필요")
+            logger.debug("   🗨️ 제안 응답: %s...", result.get('suggested_response', '')[:100])
+            logger.debug("🔍 [LLM_INTENT_ANALYSIS] 분석 완료\n")
+        except Exception as e:
+            logger.error("   ❌ [LLM_INTENT_ANALYSIS] 분석 실패: %s\n", e)
+            result = {
+                "intent": "기타",
+                "confidence": 0.5,
+                "extracted_info": {},
+                "clarification_needed": True,
+                "interpreted_meaning": user_input,
+                "suggested_response": "죄송합니다. 다시 한 번 말씀해주시겠어요?"
+            }
         
-        # 단계별 특수 힌트 추가
+        return result
+
+    @staticmethod
+    def _stage_field_hints(current_stage: Optional[str]) -> str:
+        """단계별 필드 값 힌트 (의도 분석 / 통합 추출 프롬프트 공용)"""
+        field_hints = []
         if current_stage == "statement_delivery":
             field_hints.append("- statement_delivery_method: 이메일(email), 모바일/휴대폰(mobile), 홈페이지(website)")
             field_hints.append("- statement_delivery_date: 1~31일 중 선택 (예: '16일' → \"16\", '30일' → \"30\")")
@@ -158,94 +373,45 @@ class EntityRecognitionAgent:
             field_hints.append("- card_password_same_as_account: 동일하게/같게 → true, 다르게 → false")
         elif current_stage == "card_usage_alert":
             field_hints.append("- card_usage_alert: 5만원 이상(over_50000_free), 모든 사용(all_transactions_200won), 안함(no_alert)")
-        
-        field_hints_text = '\n'.join(field_hints) if field_hints else "현재 단계에 해당하는 필드를 추출하세요"
-        
-        intent_prompt = f"""당신은 한국 은행의 친절한 상담원입니다. 고객의 말을 자연스럽게 이해하고 의도를 파악해주세요.
+        return '\n'.join(field_hints)
+
+    async def _shadow_intent_analysis(
+        self,
+        user_input: str,
+        current_stage: str,
+        stage_info: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """fast path shadow 비교용 LLM 의도 분석"""
+        result = await self._llm_intent_analysis(user_input, current_stage, stage_info)
+        return {"intent": result.get("intent"), "fields": result.get("extracted_info") or {}}
 
+    async def _llm_intent_analysis(
+        self,
+        user_input: str,
+        current_stage: str,
+        stage_info: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """LLM 의도 분석 호출 (실패 시 예외)"""
+        # 현재 단계에서 수집할 필드 정보 구성
+        fields_to_collect = stage_info.get('fields_to_collect', [])
+        field_hints_text = self._stage_field_hints(current_stage) or "현재 단계에 해당하는 필드를 추출하세요"
+        
+        intent_prompt = INTENT_ANALYSIS_INSTRUCTIONS + f"""
+[현재 상황]
 현재 단계: {stage_info.get('stage_name', current_stage)}
 현재 질문: {stage_info.get('prompt', '')}
 수집할 필드: {fields_to_collect}
-고객 발화: "{user_input}"
-
-고객이 오타를 내거나 이상하게 표현해도 문맥상 의도를 파악해주세요.
-
-분석할 내용:
-1. 고객의 전반적인 의도
-   - 긍정: 동의, 승낙, 확인 ("네", "예", "좋아요", "똑같이 해줘", "그대로 해줘" 등)
-   - 부정: 거부, 반대 ("아니요", "싫어요" 등)
-   - 정보제공: 구체적인 정보 제공 (이름, 금액, 날짜 등)
-   - 질문: 설명 요청, 의문 표현 ("뭐예요?", "왜요?" 등)
-   - 혼란: 현재 단계와 관련 없는 말, 이해 못함 표현
-   - 수정요청: 정보 변경 요청
-   - 기타: 분류하기 어려운 경우
-
-2. 고객이 제공하려는 정보 추출 (복수 정보 포함)
+필드 힌트:
 {field_hints_text}
-   - 예시: "16일마다 이메일로" → statement_delivery_date: "16", statement_delivery_method: "email"
-   - 예시: "5만원 이상 알려줘" → card_usage_alert: "above_50000"
-   - 특별 규칙: "~만" 표현이 있고 boolean 필드들이 있으면, 언급된 것만 true, 나머지는 false
-     예: "해외아이피만 해줘" → overseas_ip_restriction: true, important_transaction_alert: false, withdrawal_alert: false
-     예: "중요거래만" → important_transaction_alert: true, withdrawal_alert: false, overseas_ip_restriction: false
-   
-3. 특수 표현 처리
-   - "똑같이 해줘", "그대로 해줘" → 현재 제시된 기본값/동일하게 설정을 수락
-   - "네", "응", "어" → 현재 질문에 긍정적 답변
-
-4. 오타나 이상한 표현의 의도 추측
-5. 시나리오에서 벗어난 발화인지 판단
-
-JSON 형식으로 출력:
-{{
-  "intent": "긍정/부정/정보제공/질문/혼란/수정요청/기타",
-  "confidence": 0.0-1.0,
-  "extracted_info": {{
-    // 추출된 모든 정보를 필드명: 값 형태로 기록
-    // 날짜는 숫자만 추출 (예: "16일" → "16")
-    // 선택값은 정확한 키값으로 변환
-  }},
-  "clarification_needed": false,
-  "scenario_deviation": false,
-  "deviation_topic": "",
-  "interpreted_meaning": "오타 수정 후 의도",
-  "suggested_response": "자연스러운 응답 제안"
-}}"""
+고객 발화: "{user_input}"
+"""
 
-        try:
-            response = await json_llm.ainvoke(intent_prompt)
-            
-            # AIMessage 객체에서 content 추출
-            if hasattr(response, 'content'):
-                import json
-                result = json.loads(response.content)
-            else:
-                result = response
-            
-            print(f"   🎯 분석된 의도: {result.get('intent')}")
-            print(f"   📊 신뢰도: {result.get('confidence', 0):.2f}")
-            print(f"   💭 해석된 의미: {result.get('interpreted_meaning')}")
-            if result.get('extracted_info'):
-                print(f"   📋 추출된 정보: {result.get('extracted_info')}")
-            if result.get('clarification_needed'):
-                print(f"   ⚠️ 명확한 확인 필요")
-            print(f"   🗨️ 제안 응답: {result.get('suggested_response', '')[:100]}...")
-            print(f"🔍 [LLM_INTENT_ANALYSIS] 분석 완료\n")
-            
-            # 결과 저장
-            self.last_intent_analysis = result
-            return result
-        except Exception as e:
-            print(f"   ❌ [LLM_INTENT_ANALYSIS] 분석 실패: {e}\n")
-            result = {
-                "intent": "기타",
-                "confidence": 0.5,
-                "extracted_info": {},
-                "clarification_needed": True,
-                "interpreted_meaning": user_input,
-                "suggested_response": "죄송합니다. 다시 한 번 말씀해주시겠어요?"
-            }
-            self.last_intent_analysis = result
-            return result
+        response = await json_llm.ainvoke(intent_prompt, site="analyze_user_intent")
+        
+        # AIMessage 객체에서 content 추출
+        if hasattr(response, 'content'):
+            return json.loads(response.content)
+        return response
 
     async def extract_entities(
         self, 
@@ -264,7 +430,7 @@ JSON 형식으로 출력:
                     pattern_results[field_key] = pattern_result
             
             if pattern_results:
-                print(f"[EntityAgent] Quick pattern match for short input: {pattern_results}")
+                logger.debug("[EntityAgent] Quick pattern match for short input: %s", pattern_results)
                 return {
                     "extracted_entities": pattern_results,
                     "confidence": 0.9,
@@ -287,45 +453,16 @@ JSON 형식으로 출력:
             field_descriptions.append(desc)
         
         # 통합 추출 프롬프트
-        unified_prompt = f"""사용자 발화에서 명시적으로 언급된 정보만 추출하세요. 절대 추론하거나 기본값을 넣지 마세요.
-
-사용자 발화: "{user_input}"
-
+        unified_prompt = UNIFIED_EXTRACTION_INSTRUCTIONS + f"""
 추출 가능한 필드들:
 {json.dumps(field_descriptions, ensure_ascii=False, indent=2)}
 
-추출 규칙:
-1. 사용자가 직접 말한 내용만 추출 (추론 금지)
-2. 언급하지 않은 필드는 절대 추출하지 말 것
-3. boolean 타입: 명시적 언급만
-   - 긍정: 네/예/응/어/그래/좋아/알겠/등록/추가/신청/할게/해줘/해주세요/맞아/확인 → true
-   - 부정: 아니/아니요/안/싫/필요없/안할/안해 → false
-   - withdrawal_account_registration의 경우 "등록해줘", "추가해줘" 등도 true로 처리
-   - 특별 규칙: "~만" 표현이 있으면 언급된 항목만 true, 나머지 boolean 필드는 false
-     예: "해외아이피만 해줘" → overseas_ip_restriction: true, important_transaction_alert: false, withdrawal_alert: false
-     예: "중요거래만 알려줘" → important_transaction_alert: true, withdrawal_alert: false, overseas_ip_restriction: false
-4. number 타입: 한국어 숫자 정확히 변환
-   - "오백만원" → 500 (만원 단위)
-   - "일일" 또는 "1일" → 1일 이체한도
-   - "일회" 또는 "1회" → 1회 이체한도
-5. choice 타입: 제공된 선택지 중에서만 선택
-
-중요: 
-- 1회/1일 이체한도는 반드시 구분할 것
-- 사용자가 말하지 않은 정보는 빈 값으로 둘 것
-- "일일 오백만원"이라고 하면 transfer_limit_per_day: 500만 추출
-
-응답 형식 (JSON):
-{{
-  "extracted_fields": {{
-    "field_key": "value"  // 실제로 언급된 것만
-  }},
-  "confidence": 0.0-1.0
-}}"""
+사용자 발화: "{user_input}"
+"""
 
         try:
-            print(f"[EntityAgent] Unified extraction for input: '{user_input}'")
-            response = await json_llm.ainvoke([HumanMessage(content=unified_prompt)])
+            logger.debug("[EntityAgent] Unified extraction for input: '%s'", user_input)
+            response = await json_llm.ainvoke([HumanMessage(content=unified_prompt)], site="extract_entities")
             
             # JSON 파싱
             content = response.content.strip()
@@ -348,23 +485,23 @@ JSON 형식으로 출력:
                         if isinstance(value, (int, float)):
                             # 이미 숫자인 경우 그대로 사용
                             processed_entities[field_key] = int(value)
-                            print(f"[EntityAgent] {field_key}: already number = {value}")
+                            logger.debug("[EntityAgent] %s: already number = %s", field_key, value)
                         elif isinstance(value, str):
                             # 문자열인 경우 변환 시도
                             converted = convert_korean_number(value)
                             if converted is not None:
                                 processed_entities[field_key] = converted
-                                print(f"[EntityAgent] {field_key}: converted '{value}' → {converted}")
+                                logger.debug("[EntityAgent] %s: converted '%s' → %s", field_key, value, converted)
                             else:
                                 try:
                                     processed_entities[field_key] = int(value)
-                                    print(f"[EntityAgent] {field_key}: parsed '{value}' → {int(value)}")
+                                    logger.debug("[EntityAgent] %s: parsed '%s' → %s", field_key, value, int(value))
                                 except:
-                                    print(f"[EntityAgent] {field_key}: failed to convert '{value}'")
+                                    logger.debug("[EntityAgent] %s: failed to convert '%s'", field_key, value)
                     else:
                         processed_entities[field_key] = value
             
-            print(f"[EntityAgent] Unified extraction result: {processed_entities}")
+            logger.debug("[EntityAgent] Unified extraction result: %s", processed_entities)
             
             return {
                 "extracted_entities": processed_entities,
@@ -374,7 +511,7 @@ JSON 형식으로 출력:
             }
             
         except Exception as e:
-            print(f"[EntityAgent] Unified extraction error: {e}")
+            logger.debug("[EntityAgent] Unified extraction error: %s", e)
             # 폴백: 패턴 매칭 시도
             pattern_results = {}
             for field in required_fields:
@@ -400,21 +537,36 @@ JSON 형식으로 출력:
     ) -> Dict[str, Any]:
         """더 유연한 엔티티 추출 - 오타, 유사 표현, 문맥 고려"""
         
-        print(f"\n🔎 [LLM_ENTITY_EXTRACTION] 유연한 엔티티 추출 시작")
-        print(f"   📝 사용자 입력: \"{user_input}\"")
-        print(f"   📍 현재 단계: {current_stage}")
-        print(f"   🎯 추출 대상 필드: {[f['key'] for f in required_fields]}")
+        logger.debug("\n🔎 [LLM_ENTITY_EXTRACTION] 유연한 엔티티 추출 시작")
+        logger.debug("   📝 사용자 입력: \"%s\"", user_input)
+        logger.debug("   📍 현재 단계: %s", current_stage)
+        logger.debug("   🎯 추출 대상 필드: %s", [f['key'] for f in required_fields])
         if last_llm_prompt:
-            print(f"   💬 이전 AI 질문: \"{last_llm_prompt[:100]}...\"" if len(last_llm_prompt) > 100 else f"   💬 이전 AI 질문: \"{last_llm_prompt}\"")
-        
-        # 먼저 의도 분석
-        intent_analysis = None
-        if stage_info:
-            intent_analysis = await self.analyze_user_intent(
-                user_input, current_stage, stage_info, {}
-            )
+            logger.debug("   💬 이전 AI 질문: \"%s%s\"", last_llm_prompt[:100], "..." if len(last_llm_prompt) > 100 else "")
+        
+        # 발화 전체가 필드 값 하나로 해석되면 의도 분석/추출 LLM 호출 모두 생략
+        fast_result = fast_path.resolve(user_input, stage_info, required_fields)
+        if fast_result is not None and not fast_result.fields:
+            fast_result = None  # 의도만 결정된 단답은 추출 결과가 아니므로 LLM 경로 유지
+        fast_path_stats.record("extract_entities_flexibly", fast_result)
+        if fast_result is not None:
+            logger.debug("   ⚡ [FAST_PATH] %s: %s - LLM 호출 생략", fast_result.rule, fast_result.fields)
+            logger.debug("🔎 [LLM_ENTITY_EXTRACTION] 추출 완료\n")
+            if stage_info:
+                fast_path_stats.maybe_shadow(
+                    "extract_entities_flexibly", user_input, fast_result,
+                    lambda: self._shadow_intent_analysis(user_input, current_stage, stage_info)
+                )
+            return {
+                "extracted_entities": dict(fast_result.fields),
+                "confidence": fast_result.confidence,
+                "typo_corrections": {},
+                "ambiguous_fields": [],
+                "reasoning": f"규칙 기반 fast path ({fast_result.rule})",
+                "intent_analysis": fast_result.as_intent_analysis(user_input)
+            }
         
-        # 필드 정보 구조화
+        # 의도 분석 + 엔티티 추출을 한 번의 구조화 호출로 처리
         field_info_str = []
         for field in required_fields:
             info = f"- {field.get('display_name', field['key'])} ({field['key']}): {field['type']} 타입"
@@ -426,56 +578,49 @@ JSON 형식으로 출력:
         
         # Join field info before using in f-string
         field_info_text = '\n'.join(field_info_str)
+        stage_hints = self._stage_field_hints(current_stage)
         
-        # Build prompt parts to avoid nested f-string issues
-        prompt_parts = ["사용자의 발화를 이해하고 필요한 정보를 추출해주세요. 오타나 이상한 표현도 문맥상 이해해주세요.\n"]
-        
+        # 고정 지시문 뒤에 턴별 값만 이어 붙임
+        prompt_parts = [FLEXIBLE_EXTRACTION_INSTRUCTIONS, "\n[현재 상황]\n"]
+        if stage_info:
+            prompt_parts.append(f"현재 단계: {stage_info.get('stage_name', current_stage)}\n")
+            prompt_parts.append(f"현재 질문: {stage_info.get('prompt', '')}\n")
+        prompt_parts.extend(["추출해야 할 필드:\n", field_info_text, "\n"])
+        if stage_hints:
+            prompt_parts.extend(["단계별 값 힌트:\n", stage_hints, "\n"])
         if last_llm_prompt:
             prompt_parts.append(f'이전 AI 질문: "{last_llm_prompt}"\n')
         prompt_parts.append(f'사용자 발화: "{user_input}"\n')
         
-        if intent_analysis:
-            prompt_parts.append(f"의도 분석: {intent_analysis.get('interpreted_meaning', '')}\n")
-        
-        prompt_parts.extend([
-            "\n추출해야 할 필드:\n",
-            field_info_text,
-            "\n\n추출 원칙:\n",
-            "1. 사용자가 명시적으로 언급한 정보를 추출\n",
-            "2. 오타나 축약어도 문맥상 이해 (예: \"넴\" → \"네\", \"ㅇㅇ\" → \"응/네\", \"뺴고\" → \"빼고\")\n",
-            "3. 유사한 표현도 인정 (예: \"맞아요\" → \"네\", \"틀려요\" → \"아니요\")\n",
-            "4. 대명사나 지시어는 이전 AI 질문의 맥락을 참고 (예: \"그걸로 해줘\" → AI가 제시한 선택지)\n",
-            "5. choice 필드는 의미상 가장 가까운 선택지로 매칭\n",
-            "6. \"~만\" 표현이 있고 boolean 필드들이 있으면, 언급된 것만 true/해당값, 나머지는 false\n",
-            "   예: \"해외아이피만\" → overseas_ip_restriction: true, 다른 boolean 필드들: false\n",
-            "7. 애매한 경우 confidence를 낮게 설정\n",
-            "\n출력 형식:\n"
-        ])
-        
         flexible_prompt = ''.join(prompt_parts)
-        # Add JSON format separately to avoid f-string issues
-        flexible_prompt += """{
-  "extracted_entities": {
-    "field_key": "추출된 값",
-    ...
-  },
-  "confidence": 0.0-1.0,
-  "typo_corrections": {"원래표현": "수정된표현"},
-  "ambiguous_fields": ["애매한 필드들"],
-  "reasoning": "추출 과정 설명"
-}"""
         
         try:
-            result = await json_llm.ainvoke(flexible_prompt)
+            response = await json_llm.ainvoke(flexible_prompt, site="extract_entities_flexibly")
+            result = json.loads(response.content) if hasattr(response, 'content') else response
+            result.setdefault("extracted_entities", {})
+            
+            intent_analysis = {
+                "intent": result.get("intent", "기타"),
+                "confidence": result.get("intent_confidence", result.get("confidence", 0.5)),
+                "extracted_info": result["extracted_entities"],
+                "clarification_needed": result.get("clarification_needed", False),
+                "scenario_deviation": result.get("scenario_deviation", False),
+                "deviation_topic": result.get("deviation_topic", ""),
+                "interpreted_meaning": result.get("interpreted_meaning", user_input),
+                "suggested_response": result.get("suggested_response", ""),
+            }
+            result["intent_analysis"] = intent_analysis
             
-            print(f"   ✅ 추출된 엔티티: {result.get('extracted_entities', {})}")
-            print(f"   📊 신뢰도: {result.get('confidence', 0):.2f}")
+            logger.debug("   🎯 분석된 의도: %s", intent_analysis['intent'])
+            logger.debug("   💭 해석된 의미: %s", intent_analysis['interpreted_meaning'])
+            logger.debug("   ✅ 추출된 엔티티: %s", result.get('extracted_entities', {}))
+            logger.debug("   📊 신뢰도: %.2f", result.get('confidence', 0))
             if result.get('typo_corrections'):
-                print(f"   ✏️ 오타 수정: {result.get('typo_corrections')}")
+                logger.debug("   ✏️ 오타 수정: %s", result.get('typo_corrections'))
             if result.get('ambiguous_fields'):
-                print(f"   ⚠️ 애매한 필드: {result.get('ambiguous_fields')}")
-            print(f"   💭 추출 이유: {result.get('reasoning')}")
-            print(f"🔎 [LLM_ENTITY_EXTRACTION] 추출 완료\n")
+                logger.warning("   ⚠️ 애매한 필드: %s", result.get('ambiguous_fields'))
+            logger.debug("   💭 추출 이유: %s", result.get('reasoning'))
+            logger.debug("🔎 [LLM_ENTITY_EXTRACTION] 추출 완료\n")
             
             # confidence가 낮은 경우 재확인 메시지 추가
             if result.get("confidence", 1.0) < 0.7:
@@ -484,7 +629,7 @@ JSON 형식으로 출력:
             return result
             
         except Exception as e:
-            print(f"   ❌ [LLM_ENTITY_EXTRACTION] 추출 실패: {e}\n")
+            logger.error("   ❌ [LLM_ENTITY_EXTRACTION] 추출 실패: %s\n", e)
             # 실패 시 기존 방식으로 fallback
             return await self.extract_entities(user_input, required_fields)
 
@@ -494,32 +639,31 @@ JSON 형식으로 출력:
         required_fields: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """사용자 입력에서 엔티티 추출 - 유사도 매칭 포함"""
-        print(f"[EntityAgent] extract_entities_with_similarity called with {len(required_fields)} fields: {[f['key'] for f in required_fields]}")
+        logger.debug("[EntityAgent] extract_entities_with_similarity called with %s fields: %s", len(required_fields), [f['key'] for f in required_fields])
         
-        # 1. 먼저 기존 방식으로 추출 시도
+        # 1. 기본 추출
         extraction_result = await self.extract_entities(user_input, required_fields)
         extracted_entities = extraction_result.get("extracted_entities", {})
         
-        # 2. choice 타입 필드 중 추출되지 않은 것들에 대해 유사도 매칭 시도
+        # 2. 기본 추출에서 빠진 choice 필드만 유사도 매칭 (단일 배치 호출, 모두 채워졌으면 LLM 호출 없음)
+        unresolved_fields = [
+            f for f in required_fields
+            if f.get('type') == 'choice' and f.get('choices') and f['key'] not in extracted_entities
+        ]
+        similarity_results = await self.match_with_similarity_batch(user_input, unresolved_fields) if unresolved_fields else {}
         similarity_messages = []
-        for field in required_fields:
+        for field in unresolved_fields:
             field_key = field['key']
-            
-            # 이미 추출된 필드는 스킵
-            if field_key in extracted_entities:
+            similarity_result = similarity_results.get(field_key)
+            if not similarity_result:
                 continue
-                
-            # choice 타입 필드에 대해서만 유사도 매칭
-            if field.get('type') == 'choice' and field.get('choices'):
-                similarity_result = await self.match_with_similarity(user_input, field)
-                
-                if similarity_result['matched']:
-                    # 유사도 매칭 성공
-                    extracted_entities[field_key] = similarity_result['value']
-                    print(f"[EntityAgent] Similarity matched {field_key}: {similarity_result['value']} (score: {similarity_result['score']})")
-                elif similarity_result.get('need_retry') and similarity_result.get('message'):
-                    # 재질문 필요
-                    similarity_messages.append(similarity_result['message'])
+            if similarity_result['matched']:
+                # 유사도 매칭 성공
+                extracted_entities[field_key] = similarity_result['value']
+                logger.debug("[EntityAgent] Similarity matched %s: %s (score: %s)", field_key, similarity_result['value'], similarity_result['score'])
+            elif similarity_result.get('need_retry') and similarity_result.get('message'):
+                # 재질문 필요
+                similarity_messages.append(similarity_result['message'])
         
         # 3. 결과 반환
         result = {
@@ -552,10 +696,10 @@ JSON 형식으로 출력:
         try:
             # JSON 형식 요청을 프롬프트에 명시적으로 추가
             prompt += "\n\n반드시 JSON 형식으로 응답해주세요."
-            response = await json_llm.ainvoke([HumanMessage(content=prompt)])
+            response = await json_llm.ainvoke([HumanMessage(content=prompt)], site="entity_validation")
             result = json.loads(response.content)
             
-            print(f"[EntityAgent] Validation result: {result}")
+            logger.debug("[EntityAgent] Validation result: %s", result)
             return result
             
         except Exception as e:
@@ -567,128 +711,20 @@ JSON 형식으로 출력:
     
     def extract_with_patterns(self, user_input: str, field_key: str) -> Optional[str]:
         """패턴 기반 정보 추출 (fallback 방식)"""
-        patterns = {
-            "customer_phone": [  # phone_number -> customer_phone으로 변경
-                r"010[-\s]?\d{4}[-\s]?\d{4}",
-                r"011[-\s]?\d{3,4}[-\s]?\d{4}",
-                r"\d{3}[-\s]?\d{4}[-\s]?\d{4}"
-            ],
-            "phone_number": [  # 호환성을 위해 유지
-                r"010[-\s]?\d{4}[-\s]?\d{4}",
-                r"011[-\s]?\d{3,4}[-\s]?\d{4}",
-                r"\d{3}[-\s]?\d{4}[-\s]?\d{4}"
-            ],
-            "customer_name": [
-                r"([김이박최정강조윤장임한신오서권황안송류전고문양손배백허남심노정하곽성차주우구신임나전민유진지마진원봉][\w]{1,3})",
-                r"([\w가-힣]{2,4})(?:입니다|이에요|예요|이고|입니다)"
-            ],
-            "transfer_limit_per_time": [
-                r"일회\s*([가-힣]+)만원",  # "일회 사백만원"
-                r"1회\s*([가-힣]+)만원",   # "1회 사백만원"
-                r"일회\s*(\d+)(?:만원)?",  # "일회 400만원"
-                r"1회\s*이체\s*한도\s*(\d+)(?:만원)?",
-                r"1회\s*한도\s*(\d+)(?:만원)?",
-                r"회당\s*(\d+)(?:만원)?",
-                r"1회\s*(\d+)(?:만원)?",
-                r"한번에\s*(\d+)(?:만원)?"
-            ],
-            "transfer_limit_per_day": [
-                r"일일\s*([가-힣]+)만원",  # "일일 천만원"
-                r"1일\s*([가-힣]+)만원",   # "1일 천만원"
-                r"일일\s*(\d+)(?:만원)?",  # "일일 1000만원"
-                r"1일\s*이체\s*한도\s*(\d+)(?:만원)?",
-                r"일일\s*한도\s*(\d+)(?:만원)?",
-                r"하루\s*(\d+)(?:만원)?",
-                r"1일\s*(\d+)(?:만원)?",
-                r"일당\s*(\d+)(?:만원)?"
-            ],
-            "ib_daily_limit": [
-                r"(\d+)만원?",
-                r"(\d+)천만원?",
-                r"한도\s*(\d+)",
-                r"(\d+)원?"
-            ],
-            "cc_delivery_address": [
-                r"([\w가-힣\s\-\.]+(?:구|시|동|로|길)[\w가-힣\s\-\.]*)"
-            ],
-            "card_delivery_location": [
-                r"([\w가-힣\s\-\.]+(?:구|시|동|로|길)[\w가-힣\s\-\.]*)"
-            ],
-            "payment_date": [
-                r"(\d{1,2})일",
-                r"매월\s*(\d{1,2})",
-                r"(\d{1,2})일날",
-                r"월\s*(\d{1,2})"
-            ]
-        }
-        
-        # Boolean 필드를 위한 간단한 패턴
-        positive_patterns = ["네", "예", "응", "맞아", "맞습니다", "확인", "동의", "ok", "okay", "ㅇㅇ", "ㅇㅋ", 
-                           "어", "그래", "좋아", "알겠", "등록", "추가", "신청", "할게", "해줘", "해주세요"]
-        negative_patterns = ["아니", "아뇨", "아니요", "아니에요", "안", "싫", "no", "ㄴㄴ", "필요없", "안할"]
-        
         # Boolean 타입 필드 처리
-        if field_key in ["confirm_personal_info", "use_lifelong_account", "use_internet_banking", 
-                         "additional_withdrawal_account", "use_check_card", "postpaid_transport",
-                         "same_password_as_account", "card_usage_alert", "withdrawal_account_registration",
-                         "important_transaction_alert", "withdrawal_alert", "overseas_ip_restriction",
-                         "card_password_same_as_account", "limit_account_agreement"]:
+        if field_key in BOOLEAN_PATTERN_FIELDS:
             user_lower = user_input.lower().strip()
             
-            # 부정 패턴을 먼저 확인 (더 구체적인 패턴)
-            for pattern in negative_patterns:
-                if pattern in user_lower:
-                    # "할게"가 포함되어 있어도 "안할게"면 false
-                    if pattern == "안할" and "안할" in user_lower:
-                        return "false"
-                    # "필요없"이 포함되어 있으면 false
-                    elif pattern == "필요없" and "필요없" in user_lower:
-                        return "false"
-                    elif pattern in user_lower and pattern not in ["안할", "필요없"]:
-                        return "false"
+            # 부정 패턴을 먼저 확인 (더 구체적인 패턴, "할게"가 포함되어 있어도 "안할게"면 false)
+            if BOOLEAN_NEGATIVE_MATCHER.contains_any(user_lower):
+                return "false"
             
             # 긍정 패턴 확인
-            for pattern in positive_patterns:
-                if pattern in user_lower:
-                    return "true"
-        
-        if field_key not in patterns:
-            return None
-        
-        for pattern in patterns[field_key]:
-            match = re.search(pattern, user_input)
-            if match:
-                # group(0)는 전체 매치, group(1)은 첫 번째 캡처 그룹
-                # 캡처 그룹이 있는지 확인
-                if match.groups():
-                    value = match.group(1).strip()
-                else:
-                    value = match.group(0).strip()
-                
-                # 전화번호의 경우 하이픈 형식으로 변환
-                if field_key in ["customer_phone", "phone_number"]:
-                    # 숫자만 추출
-                    numbers_only = re.sub(r'\D', '', value)
-                    if len(numbers_only) == 11 and numbers_only.startswith('010'):
-                        return f"{numbers_only[:3]}-{numbers_only[3:7]}-{numbers_only[7:]}"
-                    elif len(numbers_only) == 10:
-                        return f"{numbers_only[:3]}-{numbers_only[3:6]}-{numbers_only[6:]}"
-                
-                # 이체한도의 경우 한국어 숫자를 변환
-                if field_key in ["transfer_limit_per_time", "transfer_limit_per_day"]:
-                    # convert_korean_number 함수 사용
-                    converted = convert_korean_number(value)
-                    if converted is not None:
-                        return str(converted)
-                    
-                    # 일반 숫자 추출 시도
-                    num_match = re.search(r'(\d+)', value)
-                    if num_match:
-                        return num_match.group(1)
-                    
-                return value
-        
-        return None
+            if BOOLEAN_POSITIVE_MATCHER.contains_any(user_lower):
+                return "true"
+        
+        # 전화번호/이름/이메일/이체한도/주소/결제일 - 공용 추출 엔진 (발화당 한 번 추출, 결과 캐시)
+        return korean_extractor.extract(user_input).value_for(field_key)
     
     async def match_with_similarity(
         self,
@@ -722,7 +758,7 @@ JSON 형식으로 출력:
         prompt += "\n\n반드시 위의 JSON 형식으로 응답해주세요."
         
         try:
-            response = await json_llm.ainvoke([HumanMessage(content=prompt)])
+            response = await json_llm.ainvoke([HumanMessage(content=prompt)], site="similarity_matching")
             
             # JSON 파싱
             content = response.content.strip()
@@ -732,62 +768,113 @@ JSON 형식으로 출력:
                 content = content[:-3]
             
             result = json.loads(content.strip())
-            
-            best_match = result.get("best_match")
-            similarity_score = result.get("similarity_score", 0.0)
-            reasoning = result.get("reasoning", "")
-            
-            print(f"[EntityAgent] Similarity matching for '{user_input}': {best_match} (score: {similarity_score})")
-            print(f"[EntityAgent] Reasoning: {reasoning}")
-            
-            # 유사도 기반 판단
-            if similarity_score >= self.similarity_threshold:
-                # 매칭 성공
-                return {
-                    "matched": True,
-                    "value": best_match,
-                    "score": similarity_score,
-                    "need_retry": False,
-                    "reasoning": reasoning
-                }
-            elif similarity_score < self.retry_threshold:
-                # 유사도가 너무 낮음 - 재질문 필요
-                return {
-                    "matched": False,
-                    "value": None,
-                    "score": similarity_score,
-                    "need_retry": True,
-                    "reasoning": reasoning,
-                    "message": f"입력하신 '{user_input}'는 선택 가능한 옵션과 일치하지 않습니다. {', '.join(field['choices'])} 중에서 선택해주세요."
-                }
-            else:
-                # 애매한 경우 - 추가 확인 필요
-                alternatives = result.get("alternative_matches", [])
-                if alternatives:
-                    alt_text = ", ".join([f"{alt['value']}({alt['score']:.1f})" for alt in alternatives[:2]])
-                    message = f"'{user_input}'를 '{best_match}'로 이해했습니다. 맞으신가요? 혹시 {alt_text} 중 하나를 말씀하신 건가요?"
-                else:
-                    message = f"'{user_input}'를 '{best_match}'로 이해했습니다. 맞으신가요?"
-                
-                return {
-                    "matched": False,
-                    "value": best_match,
-                    "score": similarity_score,
-                    "need_retry": True,
-                    "reasoning": reasoning,
-                    "message": message
-                }
+            return self._interpret_similarity(user_input, field, result)
                 
         except Exception as e:
-            print(f"[EntityAgent] Similarity matching error: {e}")
+            logger.debug("[EntityAgent] Similarity matching error: %s", e)
+            return self._similarity_error_result(field)
+    
+    async def match_with_similarity_batch(
+        self,
+        user_input: str,
+        fields: List[Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """여러 choice 필드의 유사도 매칭을 한 번의 LLM 호출로 처리 - {field_key: match_with_similarity 결과}"""
+        fields = [f for f in fields if f.get('type') == 'choice' and f.get('choices')]
+        if not fields:
+            return {}
+        if len(fields) == 1:
+            return {fields[0]['key']: await self.match_with_similarity(user_input, fields[0])}
+        
+        field_infos = [
+            {
+                "key": field['key'],
+                "display_name": field.get('display_name', field['key']),
+                "description": field.get('description', ''),
+                "choices": field['choices']
+            }
+            for field in fields
+        ]
+        prompt = self.batch_similarity_prompt.format(
+            user_input=user_input,
+            fields=json.dumps(field_infos, ensure_ascii=False)
+        )
+        prompt += "\n\n반드시 위의 JSON 형식으로 응답해주세요."
+        
+        try:
+            response = await json_llm.ainvoke([HumanMessage(content=prompt)], site="similarity_matching")
+            content = response.content.strip()
+            if content.startswith("```json"):
+                content = content[7:]
+            if content.endswith("```"):
+                content = content[:-3]
+            matches = json.loads(content.strip()).get("matches", {})
+        except Exception as e:
+            logger.debug("[EntityAgent] Batch similarity matching error: %s", e)
+            return {field['key']: self._similarity_error_result(field) for field in fields}
+        
+        return {
+            field['key']: self._interpret_similarity(user_input, field, matches.get(field['key']) or {})
+            for field in fields
+        }
+    
+    def _interpret_similarity(self, user_input: str, field: Dict[str, Any], result: Dict[str, Any]) -> Dict[str, Any]:
+        """유사도 매칭 LLM 결과 → 매칭 성공 / 재질문 / 확인 필요 판단"""
+        best_match = result.get("best_match")
+        similarity_score = result.get("similarity_score", 0.0)
+        reasoning = result.get("reasoning", "")
+        
+        logger.debug("[EntityAgent] Similarity matching for '%s' (%s): %s (score: %s)", user_input, field['key'], best_match, similarity_score)
+        logger.debug("[EntityAgent] Reasoning: %s", reasoning)
+        
+        # 유사도 기반 판단
+        if similarity_score >= self.similarity_threshold:
+            # 매칭 성공
+            return {
+                "matched": True,
+                "value": best_match,
+                "score": similarity_score,
+                "need_retry": False,
+                "reasoning": reasoning
+            }
+        elif similarity_score < self.retry_threshold:
+            # 유사도가 너무 낮음 - 재질문 필요
             return {
                 "matched": False,
                 "value": None,
-                "score": 0.0,
+                "score": similarity_score,
                 "need_retry": True,
-                "message": f"{field.get('display_name', field['key'])}을(를) 다시 말씀해주세요. 선택 가능한 옵션: {', '.join(field['choices'])}"
+                "reasoning": reasoning,
+                "message": f"입력하신 '{user_input}'는 선택 가능한 옵션과 일치하지 않습니다. {', '.join(field['choices'])} 중에서 선택해주세요."
+            }
+        else:
+            # 애매한 경우 - 추가 확인 필요
+            alternatives = result.get("alternative_matches", [])
+            if alternatives:
+                alt_text = ", ".join([f"{alt['value']}({alt['score']:.1f})" for alt in alternatives[:2]])
+                message = f"'{user_input}'를 '{best_match}'로 이해했습니다. 맞으신가요? 혹시 {alt_text} 중 하나를 말씀하신 건가요?"
+            else:
+                message = f"'{user_input}'를 '{best_match}'로 이해했습니다. 맞으신가요?"
+            
+            return {
+                "matched": False,
+                "value": best_match,
+                "score": similarity_score,
+                "need_retry": True,
+                "reasoning": reasoning,
+                "message": message
             }
     
+    @staticmethod
+    def _similarity_error_result(field: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "matched": False,
+            "value": None,
+            "score": 0.0,
+            "need_retry": True,
+            "message": f"{field.get('display_name', field['key'])}을(를) 다시 말씀해주세요. 선택 가능한 옵션: {', '.join(field['choices'])}"
+        }
+    
     async def process_slot_filling(
         self, 
         user_input: str, 
@@ -795,7 +882,7 @@ JSON 형식으로 출력:
         collected_info: Dict[str, Any]
     ) -> Dict[str, Any]:
         """종합적인 Slot Filling 처리 - 유사도 매칭 포함"""
-        print(f"[EntityAgent] process_slot_filling called with {len(required_fields)} fields: {[f['key'] for f in required_fields]}")
+        logger.debug("[EntityAgent] process_slot_filling called with %s fields: %s", len(required_fields), [f['key'] for f in required_fields])
         
         # 1단계: LLM 기반 엔티티 추출 (유사도 매칭 포함)
         extraction_result = await self.extract_entities_with_similarity(user_input, required_fields)
@@ -868,128 +955,5 @@ JSON 형식으로 출력:
             return f"다음 정보를 알려주세요: {', '.join(field_names)}"
 
 
-def convert_korean_number(text: str) -> Optional[int]:
-    """한국어 숫자 표현을 숫자로 변환 (만원 단위)"""
-    try:
-        # 기본 텍스트 정리
-        text = text.strip().replace(",", "").replace(" ", "")
-        
-        # 한글 숫자를 아라비아 숫자로 변환
-        korean_nums = {
-            "일": "1", "이": "2", "삼": "3", "사": "4", "오": "5",
-            "육": "6", "칠": "7", "팔": "8", "구": "9", "십": "10",
-            "백": "100", "천": "1000", "만": "10000", "억": "100000000"
-        }
-        
-        # 특수 케이스 처리 (일억, 일천만 등)
-        text = text.replace("일억", "1억").replace("일천", "1천").replace("일백", "1백")
-        
-        # 단순 한글 숫자 케이스 (오백만원, 삼천만원 등)
-        simple_patterns = {
-            "오백만원": 500, "오백만": 500,
-            "사백만원": 400, "사백만": 400,
-            "삼백만원": 300, "삼백만": 300,
-            "이백만원": 200, "이백만": 200,
-            "백만원": 100, "백만": 100,
-            "오천만원": 5000, "오천만": 5000,
-            "사천만원": 4000, "사천만": 4000,
-            "삼천만원": 3000, "삼천만": 3000,
-            "이천만원": 2000, "이천만": 2000,
-            "천만원": 1000, "천만": 1000,
-            "구백만원": 900, "구백만": 900,
-            "팔백만원": 800, "팔백만": 800,
-            "칠백만원": 700, "칠백만": 700,
-            "육백만원": 600, "육백만": 600,
-            "구십만원": 90, "구십만": 90,
-            "팔십만원": 80, "팔십만": 80,
-            "칠십만원": 70, "칠십만": 70,
-            "육십만원": 60, "육십만": 60,
-            "오십만원": 50, "오십만": 50,
-            "사십만원": 40, "사십만": 40,
-            "삼십만원": 30, "삼십만": 30,
-            "이십만원": 20, "이십만": 20,
-            "십만원": 10, "십만": 10
-        }
-        
-        # 정확한 매칭 우선
-        for pattern, value in simple_patterns.items():
-            if text == pattern:
-                return value
-        
-        # 만원 단위 제거
-        text = text.replace("만원", "").replace("만", "")
-        
-        # 복잡한 케이스 처리
-        if "억" in text:
-            parts = text.split("억")
-            try:
-                # 숫자로 변환 시도
-                if parts[0].isdigit():
-                    result = int(parts[0]) * 10000
-                else:
-                    # 한글 숫자인 경우
-                    result = 10000  # 기본값 1억
-            except:
-                result = 10000
-            
-            if len(parts) > 1 and parts[1]:
-                if parts[1].isdigit():
-                    result += int(parts[1])
-                elif "천" in parts[1]:
-                    sub_parts = parts[1].split("천")
-                    if sub_parts[0].isdigit():
-                        result += int(sub_parts[0]) * 1000
-                    else:
-                        result += 1000
-            return result
-            
-        elif "천" in text:
-            parts = text.split("천")
-            if parts[0].isdigit():
-                result = int(parts[0]) * 1000
-            else:
-                # "오천" -> 5000
-                num_map = {"일": 1, "이": 2, "삼": 3, "사": 4, "오": 5, 
-                          "육": 6, "칠": 7, "팔": 8, "구": 9}
-                result = num_map.get(parts[0], 1) * 1000
-                
-            if len(parts) > 1 and parts[1]:
-                if "백" in parts[1]:
-                    hundred_parts = parts[1].split("백")
-                    if hundred_parts[0].isdigit():
-                        result += int(hundred_parts[0]) * 100
-                    else:
-                        result += num_map.get(hundred_parts[0], 1) * 100
-                elif parts[1].isdigit():
-                    result += int(parts[1])
-            return result
-            
-        elif "백" in text:
-            parts = text.split("백")
-            if parts[0].isdigit():
-                result = int(parts[0]) * 100
-            else:
-                num_map = {"일": 1, "이": 2, "삼": 3, "사": 4, "오": 5, 
-                          "육": 6, "칠": 7, "팔": 8, "구": 9}
-                result = num_map.get(parts[0], 1) * 100
-                
-            if len(parts) > 1 and parts[1]:
-                if parts[1].isdigit():
-                    result += int(parts[1])
-            return result
-        else:
-            # 일반 숫자
-            if text.isdigit():
-                return int(text)
-            else:
-                # 한글 숫자 단독 (오, 십 등)
-                num_map = {"일": 1, "이": 2, "삼": 3, "사": 4, "오": 5, 
-                          "육": 6, "칠": 7, "팔": 8, "구": 9, "십": 10}
-                return num_map.get(text, None)
-    except Exception as e:
-        print(f"[convert_korean_number] Error converting '{text}': {e}")
-        return None
-
-
 # 전역 인스턴스
 entity_agent = EntityRecognitionAgent()
\ No newline at end of file
@@ -6,29 +6,23 @@
 import re
 from typing import Dict, Any, Optional, List, Tuple
 from ..graph.chains import generative_llm
+from ..graph.korean_extraction import (
+    ExtractionResult, convert_korean_to_digits, is_partial_address, korean_extractor
+)
 
 
-def convert_korean_to_digits(text: str) -> str:
-    """한국어 숫자 표현을 아라비아 숫자로 변환"""
-    korean_numbers = {
-        '영': '0', '공': '0',
-        '일': '1', '하나': '1',
-        '이': '2', '둘': '2',
-        '삼': '3', '셋': '3',
-        '사': '4', '넷': '4',
-        '오': '5', '다섯': '5',
-        '육': '6', '여섯': '6',
-        '칠': '7', '일곱': '7',
-        '팔': '8', '여덟': '8',
-        '구': '9', '아홉': '9'
-    }
-    
-    # 한국어 숫자를 아라비아 숫자로 변환
-    result = text
-    for korean, digit in korean_numbers.items():
-        result = result.replace(korean, digit)
-    
-    return result
+# 대조 표현 패턴 (예: "오육칠팔이 아니라 이이오구야", "숭인동에서 수이동으로")
+CONTRAST_PATTERNS = [
+    re.compile(r"([\d가-힣]+)\s*(이|가)?\s*아니라\s*([\d가-힣]+)", re.IGNORECASE),  # "5678이 아니라 2259"
+    re.compile(r"([\d가-힣]+)\s*(이|가)?\s*아니고\s*([\d가-힣]+)", re.IGNORECASE),  # "5678이 아니고 2259"
+    re.compile(r"([\d가-힣]+)\s*말고\s*([\d가-힣]+)", re.IGNORECASE),  # "5678 말고 2259"
+    re.compile(r"([가-힣]+(?:동|로|길))[에서|을|를]\s*([가-힣]+(?:동|로|길))(?:으로|로)", re.IGNORECASE),  # "숭인동에서 수이동으로"
+    re.compile(r"([가-힣]+)에서\s*([가-힣]+)(?:으로|로)", re.IGNORECASE),  # "김철수에서 이영희로"
+]
+DIGITS_PATTERN = re.compile(r'(\d+)')
+FOUR_DIGITS_PATTERN = re.compile(r'^\d{4}$')
+
+ADDRESS_FIELDS = ("address", "work_address")
 
 
 class InfoModificationAgent:
@@ -40,62 +34,12 @@ class InfoModificationAgent:
     2. 컨텍스트 기반 필드 매칭
     3. 기존 정보와 비교하여 수정 대상 추론
     4. 데이터 검증 및 형식 변환
+    
+    전역 인스턴스를 여러 세션이 공유하므로 요청별 상태를 보관하지 않음 (결과는 반환값으로만 전달)
     """
+    __slots__ = ("context_keywords",)
     
     def __init__(self):
-        self.field_patterns = {
-            # 전화번호 관련 패턴
-            "phone_number": [
-                r"뒷번호\s*(\d{4})",
-                r"뒷자리\s*(\d{4})",
-                r"뒤\s*(\d{4})",
-                r"마지막\s*(\d{4})",
-                r"끝번호\s*(\d{4})",
-                r"가운데가?\s*(\d{3,4})",
-                r"중간이?\s*(\d{3,4})",
-                r"010[-\s]*(\d{3,4})[-\s]*(\d{4})",
-                r"(\d{3})[-\s]*(\d{4})[-\s]*(\d{4})",
-                r"전화번호\s*(010[-\s]*\d{3,4}[-\s]*\d{4})",
-                r"휴대폰\s*(010[-\s]*\d{3,4}[-\s]*\d{4})",
-                r"연락처\s*(010[-\s]*\d{3,4}[-\s]*\d{4})"
-            ],
-            
-            # 이름 관련 패턴
-            "customer_name": [
-                r"이름\s*([가-힣]{2,4})",
-                r"성함\s*([가-힣]{2,4})",
-                r"이름은\s*([가-힣]{2,4})",
-                r"([가-힣]{2,4})\s*입니다",
-                r"([가-힣]{2,4})\s*이에요",
-                r"([가-힣]{2,4})\s*예요",
-                r"([가-힣]{2,4})\s*라고\s*해주세요"
-            ],
-            
-            # 이메일 관련 패턴
-            "email": [
-                r"([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})",
-                r"이메일\s*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})",
-                r"메일\s*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})"
-            ],
-            # 주소 관련 패턴
-            "address": [
-                r"집\s*주소.+?([가-힣]+(?:동|로|길)\s*\d+)",   # 집주소는 ~ (주소 형태만)
-                r"집이?\s+([가-힣]+(?:동|로|길)\s*\d+)",     # 집은/집이 ~ (주소 형태만)
-            ],
-            "work_address": [
-                r"직장\s*주소.+?([가-힣]+(?:동|로|길)\s*\d+)",   # 직장주소는 ~ (주소 형태만)
-                r"회사\s*주소.+?([가-힣]+(?:동|로|길)\s*\d+)",   # 회사주소는 ~ (주소 형태만)
-                r"직장이?\s+([가-힣]+(?:동|로|길)\s*\d+)",       # 직장은/직장이 ~ (주소 형태만)
-                r"회사가?\s+([가-힣]+(?:동|로|길)\s*\d+)",       # 회사가 ~ (주소 형태만)
-            ],
-            # 명시적 필드 언급이 없는 일반 주소 패턴은 별도로 처리
-            "_generic_address": [
-                r"([가-힣]+동\s*\d+)",  # 동 + 번지 (한글만)
-                r"([가-힣]+로\s*\d+)",  # 로 + 번지 (한글만)
-                r"([가-힣]+길\s*\d+)",  # 길 + 번지 (한글만)
-            ]
-        }
-        
         self.context_keywords = {
             "phone_number": ["전화", "연락처", "휴대폰", "번호", "뒷번호", "뒷자리", "뒤", "마지막", "끝번호"],
             "customer_name": ["이름", "성함", "명의", "고객명"],
@@ -169,20 +113,11 @@ class InfoModificationAgent:
         # 한국어 숫자를 아라비아 숫자로 변환한 버전도 생성
         converted_input = convert_korean_to_digits(user_input)
         
-        # 대조 표현 패턴 처리 (예: "오육칠팔이 아니라 이이오구야", "숭인동에서 수이동으로")
-        contrast_patterns = [
-            r"([\d가-힣]+)\s*(이|가)?\s*아니라\s*([\d가-힣]+)",  # "5678이 아니라 2259"
-            r"([\d가-힣]+)\s*(이|가)?\s*아니고\s*([\d가-힣]+)",  # "5678이 아니고 2259"
-            r"([\d가-힣]+)\s*말고\s*([\d가-힣]+)",  # "5678 말고 2259"
-            r"([가-힣]+(?:동|로|길))[에서|을|를]\s*([가-힣]+(?:동|로|길))(?:으로|로)",  # "숭인동에서 수이동으로"
-            r"([가-힣]+)에서\s*([가-힣]+)(?:으로|로)",  # "김철수에서 이영희로"
-        ]
-        
         # 대조 표현 확인
-        for pattern in contrast_patterns:
+        for pattern in CONTRAST_PATTERNS:
             # 먼저 원본 입력에서 확인
             for test_input in [user_input, converted_input]:
-                match = re.search(pattern, test_input, re.IGNORECASE)
+                match = pattern.search(test_input)
                 if match:
                     # 대조 표현이 있으면 뒤의 값만 추출
                     old_value = match.group(1)
@@ -192,29 +127,9 @@ class InfoModificationAgent:
                     
                     # 주소 관련 대조 표현 처리
                     if "동" in new_value or "로" in new_value or "길" in new_value:
-                        # 주소 대조 표현
-                        if modification_context in ["address", "work_address"]:
-                            # 컨텍스트가 있으면 해당 필드 사용
-                            target_field = modification_context
-                        else:
-                            # 컨텍스트가 없으면 기본적으로 address 사용 (LLM이 더 정확히 판단할 것)
-                            target_field = "address"
-                        
-                        # 기존 주소에서 시/구 정보 추출하여 결합
-                        current_address = current_info.get(target_field, "")
-                        if current_address and "서울" in current_address:
-                            parts = current_address.split()
-                            if len(parts) >= 2:
-                                prefix = " ".join(parts[:2])
-                                matches[target_field] = f"{prefix} {new_value}"
-                            else:
-                                matches[target_field] = new_value
-                        else:
-                            # 기본 시/구 정보 추가
-                            if target_field == "work_address":
-                                matches[target_field] = f"서울특별시 중구 {new_value}"
-                            else:
-                                matches[target_field] = f"서울특별시 종로구 {new_value}"
+                        # 컨텍스트가 있으면 해당 필드 사용, 없으면 기본적으로 address 사용 (LLM이 더 정확히 판단할 것)
+                        target_field = modification_context if modification_context in ADDRESS_FIELDS else "address"
+                        matches[target_field] = self._merge_partial_address(target_field, new_value, current_info)
                         
                         print(f"[InfoModAgent] Address contrast change: {target_field} = {matches[target_field]}")
                         return {"extracted": matches, "method": "contrast_pattern"}
@@ -226,8 +141,8 @@ class InfoModificationAgent:
                         new_value_digits = convert_korean_to_digits(new_value)
                         
                         # 숫자만 추출 (끝의 조사 제거)
-                        old_digits_match = re.search(r'(\d+)', old_value_digits)
-                        new_digits_match = re.search(r'(\d+)', new_value_digits)
+                        old_digits_match = DIGITS_PATTERN.search(old_value_digits)
+                        new_digits_match = DIGITS_PATTERN.search(new_value_digits)
                         
                         if old_digits_match and new_digits_match:
                             old_digits = old_digits_match.group(1)
@@ -236,7 +151,7 @@ class InfoModificationAgent:
                             print(f"[InfoModAgent] Number contrast pattern: '{old_value}' ({old_digits}) → '{new_value}' ({new_digits})")
                             
                             # 4자리 숫자인 경우 전화번호 뒷자리로 간주
-                            if re.match(r'^\d{4}$', new_digits):
+                            if FOUR_DIGITS_PATTERN.match(new_digits):
                                 # 기존 전화번호에서 뒷자리만 변경
                                 current_phone = current_info.get("phone_number", "010-1234-5678")
                                 phone_parts = current_phone.split("-")
@@ -252,144 +167,72 @@ class InfoModificationAgent:
                                 return {"extracted": matches, "method": "contrast_pattern"}
                     break
         
-        # 원본과 변환된 버전 모두에서 패턴 매칭 시도
-        for test_input in [user_input, converted_input]:
-            # 먼저 명시적 필드 패턴 확인 (address, work_address)
-            for field_key, patterns in self.field_patterns.items():
-                if field_key == "_generic_address":
-                    continue  # 일반 주소 패턴은 나중에 처리
-                
-                for pattern in patterns:
-                    match = re.search(pattern, test_input, re.IGNORECASE)
-                    if match:
-                        if field_key == "phone_number":
-                            # 전화번호 특별 처리
-                            phone_value = self._process_phone_match(match, test_input)
-                            if phone_value:
-                                matches[field_key] = phone_value
-                        elif field_key == "customer_name":
-                            # 이름 추출
-                            name_value = match.group(1).strip()
-                            if len(name_value) >= 2:
-                                matches[field_key] = name_value
-                        elif field_key == "email":
-                            # 이메일 추출
-                            email_value = match.group(1).strip()
-                            if "@" in email_value and "." in email_value:
-                                matches[field_key] = email_value
-                        elif field_key in ["address", "work_address"]:
-                            # 주소 추출 - 기존 주소와 병합 처리
-                            new_address_part = match.group(1).strip()
-                            
-                            # modification_context가 있고 주소 필드인 경우, context의 필드를 우선 사용
-                            if modification_context in ["address", "work_address"]:
-                                target_field = modification_context
-                                current_address = current_info.get(target_field, "")
-                            else:
-                                # context가 없으면 기본 필드 사용
-                                target_field = field_key
-                                current_address = current_info.get(field_key, "")
-                            
-                            # 부분 주소인 경우 (동/로/길 + 번지만 있는 경우)
-                            if ("동" in new_address_part or "로" in new_address_part or "길" in new_address_part) and len(new_address_part) < 20:
-                                if current_address and "서울" in current_address:
-                                    # 기존 주소에서 시/구 정보 추출하여 결합
-                                    parts = current_address.split()
-                                    if len(parts) >= 2:
-                                        # 서울특별시 종로구 같은 부분 유지
-                                        prefix = " ".join(parts[:2])
-                                        matches[target_field] = f"{prefix} {new_address_part}"
-                                    else:
-                                        matches[target_field] = new_address_part
-                                else:
-                                    # 기본 시/구 정보 추가
-                                    if target_field == "work_address":
-                                        # 직장주소는 기존 직장주소의 시/구를 사용하거나 기본값 사용
-                                        work_address = current_info.get("work_address", "")
-                                        if work_address and "서울" in work_address:
-                                            parts = work_address.split()
-                                            if len(parts) >= 2:
-                                                prefix = " ".join(parts[:2])
-                                                matches[target_field] = f"{prefix} {new_address_part}"
-                                            else:
-                                                matches[target_field] = f"서울특별시 중구 {new_address_part}"
-                                        else:
-                                            matches[target_field] = f"서울특별시 중구 {new_address_part}"
-                                    else:
-                                        matches[target_field] = f"서울특별시 종로구 {new_address_part}"
-                            else:
-                                # 완전한 새 주소인 경우
-                                matches[target_field] = new_address_part
-                        break
-        
-        # 명시적 필드 패턴에서 매치가 없었고, 일반 주소 패턴이 있는 경우
-        if not matches and "_generic_address" in self.field_patterns:
-            for test_input in [user_input, converted_input]:
-                for pattern in self.field_patterns["_generic_address"]:
-                    match = re.search(pattern, test_input, re.IGNORECASE)
-                    if match:
-                        new_address_part = match.group(1).strip()
-                        
-                        # modification_context가 있으면 그것을 사용
-                        if modification_context in ["address", "work_address"]:
-                            target_field = modification_context
-                        else:
-                            # context가 없으면 기본적으로 address로 설정 (하지만 LLM이 더 정확히 판단할 것)
-                            target_field = "address"
-                        
-                        current_address = current_info.get(target_field, "")
-                        
-                        # 부분 주소인 경우
-                        if ("동" in new_address_part or "로" in new_address_part or "길" in new_address_part) and len(new_address_part) < 20:
-                            if current_address and "서울" in current_address:
-                                parts = current_address.split()
-                                if len(parts) >= 2:
-                                    prefix = " ".join(parts[:2])
-                                    matches[target_field] = f"{prefix} {new_address_part}"
-                                else:
-                                    matches[target_field] = new_address_part
-                            else:
-                                # 기본 시/구 정보 추가
-                                if target_field == "work_address":
-                                    work_address = current_info.get("work_address", "")
-                                    if work_address and "서울" in work_address:
-                                        parts = work_address.split()
-                                        if len(parts) >= 2:
-                                            prefix = " ".join(parts[:2])
-                                            matches[target_field] = f"{prefix} {new_address_part}"
-                                        else:
-                                            matches[target_field] = f"서울특별시 중구 {new_address_part}"
-                                    else:
-                                        matches[target_field] = f"서울특별시 중구 {new_address_part}"
-                                else:
-                                    matches[target_field] = f"서울특별시 종로구 {new_address_part}"
-                        else:
-                            matches[target_field] = new_address_part
-                        break
+        # 공용 추출 엔진 결과 (EntityAgent와 같은 발화면 캐시된 결과 재사용)
+        extraction = korean_extractor.extract(user_input)
+        
+        phone_value = self._phone_from_spans(extraction)
+        if phone_value:
+            matches["phone_number"] = phone_value
+        
+        name_span = extraction.best("name", min_confidence=0.7)
+        if name_span:
+            matches["customer_name"] = name_span.value
+        
+        email_span = extraction.best("email")
+        if email_span:
+            matches["email"] = email_span.value
+        
+        # 집/직장 등 명시적 필드 언급이 있는 주소 - modification_context가 주소 필드면 그것을 우선 사용
+        for span in extraction.spans_of("address"):
+            if span.field in ADDRESS_FIELDS:
+                target_field = modification_context if modification_context in ADDRESS_FIELDS else span.field
+                matches[target_field] = self._merge_partial_address(target_field, span.value, current_info)
+        
+        # 명시적 필드 패턴에서 매치가 없었고, 일반 주소가 있는 경우
+        if not matches:
+            address_span = extraction.best("address")
+            if address_span:
+                # context가 없으면 기본적으로 address로 설정 (하지만 LLM이 더 정확히 판단할 것)
+                target_field = modification_context if modification_context in ADDRESS_FIELDS else "address"
+                matches[target_field] = self._merge_partial_address(target_field, address_span.value, current_info)
         
         return {"extracted": matches, "method": "pattern"}
     
-    def _process_phone_match(self, match: re.Match, user_input: str) -> Optional[str]:
-        """전화번호 매칭 특별 처리"""
-        groups = match.groups()
-        
-        # 가운데 번호 4자리인 경우
-        if len(groups) == 1 and len(groups[0]) in [3, 4]:
-            if "가운데" in user_input or "중간" in user_input:
-                # 010-{3-4자리}-xxxx로 가정
-                return f"010-{groups[0]}-xxxx"
-            elif "뒷번호" in user_input or "뒷자리" in user_input or "뒤" in user_input or "마지막" in user_input or "끝번호" in user_input:
-                # 010-xxxx-{4자리}로 가정
-                return f"010-xxxx-{groups[0]}"
-        
-        # 전체 번호인 경우
-        elif len(groups) >= 2:
-            # 010-xxxx-xxxx 형태로 조합
-            if len(groups) == 2:
-                return f"010-{groups[0]}-{groups[1]}"
-            elif len(groups) == 3:
-                return f"{groups[0]}-{groups[1]}-{groups[2]}"
-        
+    @staticmethod
+    def _merge_partial_address(target_field: str, address_part: str, current_info: Dict[str, Any]) -> str:
+        """동/로/길 + 번지만 있는 부분 주소는 기존 주소(없으면 기본값)의 시/구와 결합"""
+        if not is_partial_address(address_part):
+            # 완전한 새 주소인 경우
+            return address_part
+        
+        current_address = current_info.get(target_field, "")
+        if current_address and "서울" in current_address:
+            # 서울특별시 종로구 같은 부분 유지
+            parts = current_address.split()
+            if len(parts) >= 2:
+                return f"{' '.join(parts[:2])} {address_part}"
+            return address_part
+        
+        # 기본 시/구 정보 추가
+        if target_field == "work_address":
+            return f"서울특별시 중구 {address_part}"
+        return f"서울특별시 종로구 {address_part}"
+    
+    @staticmethod
+    def _phone_from_spans(extraction: ExtractionResult) -> Optional[str]:
+        """전화번호 span → 값 (가운데/뒷번호만 있으면 010-1234-xxxx / 010-xxxx-5678 형태)"""
+        phone_span = extraction.best("phone")
+        if phone_span:
+            return phone_span.value
+        
+        middle_span = extraction.best("phone_middle")
+        tail_span = extraction.best("phone_tail")
+        if middle_span and tail_span:
+            return f"010-{middle_span.value}-{tail_span.value}"
+        if tail_span:
+            return f"010-xxxx-{tail_span.value}"
+        if middle_span:
+            return f"010-{middle_span.value}-xxxx"
         return None
     
     def _infer_from_context(self, user_input: str, current_info: Dict[str, Any]) -> Dict[str, Any]:
@@ -549,7 +392,7 @@ class InfoModificationAgent:
 
         try:
             from langchain_core.messages import HumanMessage
-            response = await generative_llm.ainvoke([HumanMessage(content=prompt)])
+            response = await generative_llm.ainvoke([HumanMessage(content=prompt)], site="info_modification")
             
             # JSON 응답 파싱
             content = response.content.strip()
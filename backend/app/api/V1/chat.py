@@ -4,13 +4,15 @@
 
 import json
 import copy
-from typing import Optional, Dict, cast, Any
+import logging
+from typing import Optional, Dict, cast, Any, Tuple
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from starlette.websockets import WebSocketState
 from langchain_core.messages import HumanMessage, AIMessage
 from ...graph.state import AgentState
 from ...services.google_services import StreamSTTService, StreamTTSService, GOOGLE_SERVICES_AVAILABLE
 from .websocket_manager import manager
+from ...core.tracing import record_span, turn_span
 from .chat_handlers import (
     handle_agent_output_chunk,
     handle_slot_filling_update,
@@ -18,11 +20,15 @@ from .chat_handlers import (
     get_agent_generator
 )
 from .chat_utils import get_info_collection_stages, send_slot_filling_update
-from ...graph.utils import reload_scenario_data
+from .slot_filling_sync import slot_filling_sync, RESYNC_REQUEST_TYPE
+from ...graph.utils import reload_scenario_data, get_active_scenario_data
+from ...graph.history import history_manager
+from ...graph.scenario_registry import scenario_registry
 from fastapi import HTTPException
 from pydantic import BaseModel
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 # Reload scenario request model
 class ReloadScenarioRequest(BaseModel):
@@ -31,6 +37,8 @@ class ReloadScenarioRequest(BaseModel):
 
 # 전역 세션 상태
 SESSION_STATES: Dict[str, AgentState] = {}
+# 세션별 처리한 턴 수 (트레이스의 turn.number)
+SESSION_TURN_COUNTS: Dict[str, int] = {}
 INFO_COLLECTION_STAGES = get_info_collection_stages()
 
 
@@ -47,9 +55,9 @@ async def websocket_chat_endpoint(websocket: WebSocket):
     try:
         await handle_websocket_messages(websocket, session_id, tts_service, stt_service)
     except WebSocketDisconnect:
-        print(f"WebSocket disconnected: {session_id}")
+        logger.info("WebSocket disconnected: %s", session_id)
     except Exception as e:
-        print(f"WebSocket error for {session_id}: {e}")
+        logger.warning("WebSocket error for %s: %s", session_id, e)
         # WebSocket이 이미 닫혔을 수 있으므로 에러 메시지 전송을 시도하지 않음
         try:
             if session_id in manager.active_connections:
@@ -69,7 +77,7 @@ async def initialize_session(websocket: WebSocket) -> Optional[str]:
     session_id = manager.get_session_id(websocket)
     
     if not session_id:
-        print("Failed to create session ID")
+        logger.error("Failed to create session ID")
         await websocket.close()
         return None
     
@@ -77,7 +85,7 @@ async def initialize_session(websocket: WebSocket) -> Optional[str]:
     SESSION_STATES[session_id] = {
         "messages": [],
         "current_product_type": None,
-        "active_scenario_data": None,
+        "active_scenario_ref": None,
         "collected_product_info": {},
         "current_scenario_stage_id": "",
         "active_scenario_name": "미정",
@@ -90,7 +98,7 @@ async def initialize_session(websocket: WebSocket) -> Optional[str]:
         "pending_modifications": None,
     }
     
-    print(f"New session initialized: {session_id}")
+    logger.info("New session initialized: %s", session_id)
     
     # 초기 인사 메시지
     greeting = "안녕하세요. 신한은행 AI 금융 상담 서비스입니다. 통장을 새로 만드실꺼면 '통장 만들고싶어요' 와 같이 말씀해주세요"
@@ -105,6 +113,12 @@ async def initialize_session(websocket: WebSocket) -> Optional[str]:
     return session_id
 
 
+def session_metric_labels(session_id: str) -> Tuple[Optional[str], Optional[str]]:
+    """세션의 현재 (상품, 스테이지) - 음성 단계 메트릭 라벨"""
+    session_state = SESSION_STATES.get(session_id) or {}
+    return session_state.get("current_product_type"), session_state.get("current_scenario_stage_id")
+
+
 async def initialize_tts_service(session_id: str) -> StreamTTSService:
     """TTS 서비스 초기화"""
     async def on_audio_chunk(audio_chunk_b64: str):
@@ -128,7 +142,8 @@ async def initialize_tts_service(session_id: str) -> StreamTTSService:
         session_id=session_id,
         on_audio_chunk=on_audio_chunk,
         on_stream_complete=on_stream_complete,
-        on_error=on_error
+        on_error=on_error,
+        labels_provider=lambda: session_metric_labels(session_id)
     )
 
 
@@ -146,6 +161,7 @@ async def initialize_stt_service(
     
     async def on_final_result(transcript: str):
         trimmed = transcript.strip()
+        utterance_started_ns = stt_service.pop_utterance_started_ns()
         await manager.send_json_to_client(session_id, {
             "type": "stt_final_result", 
             "transcript": trimmed
@@ -153,7 +169,8 @@ async def initialize_stt_service(
         
         if trimmed:
             await process_input_through_agent(
-                session_id, trimmed, tts_service, "voice", websocket
+                session_id, trimmed, tts_service, "voice", websocket,
+                utterance_started_ns=utterance_started_ns
             )
         else:
             await handle_empty_stt_result(session_id, tts_service)
@@ -169,13 +186,15 @@ async def initialize_stt_service(
             "type": "epd_detected"
         })
     
-    return StreamSTTService(
+    stt_service = StreamSTTService(
         session_id=session_id,
         on_interim_result=on_interim_result,
         on_final_result=on_final_result,
         on_error=on_error,
-        on_epd_detected=on_epd_detected
+        on_epd_detected=on_epd_detected,
+        labels_provider=lambda: session_metric_labels(session_id)
     )
+    return stt_service
 
 
 async def handle_websocket_messages(
@@ -189,26 +208,26 @@ async def handle_websocket_messages(
         try:
             # WebSocket 상태 확인
             if websocket.client_state != WebSocketState.CONNECTED:
-                print(f"WebSocket not connected for session {session_id}, exiting message loop")
+                logger.info("WebSocket not connected for session %s, exiting message loop", session_id)
                 break
                 
             data = await websocket.receive()
             
             # 연결이 끊어진 경우 처리
             if "type" in data and data["type"] == "websocket.disconnect":
-                print(f"Received disconnect message for session {session_id}")
+                logger.info("Received disconnect message for session %s", session_id)
                 break
                 
         except WebSocketDisconnect:
-            print(f"WebSocket disconnected normally for session {session_id}")
+            logger.info("WebSocket disconnected normally for session %s", session_id)
             break
         except Exception as e:
             # "Cannot call receive" 에러는 무시하고 종료
             if "Cannot call" in str(e) and "receive" in str(e):
-                print(f"WebSocket already closed for session {session_id}")
+                logger.info("WebSocket already closed for session %s", session_id)
                 break
             else:
-                print(f"Error receiving WebSocket message for {session_id}: {e}")
+                logger.error("Error receiving WebSocket message for %s: %s", session_id, e)
                 raise
         
         # 메시지 타입 파싱
@@ -229,6 +248,8 @@ async def handle_websocket_messages(
             await handle_user_choice_selection(session_id, payload, tts_service, websocket)
         elif message_type == "user_boolean_selection":
             await handle_user_boolean_selection(session_id, payload, tts_service, websocket)
+        elif message_type == RESYNC_REQUEST_TYPE:
+            await handle_slot_filling_resync(session_id, payload, websocket)
 
 
 def parse_websocket_message(data: dict) -> tuple[str, Any]:
@@ -269,7 +290,7 @@ async def handle_voice_activation(
 ) -> None:
     """음성 인식 활성화"""
     if stt_service and GOOGLE_SERVICES_AVAILABLE:
-        print(f"[{session_id}] Activating voice")
+        logger.info("[%s] Activating voice", session_id)
         await stt_service.start_stream()
         await manager.send_json_to_client(session_id, {"type": "voice_activated"})
     else:
@@ -285,7 +306,7 @@ async def handle_voice_deactivation(
 ) -> None:
     """음성 인식 비활성화"""
     if stt_service and GOOGLE_SERVICES_AVAILABLE:
-        print(f"[{session_id}] Deactivating voice")
+        logger.info("[%s] Deactivating voice", session_id)
         await stt_service.stop_stream()
         await manager.send_json_to_client(session_id, {"type": "voice_deactivated"})
 
@@ -296,7 +317,7 @@ async def handle_tts_stop(
 ) -> None:
     """TTS 중지"""
     if tts_service and GOOGLE_SERVICES_AVAILABLE:
-        print(f"[{session_id}] Stopping TTS")
+        logger.info("[%s] Stopping TTS", session_id)
         if session_id in SESSION_STATES:
             SESSION_STATES[session_id]['tts_cancelled'] = True
         await tts_service.stop_tts_stream()
@@ -329,7 +350,7 @@ async def handle_user_choice_selection(
         })
         return
     
-    print(f"[{session_id}] User choice selection: {stage_id} -> {choice}")
+    logger.info("[%s] User choice selection: %s -> %s", session_id, stage_id, choice)
     
     # Choice selection의 경우, Entity Agent를 거치지 않고 정확한 값을 그대로 사용
     # input_mode를 "choice_exact"로 설정하여 구분
@@ -338,6 +359,17 @@ async def handle_user_choice_selection(
     )
 
 
+async def handle_slot_filling_resync(
+    session_id: str,
+    payload: dict,
+    websocket: WebSocket
+) -> None:
+    """클라이언트 요청 시 슬롯 필링 전체 상태 재전송 (델타 시퀀스 불일치 등)"""
+    logger.info("[%s] Slot filling resync requested (client seq: %s)", session_id, payload.get('seq'))
+    if session_id in SESSION_STATES:
+        await send_slot_filling_update(websocket, SESSION_STATES[session_id], session_id, force_full=True)
+
+
 async def handle_user_boolean_selection(
     session_id: str,
     payload: dict,
@@ -355,7 +387,7 @@ async def handle_user_boolean_selection(
         })
         return
     
-    print(f"[{session_id}] User boolean selection: {stage_id} -> {selections}")
+    logger.info("[%s] User boolean selection: %s -> %s", session_id, stage_id, selections)
     
     # 불린 선택을 문자열로 변환하여 에이전트로 전달
     selection_text = ", ".join([
@@ -370,11 +402,11 @@ async def handle_user_boolean_selection(
         # boolean 선택 항목들을 직접 저장
         for key, value in selections.items():
             collected_info[key] = value
-            print(f"[{session_id}] Saving boolean field '{key}' = {value}")
+            logger.debug("[%s] Saving boolean field '%s'", session_id, key)
         current_state["collected_product_info"] = collected_info
         SESSION_STATES[session_id] = current_state
-        print(f"[{session_id}] Boolean selections directly saved to collected_product_info: {selections}")
-        print(f"[{session_id}] Updated collected_product_info: {collected_info}")
+        logger.info("[%s] Boolean selections directly saved to collected_product_info: %s", session_id, sorted(selections))
+        logger.debug("[%s] Updated collected_product_info keys: %s", session_id, sorted(collected_info))
     
     await process_input_through_agent(
         session_id, selection_text, tts_service, "boolean", websocket
@@ -386,7 +418,7 @@ async def handle_empty_stt_result(
     tts_service: Optional[StreamTTSService]
 ) -> None:
     """빈 STT 결과 처리"""
-    print(f"[{session_id}] Empty STT result")
+    logger.info("[%s] Empty STT result", session_id)
     reprompt = "죄송합니다, 잘 이해하지 못했어요. 다시 한번 말씀해주시겠어요?"
     
     await manager.send_json_to_client(session_id, {
@@ -406,17 +438,37 @@ async def handle_empty_stt_result(
 
 
 async def process_input_through_agent(
+    session_id: str,
+    user_text: str,
+    tts_service: Optional[StreamTTSService],
+    input_mode: str,
+    websocket: WebSocket,
+    utterance_started_ns: Optional[int] = None
+) -> None:
+    """
+    에이전트를 통한 입력 처리 - 턴마다 루트 span (voice_turn)
+    - utterance_started_ns: 음성 입력의 발화 시작 시각 (있으면 STT 구간부터 턴 트레이스에 포함)
+    """
+    turn_number = SESSION_TURN_COUNTS.get(session_id, 0) + 1
+    SESSION_TURN_COUNTS[session_id] = turn_number
+    with turn_span(session_id, turn_number, input_mode, utterance_started_ns):
+        if utterance_started_ns:
+            record_span("stt.recognize", utterance_started_ns)
+        await _process_turn(session_id, user_text, tts_service, input_mode, websocket)
+
+
+async def _process_turn(
     session_id: str,
     user_text: str,
     tts_service: Optional[StreamTTSService],
     input_mode: str,
     websocket: WebSocket
 ) -> None:
-    """에이전트를 통한 입력 처리"""
+    """에이전트 실행 → 슬롯 필링 업데이트 → TTS"""
     
     current_state = SESSION_STATES.get(session_id)
     if not current_state:
-        print(f"[{session_id}] Session state not found")
+        logger.warning("[%s] Session state not found", session_id)
         await manager.send_json_to_client(session_id, {
             "type": "error", 
             "message": "세션 정보를 찾을 수 없습니다."
@@ -435,7 +487,7 @@ async def process_input_through_agent(
     # deep copy를 사용하여 previous_state 생성
     previous_state = {
         "collected_product_info": copy.deepcopy(current_state.get("collected_product_info", {})),
-        "scenario_data": current_state.get("active_scenario_data"),
+        "scenario_ref": current_state.get("active_scenario_ref"),
         "product_type": product_type,
         "current_scenario_stage_id": current_state.get("current_scenario_stage_id", "")
     }
@@ -445,7 +497,7 @@ async def process_input_through_agent(
         if input_mode == "choice_exact":
             # 현재 stage 정보 가져오기
             current_stage_id = current_state.get("current_scenario_stage_id")
-            scenario_data = current_state.get("active_scenario_data")
+            scenario_data = get_active_scenario_data(current_state)
             
             if scenario_data and current_stage_id:
                 # 직접 collected_product_info에 저장
@@ -462,7 +514,7 @@ async def process_input_through_agent(
                     collected_info[expected_info_key] = user_text
                     current_state["collected_product_info"] = collected_info
                     SESSION_STATES[session_id] = current_state
-                    print(f"[{session_id}] Choice selection directly saved: {expected_info_key} = {user_text}")
+                    logger.debug("[%s] Choice selection directly saved: %s = %s", session_id, expected_info_key, user_text)
         
         # 에이전트 출력 처리
         async for chunk in get_agent_generator(
@@ -500,14 +552,10 @@ async def process_input_through_agent(
             if stream_ended and chunk.get("type") == "error":
                 break
         
-        # 디버그 로그 종료 - collected_info 출력
-        final_collected_info = current_state.get("collected_product_info", {}) if current_state else {}
-        if final_collected_info:
-            for key, value in final_collected_info.items():
-                print(f"[{session_id}]   - {key}: {value}")
-        else:
-            print(f"[{session_id}]   (No data collected)")
-        print(f"{'='*60}\n")
+        # 디버그 로그 - collected_info 키만 출력 (값은 개인정보이므로 로그에 남기지 않음)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[%s] collected_info keys: %s", session_id,
+                         sorted(current_state.get("collected_product_info", {})) if current_state else [])
         
         # TTS 처리
         await process_tts_for_response(
@@ -516,15 +564,9 @@ async def process_input_through_agent(
         )
         
     except Exception as e:
-        print(f"[{session_id}] Agent processing error: {e}")
-        # 에러 상황에서도 collected_info 출력
-        error_collected_info = current_state.get("collected_product_info", {}) if current_state else {}
-        if error_collected_info:
-            for key, value in error_collected_info.items():
-                print(f"[{session_id}]   - {key}: {value}")
-        else:
-            print(f"[{session_id}]   (No data collected)")
-        print(f"{'='*60}\n")
+        # 에러 상황에서는 collected_info를 함께 기록 (PII는 출력 핸들러에서 마스킹)
+        logger.error("[%s] Agent processing error: %s (collected_info: %s)", session_id, e,
+                     current_state.get("collected_product_info", {}) if current_state else {})
         # WebSocket이 이미 닫혔을 수 있으므로 에러 메시지 전송을 시도하지 않음
         try:
             if session_id in manager.active_connections:
@@ -548,23 +590,34 @@ async def cleanup_session(
             try:
                 await stt_service.stop_stream()
             except Exception as e:
-                print(f"Error stopping STT service for {session_id}: {e}")
+                logger.error("Error stopping STT service for %s: %s", session_id, e)
         
         if tts_service:
             try:
                 await tts_service.stop_tts_stream()
             except Exception as e:
-                print(f"Error stopping TTS service for {session_id}: {e}")
+                logger.error("Error stopping TTS service for %s: %s", session_id, e)
         
         # WebSocket 연결 해제
         manager.disconnect(session_id)
         
+        # 대화 요약 상태 정리
+        history_manager.clear_session(session_id)
+        
+        # 슬롯 필링 동기화 상태 정리
+        slot_filling_sync.clear_session(session_id)
+        
+        SESSION_TURN_COUNTS.pop(session_id, None)
+
+        # 세션이 고정한 시나리오 버전 해제
+        scenario_registry.release(session_id)
+
         # 세션 상태 삭제
         if session_id in SESSION_STATES:
             del SESSION_STATES[session_id]
-            print(f"Session cleaned up: {session_id}")
+            logger.info("Session cleaned up: %s", session_id)
     except Exception as e:
-        print(f"Error during cleanup for session {session_id}: {e}")
+        logger.error("Error during cleanup for session %s: %s", session_id, e)
 
 
 @router.websocket("/ws/{session_id}")
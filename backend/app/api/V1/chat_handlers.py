@@ -7,9 +7,11 @@ from typing import Optional, Dict, Any, AsyncGenerator
 from langchain_core.messages import HumanMessage, AIMessage
 # from ...graph.unified_agent_integration import process_with_unified_agent
 from ...graph.agent import run_agent_streaming
+from ...graph.utils import get_active_scenario_data
 from ...services.google_services import StreamTTSService
 from ...utils import split_into_sentences
 from ...services.google_services import GOOGLE_SERVICES_AVAILABLE
+from ...core.tracing import start_span
 from .websocket_manager import manager
 
 
@@ -120,10 +122,10 @@ async def handle_slot_filling_update(
     
     # 업데이트 필요 조건 확인
     info_changed = previous_state.get("collected_product_info", {}) != current_collected_info
-    scenario_changed = previous_state.get("scenario_data") != current_state.get("active_scenario_data")
+    scenario_changed = previous_state.get("scenario_ref") != current_state.get("active_scenario_ref")
     product_type_changed = previous_state.get("product_type") != current_state.get("current_product_type")
     stage_changed = previous_state.get("current_scenario_stage_id") != current_scenario_stage
-    scenario_active = current_state.get("active_scenario_data") is not None
+    scenario_active = get_active_scenario_data(current_state) is not None
     is_info_collection_stage = (current_scenario_stage in info_collection_stages or 
                                current_state.get("current_product_type") == "deposit_account")
     
@@ -164,7 +166,9 @@ async def process_tts_for_response(
             sentence_strip = sentence.strip()
             if sentence_strip:
                 print(f"[{session_id}] TTS sentence {i+1}/{len(sentences)}")
-                await tts_service.start_tts_stream(sentence_strip)
+                # 합성 태스크는 이 span 안에서 생성되어 자식으로 이어짐
+                with start_span("tts.sentence", **{"tts.index": i, "tts.chars": len(sentence_strip)}):
+                    await tts_service.start_tts_stream(sentence_strip)
 
 
 async def get_agent_generator(
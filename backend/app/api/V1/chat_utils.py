@@ -3,128 +3,55 @@
 """
 
 import json
+import logging
 import re
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from starlette.websockets import WebSocketState
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
 from ...graph.state import AgentState
+from ...graph.utils import get_active_scenario_data
+from ...graph.scenario_registry import FrozenList
+from ...graph.show_when import FieldDependencyGraph, compile_show_when, get_field_graph
 from ...data.slot_filling_groups import get_groups_for_product, get_group_id_for_stage
 from ...data.deposit_account_fields import get_deposit_account_fields, convert_korean_keys_to_english
+from .slot_filling_sync import slot_filling_sync
 
+logger = logging.getLogger(__name__)
 
-# ===== 새로운 조건 평가 엔진 (심플 구조) =====
-
-def normalize_bool_value(value):
-    """다양한 타입의 값을 boolean으로 정규화"""
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, str):
-        # True로 처리할 값들
-        if value.lower() in ['true', '1', 'yes', 'y', '네', '예', '신청', '가입', '필요', '할게요']:
-            return True
-        # False로 처리할 값들
-        elif value.lower() in ['false', '0', 'no', 'n', '아니요', '아니오', '미신청', '미가입', '안해요', '필요없어요']:
-            return False
-    if isinstance(value, (int, float)):
-        return bool(value)
-    return False
+# ===== 조건 평가 엔진 (컴파일된 show_when, graph/show_when.py) =====
 
 def evaluate_show_when(show_when: str, collected_info: Dict[str, Any]) -> bool:
-    """간단한 표현식으로 조건 평가
-    
+    """show_when 조건 평가 - 조건식은 최초 1회 컴파일 후 캐시된 클로저로 평가
+
     지원하는 표현식:
     - field == value
     - field != null  
     - condition1 && condition2
     - condition1 || condition2
+    - (condition), !condition  (&&가 ||보다 우선)
     """
-    if not show_when or not show_when.strip():
-        return True
-    
-    try:
-        expression = show_when.strip()
-        
-        # && 및 || 연산자로 분리
-        if '&&' in expression:
-            conditions = [cond.strip() for cond in expression.split('&&')]
-            return all(evaluate_single_condition(cond, collected_info) for cond in conditions)
-        elif '||' in expression:
-            conditions = [cond.strip() for cond in expression.split('||')]
-            return any(evaluate_single_condition(cond, collected_info) for cond in conditions)
-        else:
-            return evaluate_single_condition(expression, collected_info)
-    
-    except Exception as e:
-        print(f"Error evaluating show_when expression '{show_when}': {e}")
-        return True  # 에러 시 기본적으로 표시
+    return compile_show_when(show_when)(collected_info)
 
 
 def evaluate_single_condition(condition: str, collected_info: Dict[str, Any]) -> bool:
-    """단일 조건 평가"""
-    condition = condition.strip()
-    
-    # field != null 패턴
-    if ' != null' in condition:
-        field_name = condition.replace(' != null', '').strip()
-        value = collected_info.get(field_name)
-        result = value is not None and value != '' and value != False
-        return result
-    
-    # field == null 패턴  
-    if ' == null' in condition:
-        field_name = condition.replace(' == null', '').strip()
-        value = collected_info.get(field_name)
-        result = value is None or value == '' or value == False
-        return result
-    
-    # field == value 패턴
-    if ' == ' in condition:
-        parts = condition.split(' == ', 1)
-        if len(parts) == 2:
-            field_name = parts[0].strip()
-            expected_value = parts[1].strip().strip("'\"")
-            current_value = collected_info.get(field_name)
-            
-            # boolean 값 처리 - 통합된 정규화 함수 사용
-            if expected_value.lower() == 'true':
-                result = normalize_bool_value(current_value) is True
-            elif expected_value.lower() == 'false':
-                result = normalize_bool_value(current_value) is False
-            else:
-                # 문자열 비교에서도 정규화된 비교 수행
-                if isinstance(current_value, bool):
-                    current_str = 'true' if current_value else 'false'
-                else:
-                    current_str = str(current_value) if current_value is not None else ''
-                result = current_str == expected_value
-            
-            return result
-    
-    # field != value 패턴
-    if ' != ' in condition:
-        parts = condition.split(' != ', 1)
-        if len(parts) == 2:
-            field_name = parts[0].strip()
-            expected_value = parts[1].strip().strip("'\"")
-            current_value = collected_info.get(field_name)
-            
-            # boolean 값 처리 - 통합된 정규화 함수 사용
-            if expected_value.lower() == 'true':
-                result = normalize_bool_value(current_value) is not True
-            elif expected_value.lower() == 'false':
-                result = normalize_bool_value(current_value) is not False
-            else:
-                # 문자열 비교에서도 정규화된 비교 수행
-                if isinstance(current_value, bool):
-                    current_str = 'true' if current_value else 'false'
-                else:
-                    current_str = str(current_value) if current_value is not None else ''
-                result = current_str != expected_value
-            
-            return result
-    
-    return True
+    """단일 조건 평가 (이전 버전 호환성 위해 유지)"""
+    return compile_show_when(condition)(collected_info)
+
+
+# 필드 목록이 없는 시나리오용 (호출마다 새 빈 목록으로 그래프 캐시 항목이 생기지 않도록 모듈 상수)
+_NO_FIELDS: tuple = ()
+
+
+def _field_graph(fields) -> FieldDependencyGraph:
+    """
+    필드 목록의 의존성 그래프
+    - 게시된 시나리오의 (동결된) 목록 / 모듈 상수 목록: 캐시된 그래프 (컴파일된 시나리오의 field_graph와 공유)
+    - 그 외 호출 측이 새로 만든 목록: 캐시하지 않고 이번 호출용으로만 생성
+    """
+    if isinstance(fields, FrozenList) or fields is _NO_FIELDS or fields is get_deposit_account_fields():
+        return get_field_graph(fields)
+    return FieldDependencyGraph(fields)
 
 
 def get_contextual_visible_fields(scenario_data: Dict, collected_info: Dict, current_stage: str) -> List[Dict]:
@@ -135,26 +62,19 @@ def get_contextual_visible_fields(scenario_data: Dict, collected_info: Dict, cur
     # deposit_account의 경우 하드코딩된 필드 사용
     if scenario_data.get("scenario_id") == "deposit_account_concurrent" or scenario_data.get("product_type") == "deposit_account":
         required_fields = get_deposit_account_fields()
-        print(f"[get_contextual_visible_fields] Using {len(required_fields)} deposit_account fields")
+        logger.debug("[get_contextual_visible_fields] Using %s deposit_account fields", len(required_fields))
     else:
-        required_fields = scenario_data.get("required_info_fields", [])
+        required_fields = scenario_data.get("required_info_fields") or _NO_FIELDS
     
     visible_fields = []
     
-    # 간소화된 로직: 시나리오 JSON의 show_when 조건과 수집된 정보만 기반으로 필드 표시
-    for field in required_fields:
-        field_key = field.get("key")
-        show_when = field.get("show_when")
-        
-        # show_when 조건 확인
-        if show_when:
-            is_visible = evaluate_show_when(show_when, collected_info)
-            if not is_visible:
-                continue
-        
+    # 시나리오 JSON의 show_when 조건과 수집된 정보만 기반으로 필드 표시
+    # 의존성 그래프가 직전 평가 대비 바뀐 키에 의존하는 필드만 재평가, depth는 미리 계산됨
+    field_graph = _field_graph(required_fields)
+    for field, depth in field_graph.visible_fields(collected_info):
         # 계층 정보 추가
         field_with_hierarchy = field.copy()
-        field_with_hierarchy["depth"] = calculate_field_depth(field, required_fields)
+        field_with_hierarchy["depth"] = depth
         field_with_hierarchy["is_visible"] = True
         
         visible_fields.append(field_with_hierarchy)
@@ -168,17 +88,10 @@ def get_visible_fields_with_hierarchy(scenario_data: Dict, collected_info: Dict)
 
 
 def calculate_field_depth(field: Dict, all_fields: List[Dict]) -> int:
-    """필드의 계층 깊이 계산"""
-    parent_field = field.get("parent_field")
-    if not parent_field:
+    """필드의 계층 깊이 계산 (의존성 그래프에 미리 계산된 값 사용)"""
+    if not field.get("parent_field"):
         return 0
-    
-    # 부모 필드 찾기
-    for parent in all_fields:
-        if parent.get("key") == parent_field:
-            return calculate_field_depth(parent, all_fields) + 1
-    
-    return 0
+    return _field_graph(all_fields).depth_of(field.get("key"))
 
 
 def apply_conditional_defaults(scenario_data: Dict, collected_info: Dict) -> Dict:
@@ -199,7 +112,7 @@ def apply_conditional_defaults(scenario_data: Dict, collected_info: Dict) -> Dic
         show_when = field.get("show_when")
         if show_when:
             # 조건이 만족되어도 default 값 자동 설정 비활성화
-            if evaluate_show_when(show_when, enhanced_info) and "default" in field:
+            if compile_show_when(show_when)(enhanced_info) and "default" in field:
                 # enhanced_info[field_key] = field["default"]
                 # print(f"Applied conditional default: {field_key} = {field['default']}")
                 pass
@@ -227,7 +140,7 @@ def update_slot_filling_with_hierarchy(scenario_data: Dict, collected_info: Dict
     if scenario_data.get("scenario_id") == "deposit_account_concurrent" or scenario_data.get("product_type") == "deposit_account":
         from ...data.deposit_account_fields import get_deposit_account_fields
         visible_fields = get_deposit_account_fields()
-        print(f"[SLOT_FILLING] Using all deposit account fields: {len(visible_fields)} fields")
+        logger.debug("[SLOT_FILLING] Using all deposit account fields: %s fields", len(visible_fields))
     else:
         # 현재 단계에 맞는 필드들만 가져오기 - 점진적 공개
         visible_fields = get_contextual_visible_fields(scenario_data, collected_info, current_stage)
@@ -256,7 +169,7 @@ def update_slot_filling_with_hierarchy(scenario_data: Dict, collected_info: Dict
     # 완료 상태 계산 (모든 필드, 표시되지 않는 필드도 포함)
     if scenario_data.get("scenario_id") == "deposit_account_concurrent" or scenario_data.get("product_type") == "deposit_account":
         all_fields = get_deposit_account_fields()
-        print(f"[update_slot_filling_with_hierarchy] Using deposit_account all_fields: {len(all_fields)}")
+        logger.debug("[update_slot_filling_with_hierarchy] Using deposit_account all_fields: %s", len(all_fields))
     else:
         all_fields = scenario_data.get("required_info_fields", [])
     
@@ -378,7 +291,7 @@ def update_slot_filling_with_hierarchy(scenario_data: Dict, collected_info: Dict
     
     # visible_fields가 dict 리스트가 아닌 경우 변환
     formatted_visible_fields = []
-    print(f"[update_slot_filling_with_hierarchy] visible_fields count: {len(visible_fields)}")
+    logger.debug("[update_slot_filling_with_hierarchy] visible_fields count: %s", len(visible_fields))
     for field in visible_fields:
         if isinstance(field, dict):
             # depth가 없으면 추가
@@ -399,7 +312,7 @@ def update_slot_filling_with_hierarchy(scenario_data: Dict, collected_info: Dict
                 "unit": field.get("unit", ""),
                 "depth": 0  # 기본 depth
             })
-    print(f"[update_slot_filling_with_hierarchy] formatted_visible_fields count: {len(formatted_visible_fields)}")
+    logger.debug("[update_slot_filling_with_hierarchy] formatted_visible_fields count: %s", len(formatted_visible_fields))
     
     return {
         "visible_fields": formatted_visible_fields,
@@ -433,24 +346,64 @@ def should_send_slot_filling_update(
     )
 
 
+async def _send_slot_filling_message(
+    websocket: Any,
+    session_id: str,
+    slot_filling_data: Dict[str, Any],
+    state: AgentState,
+    force_full: bool = False
+) -> bool:
+    """슬롯 필링 payload를 전체 상태 또는 델타로 인코딩하여 전송 (변경 없으면 전송 생략)"""
+    if websocket.client_state != WebSocketState.CONNECTED:
+        logger.debug("[%s] WebSocket not connected, skipping slot filling update", session_id)
+        slot_filling_sync.invalidate(session_id)
+        return False
+    
+    message = slot_filling_sync.encode(session_id, slot_filling_data, state, force_full=force_full)
+    if message is None:
+        logger.debug("[%s] Slot filling unchanged, nothing to send", session_id)
+        return False
+    
+    try:
+        await websocket.send_json(message)
+    except Exception:
+        # 클라이언트가 어느 시퀀스까지 받았는지 알 수 없으므로 다음에는 전체 상태 전송
+        slot_filling_sync.invalidate(session_id)
+        raise
+    
+    if message["type"] == "slot_filling_delta":
+        logger.debug("[%s] ✅ SLOT_FILLING_DELTA SENT (seq=%s, ops=%s)", session_id, message['seq'], len(message['ops']))
+    else:
+        logger.debug("[%s] ✅ SLOT_FILLING_UPDATE SENT (full, seq=%s)", session_id, message['seq'])
+    return True
+
+
 async def send_slot_filling_update(
     websocket: Any,
     state: AgentState,
-    session_id: str
+    session_id: str,
+    force_full: bool = False
 ) -> None:
-    """슬롯 필링 상태 업데이트를 WebSocket으로 전송"""
+    """슬롯 필링 상태 업데이트를 WebSocket으로 전송
     
-    print(f"[{session_id}] 🔄 SEND_SLOT_FILLING_UPDATE CALLED")
-    print(f"[{session_id}] Current product type: {state.get('current_product_type')}")
-    print(f"[{session_id}] Current stage: {state.get('current_scenario_stage_id')}")
+    - 직전 전송 이후 입력(제품/시나리오/단계/수집 정보)이 그대로면 재계산 없이 종료
+    - 변경분만 slot_filling_delta로 전송, force_full이면 전체 상태(slot_filling_update) 재전송
+    """
+    
+    logger.debug("[%s] 🔄 SEND_SLOT_FILLING_UPDATE CALLED", session_id)
+    if not force_full and not slot_filling_sync.inputs_changed(session_id, state):
+        logger.debug("[%s] Slot filling inputs unchanged, skipping recomputation", session_id)
+        return
+    logger.debug("[%s] Current product type: %s", session_id, state.get('current_product_type'))
+    logger.debug("[%s] Current stage: %s", session_id, state.get('current_scenario_stage_id'))
     
     # 시나리오 데이터 확인
-    scenario_data = state.get("active_scenario_data")
+    scenario_data = get_active_scenario_data(state)
     if not scenario_data:
-        print(f"[{session_id}] No active scenario data")
+        logger.debug("[%s] No active scenario data", session_id)
         # deposit_account의 경우 기본 시나리오 데이터 생성
         if state.get("current_product_type") == "deposit_account":
-            await _send_deposit_account_update(websocket, state, session_id)
+            await _send_deposit_account_update(websocket, state, session_id, force_full)
         return
     
     try:
@@ -458,21 +411,21 @@ async def send_slot_filling_update(
         product_type = state.get("current_product_type", "")
         scenario_id = scenario_data.get("scenario_id", "")
         
-        print(f"[{session_id}] DEBUG - product_type: {product_type}, scenario_id: {scenario_id}")
+        logger.debug("[%s] DEBUG - product_type: %s, scenario_id: %s", session_id, product_type, scenario_id)
         
         # deposit_account의 경우 무조건 하드코딩된 필드 정의 사용
         if product_type == "deposit_account" or scenario_id == "deposit_account_concurrent":
             required_fields = get_deposit_account_fields()
-            print(f"[{session_id}] ✅ USING DEPOSIT_ACCOUNT_FIELDS.PY - Loaded {len(required_fields)} deposit_account fields")
+            logger.debug("[%s] ✅ USING DEPOSIT_ACCOUNT_FIELDS.PY - Loaded %s deposit_account fields", session_id, len(required_fields))
             # 필드 키 리스트 출력
             field_keys = [f.get("key", "") for f in required_fields]
-            print(f"[{session_id}] Field keys: {field_keys}")
+            logger.debug("[%s] Field keys: %s", session_id, field_keys)
         else:
             # 다른 시나리오의 경우 기존 방식 사용
             required_fields = scenario_data.get("required_info_fields", [])
             if not required_fields:
                 required_fields = scenario_data.get("slot_fields", [])
-            print(f"[{session_id}] Using scenario fields: {len(required_fields)} fields")
+            logger.debug("[%s] Using scenario fields: %s fields", session_id, len(required_fields))
         
         # 새로운 그룹 정의 사용 (우선순위: slot_filling_groups.py > 시나리오 파일)
         predefined_groups = get_groups_for_product(product_type)
@@ -482,10 +435,10 @@ async def send_slot_filling_update(
         # deposit_account의 경우 한글 키를 영문 키로 변환
         if product_type == "deposit_account":
             collected_info = convert_korean_keys_to_english(collected_info)
-            print(f"[SLOT_FILLING] Converted collected_info keys: {list(collected_info.keys())}")
+            logger.debug("[SLOT_FILLING] Converted collected_info keys: %s", list(collected_info.keys()))
             # statement_delivery_date 디버그
             if "statement_delivery_date" in collected_info:
-                print(f"🔥 [SLOT_FILLING_DEBUG] statement_delivery_date value: {collected_info['statement_delivery_date']}")
+                logger.debug("🔥 [SLOT_FILLING_DEBUG] statement_delivery_date collected")
         
         current_stage = state.get("current_scenario_stage_id", "")
         
@@ -493,34 +446,6 @@ async def send_slot_filling_update(
         if "card_receive_method" in collected_info:
             pass
         
-        # 각 필드의 수집 상태 확인
-        fields_status = []
-        for field in required_fields:
-            field_key = field.get("key", "")
-            field_status = {
-                "key": field_key,
-                "display_name": field.get("display_name", field_key),
-                "value": collected_info.get(field_key, ""),
-                "is_collected": field_key in collected_info,
-                "is_required": field.get("required", True)
-            }
-            fields_status.append(field_status)
-        
-        # 그룹별 진행률 계산
-        groups_status = []
-        for group in field_groups:
-            group_fields = group.get("fields", [])
-            collected_count = sum(1 for field in group_fields if field in collected_info)
-            total_count = len(group_fields)
-            
-            groups_status.append({
-                "id": group.get("id", ""),
-                "name": group.get("name", ""),
-                "progress": (collected_count / total_count * 100) if total_count > 0 else 0,
-                "collected": collected_count,
-                "total": total_count
-            })
-        
         # 서비스 선택에 따른 진행률 계산
         services_selected = collected_info.get("services_selected", "all")
         
@@ -547,15 +472,8 @@ async def send_slot_filling_update(
         
         # 서비스 선택에 따라 그룹 필터링
         services_selected = collected_info.get("services_selected", "all")
-        allowed_groups = ["basic_info"]  # 기본정보는 항상 포함
-        
-        if services_selected == "all":
-            allowed_groups.extend(["electronic_banking", "check_card"])
-        elif services_selected == "mobile_only":
-            allowed_groups.append("electronic_banking")
-        elif services_selected == "card_only":
-            allowed_groups.append("check_card")
-        # account_only는 basic_info만
+        # 기본정보는 항상 포함, account_only는 basic_info만
+        allowed_groups = SERVICE_GROUPS.get(services_selected, SERVICE_GROUPS["account_only"])
         
         # 이미 수집된 정보가 있는 그룹도 추가 (allowed_groups 내에서만)
         for group in field_groups:
@@ -582,23 +500,23 @@ async def send_slot_filling_update(
             else:
                 pass
         except Exception as e:
-            print(f"[{session_id}] ❌ Error in update_slot_filling_with_hierarchy: {e}")
+            logger.error("[%s] ❌ Error in update_slot_filling_with_hierarchy: %s", session_id, e)
             hierarchy_data = {}
         
         # deposit_account의 경우 모든 필드를 포함
         if product_type == "deposit_account" or scenario_id == "deposit_account_concurrent":
-            print(f"[{session_id}] ✅ CREATING ENHANCED FIELDS FOR DEPOSIT_ACCOUNT")
+            logger.debug("[%s] ✅ CREATING ENHANCED FIELDS FOR DEPOSIT_ACCOUNT", session_id)
             
             # services_selected에 따라 필드 필터링
             services_selected = collected_info.get("services_selected", "all")
-            print(f"[{session_id}] Services selected: {services_selected}")
+            logger.debug("[%s] Services selected: %s", session_id, services_selected)
             
             # hierarchy_data의 visible_fields가 있으면 사용, 없으면 required_fields 사용
             all_visible_fields = hierarchy_data.get("visible_fields") if hierarchy_data.get("visible_fields") else required_fields
             
             # 서비스 선택에 따라 필드 필터링
             fields_to_use = filter_fields_by_service(all_visible_fields, services_selected)
-            print(f"[{session_id}] Fields to use count after filtering: {len(fields_to_use)}")
+            logger.debug("[%s] Fields to use count after filtering: %s", session_id, len(fields_to_use))
             enhanced_fields = []
             for f in fields_to_use:
                 try:
@@ -619,7 +537,7 @@ async def send_slot_filling_update(
                     }
                     enhanced_fields.append(field_dict)
                 except Exception as field_error:
-                    print(f"[{session_id}] ❌ Error processing field {f.get('key', 'unknown')}: {field_error}")
+                    logger.error("[%s] ❌ Error processing field %s: %s", session_id, f.get('key', 'unknown'), field_error)
                     # 기본 필드 구조로 fallback
                     enhanced_fields.append({
                         "key": str(f.get("key", "")),
@@ -636,10 +554,10 @@ async def send_slot_filling_update(
                         "group": "",
                         "stage": ""
                     })
-            print(f"[{session_id}] ✅ Enhanced fields count: {len(enhanced_fields)}")
+            logger.debug("[%s] ✅ Enhanced fields count: %s", session_id, len(enhanced_fields))
             # 필드 키 샘플 출력
             sample_keys = [f["key"] for f in enhanced_fields[:5]]
-            print(f"[{session_id}] Sample field keys: {sample_keys}")
+            logger.debug("[%s] Sample field keys: %s", session_id, sample_keys)
         else:
             # 계층 정보가 있는 필드들 준비
             enhanced_fields = []
@@ -665,7 +583,7 @@ async def send_slot_filling_update(
                     }
                     enhanced_fields.append(field_dict)
                 except Exception as field_error:
-                    print(f"[{session_id}] ❌ Error processing other scenario field {f.get('key', 'unknown')}: {field_error}")
+                    logger.error("[%s] ❌ Error processing other scenario field %s: %s", session_id, f.get('key', 'unknown'), field_error)
                     # 기본 필드 구조로 fallback
                     enhanced_fields.append({
                         "key": str(f.get("key", "")),
@@ -717,33 +635,22 @@ async def send_slot_filling_update(
                 "serviceFieldCounts": calculate_required_fields_for_service(collected_info.get("services_selected", "all"))  # 서비스별 필드 개수
             }
         except Exception as e:
-            print(f"[{session_id}] ❌ Error creating slot_filling_data: {e}")
+            logger.error("[%s] ❌ Error creating slot_filling_data: %s", session_id, e)
             raise
         
-        # 디버그 로그 추가
-        
-        
         try:
-            # Check if websocket is still connected before sending
-            if websocket.client_state == WebSocketState.CONNECTED:
-                await websocket.send_json(slot_filling_data)
-                print(f"[{session_id}] ✅ SLOT_FILLING_UPDATE SENT SUCCESSFULLY")
-                print(f"[{session_id}] - Fields count: {len(enhanced_fields)}")
-            else:
-                print(f"[{session_id}] WebSocket not connected, skipping slot filling update")
-            print(f"[{session_id}] - Collected info keys: {list(collected_info.keys())}")
-            print(f"[{session_id}] - Visible groups: {visible_groups}")
-            
+            if await _send_slot_filling_message(websocket, session_id, slot_filling_data, state, force_full):
+                logger.debug("[%s] - Fields count: %s", session_id, len(enhanced_fields))
+            logger.debug("[%s] - Collected info keys: %s", session_id, list(collected_info.keys()))
+            logger.debug("[%s] - Visible groups: %s", session_id, visible_groups)
             
         except Exception as e:
-            print(f"[{session_id}] ❌ WEBSOCKET SEND FAILED: {e}")
-            print(f"[{session_id}] ❌ WebSocket state: {websocket.client_state if hasattr(websocket, 'client_state') else 'unknown'}")
+            logger.error("[%s] ❌ WEBSOCKET SEND FAILED: %s", session_id, e)
+            logger.error("[%s] ❌ WebSocket state: %s", session_id, websocket.client_state if hasattr(websocket, 'client_state') else 'unknown')
             raise
         
-        
-        
     except Exception as e:
-        print(f"[{session_id}] Error sending slot filling update: {e}")
+        logger.error("[%s] Error sending slot filling update: %s", session_id, e)
 
 
 def format_messages_for_display(messages: List[BaseMessage]) -> List[Dict[str, str]]:
@@ -762,7 +669,8 @@ def format_messages_for_display(messages: List[BaseMessage]) -> List[Dict[str, s
 async def _send_deposit_account_update(
     websocket: Any,
     state: AgentState,
-    session_id: str
+    session_id: str,
+    force_full: bool = False
 ) -> None:
     """입출금통장용 기본 슬롯 필링 업데이트"""
     try:
@@ -770,7 +678,7 @@ async def _send_deposit_account_update(
         current_stage = state.get("current_scenario_stage_id", "collect_basic")
         
         # 실제 시나리오 데이터에서 필드 가져오기
-        scenario_data = state.get("active_scenario_data")
+        scenario_data = get_active_scenario_data(state)
         
         if scenario_data and "required_info_fields" in scenario_data:
             default_fields = scenario_data["required_info_fields"]
@@ -803,39 +711,12 @@ async def _send_deposit_account_update(
                 }
             ]
         
-        # 그룹별 진행률 계산
-        groups_status = []
-        for group in field_groups:
-            group_fields = group["fields"]
-            collected_count = sum(1 for field in group_fields if field in collected_info)
-            total_count = len(group_fields)
-            
-            groups_status.append({
-                "id": group["id"],
-                "name": group["name"],
-                "progress": (collected_count / total_count * 100) if total_count > 0 else 0,
-                "collected": collected_count,
-                "total": total_count
-            })
-        
         # 전체 진행률 (필수 필드만)
         required_fields = [f for f in default_fields if f["required"]]
         total_required = len(required_fields)
         total_collected = sum(1 for f in required_fields if f["key"] in collected_info)
         overall_progress = (total_collected / total_required * 100) if total_required > 0 else 0
         
-        # 필드 상태
-        fields_status = []
-        for field in default_fields:
-            field_key = field["key"]
-            fields_status.append({
-                "key": field_key,
-                "display_name": field["display_name"],
-                "value": collected_info.get(field_key, ""),
-                "is_collected": field_key in collected_info,
-                "is_required": field["required"]
-            })
-        
         # 새로운 계층적 슬롯 필링 계산
         if scenario_data:
             hierarchy_data = update_slot_filling_with_hierarchy(scenario_data, collected_info, current_stage)
@@ -871,14 +752,11 @@ async def _send_deposit_account_update(
             } for group in field_groups] if field_groups else []
         }
         
-        if websocket.client_state == WebSocketState.CONNECTED:
-            await websocket.send_json(slot_filling_data)
-            print(f"[{session_id}] Deposit account slot filling update sent: {overall_progress:.1f}% complete")
-        else:
-            print(f"[{session_id}] WebSocket not connected, skipping deposit account update")
+        if await _send_slot_filling_message(websocket, session_id, slot_filling_data, state, force_full):
+            logger.debug("[%s] Deposit account slot filling update sent: %.1f%% complete", session_id, overall_progress)
         
     except Exception as e:
-        print(f"[{session_id}] Error sending deposit account slot filling update: {e}")
+        logger.error("[%s] Error sending deposit account slot filling update: %s", session_id, e)
 
 
 def get_choice_display_mappings(product_type: str) -> Dict[str, str]:
@@ -889,39 +767,31 @@ def get_choice_display_mappings(product_type: str) -> Dict[str, str]:
     return {}
 
 
+# 항상 포함되는 기본 정보 필드
+BASIC_INFO_FIELD_KEYS = frozenset(["name", "english_name", "ssn", "phone_number", "email", "address", "work_address"])
+
+# 서비스별 포함할 그룹 (기본정보는 항상 포함)
+SERVICE_GROUPS = {
+    "all": frozenset(["basic_info", "electronic_banking", "check_card"]),
+    "mobile_only": frozenset(["basic_info", "electronic_banking"]),  # 모바일 앱만: 기본정보 + 전자금융
+    "card_only": frozenset(["basic_info", "check_card"]),  # 체크카드만: 기본정보 + 체크카드
+    "account_only": frozenset(["basic_info"]),  # 입출금 계좌만: 기본정보만
+}
+
+
 def filter_fields_by_service(fields: List[Dict], services_selected: str) -> List[Dict]:
     """선택한 서비스에 따라 필드 필터링"""
     if not services_selected or services_selected == "all":
         # 모든 필드 반환
         return fields
     
-    # 항상 포함되는 기본 정보 필드
-    basic_info_keys = ["name", "english_name", "ssn", "phone_number", "email", "address", "work_address"]
-    
-    # 서비스별 포함할 그룹
-    groups_to_include = ["basic_info"]  # 기본정보는 항상 포함
-    
-    if services_selected == "mobile_only":
-        # 모바일 앱만: 기본정보 + 전자금융
-        groups_to_include.append("electronic_banking")
-    elif services_selected == "card_only":
-        # 체크카드만: 기본정보 + 체크카드
-        groups_to_include.append("check_card")
-    elif services_selected == "account_only":
-        # 입출금 계좌만: 기본정보만
-        pass  # 이미 basic_info가 포함됨
-    
-    # 필드 필터링
-    filtered_fields = []
-    for field in fields:
-        field_key = field.get("key", "")
-        field_group = field.get("group", "")
-        
-        # 기본정보 필드이거나 포함할 그룹에 속한 필드만 추가
-        if field_key in basic_info_keys or field_group in groups_to_include:
-            filtered_fields.append(field)
+    groups_to_include = SERVICE_GROUPS.get(services_selected, SERVICE_GROUPS["account_only"])
     
-    return filtered_fields
+    # 기본정보 필드이거나 포함할 그룹에 속한 필드만 추가
+    return [
+        field for field in fields
+        if field.get("key", "") in BASIC_INFO_FIELD_KEYS or field.get("group", "") in groups_to_include
+    ]
 
 
 def calculate_required_fields_for_service(services_selected: str) -> Dict[str, int]:
@@ -1041,8 +911,6 @@ def get_stage_visible_groups(scenario_data: Dict, stage_id: str, collected_info:
 
 def initialize_default_values(state: Dict[str, Any]) -> Dict[str, Any]:
     """시나리오 시작 시 default 값들을 collected_info에 설정 (조건부 필드 고려)"""
-    from ...graph.utils import get_active_scenario_data
-    
     scenario_data = get_active_scenario_data(state)
     collected_info = state.get("collected_product_info", {}).copy()
     
@@ -1055,7 +923,7 @@ def initialize_default_values(state: Dict[str, Any]) -> Dict[str, Any]:
     # customer_info_check 단계 이전에는 default 값을 설정하지 않음
     # (limit_account_guide 단계에서 정보가 노출되는 것을 방지)
     if current_stage in ["limit_account_guide", "limit_account_agreement", ""]:
-        print(f"Skipping default value initialization for stage: {current_stage}")
+        logger.debug("Skipping default value initialization for stage: %s", current_stage)
         return collected_info
     
     # 기본정보(customer_name, phone_number, address)만 default 값 설정
@@ -1073,6 +941,6 @@ def initialize_default_values(state: Dict[str, Any]) -> Dict[str, Any]:
         # default 값이 있으면 설정
         if "default" in field:
             collected_info[field_key] = field["default"]
-            print(f"Initialized default value: {field_key} = {field['default']}")
+            logger.debug("Initialized default value: %s = %s", field_key, field['default'])
     
     return collected_info
\ No newline at end of file
@@ -0,0 +1,144 @@
+"""
+슬롯 필링 상태 동기화 (버전 관리 + 델타 전송)
+- 세션별로 마지막으로 전송한 슬롯 필링 payload와 시퀀스 번호를 보관
+- 이후 업데이트는 변경된 경로만 JSON-patch 형태(add/replace/remove)로 전송
+- 클라이언트가 시퀀스 불일치 등으로 요청하면 전체 상태 재전송(resync)
+- 입력(제품/시나리오/단계/수집 정보)이 바뀌지 않았으면 재계산 자체를 건너뜀
+"""
+
+import copy
+import json
+from typing import Any, Dict, List, Optional
+
+
+FULL_MESSAGE_TYPE = "slot_filling_update"
+DELTA_MESSAGE_TYPE = "slot_filling_delta"
+RESYNC_REQUEST_TYPE = "slot_filling_resync"
+
+# 델타 연산 수가 이보다 많으면 전체 상태 전송
+MAX_DELTA_OPS = 200
+
+
+def _escape_pointer(key: Any) -> str:
+    """JSON Pointer(RFC 6901) 토큰 이스케이프"""
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def diff_json(before: Any, after: Any, path: str = "", ops: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+    """
+    두 JSON 값의 차이를 JSON-patch 연산 목록으로 계산
+    - dict는 키 단위로, 길이가 같은 list는 인덱스 단위로 재귀 비교
+    - 그 외(길이가 다른 list, 타입 변경, 스칼라)는 replace
+    """
+    if ops is None:
+        ops = []
+    if type(before) is type(after) and before == after:
+        return ops
+
+    if isinstance(before, dict) and isinstance(after, dict):
+        for key in before:
+            if key not in after:
+                ops.append({"op": "remove", "path": f"{path}/{_escape_pointer(key)}"})
+        for key, value in after.items():
+            child_path = f"{path}/{_escape_pointer(key)}"
+            if key not in before:
+                ops.append({"op": "add", "path": child_path, "value": value})
+            else:
+                diff_json(before[key], value, child_path, ops)
+        return ops
+
+    if isinstance(before, list) and isinstance(after, list) and len(before) == len(after):
+        for index, (old_item, new_item) in enumerate(zip(before, after)):
+            diff_json(old_item, new_item, f"{path}/{index}", ops)
+        return ops
+
+    ops.append({"op": "replace", "path": path, "value": after})
+    return ops
+
+
+class SlotFillingSession:
+    """세션별 슬롯 필링 동기화 상태"""
+    __slots__ = ("seq", "snapshot", "inputs")
+
+    def __init__(self):
+        self.seq = 0
+        self.snapshot: Optional[Dict[str, Any]] = None
+        self.inputs: Optional[tuple] = None
+
+
+class SlotFillingSyncManager:
+    """슬롯 필링 payload 버전 관리 및 델타 인코딩"""
+
+    def __init__(self):
+        self._sessions: Dict[str, SlotFillingSession] = {}
+
+    @staticmethod
+    def _inputs_of(state: Any) -> tuple:
+        collected_info = state.get("collected_product_info") or {}
+        return (
+            state.get("current_product_type"),
+            state.get("active_scenario_ref"),
+            state.get("current_scenario_stage_id"),
+            # 중첩된 값(dict/list)이 이후 제자리 수정되어도 스냅샷이 바뀌지 않도록 깊은 복사
+            copy.deepcopy(collected_info),
+        )
+
+    def inputs_changed(self, session_id: str, state: Any) -> bool:
+        """마지막 전송 이후 슬롯 필링 계산 입력이 바뀌었는지"""
+        session = self._sessions.get(session_id)
+        if session is None or session.snapshot is None:
+            return True
+        return session.inputs != self._inputs_of(state)
+
+    def encode(self, session_id: str, payload: Dict[str, Any], state: Any = None,
+               force_full: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        전송할 메시지 생성 (전송 전 호출, 내부 스냅샷 갱신)
+        - 첫 전송 / resync 요청 / 제품 변경 / 변경량 과다 → 전체 상태 (type: slot_filling_update)
+        - 그 외 → 델타 (type: slot_filling_delta)
+        - 변경 사항이 없으면 None
+        """
+        session = self._sessions.setdefault(session_id, SlotFillingSession())
+        # send_json과 동일한 직렬화를 거친 사본을 스냅샷으로 보관
+        normalized = json.loads(json.dumps(payload, ensure_ascii=False))
+        if state is not None:
+            session.inputs = self._inputs_of(state)
+
+        previous = session.snapshot
+        send_full = (
+            force_full
+            or previous is None
+            or previous.get("productType") != normalized.get("productType")
+        )
+        ops: List[Dict[str, Any]] = []
+        if not send_full:
+            ops = diff_json(previous, normalized)
+            if not ops:
+                return None
+            send_full = len(ops) > MAX_DELTA_OPS
+
+        session.seq += 1
+        session.snapshot = normalized
+        if send_full:
+            return {**normalized, "type": FULL_MESSAGE_TYPE, "seq": session.seq, "full": True}
+        return {
+            "type": DELTA_MESSAGE_TYPE,
+            "productType": normalized.get("productType"),
+            "seq": session.seq,
+            "baseSeq": session.seq - 1,
+            "ops": ops,
+        }
+
+    def invalidate(self, session_id: str) -> None:
+        """전송 실패 등으로 클라이언트 상태를 알 수 없을 때 - 다음 전송은 전체 상태"""
+        session = self._sessions.get(session_id)
+        if session is not None:
+            session.snapshot = None
+            session.inputs = None
+
+    def clear_session(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+
+
+# 전역 인스턴스
+slot_filling_sync = SlotFillingSyncManager()
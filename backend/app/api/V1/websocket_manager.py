@@ -6,6 +6,7 @@ import uuid
 from typing import Dict
 from fastapi import WebSocket, WebSocketException
 from starlette.websockets import WebSocketState
+from ...core.metrics import WEBSOCKET_ACTIVE_SESSIONS, WEBSOCKET_SEND_QUEUE_DEPTH
 
 
 class ConnectionManager:
@@ -19,6 +20,7 @@ class ConnectionManager:
         session_id = str(uuid.uuid4())
         self.active_connections[session_id] = websocket
         self.websocket_to_session[websocket] = session_id
+        WEBSOCKET_ACTIVE_SESSIONS.inc()
         print(f"WebSocket connected: {session_id}")
         return session_id
 
@@ -29,6 +31,7 @@ class ConnectionManager:
             if websocket in self.websocket_to_session:
                 del self.websocket_to_session[websocket]
             del self.active_connections[session_id]
+            WEBSOCKET_ACTIVE_SESSIONS.dec()
             print(f"WebSocket disconnected: {session_id}")
 
     def get_session_id(self, websocket: WebSocket) -> str:
@@ -46,6 +49,7 @@ class ConnectionManager:
                 self.disconnect(session_id)
                 return
                 
+            WEBSOCKET_SEND_QUEUE_DEPTH.inc()
             try:
                 await websocket.send_json(data)
             except WebSocketException as e:
@@ -61,6 +65,8 @@ class ConnectionManager:
             except Exception as e:
                 print(f"Unexpected error sending to client {session_id}: {type(e).__name__}: {e}")
                 self.disconnect(session_id)
+            finally:
+                WEBSOCKET_SEND_QUEUE_DEPTH.dec()
 
 
 manager = ConnectionManager()
\ No newline at end of file
@@ -0,0 +1,151 @@
+"""
+설정(YAML) 레지스트리
+- 각 YAML 파일은 한 번만 파싱하여 캐시
+- 파싱 결과로부터 만든 파생 값(포맷된 프롬프트 블록, 키워드 인덱스 등)도 함께 캐시
+- 파일 mtime을 주기적으로 확인하여 변경 시 재파싱 + 파생 값 무효화 + 리스너 호출
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import yaml
+
+
+CONFIG_DIR = Path(__file__).resolve().parent
+
+# 같은 파일의 mtime을 다시 확인하기까지의 최소 간격 (초)
+MTIME_CHECK_INTERVAL = 2.0
+
+PathLike = Union[str, Path]
+
+
+class _ConfigEntry:
+    """파일 하나의 캐시 상태"""
+    __slots__ = ("path", "data", "mtime", "version", "checked_at", "derived")
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.data: Any = None
+        self.mtime: Optional[float] = None
+        self.version = 0
+        self.checked_at = 0.0
+        self.derived: Dict[str, Any] = {}
+
+
+class ConfigRegistry:
+    """YAML 설정 파일 캐시 + mtime 기반 무효화"""
+
+    def __init__(self, config_dir: Path = CONFIG_DIR, check_interval: float = MTIME_CHECK_INTERVAL):
+        self.config_dir = config_dir
+        self.check_interval = check_interval
+        self._lock = threading.RLock()
+        self._entries: Dict[Path, _ConfigEntry] = {}
+        self._listeners: Dict[Path, List[Callable[[Any], None]]] = {}
+
+    def _resolve(self, name: PathLike) -> Path:
+        path = Path(name)
+        if not path.is_absolute():
+            path = self.config_dir / path
+        return path.resolve()
+
+    def _load(self, entry: _ConfigEntry, required: bool) -> None:
+        """mtime이 바뀌었으면 재파싱 (실패 시 이전 캐시 유지)"""
+        try:
+            mtime = entry.path.stat().st_mtime
+        except FileNotFoundError:
+            if required:
+                raise
+            if entry.mtime is not None:
+                print(f"⚠️ [CONFIG_REGISTRY] {entry.path.name} removed, keeping cached version")
+            else:
+                print(f"Warning: Prompt file not found: {entry.path}")
+            return
+
+        if entry.mtime == mtime:
+            return
+
+        try:
+            with open(entry.path, 'r', encoding='utf-8') as f:
+                data = yaml.safe_load(f)
+        except Exception as e:
+            if required and entry.mtime is None:
+                raise
+            print(f"❌ [CONFIG_REGISTRY] Error loading {entry.path.name}: {e}")
+            return
+
+        is_reload = entry.mtime is not None
+        entry.data = data
+        entry.mtime = mtime
+        entry.version += 1
+        entry.derived = {}
+        if is_reload:
+            print(f"🔄 [CONFIG_REGISTRY] {entry.path.name} reloaded (v{entry.version})")
+            for listener in self._listeners.get(entry.path, ()):
+                try:
+                    listener(data)
+                except Exception as e:
+                    print(f"❌ [CONFIG_REGISTRY] Listener failed for {entry.path.name}: {e}")
+
+    def _entry(self, name: PathLike, required: bool = False) -> _ConfigEntry:
+        path = self._resolve(name)
+        now = time.monotonic()
+        entry = self._entries.get(path)
+        if entry is not None and now - entry.checked_at < self.check_interval:
+            return entry
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None:
+                entry = _ConfigEntry(path)
+                self._entries[path] = entry
+            self._load(entry, required)
+            entry.checked_at = now
+        return entry
+
+    def get(self, name: PathLike, default: Any = None, required: bool = False) -> Any:
+        """
+        파싱된 YAML 반환 (공유 객체이므로 수정하지 말 것)
+        - required=True면 최초 로드 실패 시 예외 발생
+        """
+        data = self._entry(name, required).data
+        return default if data is None else data
+
+    def version(self, name: PathLike) -> int:
+        """파일이 (재)로드된 횟수 - 0이면 아직 로드되지 않음"""
+        return self._entry(name).version
+
+    def derived(self, name: PathLike, key: str, builder: Callable[[Any], Any], default: Any = None) -> Any:
+        """
+        파일 내용으로부터 계산한 파생 값 캐시
+        - 파일이 다시 로드되면 자동으로 무효화되어 다음 호출 시 재계산
+        - 파일이 없으면 default
+        """
+        entry = self._entry(name)
+        if entry.data is None:
+            return default
+        derived = entry.derived
+        if key not in derived:
+            derived[key] = builder(entry.data)
+        return derived[key]
+
+    def on_change(self, name: PathLike, listener: Callable[[Any], None]) -> None:
+        """파일이 다시 로드되었을 때 호출될 리스너 등록"""
+        self._listeners.setdefault(self._resolve(name), []).append(listener)
+
+    def check_for_updates(self) -> List[str]:
+        """등록된 모든 파일의 mtime 확인 (턴 시작 시 호출) - 다시 로드된 파일명 반환"""
+        reloaded = []
+        for path, entry in list(self._entries.items()):
+            before = entry.version
+            self._entry(path)
+            if entry.version != before:
+                reloaded.append(path.name)
+        return reloaded
+
+    def loaded_files(self) -> List[Tuple[str, int]]:
+        return [(path.name, entry.version) for path, entry in self._entries.items()]
+
+
+# 전역 인스턴스
+config_registry = ConfigRegistry()
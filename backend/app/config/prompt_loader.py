@@ -2,22 +2,15 @@
 프롬프트 로더 - YAML 파일에서 프롬프트 로드
 """
 
-import yaml
 import os
 from pathlib import Path
 from typing import Dict, Any
 
+from .config_registry import config_registry
+
 def load_yaml_file(file_path: str) -> Dict[str, Any]:
-    """YAML 파일 로드"""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
-    except FileNotFoundError:
-        print(f"Warning: Prompt file not found: {file_path}")
-        return {}
-    except Exception as e:
-        print(f"Error loading prompt file {file_path}: {e}")
-        return {}
+    """YAML 파일 로드 (config_registry 캐시 사용 - 파일 변경 시 자동 재파싱)"""
+    return config_registry.get(file_path, default={})
 
 def load_all_prompts() -> Dict[str, Any]:
     """모든 프롬프트 파일 로드"""
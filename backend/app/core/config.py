@@ -8,6 +8,60 @@ GOOGLE_APPLICATION_CREDENTIALS = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
 
 LLM_MODEL_NAME = os.getenv("LLM_MODEL_NAME", "gpt-4o-mini") # 환경 변수 또는 기본값 사용
 
+# LLM 게이트웨이 (커넥션 풀 / 분당 요청·토큰 한도 / 동시 호출 수 / 기본 타임아웃)
+LLM_HTTP_MAX_CONNECTIONS = int(os.getenv("LLM_HTTP_MAX_CONNECTIONS", "100"))
+LLM_REQUESTS_PER_MINUTE = int(os.getenv("LLM_REQUESTS_PER_MINUTE", "500"))
+LLM_TOKENS_PER_MINUTE = int(os.getenv("LLM_TOKENS_PER_MINUTE", "200000"))
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "64"))
+LLM_DEFAULT_TIMEOUT = float(os.getenv("LLM_DEFAULT_TIMEOUT", "20"))
+
+# 결정적 JSON 호출 응답 캐시 (호출 지점 정책에 cache_ttl이 있을 때만 사용)
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() not in ("0", "false", "no")
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "2000"))
+# 설정 시 워커 간 공유 캐시로 사용 (예: redis://localhost:6379/0, redis 패키지 필요)
+LLM_CACHE_REDIS_URL = os.getenv("LLM_CACHE_REDIS_URL")
+
+# 호출 지점별 모델 라우팅 (config/model_routing.yaml) - 기본 꺼짐: 모든 호출이 LLM_MODEL_NAME 사용
+# 켜도 standard 등급은 LLM_MODEL_NAME, fast로 지정한 호출 지점만 다른 모델 사용
+MODEL_ROUTING_ENABLED = os.getenv("MODEL_ROUTING_ENABLED", "false").lower() not in ("0", "false", "no")
+
+# 규칙 기반 fast path (단답/정확한 선택지/숫자·날짜·연락처는 LLM 호출 생략)
+FAST_PATH_ENABLED = os.getenv("FAST_PATH_ENABLED", "true").lower() not in ("0", "false", "no")
+FAST_PATH_MIN_CONFIDENCE = float(os.getenv("FAST_PATH_MIN_CONFIDENCE", "0.9"))
+# fast path로 처리한 턴 중 LLM 결과와 비교(shadow)할 비율 (0이면 비교 안 함)
+FAST_PATH_SHADOW_RATE = float(os.getenv("FAST_PATH_SHADOW_RATE", "0.1"))
+
+# 스테이지 routing: classifier 정책에서 로컬 분류 결과로 메인 라우터 LLM을 생략할 최소 신뢰도
+ROUTER_BYPASS_MIN_CONFIDENCE = float(os.getenv("ROUTER_BYPASS_MIN_CONFIDENCE", "0.8"))
+
+# 턴 이해 통합 호출 (라우팅 + 의도 + 스테이지 필드 추출을 한 번에) - 신뢰도가 낮으면 기존 라우터/NLU 경로
+TURN_UNDERSTANDING_ENABLED = os.getenv("TURN_UNDERSTANDING_ENABLED", "true").lower() not in ("0", "false", "no")
+TURN_UNDERSTANDING_MIN_CONFIDENCE = float(os.getenv("TURN_UNDERSTANDING_MIN_CONFIDENCE", "0.7"))
+
+# 워커 하나의 답변은 synthesizer LLM 없이 그대로 최종 응답으로 사용 (여러 워커 결과 병합 시에만 synthesizer)
+SYNTHESIS_PASSTHROUGH_ENABLED = os.getenv("SYNTHESIS_PASSTHROUGH_ENABLED", "true").lower() not in ("0", "false", "no")
+
+# 웹 검색 (tavily: Tavily REST API, local: 네트워크 없는 고정 결과 - 테스트/개발용)
+WEB_SEARCH_BACKEND = os.getenv("WEB_SEARCH_BACKEND", "tavily").lower()
+WEB_SEARCH_DEPTH = os.getenv("WEB_SEARCH_DEPTH", "basic")  # basic | advanced (advanced는 느림)
+WEB_SEARCH_TIMEOUT = float(os.getenv("WEB_SEARCH_TIMEOUT", "5"))
+WEB_SEARCH_CACHE_TTL = float(os.getenv("WEB_SEARCH_CACHE_TTL", "600"))
+WEB_SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("WEB_SEARCH_CACHE_MAX_ENTRIES", "500"))
+
+# 턴 트레이싱 (OpenTelemetry) - otlp: OTEL_EXPORTER_OTLP_ENDPOINT로 전송, file: span당 JSON 한 줄, console, none
+TRACING_EXPORTER = os.getenv("TRACING_EXPORTER", "none").lower()
+TRACING_FILE_PATH = os.getenv("TRACING_FILE_PATH", "traces.jsonl")
+TRACING_SERVICE_NAME = os.getenv("TRACING_SERVICE_NAME", "didimdol-voice-agent")
+
+# 로깅 (graph/logger.py) - 큐 기반 비동기 출력, PII 마스킹은 출력 핸들러에서
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json").lower()  # json | text
+# 모듈별 레벨: "app.agents=WARNING,app.graph.nodes.workers.scenario_logic=DEBUG"
+LOG_MODULE_LEVELS = os.getenv("LOG_MODULE_LEVELS", "")
+# DEBUG 레코드 중 출력할 비율 (1이면 모두)
+LOG_DEBUG_SAMPLE_RATE = float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "0.1"))
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+
 # Data file paths (optional, can be defined in agent.py directly)
 # DIDIMDOL_SCENARIO_PATH = "backend/app/data/didimdol_loan_scenario.json"
 # JEONSE_SCENARIO_PATH = "backend/app/data/jeonse_loan_scenario.json"
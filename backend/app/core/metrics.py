@@ -0,0 +1,218 @@
+# backend/app/core/metrics.py
+"""
+Prometheus 형식 메트릭 (GET /metrics)
+- 외부 의존성 없는 최소 구현: Counter / Gauge / Histogram + 라벨, text exposition format 0.0.4
+- 라벨은 상품(product)/스테이지(stage) 중심 - 운영에서 느린 스테이지를 찾기 위함
+  (스테이지 ID는 시나리오 JSON에 정의된 값이라 라벨 수가 제한됨)
+- 수집 지점
+  · LangGraph 노드: logger.log_execution_time
+  · LLM 호출 지점: llm_gateway (지연, prompt/cached/completion 토큰)
+  · STT 첫 interim / final 까지 시간, TTS 첫 오디오 chunk 까지 시간: google_services
+  · WebSocket 활성 세션, 전송 대기 중인 메시지 수: websocket_manager
+"""
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# 기본 버킷 (초) - 짧은 노드 처리부터 긴 생성형 LLM 호출까지
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# 음성 단계 (STT/TTS) 버킷 (초)
+AUDIO_BUCKETS = (0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0)
+
+UNKNOWN_LABEL = "none"
+
+LabelValues = Tuple[str, ...]
+
+
+def _label_value(value: object) -> str:
+    return UNKNOWN_LABEL if value is None or value == "" else str(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, object]) -> LabelValues:
+        return tuple(_label_value(labels.get(name)) for name in self.labelnames)
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_number(value)}")
+        return lines
+
+
+class Gauge(_Metric):
+    """현재 값 (증감 가능)"""
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: object) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: object) -> None:
+        self.inc(-amount, **labels)
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        with self._lock:
+            values = dict(self._values) or ({(): 0.0} if not self.labelnames else {})
+            for key, value in sorted(values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_number(value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램"""
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 값 → (버킷별 개수, 합계, 전체 개수)
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts, totals = self._series.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0, 0.0]))
+            counts[index] += 1
+            totals[0] += value
+            totals[1] += 1
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        with self._lock:
+            for key, (counts, totals) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float("inf"),), counts):
+                    cumulative += count
+                    labels = _format_labels(self.labelnames, key, ("le", _format_number(bound)))
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                labels = _format_labels(self.labelnames, key)
+                lines.append(f"{self.name}_sum{labels} {_format_number(totals[0])}")
+                lines.append(f"{self.name}_count{labels} {_format_number(totals[1])}")
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭 등록 / text exposition 렌더링"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 전역 인스턴스
+metrics_registry = MetricsRegistry()
+
+# --- LangGraph 노드 ---
+NODE_LATENCY = metrics_registry.histogram(
+    "agent_node_duration_seconds", "LangGraph node execution time", ("node", "product", "stage", "status")
+)
+
+# --- LLM 호출 지점 ---
+LLM_CALL_LATENCY = metrics_registry.histogram(
+    "llm_call_duration_seconds", "LLM call latency per call site (streaming: time to first chunk)",
+    ("site", "product", "stage", "status")
+)
+LLM_TOKENS = metrics_registry.counter(
+    "llm_tokens_total", "LLM tokens per call site (kind: prompt, cached_prompt, completion)",
+    ("site", "product", "stage", "kind")
+)
+
+# --- 음성 단계 ---
+STT_FIRST_INTERIM_LATENCY = metrics_registry.histogram(
+    "stt_time_to_first_interim_seconds", "Time from speech start (VAD) to the first interim transcript",
+    ("product", "stage"), AUDIO_BUCKETS
+)
+STT_FINAL_LATENCY = metrics_registry.histogram(
+    "stt_time_to_final_seconds", "Time from speech start (VAD) to the final transcript",
+    ("product", "stage"), AUDIO_BUCKETS
+)
+TTS_FIRST_BYTE_LATENCY = metrics_registry.histogram(
+    "tts_time_to_first_byte_seconds", "Time from TTS request to the first audio chunk sent",
+    ("product", "stage"), AUDIO_BUCKETS
+)
+
+# --- WebSocket ---
+WEBSOCKET_ACTIVE_SESSIONS = metrics_registry.gauge(
+    "websocket_active_sessions", "Connected WebSocket sessions"
+)
+WEBSOCKET_SEND_QUEUE_DEPTH = metrics_registry.gauge(
+    "websocket_send_queue_depth", "WebSocket messages waiting to be sent (send_json calls in flight)"
+)
@@ -0,0 +1,134 @@
+# backend/app/core/tracing.py
+"""
+OpenTelemetry 턴 트레이싱
+- 음성 턴 하나 = 루트 span (voice_turn: 세션 ID, 턴 번호) → 노드 / LLM 호출 / 검색 / TTS 문장 span
+- span 컨텍스트는 contextvars로 전달 → asyncio.create_task / gather로 만든 태스크도 생성 시점의 span을 부모로 사용
+  (StreamSTTService 콜백 안에서 턴 span을 열고, StreamTTSService 합성 태스크는 문장 span 안에서 생성)
+- 내보내기: TRACING_EXPORTER = otlp (OTEL_EXPORTER_OTLP_ENDPOINT) | file (TRACING_FILE_PATH, span당 JSON 한 줄) | console | none
+- opentelemetry 패키지가 없거나 none이면 모든 함수가 아무 일도 하지 않음 (호출 측은 분기 없이 사용)
+"""
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from .config import TRACING_EXPORTER, TRACING_FILE_PATH, TRACING_SERVICE_NAME
+
+try:
+    from opentelemetry import context as otel_context, trace
+    from opentelemetry.trace import Status, StatusCode
+    TRACING_AVAILABLE = True
+except ImportError:
+    otel_context = trace = None
+    TRACING_AVAILABLE = False
+
+_provider: Any = None
+_trace_file: Any = None
+
+
+def _create_exporter(kind: str) -> Any:
+    if kind == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        return OTLPSpanExporter()
+    from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+    if kind == "file":
+        global _trace_file
+        _trace_file = open(TRACING_FILE_PATH, "a", encoding="utf-8")
+        return ConsoleSpanExporter(out=_trace_file, formatter=lambda span: span.to_json(indent=None) + "\n")
+    return ConsoleSpanExporter()
+
+
+def setup_tracing() -> bool:
+    """서버 시작 시 TracerProvider 구성 - 활성화되면 True"""
+    global _provider
+    if _provider is not None:
+        return True
+    if TRACING_EXPORTER == "none":
+        return False
+    if not TRACING_AVAILABLE:
+        print(f"⚠️ [TRACING] opentelemetry not installed - tracing disabled (TRACING_EXPORTER={TRACING_EXPORTER})")
+        return False
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+        provider = TracerProvider(resource=Resource.create({"service.name": TRACING_SERVICE_NAME}))
+        provider.add_span_processor(BatchSpanProcessor(_create_exporter(TRACING_EXPORTER)))
+        trace.set_tracer_provider(provider)
+        _provider = provider
+    except Exception as e:
+        print(f"❌ [TRACING] setup failed ({TRACING_EXPORTER}): {type(e).__name__}: {e}")
+        return False
+    print(f"🔭 [TRACING] exporting spans via {TRACING_EXPORTER}")
+    return True
+
+
+def shutdown_tracing() -> None:
+    """남은 span flush 후 종료"""
+    global _provider, _trace_file
+    if _provider is not None:
+        _provider.shutdown()
+        _provider = None
+    if _trace_file is not None:
+        _trace_file.close()
+        _trace_file = None
+
+
+def _attributes(attributes: Dict[str, Any]) -> Dict[str, Any]:
+    """OTel 속성으로 쓸 수 있는 값만 (None 제외, 그 외 타입은 문자열)"""
+    return {
+        key: value if isinstance(value, (str, bool, int, float)) else str(value)
+        for key, value in attributes.items() if value is not None
+    }
+
+
+@contextmanager
+def start_span(name: str, start_time_ns: Optional[int] = None, root: bool = False, **attributes: Any) -> Iterator[Any]:
+    """
+    현재 span의 자식 span (root=True면 부모 없이 새 trace, 비활성 시 None을 yield)
+    - 예외는 span에 기록하고 그대로 다시 발생
+    """
+    if _provider is None:
+        yield None
+        return
+    parent = otel_context.Context() if root else None
+    tracer = trace.get_tracer(__name__)
+    with tracer.start_as_current_span(name, context=parent, start_time=start_time_ns,
+                                      attributes=_attributes(attributes)) as span:
+        yield span
+
+
+def record_span(name: str, start_time_ns: int, end_time_ns: Optional[int] = None, **attributes: Any) -> None:
+    """이미 지나간 구간을 현재 span의 자식으로 기록 (예: 발화 시작 → STT final)"""
+    if _provider is None:
+        return
+    span = trace.get_tracer(__name__).start_span(name, start_time=start_time_ns, attributes=_attributes(attributes))
+    span.end(end_time=end_time_ns or time.time_ns())
+
+
+def set_attributes(**attributes: Any) -> None:
+    """현재 span에 속성 추가"""
+    if _provider is None:
+        return
+    trace.get_current_span().set_attributes(_attributes(attributes))
+
+
+def add_event(name: str, **attributes: Any) -> None:
+    """현재 span에 이벤트 추가 (예: 첫 오디오 chunk)"""
+    if _provider is None:
+        return
+    trace.get_current_span().add_event(name, _attributes(attributes))
+
+
+def mark_error(message: str) -> None:
+    """현재 span을 오류로 표시 (예외 없이 실패를 처리한 경우)"""
+    if _provider is None:
+        return
+    trace.get_current_span().set_status(Status(StatusCode.ERROR, message))
+
+
+def turn_span(session_id: str, turn_number: int, input_mode: str, start_time_ns: Optional[int] = None) -> Any:
+    """음성/텍스트 턴 루트 span (start_time_ns: 발화 시작 시각이 있으면 STT 구간 포함)"""
+    return start_span("voice_turn", start_time_ns, root=True, **{
+        "session.id": session_id, "turn.number": turn_number, "turn.input_mode": input_mode,
+    })
@@ -58,20 +58,23 @@ DEPOSIT_ACCOUNT_GROUPS = {
     }
 }
 
+# 상품별 그룹 목록 / stage → group 인덱스 (모듈 로드 시 한 번 생성)
+PRODUCT_GROUPS = {
+    "deposit_account": list(DEPOSIT_ACCOUNT_GROUPS.values()),
+}
+STAGE_GROUP_INDEX = {
+    product_type: {stage_id: group for group in reversed(groups) for stage_id in group.get("stages", [])}
+    for product_type, groups in PRODUCT_GROUPS.items()
+}
+
 def get_groups_for_product(product_type: str):
     """상품 타입에 따른 그룹 정의 반환"""
-    if product_type == "deposit_account":
-        return list(DEPOSIT_ACCOUNT_GROUPS.values())
-    # 다른 상품 타입 추가 가능
-    return []
+    # 다른 상품 타입은 PRODUCT_GROUPS에 추가
+    return list(PRODUCT_GROUPS.get(product_type, []))
 
 def get_group_for_stage(product_type: str, stage_id: str):
     """특정 스테이지가 속한 그룹 반환"""
-    groups = get_groups_for_product(product_type)
-    for group in groups:
-        if stage_id in group.get("stages", []):
-            return group
-    return None
+    return STAGE_GROUP_INDEX.get(product_type, {}).get(stage_id)
 
 def get_group_id_for_stage(product_type: str, stage_id: str):
     """특정 스테이지가 속한 그룹 ID 반환"""
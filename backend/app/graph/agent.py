@@ -21,6 +21,9 @@ from .chains import (
 
 # --- Import logger ---
 from .logger import log_node_execution
+from .history import history_manager
+from .model_router import routing_scope
+from ..config.config_registry import config_registry
 
 # --- Helper Functions for Information Collection ---
 
@@ -29,6 +32,7 @@ from .logger import log_node_execution
 # --- Import Node Functions ---
 from .nodes.orchestrator.entry_point import entry_point_node
 from .nodes.orchestrator.main_router import main_agent_router_node
+from .nodes.orchestrator.parallel_workers import parallel_workers_node
 from .nodes.control.end_conversation import end_conversation_node
 from .nodes.control.synthesize import synthesize_response_node
 from .nodes.control.set_product import set_product_type_node
@@ -39,7 +43,7 @@ from .nodes.workers.scenario_agent import call_scenario_agent_node
 from .nodes.workers.scenario_logic import process_scenario_logic_node
 
 # --- Import Router ---
-from .router import execute_plan_router, route_after_scenario_logic
+from .router import PARALLEL_NODE, execute_plan_router, route_after_scenario_logic
 
 
 # --- Orchestration-Worker Graph Build ---
@@ -54,6 +58,8 @@ workflow.add_node("scenario_worker", call_scenario_agent_node)
 workflow.add_node("scenario_flow_worker", process_scenario_logic_node) 
 workflow.add_node("rag_worker", factual_answer_node)
 workflow.add_node("web_worker", web_search_node)
+# 독립 액션 동시 실행 (fan-out/fan-in)
+workflow.add_node(PARALLEL_NODE, parallel_workers_node)
 
 # Response & Control Nodes
 workflow.add_node("synthesize_response_node", synthesize_response_node)
@@ -77,6 +83,7 @@ workflow.add_conditional_edges(
         "set_product_type_node": "set_product_type_node",
         "end_conversation_node": "end_conversation_node",
         "personal_info_correction_node": "personal_info_correction_node",
+        PARALLEL_NODE: PARALLEL_NODE,
     }
 )
 
@@ -85,6 +92,7 @@ workflow.add_edge("scenario_worker", "scenario_flow_worker")
 workflow.add_conditional_edges("scenario_flow_worker", execute_plan_router)
 workflow.add_conditional_edges("rag_worker", execute_plan_router)
 workflow.add_conditional_edges("web_worker", execute_plan_router)
+workflow.add_conditional_edges(PARALLEL_NODE, execute_plan_router)
 
 workflow.add_edge("synthesize_response_node", END)
 workflow.add_edge("set_product_type_node", END)
@@ -128,6 +136,8 @@ async def run_agent_streaming(
         "user_input_audio_b64": user_input_audio_b64,
         "messages": current_state_dict.get("messages", []) if current_state_dict else [],
         "current_product_type": current_state_dict.get("current_product_type") if current_state_dict else None,
+        # 세션이 고정한 시나리오 버전 참조 (핫 리로드 중에도 기존 버전 유지)
+        "active_scenario_ref": current_state_dict.get("active_scenario_ref") if current_state_dict else None,
         "current_scenario_stage_id": current_state_dict.get("current_scenario_stage_id") if current_state_dict else None,
         "collected_product_info": current_state_dict.get("collected_product_info", {}) if current_state_dict else {},
         "available_product_types": ["didimdol", "jeonse", "deposit_account"],
@@ -154,7 +164,15 @@ async def run_agent_streaming(
     streamed_text = ""
 
     try:
-        final_state = await app_graph.ainvoke(initial_state)
+        # 변경된 설정(YAML) 파일이 있으면 턴 시작 전에 반영 (mtime 확인은 주기적으로만 수행)
+        config_registry.check_for_updates()
+        # 이번 턴의 LLM 호출은 상품/스테이지별 모델 라우팅 예외 적용
+        with routing_scope(initial_state["current_product_type"], initial_state.get("current_scenario_stage_id")):
+            final_state = await app_graph.ainvoke(initial_state)
+        
+        # 대화 요약은 응답 전송과 별개로 백그라운드에서 증분 갱신
+        if final_state:
+            history_manager.schedule_update(session_id, final_state.get("messages", []))
         
         # Check for stage_response_data and send it first
         if final_state and final_state.get("stage_response_data"):
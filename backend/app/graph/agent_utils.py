@@ -7,11 +7,8 @@ import re
 import json
 from typing import Dict, Any, List, Optional, Tuple
 from langchain_core.messages import HumanMessage
-from ..core.config import get_llm_model
 from ..data.scenario_loader import ALL_SCENARIOS_DATA
-
-# json_llm 초기화
-json_llm = get_llm_model(response_format={"type": "json_object"})
+from .chains import json_llm  # llm_gateway 경유 공용 모델
 
 
 def format_transitions_for_prompt(transitions: List[Dict], current_prompt: str) -> str:
@@ -79,7 +76,7 @@ JSON 형식으로만 응답하세요:
 """
     
     try:
-        response = await json_llm.ainvoke([HumanMessage(content=extraction_prompt)])
+        response = await json_llm.ainvoke([HumanMessage(content=extraction_prompt)], site="field_extraction")
         result = json.loads(response.content.strip().replace("```json", "").replace("```", ""))
         
         extracted_fields = result.get("extracted_fields", {})
@@ -11,28 +11,35 @@ from langchain_openai import ChatOpenAI
 from ..core.config import OPENAI_API_KEY, LLM_MODEL_NAME
 from .models import scenario_output_parser
 from .state import ScenarioAgentOutput
-from .utils import ALL_PROMPTS, format_messages_for_prompt, load_knowledge_base_content_async
+from .utils import ALL_PROMPTS, load_knowledge_base_content_async
+from .history import history_manager
+from .llm_gateway import llm_gateway
 
 # --- LLM Initialization ---
-# This part remains the same
+# 모든 호출은 llm_gateway 경유 (공유 커넥션 풀, 호출 지점별 타임아웃/재시도, 요청·토큰 한도)
+# 재시도는 게이트웨이가 담당하므로 클라이언트 자체 재시도는 끔
 if not OPENAI_API_KEY:
     print("CRITICAL: OPENAI_API_KEY is not set. Check your .env file.")
 
-json_llm = ChatOpenAI(
+json_llm = llm_gateway.wrap(ChatOpenAI(
     model=LLM_MODEL_NAME, openai_api_key=OPENAI_API_KEY, temperature=0.1,
-    model_kwargs={"response_format": {"type": "json_object"}}
-) if OPENAI_API_KEY else None
+    model_kwargs={"response_format": {"type": "json_object"}},
+    max_retries=0, http_async_client=llm_gateway.http_client
+)) if OPENAI_API_KEY else None
 
-generative_llm = ChatOpenAI(
-    model=LLM_MODEL_NAME, openai_api_key=OPENAI_API_KEY, temperature=0.3, streaming=True
-) if OPENAI_API_KEY else None
+generative_llm = llm_gateway.wrap(ChatOpenAI(
+    model=LLM_MODEL_NAME, openai_api_key=OPENAI_API_KEY, temperature=0.3, streaming=True,
+    stream_usage=True,  # 스트리밍 응답에도 토큰 사용량(캐시 적중 포함) 포함
+    max_retries=0, http_async_client=llm_gateway.http_client
+)) if OPENAI_API_KEY else None
 
 
 # --- Agent Logic / Chains (Our Tools) ---
 
 async def invoke_scenario_agent_logic(
     user_input: str, current_stage_prompt: str, expected_info_key: Optional[str],
-    messages_history: Sequence[BaseMessage], scenario_name: str
+    messages_history: Sequence[BaseMessage], scenario_name: str,
+    session_id: Optional[str] = None
 ) -> ScenarioAgentOutput:
     """This function now acts as our 'Scenario NLU Tool'."""
     # This function's internal logic is good, no changes needed.
@@ -45,7 +52,7 @@ async def invoke_scenario_agent_logic(
     if not prompt_template:
         return cast(ScenarioAgentOutput, {"intent": "error_prompt_not_found", "entities": {}, "is_scenario_related": False})
 
-    formatted_history = format_messages_for_prompt(messages_history)
+    formatted_history = history_manager.format_for_prompt(messages_history, session_id)
     try:
         format_instructions = scenario_output_parser.get_format_instructions()
         prompt = prompt_template.format(
@@ -54,7 +61,7 @@ async def invoke_scenario_agent_logic(
             formatted_messages_history=formatted_history, user_input=user_input,
             format_instructions=format_instructions
         )
-        response = await json_llm.ainvoke([HumanMessage(content=prompt)])
+        response = await json_llm.ainvoke([HumanMessage(content=prompt)], site="scenario_nlu")
         raw_content = response.content.strip()
         if raw_content.startswith("```json"):
             raw_content = raw_content.replace("```json", "").replace("```", "").strip()
@@ -74,11 +81,11 @@ if synthesizer_prompt_template_str and generative_llm:
     synthesizer_prompt_template = ChatPromptTemplate.from_template(synthesizer_prompt_template_str)
     synthesizer_chain = (
         {
-            "chat_history": lambda x: format_messages_for_prompt(x["chat_history"]),
+            "chat_history": lambda x: history_manager.format_for_prompt(x["chat_history"], x.get("session_id")),
             "analysis_context": lambda x: x["analysis_context"],
         }
         | synthesizer_prompt_template
-        | generative_llm
+        | generative_llm.for_site("synthesizer")
     )
 else:
     synthesizer_chain = None
\ No newline at end of file
@@ -0,0 +1,435 @@
+# backend/app/graph/fast_path.py
+"""
+규칙 기반 fast path (LLM 앞단의 결정적 규칙 계층)
+- "네", "아니요", "16일", "010-1234-5678"처럼 발화 전체가 하나의 답으로 해석되는 경우
+  현재 스테이지의 수집 필드에 맞춰 값을 결정하고 LLM 호출(의도 분석/엔티티 추출/선택지 매핑)을 생략
+  · 예/아니요: 발화 전체가 긍정/부정 표현으로만 구성된 경우
+  · 정확한 선택지: 발화(어미 제외)가 선택지의 value/display/keyword 중 하나와 정확히 일치
+  · 숫자/날짜/연락처: 공용 추출 엔진의 span이 발화 전체(어미 제외)를 덮는 경우
+- 애매하면(대상 필드가 여럿, 선택지 중복, 질문 형태 등) None → 기존 LLM 경로
+- 일부 턴은 LLM 결과와 백그라운드로 비교(shadow)하여 생략률/불일치율을 기록
+"""
+import asyncio
+import logging
+import random
+import re
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..core.config import FAST_PATH_ENABLED, FAST_PATH_MIN_CONFIDENCE, FAST_PATH_SHADOW_RATE
+from .keyword_matcher import cached_matcher, content_key
+from .llm_gateway import background_priority
+from .korean_extraction import FIELD_SPAN_KINDS, korean_extractor
+from .scenario_model import CompiledChoice, CompiledStage
+from .scenario_registry import scenario_registry
+
+logger = logging.getLogger(__name__)
+
+
+# 이보다 긴 발화는 단답으로 보지 않음 (공백 제외 글자 수)
+MAX_FAST_PATH_LENGTH = 30
+
+YES_PHRASES = (
+    "네", "넵", "넹", "예", "응", "웅", "어", "ㅇㅇ", "ㅇㅋ", "ok", "okay", "yes",
+    "좋아", "좋아요", "좋습니다", "그래", "그래요", "그럼요", "맞아", "맞아요", "맞습니다", "맞네요",
+    "알겠어요", "알겠습니다", "알았어요", "동의", "동의해요", "동의합니다", "할게요", "하겠습니다",
+    "진행", "진행해요", "진행할게요", "진행해주세요", "그렇게", "그렇게요", "그렇게해주세요", "그렇게할게요",
+)
+NO_PHRASES = (
+    "아니", "아니요", "아니오", "아니에요", "아니야", "아뇨", "아닙니다", "ㄴㄴ", "no",
+    "싫어", "싫어요", "싫습니다", "안할게요", "안해요", "안할래요", "안하겠습니다",
+    "필요없어요", "필요없습니다", "됐어요",
+)
+# 긍정/부정 표현과 함께 쓰여도 의미를 바꾸지 않는 말
+NEUTRAL_PHRASES = ("괜찮아요", "괜찮습니다", "감사합니다", "그냥", "해주세요", "주세요")
+
+_POLARITY = {phrase: True for phrase in YES_PHRASES}
+_POLARITY.update({phrase: False for phrase in NO_PHRASES})
+_POLARITY.update({phrase: None for phrase in NEUTRAL_PHRASES})
+# 긴 표현부터 시도 ("아니요"가 "아니" + "요"로 쪼개지지 않도록)
+_POLAR_TOKEN_PATTERN = re.compile("|".join(re.escape(p) for p in sorted(_POLARITY, key=len, reverse=True)))
+
+# 값 뒤에 붙는 어미/조사 ("16일로 해주세요", "모바일이요", "오백만원입니다")
+_FILLER_PATTERN = re.compile(
+    r"(?:원)?(?:이?요|입니다|이에요|예요|"
+    r"으?로(?:요|할게요|해주세요|해줘|부탁해요|부탁드려요|하겠습니다)?|"
+    r"할게요|해주세요|해줘|부탁해요|부탁드려요)?"
+)
+_NOISE_PATTERN = re.compile(r"[\s.,!~]+")
+
+INTENT_POSITIVE = "긍정"
+INTENT_NEGATIVE = "부정"
+INTENT_INFO = "정보제공"
+
+# 발화 전체를 덮는 span의 원래 신뢰도가 이 이상이면 가산 (숫자만 말한 경우는 0.9)
+_STRONG_SPAN_CONFIDENCE = 0.7
+
+
+class FastPathResult:
+    """규칙으로 결정한 답"""
+    __slots__ = ("intent", "fields", "confidence", "rule")
+
+    def __init__(self, intent: str, fields: Dict[str, Any], confidence: float, rule: str):
+        self.intent = intent
+        self.fields = fields
+        self.confidence = confidence
+        self.rule = rule
+
+    def as_intent_analysis(self, user_input: str) -> Dict[str, Any]:
+        """EntityRecognitionAgent.analyze_user_intent 결과 형식"""
+        return {
+            "intent": self.intent,
+            "confidence": self.confidence,
+            "extracted_info": dict(self.fields),
+            "clarification_needed": False,
+            "scenario_deviation": False,
+            "deviation_topic": "",
+            "interpreted_meaning": user_input,
+            "suggested_response": "",
+            "fast_path": self.rule,
+        }
+
+    def __repr__(self) -> str:
+        return f"FastPathResult({self.intent!r}, {self.fields!r}, {self.confidence}, {self.rule!r})"
+
+
+def _normalize(text: str) -> str:
+    return _NOISE_PATTERN.sub("", (text or "").lower())
+
+
+def _is_filler(rest: str) -> bool:
+    return _FILLER_PATTERN.fullmatch(rest) is not None
+
+
+def classify_yes_no(text: str) -> Optional[bool]:
+    """발화 전체가 긍정(True)/부정(False) 표현으로만 구성되었는지 - 아니면 None"""
+    normalized = _normalize(text)
+    if not normalized:
+        return None
+    polarity: Optional[bool] = None
+    position = 0
+    while position < len(normalized):
+        match = _POLAR_TOKEN_PATTERN.match(normalized, position)
+        if match is None:
+            return None
+        token_polarity = _POLARITY[match.group(0)]
+        if token_polarity is not None:
+            if polarity is not None and polarity != token_polarity:
+                return None
+            polarity = token_polarity
+        position = match.end()
+    return polarity
+
+
+# ---------------------------------------------------------------------------
+# 스테이지 대상 필드
+# ---------------------------------------------------------------------------
+
+def _compiled_stage(stage_info: Optional[Dict[str, Any]]) -> Optional[CompiledStage]:
+    if not stage_info:
+        return None
+    compiled_stage = scenario_registry.compiled_stage(stage_info)
+    if compiled_stage is None:
+        # 레지스트리에 게시되지 않은 stage dict (로컬 사본 등) - 이번 호출용으로만 컴파일
+        compiled_stage = CompiledStage(stage_info.get("stage_id", ""), stage_info)
+    return compiled_stage
+
+
+def _choice_aliases(choices: Sequence[CompiledChoice]) -> Dict[str, Optional[Tuple[Any, float]]]:
+    """정규화된 선택지 표현 → (value, 신뢰도) - 여러 선택지가 같은 표현을 쓰면 None(애매)"""
+    aliases: Dict[str, Optional[Tuple[Any, float]]] = {}
+
+    def add(alias: Any, value: Any, confidence: float) -> None:
+        key = _normalize(str(alias))
+        if not key:
+            return
+        if key in aliases:
+            current = aliases[key]
+            if current is not None and current[0] != value:
+                aliases[key] = None
+            return
+        aliases[key] = (value, confidence)
+
+    choices = [choice for choice in choices if not choice.is_toggle]
+    for choice in choices:
+        add(choice.value, choice.value, 0.97)
+        add(choice.display, choice.value, 0.97)
+    for choice in choices:
+        for keyword in choice.keywords:
+            add(keyword, choice.value, 0.92)
+    return aliases
+
+
+def _stage_choice_aliases(compiled_stage: CompiledStage) -> Dict[str, Optional[Tuple[Any, float]]]:
+    return _choice_aliases(compiled_stage.choices)
+
+
+def _field_choice_aliases(choices: Sequence[Any]) -> Dict[str, Optional[Tuple[Any, float]]]:
+    return _choice_aliases([CompiledChoice(choice) for choice in choices])
+
+
+def _field_span_kind(field_key: str, field_def: Dict[str, Any]) -> Optional[str]:
+    """필드 → fast path에서 사용할 span 종류 (이름/주소는 발화 전체라도 오인식이 잦아 제외)"""
+    spec = FIELD_SPAN_KINDS.get(field_key)
+    if spec is not None:
+        return spec[0] if spec[0] in ("phone", "email", "amount", "day_of_month") else None
+    if field_def.get("type") == "number":
+        return "amount"
+    if field_key.endswith("_date"):
+        return "day_of_month"
+    if "phone" in field_key:
+        return "phone"
+    if "email" in field_key:
+        return "email"
+    return None
+
+
+def _target_fields(compiled_stage: Optional[CompiledStage], stage_info: Optional[Dict[str, Any]],
+                   fields: Optional[Sequence[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    if fields:
+        return [field for field in fields if isinstance(field, dict) and field.get("key")]
+    keys: List[str] = list(compiled_stage.fields_to_collect) if compiled_stage else []
+    expected = (stage_info or {}).get("expected_info_key")
+    if expected and expected not in keys:
+        keys.append(expected)
+    # 필드 정의가 없으면 스테이지 response_type으로 boolean 여부 판단
+    is_boolean_stage = (stage_info or {}).get("response_type") == "boolean" and len(keys) == 1
+    return [{"key": key, "type": "boolean"} if is_boolean_stage else {"key": key} for key in keys]
+
+
+# ---------------------------------------------------------------------------
+# 규칙
+# ---------------------------------------------------------------------------
+
+def _yes_no_rule(text: str, targets: List[Dict[str, Any]]) -> Optional[FastPathResult]:
+    polarity = classify_yes_no(text)
+    if polarity is None:
+        return None
+    intent = INTENT_POSITIVE if polarity else INTENT_NEGATIVE
+    boolean_fields = [field["key"] for field in targets if field.get("type") == "boolean"]
+    if len(boolean_fields) > 1:
+        # 여러 boolean 필드 중 어디에 대한 답인지 알 수 없음
+        return None
+    # 다른 필드와 함께 수집하는 스테이지의 "네"는 기본값 수락일 수 있으므로 의도만 결정
+    fields = {boolean_fields[0]: polarity} if boolean_fields and len(targets) == 1 else {}
+    return FastPathResult(intent, fields, 0.95, "yes_no")
+
+
+def _choice_rule(normalized: str, compiled_stage: Optional[CompiledStage],
+                 targets: List[Dict[str, Any]]) -> Optional[FastPathResult]:
+    target_keys = {field["key"] for field in targets}
+    candidates: List[Tuple[str, Dict[str, Optional[Tuple[Any, float]]]]] = []
+    if compiled_stage is not None and compiled_stage.choice_field in target_keys \
+            and any(not choice.is_toggle for choice in compiled_stage.choices):
+        # 레지스트리의 CompiledStage는 객체 기준, 즉석 컴파일한 로컬 사본은 내용 기준으로 캐시
+        published = scenario_registry.compiled_stage(compiled_stage.raw) is compiled_stage
+        aliases = cached_matcher(compiled_stage, _stage_choice_aliases, "fast_path_choices",
+                                 key=None if published else content_key(compiled_stage.raw))
+        candidates.append((compiled_stage.choice_field, aliases))
+    for field in targets:
+        # 필드 정의의 선택지 (V1 문자열 선택지 등) - 스테이지 선택지가 채우는 필드는 제외
+        if field.get("type") == "choice" and field.get("choices") and \
+                not (compiled_stage is not None and field["key"] == compiled_stage.choice_field):
+            # 호출 측이 턴마다 새로 만든 선택지 목록을 넘기기도 하므로 내용 기준으로 캐시
+            aliases = cached_matcher(field["choices"], _field_choice_aliases, "fast_path_field_choices",
+                                     key=content_key(field["choices"]))
+            candidates.append((field["key"], aliases))
+    if not candidates:
+        return None
+
+    # 발화 전체 → 어미를 하나씩 떼어 가며 선택지 표현과 정확히 일치하는지 확인
+    for end in range(len(normalized), 0, -1):
+        if end != len(normalized) and not _is_filler(normalized[end:]):
+            continue
+        core = normalized[:end]
+        matches = [(field_key, aliases[core]) for field_key, aliases in candidates if core in aliases]
+        if not matches:
+            continue
+        if len(matches) > 1 or matches[0][1] is None:
+            return None
+        field_key, (value, confidence) = matches[0]
+        return FastPathResult(INTENT_INFO, {field_key: value}, confidence, "exact_choice")
+    return None
+
+
+def _format_span_value(kind: str, value: Any) -> Any:
+    # 날짜(일)는 LLM 추출과 같은 문자열 형식 ("16일" → "16")
+    return str(value) if kind == "day_of_month" else value
+
+
+def _typed_value_rule(text: str, targets: List[Dict[str, Any]]) -> Optional[FastPathResult]:
+    fields_by_kind: Dict[str, List[str]] = {}
+    for field in targets:
+        kind = _field_span_kind(field["key"], field)
+        if kind:
+            fields_by_kind.setdefault(kind, []).append(field["key"])
+    if not fields_by_kind:
+        return None
+
+    extraction = korean_extractor.extract(text)
+    resolved: Optional[Tuple[str, Any, float]] = None
+    for kind, field_keys in fields_by_kind.items():
+        covering = [
+            span for span in extraction.spans_of(kind)
+            if not _normalize(text[:span.start]) and _is_filler(_normalize(text[span.end:]))
+        ]
+        if not covering or len({span.value for span in covering}) > 1:
+            continue
+        span = max(covering, key=lambda s: s.confidence)
+        if len(field_keys) == 1:
+            field_key = field_keys[0]
+        elif span.field in field_keys:
+            field_key = span.field
+        else:
+            return None
+        if resolved is not None:
+            return None
+        confidence = 0.95 if span.confidence >= _STRONG_SPAN_CONFIDENCE else 0.9
+        resolved = (field_key, _format_span_value(kind, span.value), confidence)
+
+    if resolved is None:
+        return None
+    field_key, value, confidence = resolved
+    return FastPathResult(INTENT_INFO, {field_key: value}, confidence, "typed_value")
+
+
+def resolve(user_input: str, stage_info: Optional[Dict[str, Any]],
+            fields: Optional[Sequence[Dict[str, Any]]] = None) -> Optional[FastPathResult]:
+    """
+    발화를 규칙만으로 해석 - 애매하면 None
+    - stage_info: 현재 스테이지 (선택지/수집 필드)
+    - fields: 대상 필드 정의 목록 (없으면 스테이지의 fields_to_collect / expected_info_key)
+    """
+    if not FAST_PATH_ENABLED or not user_input or "?" in user_input:
+        return None
+    normalized = _normalize(user_input)
+    if not normalized or len(normalized) > MAX_FAST_PATH_LENGTH:
+        return None
+
+    compiled_stage = _compiled_stage(stage_info)
+    targets = _target_fields(compiled_stage, stage_info, fields)
+    result = (
+        _yes_no_rule(user_input, targets)
+        or _choice_rule(normalized, compiled_stage, targets)
+        or _typed_value_rule(user_input, targets)
+    )
+    if result is None or result.confidence < FAST_PATH_MIN_CONFIDENCE:
+        return None
+    return result
+
+
+def confirms_entities(result: Optional[FastPathResult], entities: Dict[str, Any]) -> bool:
+    """
+    규칙 결과가 이미 추출된 엔티티를 확정하는 단답인지
+    - "네" 또는 추출 값과 같은 값만 말한 경우 (질문 형태는 resolve 단계에서 제외됨)
+    """
+    if result is None or (result.intent == INTENT_NEGATIVE and not result.fields):
+        # 필드 없이 "아니요"만 말한 경우는 추출 값을 거절한 것일 수 있음
+        return False
+    return all(
+        key not in entities or _comparable(entities[key]) == _comparable(value)
+        for key, value in result.fields.items()
+    )
+
+
+# ---------------------------------------------------------------------------
+# 통계 / shadow 비교
+# ---------------------------------------------------------------------------
+
+# LLM 결과 형식: {"intent": str | None, "fields": {필드: 값}}
+ShadowCall = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+def _comparable(value: Any) -> str:
+    if isinstance(value, bool):
+        return str(value).lower()
+    return str(value).strip().lower()
+
+
+def compare_with_llm(result: FastPathResult, llm_result: Dict[str, Any]) -> List[str]:
+    """fast path 결과와 LLM 결과의 차이 목록 (LLM이 값을 내지 않은 필드는 비교하지 않음)"""
+    differences = []
+    llm_intent = llm_result.get("intent")
+    if llm_intent and result.intent != INTENT_INFO and llm_intent != result.intent:
+        differences.append(f"intent: {result.intent} != {llm_intent}")
+    llm_fields = llm_result.get("fields") or {}
+    for key, value in result.fields.items():
+        llm_value = llm_fields.get(key)
+        if llm_value is not None and _comparable(llm_value) != _comparable(value):
+            differences.append(f"{key}: {value!r} != {llm_value!r}")
+    for key, llm_value in llm_fields.items():
+        if key not in result.fields and llm_value is not None:
+            differences.append(f"{key}: (none) != {llm_value!r}")
+    return differences
+
+
+class FastPathStats:
+    """호출 지점별 생략률 / shadow 불일치율"""
+
+    def __init__(self, log_every: int = 50):
+        self.log_every = log_every
+        self._sites: Dict[str, Dict[str, int]] = {}
+        self._attempts = 0
+        self._pending: set = set()
+
+    def _site(self, site: str) -> Dict[str, int]:
+        return self._sites.setdefault(site, {"attempts": 0, "skipped": 0, "shadowed": 0, "disagreements": 0})
+
+    def record(self, site: str, result: Optional[FastPathResult]) -> None:
+        counters = self._site(site)
+        counters["attempts"] += 1
+        if result is not None:
+            counters["skipped"] += 1
+        self._attempts += 1
+        if self.log_every and self._attempts % self.log_every == 0:
+            self.log_summary()
+
+    def maybe_shadow(self, site: str, user_input: str, result: FastPathResult, llm_call: ShadowCall) -> None:
+        """일부 턴에 대해 LLM을 백그라운드로 호출하여 규칙 결과와 비교 (응답 지연 없음)"""
+        if FAST_PATH_SHADOW_RATE <= 0 or random.random() >= FAST_PATH_SHADOW_RATE:
+            return
+        try:
+            task = asyncio.get_running_loop().create_task(self._shadow(site, user_input, result, llm_call))
+        except RuntimeError:
+            return
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _shadow(self, site: str, user_input: str, result: FastPathResult, llm_call: ShadowCall) -> None:
+        try:
+            # 응답 경로 밖의 비교 호출 - 실시간 턴보다 뒤로 대기
+            with background_priority():
+                llm_result = await llm_call()
+        except Exception as e:
+            logger.warning("⚠️ [FAST_PATH_SHADOW] %s LLM call failed: %s", site, e)
+            return
+        counters = self._site(site)
+        counters["shadowed"] += 1
+        differences = compare_with_llm(result, llm_result or {})
+        if differences:
+            counters["disagreements"] += 1
+            # 불일치 값(사용자 정보)은 남기지 않고 항목명만
+            logger.debug("⚠️ [FAST_PATH_SHADOW] %s rule=%s disagrees on: %s",
+                         site, result.rule, [difference.split(":", 1)[0] for difference in differences])
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        summary = {}
+        for site, counters in self._sites.items():
+            attempts, shadowed = counters["attempts"], counters["shadowed"]
+            summary[site] = {
+                **counters,
+                "skip_rate": counters["skipped"] / attempts if attempts else 0.0,
+                "disagreement_rate": counters["disagreements"] / shadowed if shadowed else 0.0,
+            }
+        return summary
+
+    def log_summary(self) -> None:
+        for site, stats in self.summary().items():
+            logger.info(
+                "📊 [FAST_PATH] %s: skip_rate=%.1f%% (%s/%s), disagreement_rate=%.1f%% (%s/%s shadowed)",
+                site, stats['skip_rate'] * 100, stats['skipped'], stats['attempts'],
+                stats['disagreement_rate'] * 100, stats['disagreements'], stats['shadowed']
+            )
+
+
+# 전역 인스턴스
+fast_path_stats = FastPathStats()
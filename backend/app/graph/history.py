@@ -0,0 +1,170 @@
+# backend/app/graph/history.py
+"""
+대화 히스토리 관리 모듈
+- LLM 프롬프트용 히스토리 = 누적 요약(running summary) + 최근 N턴 원문
+- 요약은 턴 종료 후 비동기로 증분 갱신 (응답 지연에 영향 없음)
+- 내부 로그용 SystemMessage("Main Agent Plan: ...")는 LLM 히스토리에서 제외
+"""
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
+
+from .utils import ALL_PROMPTS, is_internal_log_message
+
+logger = logging.getLogger(__name__)
+
+
+# 원문 그대로 유지할 최근 턴 수 (1턴 = User + AI)
+RECENT_TURN_WINDOW = 4
+# 요약이 아직 따라오지 못한 경우 원문으로 추가 허용할 최대 메시지 수
+MAX_PENDING_MESSAGES = 6
+# 요약문 최대 길이 (문자)
+MAX_SUMMARY_CHARS = 1200
+
+NO_HISTORY_TEXT = "No previous conversation."
+
+
+@dataclass
+class SessionSummary:
+    """세션별 누적 요약 상태"""
+    summary: str = ""
+    # 요약에 반영된 (필터링된) 메시지 개수 - 히스토리 앞에서부터의 인덱스
+    covered_count: int = 0
+
+
+def filter_llm_messages(messages: Sequence[BaseMessage]) -> List[BaseMessage]:
+    """LLM에 전달할 메시지만 남김 (내부 로그 SystemMessage 제외)"""
+    return [
+        m for m in messages
+        if isinstance(m, (HumanMessage, AIMessage, SystemMessage)) and not is_internal_log_message(m)
+    ]
+
+
+def _format_lines(messages: Sequence[BaseMessage]) -> List[str]:
+    lines = []
+    for msg in messages:
+        role = "System"
+        if isinstance(msg, HumanMessage): role = "User"
+        elif isinstance(msg, AIMessage): role = "AI"
+        lines.append(f"{role}: {msg.content}")
+    return lines
+
+
+class ConversationHistoryManager:
+    """누적 요약 + 최근 턴 윈도우 기반 히스토리 관리자"""
+
+    def __init__(self, recent_turns: int = RECENT_TURN_WINDOW):
+        self.recent_turns = recent_turns
+        self._summaries: Dict[str, SessionSummary] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def get_summary(self, session_id: Optional[str]) -> str:
+        """세션의 현재 요약문 반환"""
+        if not session_id or session_id not in self._summaries:
+            return ""
+        return self._summaries[session_id].summary
+
+    def format_for_prompt(
+        self,
+        messages: Sequence[BaseMessage],
+        session_id: Optional[str] = None,
+        recent_turns: Optional[int] = None
+    ) -> str:
+        """
+        프롬프트용 히스토리 문자열 생성
+        - [이전 대화 요약] + 최근 N턴 원문
+        - 요약이 아직 갱신되지 않은 구간은 MAX_PENDING_MESSAGES 만큼 원문으로 보충
+        """
+        filtered = filter_llm_messages(messages)
+        window_size = (recent_turns or self.recent_turns) * 2
+        window_start = max(0, len(filtered) - window_size)
+
+        session_summary = self._summaries.get(session_id) if session_id else None
+        if session_summary and session_summary.covered_count < window_start:
+            window_start = max(session_summary.covered_count, window_start - MAX_PENDING_MESSAGES)
+
+        parts = []
+        if session_summary and session_summary.summary:
+            parts.append(f"[이전 대화 요약]\n{session_summary.summary}")
+        recent_lines = _format_lines(filtered[window_start:])
+        if recent_lines:
+            if parts:
+                parts.append("[최근 대화]")
+            parts.extend(recent_lines)
+
+        return "\n".join(parts) if parts else NO_HISTORY_TEXT
+
+    def schedule_update(self, session_id: Optional[str], messages: Sequence[BaseMessage]) -> Optional[asyncio.Task]:
+        """
+        턴 종료 후 요약 증분 갱신을 백그라운드로 예약
+        - 윈도우 밖으로 밀려난 메시지만 기존 요약에 합침
+        - 동일 세션의 갱신이 진행 중이면 건너뜀 (다음 턴에 따라잡음)
+        """
+        if not session_id:
+            return None
+        running = self._tasks.get(session_id)
+        if running and not running.done():
+            return None
+
+        filtered = filter_llm_messages(messages)
+        session_summary = self._summaries.setdefault(session_id, SessionSummary())
+        overflow_end = len(filtered) - self.recent_turns * 2
+        if overflow_end <= session_summary.covered_count:
+            return None
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+        new_messages = filtered[session_summary.covered_count:overflow_end]
+        task = loop.create_task(self._update_summary(session_id, new_messages, overflow_end))
+        self._tasks[session_id] = task
+        return task
+
+    async def _update_summary(self, session_id: str, new_messages: List[BaseMessage], covered_until: int) -> None:
+        """기존 요약 + 새 메시지로 요약 갱신"""
+        from .chains import json_llm  # 순환 import 방지
+
+        session_summary = self._summaries.get(session_id)
+        if session_summary is None:
+            return
+
+        prompt_template = ALL_PROMPTS.get('main_agent', {}).get('conversation_summary_prompt', '')
+        new_lines = "\n".join(_format_lines(new_messages))
+        updated_summary = ""
+
+        if json_llm and prompt_template:
+            try:
+                prompt = prompt_template.format(
+                    previous_summary=session_summary.summary or "없음",
+                    new_messages=new_lines
+                )
+                response = await json_llm.ainvoke([HumanMessage(content=prompt)], site="history_summary")
+                updated_summary = str(json.loads(response.content).get("summary", "")).strip()
+            except Exception as e:
+                logger.error("❌ [HISTORY] Summary update failed for %s: %s", session_id, e)
+
+        if not updated_summary:
+            # LLM 요약 실패 시 원문을 이어붙이고 길이만 제한
+            updated_summary = "\n".join(filter(None, [session_summary.summary, new_lines]))
+
+        # 세션이 그 사이 정리되었으면 반영하지 않음
+        if self._summaries.get(session_id) is session_summary:
+            session_summary.summary = updated_summary[-MAX_SUMMARY_CHARS:]
+            session_summary.covered_count = covered_until
+
+    def clear_session(self, session_id: str) -> None:
+        """세션 종료 시 요약 상태 정리"""
+        self._summaries.pop(session_id, None)
+        task = self._tasks.pop(session_id, None)
+        if task and not task.done():
+            task.cancel()
+
+
+# 전역 인스턴스
+history_manager = ConversationHistoryManager()
@@ -0,0 +1,159 @@
+# backend/app/graph/keyword_matcher.py
+"""
+공용 다중 키워드 매처 (Aho-Corasick)
+- 키워드 목록을 오토마톤으로 한 번 컴파일 → 발화를 한 번만 훑어서 모든 키워드 위치를 찾음
+- 매칭 비용이 키워드 수와 무관 (발화 길이 + 매칭 수에 비례)
+- 각 키워드는 등록 순서(priority)를 가지므로 "목록 순서대로 첫 번째로 포함된 키워드"를
+  찾던 기존 루프와 동일한 결과를 first_match()로 얻을 수 있음
+- 대소문자 변환 등 정규화는 호출 측에서 키워드/발화 모두에 동일하게 적용
+"""
+from collections import OrderedDict, deque
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+
+class KeywordHit(NamedTuple):
+    """키워드 매칭 결과 - text[start:end] == keyword"""
+    start: int
+    end: int
+    keyword: str
+    value: Any
+    priority: int
+
+
+class KeywordMatcher:
+    """Aho-Corasick 오토마톤"""
+    __slots__ = ("keywords", "values", "_goto", "_fail", "_out", "_always")
+
+    def __init__(self, entries: Iterable[Tuple[str, Any]]):
+        self.keywords: List[str] = []
+        self.values: List[Any] = []
+        # 노드별 전이 / 실패 링크 / 출력(키워드 인덱스)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+        # 빈 키워드는 모든 문자열에 포함됨 ("" in text == True)
+        self._always: List[int] = []
+
+        outputs: List[List[int]] = [[]]
+        for keyword, value in entries:
+            index = len(self.keywords)
+            self.keywords.append(keyword)
+            self.values.append(value)
+            if not keyword:
+                self._always.append(index)
+                continue
+            node = 0
+            for char in keyword:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append([])
+                node = next_node
+            outputs[node].append(index)
+
+        # BFS로 실패 링크 계산, 출력은 실패 링크를 따라 병합
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail_target = self._goto[fail].get(char, 0)
+                self._fail[child] = fail_target if fail_target != child else 0
+                outputs[child].extend(outputs[self._fail[child]])
+                queue.append(child)
+        self._out = [tuple(sorted(set(out))) for out in outputs]
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def iter_hits(self, text: str) -> Iterator[KeywordHit]:
+        """발화를 한 번 훑으며 모든 키워드 매칭을 끝 위치 순으로 반환"""
+        for index in self._always:
+            yield KeywordHit(0, 0, "", self.values[index], index)
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for position, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for index in out[node]:
+                keyword = self.keywords[index]
+                end = position + 1
+                yield KeywordHit(end - len(keyword), end, keyword, self.values[index], index)
+
+    def find_all(self, text: str) -> List[KeywordHit]:
+        return list(self.iter_hits(text))
+
+    def contains_any(self, text: str) -> bool:
+        """키워드가 하나라도 포함되어 있는지 (첫 매칭에서 종료)"""
+        for _ in self.iter_hits(text):
+            return True
+        return False
+
+    def first_match(self, text: str) -> Optional[KeywordHit]:
+        """등록 순서상 가장 앞선 키워드의 매칭 (기존 순차 루프와 동일한 결과)"""
+        best: Optional[KeywordHit] = None
+        for hit in self.iter_hits(text):
+            if best is None or hit.priority < best.priority:
+                best = hit
+                if best.priority == 0:
+                    break
+        return best
+
+    def leftmost_match(self, text: str) -> Optional[KeywordHit]:
+        """발화에서 가장 먼저 등장하는(가장 긴) 키워드 매칭"""
+        best: Optional[KeywordHit] = None
+        for hit in self.iter_hits(text):
+            if best is None or (hit.start, -len(hit.keyword)) < (best.start, -len(best.keyword)):
+                best = hit
+        return best
+
+
+def build_matcher(keywords: Iterable[str], value: Any = True) -> KeywordMatcher:
+    """키워드 목록 → 매처 (모든 키워드가 같은 value)"""
+    return KeywordMatcher((keyword, value) for keyword in keywords)
+
+
+def build_mapping_matcher(mapping: Dict[Any, Iterable[str]]) -> KeywordMatcher:
+    """{value: [keywords]} → 매처 (dict 순서 = 우선순위)"""
+    return KeywordMatcher((keyword, value) for value, keywords in mapping.items() for keyword in keywords)
+
+
+# 설정/시나리오 객체 → 매처 캐시 (동결된 시나리오 데이터 등 동일 객체 재사용 시 재컴파일 없음)
+MAX_CACHED_MATCHERS = 512
+_matcher_cache: "OrderedDict[Tuple[Any, str], Tuple[Any, Any]]" = OrderedDict()
+
+
+def content_key(value: Any) -> Any:
+    """dict/list 구조 → 내용 기준 해시 가능한 키 (턴마다 새로 만드는 목록용)"""
+    if isinstance(value, dict):
+        return tuple((k, content_key(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(content_key(v) for v in value)
+    return value
+
+
+def cached_matcher(source: Any, builder: Callable[[Any], Any], tag: str = "", key: Any = None) -> Any:
+    """
+    캐시된 매처 (LRU로 크기 제한)
+    - key가 없으면 source 객체 기준 (객체가 바뀌면 재생성) - 동결된 시나리오 데이터처럼 재사용되는 객체용
+    - key가 있으면 그 값 기준 (source는 보관하지 않음) - 턴마다 새로 만드는 목록은 content_key(source)
+    - builder는 매처 또는 매처를 포함한 인덱스 객체를 반환
+    - tag로 같은 source에 대한 서로 다른 매처를 구분
+    """
+    held = source if key is None else None
+    cache_key = ((id(source) if key is None else key), tag)
+    cached = _matcher_cache.get(cache_key)
+    if cached is not None and cached[0] is held:
+        _matcher_cache.move_to_end(cache_key)
+        return cached[1]
+    matcher = builder(source)
+    _matcher_cache[cache_key] = (held, matcher)
+    if len(_matcher_cache) > MAX_CACHED_MATCHERS:
+        _matcher_cache.popitem(last=False)
+    return matcher
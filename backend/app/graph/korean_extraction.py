@@ -0,0 +1,520 @@
+# backend/app/graph/korean_extraction.py
+"""
+한국어 슬롯 추출 엔진 (결정적 추출)
+- 전화번호 / 이름 / 이메일 / 주소 / 한국어 수사(십·백·천·만·억) / 날짜 / 이체한도 패턴을
+  모듈 로드 시 한 번 컴파일
+- 발화를 한 번 훑어 타입이 지정된 span(위치, 정규화된 값, 신뢰도, 대상 필드 힌트) 목록 생성
+- 발화별 결과를 LRU로 캐시 → EntityRecognitionAgent / InfoModificationAgent가 같은 발화에 대해
+  추출 결과를 공유 (발화당 한 번만 실행)
+- 숫자 파싱의 단일 구현: convert_korean_number(만원 단위 금액), convert_korean_to_digits(자릿수 읽기)
+
+실행: python -m app.graph.korean_extraction  (backend 디렉토리에서, 코퍼스 정확도/처리량 측정)
+"""
+import json
+import re
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+
+# ---------------------------------------------------------------------------
+# 한국어 수사
+# ---------------------------------------------------------------------------
+
+# 자릿수 읽기 (공일공, 오육칠팔, 하나둘셋)
+DIGIT_WORDS: Dict[str, int] = {
+    '영': 0, '공': 0,
+    '일': 1, '하나': 1,
+    '이': 2, '둘': 2,
+    '삼': 3, '셋': 3,
+    '사': 4, '넷': 4,
+    '오': 5, '다섯': 5,
+    '육': 6, '여섯': 6,
+    '칠': 7, '일곱': 7,
+    '팔': 8, '여덟': 8,
+    '구': 9, '아홉': 9,
+}
+SMALL_UNITS: Dict[str, int] = {'십': 10, '백': 100, '천': 1000}
+LARGE_UNITS: Dict[str, int] = {'만': 10 ** 4, '억': 10 ** 8, '조': 10 ** 12}
+# "1억 5천" → 1억 5천만 처럼 큰 단위 뒤에 생략된 하위 단위
+_IMPLIED_LOWER_UNIT = {10 ** 8: 10 ** 4, 10 ** 12: 10 ** 8}
+
+# 두 글자 단어를 먼저 시도해야 "일곱"이 "1곱"이 되지 않음
+_DIGIT_WORD = "하나|다섯|여섯|일곱|여덟|아홉|[영공일이삼사오육칠팔구둘셋넷]"
+_DIGIT_WORD_PATTERN = re.compile(_DIGIT_WORD)
+# 자릿수 읽기로 볼 연속 구간 (3자리 이상 - "중간이", "뒤에 이" 같은 조사는 제외,
+# "오육칠팔이에요"의 서술격 조사 "이"도 제외)
+_DIGIT_RUN_PATTERN = re.compile(f"(?:{_DIGIT_WORD}){{3,}}?(?=이(?:에요|예요|야|요|고|라|다|었|니)|(?!{_DIGIT_WORD}))")
+
+_NUMBER_TOKEN_PATTERN = re.compile(rf"\d+|{_DIGIT_WORD}|[십백천만억조]")
+_NUMBER_TEXT_PATTERN = re.compile(rf"(?:\d+|{_DIGIT_WORD}|[십백천만억조])+")
+_NUMBER_NOISE_PATTERN = re.compile(r"[\s,]|원$")
+_LARGE_UNIT_CHARS = frozenset(LARGE_UNITS)
+
+
+def parse_korean_number(text: str) -> Optional[int]:
+    """
+    한국어/혼합 수 표현 → 정수 (해석할 수 없으면 None)
+    예) '오백만' → 5000000, '1억 5천' → 150000000, '3,000' → 3000, '이십오' → 25, '일이삼사' → 1234
+    """
+    if text is None:
+        return None
+    cleaned = _NUMBER_NOISE_PATTERN.sub("", str(text).strip())
+    if not cleaned:
+        return None
+    if cleaned.isdigit():
+        return int(cleaned)
+    if not _NUMBER_TEXT_PATTERN.fullmatch(cleaned):
+        return None
+
+    total = 0            # 큰 단위(만/억/조)로 확정된 값
+    section = 0          # 현재 큰 단위 구간 (천/백/십 단위 합)
+    current: Optional[int] = None   # 아직 단위가 붙지 않은 숫자
+    last_large = 0
+    for token in _NUMBER_TOKEN_PATTERN.findall(cleaned):
+        if token.isdigit():
+            current = int(token) if current is None else int(f"{current}{token}")
+        elif token in DIGIT_WORDS:
+            digit = DIGIT_WORDS[token]
+            current = digit if current is None else current * 10 + digit
+        elif token in SMALL_UNITS:
+            section += (1 if current is None else current) * SMALL_UNITS[token]
+            current = None
+        else:
+            unit = LARGE_UNITS[token]
+            amount = section + (current or 0)
+            total += (amount or 1) * unit
+            section, current, last_large = 0, None, unit
+
+    rest = section + (current or 0)
+    if rest and last_large in _IMPLIED_LOWER_UNIT and rest < _IMPLIED_LOWER_UNIT[last_large]:
+        rest *= _IMPLIED_LOWER_UNIT[last_large]
+    return total + rest
+
+
+def convert_korean_number(text: str) -> Optional[int]:
+    """한국어 금액 표현을 만원 단위 숫자로 변환 ('오백만원' → 500, '1억' → 10000, '500' → 500)"""
+    value = parse_korean_number(text)
+    if value is None:
+        return None
+    if _LARGE_UNIT_CHARS.intersection(str(text)):
+        return value // 10000
+    return value
+
+
+def convert_korean_to_digits(text: str) -> str:
+    """한국어 숫자 읽기를 아라비아 숫자로 변환 ('오육칠팔' → '5678')"""
+    return _DIGIT_WORD_PATTERN.sub(lambda m: str(DIGIT_WORDS[m.group()]), text)
+
+
+def _digit_view(text: str) -> Optional[Tuple[str, List[int]]]:
+    """
+    자릿수 읽기 구간만 숫자로 바꾼 텍스트 + 위치 매핑
+    - origin[i]: 변환된 텍스트 i번째 문자의 원문 위치 (마지막 원소는 len(text))
+    - 바꿀 구간이 없으면 None
+    """
+    pieces: List[str] = []
+    origin: List[int] = []
+    pos = 0
+    for run in _DIGIT_RUN_PATTERN.finditer(text):
+        pieces.append(text[pos:run.start()])
+        origin.extend(range(pos, run.start()))
+        for word in _DIGIT_WORD_PATTERN.finditer(run.group()):
+            pieces.append(str(DIGIT_WORDS[word.group()]))
+            origin.append(run.start() + word.start())
+        pos = run.end()
+    if not origin and pos == 0:
+        return None
+    pieces.append(text[pos:])
+    origin.extend(range(pos, len(text) + 1))
+    return "".join(pieces), origin
+
+
+# ---------------------------------------------------------------------------
+# 정규화
+# ---------------------------------------------------------------------------
+
+_NON_DIGIT_PATTERN = re.compile(r"\D")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_phone(text: str) -> Optional[str]:
+    """전화번호 → 하이픈 형식 (01012345678 → 010-1234-5678)"""
+    digits = _NON_DIGIT_PATTERN.sub("", text)
+    if len(digits) == 11:
+        return f"{digits[:3]}-{digits[3:7]}-{digits[7:]}"
+    if len(digits) == 10:
+        if digits.startswith("02"):
+            return f"{digits[:2]}-{digits[2:6]}-{digits[6:]}"
+        return f"{digits[:3]}-{digits[3:6]}-{digits[6:]}"
+    if len(digits) == 9 and digits.startswith("02"):
+        return f"{digits[:2]}-{digits[2:5]}-{digits[5:]}"
+    return None
+
+
+def normalize_email(text: str) -> Optional[str]:
+    """이메일 → 공백 제거 + 도메인 소문자"""
+    compact = _WHITESPACE_PATTERN.sub("", text)
+    local, sep, domain = compact.partition("@")
+    if not sep or not local or "." not in domain:
+        return None
+    return f"{local}@{domain.lower()}"
+
+
+_REGION_PREFIX_PATTERN = re.compile(r"^[가-힣]+(?:특별시|광역시|특별자치시|특별자치도|도|시|군|구)\s")
+
+
+def is_partial_address(address: str) -> bool:
+    """시/도·구 없이 도로명/동 + 번지만 있는 부분 주소인지"""
+    return not _REGION_PREFIX_PATTERN.match(address.strip())
+
+
+# ---------------------------------------------------------------------------
+# 추출 결과
+# ---------------------------------------------------------------------------
+
+class ExtractedSpan(NamedTuple):
+    """
+    추출된 값 하나 - text[start:end]가 원문 구간
+    - kind: phone / phone_middle / phone_tail / name / email / address / amount / day_of_month / date
+    - value: 정규화된 값 (amount는 만원 단위 int, day_of_month는 int, 나머지는 str)
+    - field: 문맥상 대상 필드 힌트 (예: transfer_limit_per_day, work_address) - 없으면 None
+    """
+    kind: str
+    value: Any
+    start: int
+    end: int
+    confidence: float
+    field: Optional[str] = None
+
+
+# 슬롯 키 → (span 종류, 필드 힌트가 일치하는 span만 허용할지)
+FIELD_SPAN_KINDS: Dict[str, Tuple[str, bool]] = {
+    "customer_phone": ("phone", False),
+    "phone_number": ("phone", False),
+    "customer_name": ("name", False),
+    "email": ("email", False),
+    "transfer_limit_per_time": ("amount", True),
+    "transfer_limit_per_day": ("amount", True),
+    "ib_daily_limit": ("amount", False),
+    "cc_delivery_address": ("address", False),
+    "card_delivery_location": ("address", False),
+    "payment_date": ("day_of_month", False),
+}
+
+
+class ExtractionResult:
+    """발화 하나의 추출 결과 (캐시되어 공유되므로 읽기 전용)"""
+    __slots__ = ("text", "spans", "_by_kind")
+
+    def __init__(self, text: str, spans: Tuple[ExtractedSpan, ...]):
+        self.text = text
+        self.spans = spans
+        by_kind: Dict[str, List[ExtractedSpan]] = {}
+        for span in spans:
+            by_kind.setdefault(span.kind, []).append(span)
+        self._by_kind: Dict[str, Tuple[ExtractedSpan, ...]] = {k: tuple(v) for k, v in by_kind.items()}
+
+    def spans_of(self, kind: str) -> Tuple[ExtractedSpan, ...]:
+        return self._by_kind.get(kind, ())
+
+    def best(self, kind: str, field: Optional[str] = None, strict: bool = False,
+             min_confidence: float = 0.0) -> Optional[ExtractedSpan]:
+        """
+        kind 중 가장 신뢰도 높은 span (동률이면 앞쪽)
+        - field가 주어지면 해당 필드 힌트가 붙은 span 우선, strict면 그런 span만
+        """
+        candidates = [s for s in self.spans_of(kind) if s.confidence >= min_confidence]
+        if field is not None:
+            hinted = [s for s in candidates if s.field == field]
+            if hinted or strict:
+                candidates = hinted
+        if not candidates:
+            return None
+        return max(candidates, key=lambda s: (s.confidence, -s.start))
+
+    def value_for(self, field_key: str) -> Optional[str]:
+        """슬롯 키에 해당하는 값 (문자열) - 매핑이 없는 슬롯이면 None"""
+        spec = FIELD_SPAN_KINDS.get(field_key)
+        if spec is None:
+            return None
+        kind, strict = spec
+        span = self.best(kind, field_key, strict)
+        return str(span.value) if span is not None else None
+
+    def __repr__(self) -> str:
+        return f"ExtractionResult({self.text!r}, {list(self.spans)!r})"
+
+
+# ---------------------------------------------------------------------------
+# 패턴 규칙
+# ---------------------------------------------------------------------------
+
+class _Rule(NamedTuple):
+    kind: str
+    pattern: "re.Pattern[str]"
+    confidence: float
+    build: Callable[["re.Match[str]"], Any]
+    field: Optional[Any] = None          # str 또는 match → str 함수
+    digit_view: bool = False             # 자릿수 읽기 변환 텍스트에도 적용
+
+
+# 금액: '500', '1,000만', '오백만', '1억 5천만', '일억오천' (각 토큰은 숫자 또는 단위로 끝나는 한글 수사)
+_AMOUNT = (
+    r"(?P<amount>(?:\d[\d,]*|[일이삼사오육칠팔구]*[십백천만억])+[일이삼사오육칠팔구]?"
+    r"(?:(?<=[억만])\s+(?:\d[\d,]*|[일이삼사오육칠팔구]*[십백천만])+[일이삼사오육칠팔구]?)*)"
+)
+_LIMIT_TAIL = r"(?:\s*이체)?(?:\s*한도)?(?:는|은|를|을|에|로)?\s*"
+
+_NAME_END = r"(?=$|[\s.,!?~]|이?에요|예요|입니다|이고|이?요|으?로|이?라고)"
+_NAME_SUFFIX = r"\s*(?:입니다|이에요|예요|이고요|이?라고\s*해\s*주세요)"
+_SURNAMES = "김이박최정강조윤장임한신오서권황안송류전고문양손배백허남심노하곽성차주우구나민유진지마원봉"
+NON_NAME_WORDS = frozenset([
+    "이름", "성함", "번호", "전화", "연락처", "정보", "수정", "변경", "주소", "이메일",
+    "그거", "이거", "저거", "여기", "거기", "아니", "맞아", "저는", "제가", "본인", "고객",
+    "한도", "하루", "바꿔", "계좌", "카드", "신청",
+])
+# 이름 뒤에 오지 않는 어미/조사로 끝나면 이름이 아님 ("바꿔줘", "틀렸어", "이에요")
+_NON_NAME_ENDINGS = ("요", "줘", "어", "해", "는", "을", "를")
+
+
+def _amount_value(match: "re.Match[str]") -> Optional[int]:
+    return convert_korean_number(match.group("amount"))
+
+
+def _phone_value(match: "re.Match[str]") -> Optional[str]:
+    return normalize_phone(match.group(0))
+
+
+def _name_value(match: "re.Match[str]") -> Optional[str]:
+    name = match.group("name")
+    if name in NON_NAME_WORDS or name.endswith(_NON_NAME_ENDINGS) or parse_korean_number(name) is not None:
+        return None
+    return name
+
+
+def _email_value(match: "re.Match[str]") -> Optional[str]:
+    return normalize_email(match.group(0))
+
+
+def _address_value(match: "re.Match[str]") -> Optional[str]:
+    # 번지도 시/구도 없는 단어("자동", "으로")는 주소로 보지 않음
+    if not match.group("number") and not match.group("region"):
+        return None
+    return _WHITESPACE_PATTERN.sub(" ", match.group(0).strip())
+
+
+_ADDRESS_OWNER_PATTERN = re.compile(r"(직장|회사|근무지)|(집|자택|사는\s*곳|거주지)")
+
+
+def _address_field(match: "re.Match[str]") -> Optional[str]:
+    """주소 앞에서 가장 가까운 소유 표현(집/직장)으로 대상 필드 추정"""
+    owner = None
+    for owner in _ADDRESS_OWNER_PATTERN.finditer(match.string, 0, match.start()):
+        pass
+    if owner is None:
+        return None
+    return "work_address" if owner.group(1) else "address"
+
+
+def _day_value(match: "re.Match[str]") -> Optional[int]:
+    day = parse_korean_number(match.group("day"))
+    return day if day is not None and 1 <= day <= 31 else None
+
+
+def _date_value(match: "re.Match[str]") -> Optional[str]:
+    month, day = int(match.group("month")), int(match.group("day"))
+    if not (1 <= month <= 12 and 1 <= day <= 31):
+        return None
+    if match.group("year"):
+        return f"{int(match.group('year')):04d}-{month:02d}-{day:02d}"
+    return f"{month:02d}-{day:02d}"
+
+
+_RULES: Tuple[_Rule, ...] = (
+    # 전화번호
+    _Rule("phone", re.compile(r"(?<!\d)0\d{1,2}[-\s.]*\d{3,4}[-\s.]*\d{4}(?!\d)"), 0.95, _phone_value,
+          digit_view=True),
+    _Rule("phone_tail", re.compile(
+        r"(?:뒷\s*번호|뒷\s*자리|뒤\s*번호|끝\s*번호|끝\s*자리|마지막(?:\s*번호|\s*자리)?|뒤)"
+        r"(?:는|은|가|이|를|을)?\s*(?P<digits>\d{4})(?!\d)"), 0.85, lambda m: m.group("digits"), digit_view=True),
+    _Rule("phone_middle", re.compile(
+        r"(?:가운데|중간)(?:\s*번호|\s*자리)?(?:는|은|가|이|를|을)?\s*(?P<digits>\d{3,4})(?!\d)"), 0.85,
+          lambda m: m.group("digits"), digit_view=True),
+
+    # 이름
+    _Rule("name", re.compile(rf"(?:이름|성함)(?:은|는|이|을|를)?\s*(?P<name>[가-힣]{{2,4}}?){_NAME_END}"), 0.9,
+          _name_value, field="customer_name"),
+    _Rule("name", re.compile(rf"(?<![가-힣])(?P<name>[가-힣]{{2,4}}?){_NAME_SUFFIX}"), 0.75, _name_value),
+    _Rule("name", re.compile(rf"(?<![가-힣])(?P<name>[{_SURNAMES}][가-힣]{{1,2}})(?![가-힣])"), 0.5, _name_value),
+
+    # 이메일
+    _Rule("email", re.compile(r"[A-Za-z0-9._%+-]+\s*@\s*[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}"), 0.95,
+          _email_value, field="email"),
+
+    # 주소 (시/도, 시/군/구 + 동/로/길 + 번지)
+    _Rule("address", re.compile(
+        r"(?<![가-힣\d])"
+        r"(?P<region>(?:[가-힣]+(?:특별시|광역시|특별자치시|특별자치도|도|시)\s+)?(?:[가-힣]+(?:시|군|구)\s+)?)"
+        r"[가-힣\d]*[가-힣](?<!으)(?:동|로|길|읍|면)"
+        r"(?:\s*(?P<number>\d+(?:-\d+)?)(?:\s*번지)?)?(?:\s*\d+호)?"), 0.85, _address_value, field=_address_field),
+
+    # 이체한도 (1회 / 1일) 및 일반 금액
+    _Rule("amount", re.compile(rf"(?:1회|일회|회당|한\s*번에){_LIMIT_TAIL}{_AMOUNT}"), 0.9, _amount_value,
+          field="transfer_limit_per_time"),
+    _Rule("amount", re.compile(rf"(?:1일|일일|하루|일당){_LIMIT_TAIL}{_AMOUNT}"), 0.9, _amount_value,
+          field="transfer_limit_per_day"),
+    _Rule("amount", re.compile(rf"(?<![\d가-힣]){_AMOUNT}(?=\s*원)"), 0.7, _amount_value),
+    _Rule("amount", re.compile(
+        r"(?<![\d가-힣\-])(?P<amount>\d[\d,]*(?:\s*[천백]?만)?)(?![\d,\-]|\s*(?:회|일|월|년|시|분|호|번지|층))"),
+          0.4, _amount_value),
+
+    # 날짜
+    _Rule("date", re.compile(
+        r"(?:(?P<year>\d{4})\s*(?:년|[.\-/])\s*)?(?P<month>\d{1,2})\s*(?:월|[.\-/])\s*(?P<day>\d{1,2})(?!\d)\s*일?"),
+          0.85, _date_value),
+    _Rule("day_of_month", re.compile(
+        r"(?:매월|매달|(?<!\d)월)\s*(?P<day>\d{1,2}(?!\d)|[일이삼사오육칠팔구십]{1,3}?(?=\s*일))\s*일?"), 0.9, _day_value),
+    _Rule("day_of_month", re.compile(r"(?<![\d.\-/])(?P<day>\d{1,2})\s*일(?:날)?"), 0.7, _day_value),
+)
+
+# 자릿수 읽기 변환 텍스트에서 찾은 span의 신뢰도 감점
+DIGIT_VIEW_PENALTY = 0.1
+# 이보다 신뢰도가 낮은 span은 더 확실한 span 안에 있으면 버림 (전화번호 속 숫자, 주소 속 "서울시")
+WEAK_SPAN_CONFIDENCE = 0.6
+
+
+# ---------------------------------------------------------------------------
+# 엔진
+# ---------------------------------------------------------------------------
+
+MAX_CACHED_UTTERANCES = 256
+
+
+class KoreanSlotExtractor:
+    """컴파일된 규칙으로 발화에서 span을 추출하고 발화별 결과를 캐시"""
+
+    def __init__(self, rules: Tuple[_Rule, ...] = _RULES, cache_size: int = MAX_CACHED_UTTERANCES):
+        self.rules = rules
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, ExtractionResult]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def extract(self, text: str) -> ExtractionResult:
+        """발화 → ExtractionResult (같은 발화는 캐시된 결과 재사용)"""
+        text = text or ""
+        cached = self._cache.get(text)
+        if cached is not None:
+            self._cache.move_to_end(text)
+            self.hits += 1
+            return cached
+        self.misses += 1
+        result = self._extract_uncached(text)
+        self._cache[text] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result
+
+    def _extract_uncached(self, text: str) -> ExtractionResult:
+        spans: List[ExtractedSpan] = []
+        seen = set()
+        view = None
+        if any(rule.digit_view for rule in self.rules):
+            view = _digit_view(text)
+
+        for rule in self.rules:
+            sources = [(text, None, 0.0)]
+            if rule.digit_view and view is not None:
+                sources.append((view[0], view[1], DIGIT_VIEW_PENALTY))
+            for source, origin, penalty in sources:
+                for match in rule.pattern.finditer(source):
+                    value = rule.build(match)
+                    if value is None:
+                        continue
+                    start, end = match.span()
+                    if origin is not None:
+                        start, end = origin[start], origin[end]
+                    field = rule.field(match) if callable(rule.field) else rule.field
+                    key = (rule.kind, value, field)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    spans.append(ExtractedSpan(rule.kind, value, start, end, round(rule.confidence - penalty, 2), field))
+
+        spans = [span for span in spans if not self._is_shadowed(span, spans)]
+        spans.sort(key=lambda s: (s.start, -s.confidence))
+        return ExtractionResult(text, tuple(spans))
+
+    @staticmethod
+    def _is_shadowed(span: ExtractedSpan, spans: List[ExtractedSpan]) -> bool:
+        if span.confidence >= WEAK_SPAN_CONFIDENCE:
+            return False
+        return any(
+            other.confidence > span.confidence
+            and other.start <= span.start and span.end <= other.end
+            for other in spans
+        )
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+
+# 전역 인스턴스
+korean_extractor = KoreanSlotExtractor()
+
+
+# ---------------------------------------------------------------------------
+# 벤치마크
+# ---------------------------------------------------------------------------
+
+CORPUS_PATH = Path(__file__).resolve().parent.parent / "data" / "extraction_corpus.json"
+
+
+def run_benchmark(corpus_path: Path = CORPUS_PATH, repeat: int = 200) -> Dict[str, Any]:
+    """
+    발화 코퍼스로 필드별 정확도와 처리량 측정
+    - 코퍼스 형식: [{"text": "...", "expected": {"field_key": "value", ...}}, ...]
+    - 처리량은 캐시를 거치지 않은 추출 기준
+    """
+    with open(corpus_path, 'r', encoding='utf-8') as f:
+        corpus = json.load(f)
+
+    extractor = KoreanSlotExtractor()
+    checked = correct = 0
+    failures = []
+    for item in corpus:
+        result = extractor.extract(item["text"])
+        for field_key, expected in item.get("expected", {}).items():
+            actual = result.value_for(field_key)
+            checked += 1
+            if actual == (None if expected is None else str(expected)):
+                correct += 1
+            else:
+                failures.append({"text": item["text"], "field": field_key, "expected": expected, "actual": actual})
+
+    texts = [item["text"] for item in corpus]
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            extractor._extract_uncached(text)
+    elapsed = time.perf_counter() - started
+    count = repeat * len(texts)
+
+    return {
+        "utterances": len(texts),
+        "checked_fields": checked,
+        "accuracy": correct / checked if checked else 1.0,
+        "failures": failures,
+        "avg_us_per_utterance": elapsed / count * 1e6 if count else 0.0,
+    }
+
+
+if __name__ == "__main__":
+    report = run_benchmark()
+    print(f"📊 [KOREAN_EXTRACTION] {report['utterances']} utterances, "
+          f"accuracy {report['accuracy']:.1%} ({report['checked_fields']} fields), "
+          f"{report['avg_us_per_utterance']:.1f}µs/utterance")
+    for failure in report["failures"]:
+        print(f"   ❌ {failure}")
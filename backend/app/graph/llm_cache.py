@@ -0,0 +1,183 @@
+# backend/app/graph/llm_cache.py
+"""
+결정적 JSON LLM 호출 응답 캐시
+- 키: 렌더링된 프롬프트(정규화) + 모델명 + 호출 파라미터의 해시
+- 1단계: 프로세스 내 LRU (TTL 포함)
+- 2단계(선택): 여러 워커가 공유하는 외부 저장소 (LLM_CACHE_REDIS_URL 설정 시 Redis)
+- 사용 여부와 TTL은 호출 지점 정책(CallPolicy.cache_ttl)으로 지정 - 없으면 캐시하지 않음
+"""
+import hashlib
+import json
+import logging
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.config import LLM_CACHE_ENABLED, LLM_CACHE_MAX_ENTRIES, LLM_CACHE_REDIS_URL
+
+logger = logging.getLogger(__name__)
+
+SHARED_KEY_PREFIX = "llm_cache:"
+
+# 캐시 키에 포함할 모델 파라미터
+KEY_MODEL_PARAMS = ("temperature", "top_p", "max_tokens", "model_kwargs")
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """유니코드 정규화(NFC) + 공백 정리 - 띄어쓰기/줄바꿈만 다른 프롬프트를 같은 키로"""
+    return _WHITESPACE_PATTERN.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def _prompt_parts(payload: Any) -> List[Tuple[str, str]]:
+    """LangChain 입력(문자열 / 메시지 목록 / PromptValue)을 (역할, 정규화된 내용) 목록으로"""
+    if hasattr(payload, "to_messages"):
+        payload = payload.to_messages()
+    if isinstance(payload, str):
+        return [("human", normalize_text(payload))]
+    parts = []
+    for item in payload if isinstance(payload, (list, tuple)) else [payload]:
+        if isinstance(item, dict):
+            role, content = item.get("role", "human"), item.get("content", "")
+        elif isinstance(item, (list, tuple)) and len(item) == 2:
+            role, content = item
+        else:
+            role, content = getattr(item, "type", "human"), getattr(item, "content", item)
+        parts.append((str(role), normalize_text(content if isinstance(content, str) else json.dumps(content, ensure_ascii=False, sort_keys=True))))
+    return parts
+
+
+def cache_key(model_name: str, model: Any, payload: Any, call_kwargs: Optional[Dict[str, Any]] = None) -> str:
+    params = {name: getattr(model, name, None) for name in KEY_MODEL_PARAMS}
+    material = json.dumps(
+        {"model": model_name, "params": params, "call": call_kwargs or {}, "prompt": _prompt_parts(payload)},
+        ensure_ascii=False, sort_keys=True, default=str,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def cacheable_content(result: Any) -> Optional[str]:
+    """JSON으로 파싱되는 응답만 캐시 (잘린 응답/오류 문구가 고정되지 않도록)"""
+    content = getattr(result, "content", None)
+    if not isinstance(content, str) or not content.strip():
+        return None
+    try:
+        json.loads(content.strip().replace("```json", "").replace("```", ""))
+    except ValueError:
+        return None
+    return content
+
+
+class LRUCache:
+    """TTL이 있는 프로세스 내 LRU"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisSharedCache:
+    """워커 간 공유 캐시 (redis 패키지가 있을 때만 사용)"""
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis_asyncio
+        self._client = redis_asyncio.from_url(url)
+
+    async def get(self, key: str) -> Optional[str]:
+        value = await self._client.get(SHARED_KEY_PREFIX + key)
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        await self._client.set(SHARED_KEY_PREFIX + key, value, ex=max(1, int(ttl)))
+
+
+def _create_shared_cache() -> Optional[RedisSharedCache]:
+    if not LLM_CACHE_REDIS_URL:
+        return None
+    try:
+        return RedisSharedCache(LLM_CACHE_REDIS_URL)
+    except ImportError:
+        logger.warning("⚠️ [LLM_CACHE] LLM_CACHE_REDIS_URL is set but redis is not installed - using in-memory cache only")
+        return None
+
+
+class LLMResponseCache:
+    """메모리 LRU + 선택적 공유 저장소, 호출 지점별 적중률 집계"""
+
+    def __init__(self, max_entries: int = LLM_CACHE_MAX_ENTRIES, shared: Optional[RedisSharedCache] = None,
+                 enabled: bool = LLM_CACHE_ENABLED):
+        self.enabled = enabled
+        self.local = LRUCache(max_entries)
+        self.shared = shared
+        self._sites: Dict[str, Dict[str, int]] = {}
+
+    def _site(self, site: str) -> Dict[str, int]:
+        return self._sites.setdefault(site, {"lookups": 0, "hits": 0, "shared_hits": 0, "stores": 0})
+
+    async def get(self, site: str, key: str, ttl: float) -> Optional[str]:
+        """캐시된 응답 내용 (없으면 None) - 공유 저장소에서 찾은 값은 메모리에도 ttl 동안 보관"""
+        counters = self._site(site)
+        counters["lookups"] += 1
+        content = self.local.get(key)
+        if content is not None:
+            counters["hits"] += 1
+            return content
+        if self.shared is None:
+            return None
+        try:
+            content = await self.shared.get(key)
+        except Exception as e:
+            logger.warning("⚠️ [LLM_CACHE] shared get failed: %s", e)
+            return None
+        if content is not None:
+            counters["hits"] += 1
+            counters["shared_hits"] += 1
+            self.local.set(key, content, ttl)
+        return content
+
+    async def set(self, site: str, key: str, content: str, ttl: float) -> None:
+        self._site(site)["stores"] += 1
+        self.local.set(key, content, ttl)
+        if self.shared is None:
+            return
+        try:
+            await self.shared.set(key, content, ttl)
+        except Exception as e:
+            logger.warning("⚠️ [LLM_CACHE] shared set failed: %s", e)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        summary = {}
+        for site, counters in self._sites.items():
+            lookups = counters["lookups"]
+            summary[site] = {**counters, "hit_rate": counters["hits"] / lookups if lookups else 0.0}
+        return summary
+
+
+# 전역 인스턴스
+llm_cache = LLMResponseCache(shared=_create_shared_cache())
@@ -0,0 +1,564 @@
+# backend/app/graph/llm_gateway.py
+"""
+LLM 게이트웨이 - 모든 LLM 호출이 거치는 단일 경로
+- 공유 HTTP 커넥션 풀 (ChatOpenAI / AsyncOpenAI가 같은 httpx.AsyncClient 사용)
+- 호출 지점(site)별 정책: 타임아웃, 재시도(지수 백오프 + jitter), hedged request, 우선순위
+- 분당 요청 수 / 토큰 수 토큰 버킷 + 동시 호출 수 제한 (우선순위 대기열 → 실시간 음성 턴 먼저)
+- 대기 시간이 정책 한도를 넘으면 LLMCapacityError (RateLimitError를 맞기 전에 입구에서 제어)
+- 호출 지점별 모델 선택은 model_router (config/model_routing.yaml)
+- cache_ttl이 있는 호출 지점은 llm_cache에서 같은 프롬프트의 응답 재사용
+- 호출마다 llm.<site> span (모델, 캐시 적중, 토큰, 재시도/hedge 이벤트) - 턴 트레이스의 자식
+
+사용:
+    response = await json_llm.ainvoke(messages, site="analyze_user_intent")
+    chain = prompt | generative_llm.for_site("web_synthesis")
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple, TypeVar
+
+from langchain_core.runnables import Runnable
+
+from .llm_cache import cache_key, cacheable_content, llm_cache
+from .model_router import current_routing_context, model_router
+from ..core.metrics import LLM_CALL_LATENCY, LLM_TOKENS
+from ..core.tracing import add_event, record_span, set_attributes, start_span
+from ..core.config import (
+    LLM_DEFAULT_TIMEOUT,
+    LLM_HTTP_MAX_CONNECTIONS,
+    LLM_MAX_CONCURRENCY,
+    LLM_REQUESTS_PER_MINUTE,
+    LLM_TOKENS_PER_MINUTE,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+PRIORITY_LIVE = 0           # 사용자 응답 대기 중인 음성 턴
+PRIORITY_BACKGROUND = 1     # 요약, shadow 비교 등 응답 경로 밖의 작업
+
+# 응답 토큰 수 추정치 (실제 사용량은 응답의 usage로 보정)
+OUTPUT_TOKEN_ESTIMATE = 300
+
+_priority_override: ContextVar[Optional[int]] = ContextVar("llm_priority", default=None)
+
+
+@contextmanager
+def background_priority():
+    """이 블록(및 여기서 만든 task)의 LLM 호출을 백그라운드 우선순위로 실행"""
+    token = _priority_override.set(PRIORITY_BACKGROUND)
+    try:
+        yield
+    finally:
+        _priority_override.reset(token)
+
+
+class LLMCapacityError(RuntimeError):
+    """요청/토큰 한도 대기 시간 초과 (과부하로 호출을 받아들이지 않음)"""
+
+
+class CallPolicy(NamedTuple):
+    """호출 지점별 정책"""
+    timeout: float = LLM_DEFAULT_TIMEOUT      # 시도 한 번의 제한 시간 (스트리밍은 첫 chunk까지)
+    max_retries: int = 2
+    backoff: float = 0.5                      # 첫 재시도 대기 (초), 이후 2배씩
+    backoff_max: float = 8.0
+    hedge_after: Optional[float] = None       # 이 시간 안에 응답이 없으면 같은 요청을 한 번 더 보내 먼저 온 응답 사용
+    priority: int = PRIORITY_LIVE
+    max_queue_wait: float = 10.0              # 한도 대기 최대 시간
+    cache_ttl: Optional[float] = None         # 응답 캐시 유지 시간 (초) - 입력이 같으면 결과가 같은 JSON 호출만 지정 (세션 상태에 의존하는 호출 지점 제외)
+
+
+DEFAULT_POLICY = CallPolicy()
+
+# 호출 지점 → 정책 (없으면 DEFAULT_POLICY)
+SITE_POLICIES: Dict[str, CallPolicy] = {
+    # 턴마다 응답 경로에 있는 짧은 JSON 분류/추출 호출 - 짧은 타임아웃 + hedge
+    # main_router는 캐시하지 않음 - 같은 "네"라도 현재 단계/시나리오 상태에 따라 라우팅 결정이 달라짐
+    "main_router": CallPolicy(timeout=15.0, max_retries=3, backoff=1.0, hedge_after=4.0),
+    "scenario_nlu": CallPolicy(timeout=15.0, hedge_after=4.0),
+    "turn_understanding": CallPolicy(timeout=15.0, hedge_after=4.0),
+    "analyze_user_intent": CallPolicy(timeout=10.0, hedge_after=3.0),
+    "extract_entities_flexibly": CallPolicy(timeout=10.0, hedge_after=3.0),
+    "extract_entities": CallPolicy(timeout=10.0, hedge_after=3.0),
+    "similarity_matching": CallPolicy(timeout=10.0, hedge_after=3.0),
+    "entity_validation": CallPolicy(timeout=10.0, hedge_after=3.0),
+    "choice_mapping": CallPolicy(timeout=8.0, hedge_after=2.5, cache_ttl=3600.0),
+    "entity_verification": CallPolicy(timeout=8.0, hedge_after=2.5, cache_ttl=3600.0),
+    "field_extraction": CallPolicy(timeout=10.0, hedge_after=3.0, cache_ttl=3600.0),
+    "service_selection": CallPolicy(timeout=10.0, hedge_after=3.0, cache_ttl=3600.0),
+    "stage_transition": CallPolicy(timeout=10.0, hedge_after=3.0),
+    # 생성형 응답 - 길어질 수 있으므로 타임아웃을 넉넉히, hedge 없음
+    "synthesizer": CallPolicy(timeout=30.0, max_retries=1),
+    "response_generation": CallPolicy(timeout=20.0, max_retries=1),
+    "info_modification": CallPolicy(timeout=20.0, max_retries=1),
+    "rag_query_expansion": CallPolicy(timeout=15.0),
+    "rag_answer": CallPolicy(timeout=30.0, max_retries=1),
+    "web_synthesis": CallPolicy(timeout=30.0, max_retries=1),
+    # 응답 경로 밖
+    "history_summary": CallPolicy(timeout=30.0, priority=PRIORITY_BACKGROUND, max_queue_wait=60.0),
+}
+
+
+def _retryable_errors() -> Tuple[type, ...]:
+    errors: List[type] = [asyncio.TimeoutError]
+    try:
+        import openai
+        errors.extend([openai.RateLimitError, openai.APITimeoutError, openai.APIConnectionError,
+                       openai.InternalServerError])
+    except (ImportError, AttributeError):
+        pass
+    return tuple(errors)
+
+
+RETRYABLE_ERRORS = _retryable_errors()
+
+
+def estimate_tokens(payload: Any) -> int:
+    """요청 토큰 수 대략 추정 (한국어 기준 2글자 ≈ 1토큰) + 응답 추정치"""
+    if isinstance(payload, str):
+        chars = len(payload)
+    elif isinstance(payload, dict):
+        chars = sum(len(str(value)) for value in payload.values())
+    elif isinstance(payload, (list, tuple)):
+        chars = 0
+        for item in payload:
+            content = item.get("content") if isinstance(item, dict) else getattr(item, "content", item)
+            chars += len(str(content))
+    else:
+        chars = len(str(payload))
+    return chars // 2 + OUTPUT_TOKEN_ESTIMATE
+
+
+class TokenUsage(NamedTuple):
+    total: int
+    prompt: int
+    cached: int      # 프롬프트 중 provider 측 prefix 캐시에서 읽은 토큰
+    completion: int
+
+
+def token_usage(result: Any) -> Optional[TokenUsage]:
+    """응답의 실제 토큰 사용량 (LangChain AIMessage/AIMessageChunk 또는 OpenAI 응답/스트림 chunk)"""
+    usage = getattr(result, "usage_metadata", None)
+    if isinstance(usage, dict) and usage.get("total_tokens"):
+        details = usage.get("input_token_details") or {}
+        return TokenUsage(int(usage["total_tokens"]), int(usage.get("input_tokens") or 0),
+                          int(details.get("cache_read") or 0), int(usage.get("output_tokens") or 0))
+    usage = getattr(result, "usage", None)
+    total = getattr(usage, "total_tokens", None)
+    if not total:
+        return None
+    details = getattr(usage, "prompt_tokens_details", None)
+    return TokenUsage(int(total), int(getattr(usage, "prompt_tokens", 0) or 0),
+                      int(getattr(details, "cached_tokens", 0) or 0), int(getattr(usage, "completion_tokens", 0) or 0))
+
+
+# ---------------------------------------------------------------------------
+# 요청/토큰 한도
+# ---------------------------------------------------------------------------
+
+class PriorityRateLimiter:
+    """
+    분당 요청 수 / 토큰 수 토큰 버킷 + 동시 호출 수 제한
+    - 대기열은 (우선순위, 도착 순서) 순 - 맨 앞 대기자만 버킷에서 가져갈 수 있음
+    - 응답 후 실제 토큰 사용량으로 버킷 보정
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int, max_concurrency: int):
+        self.requests_per_minute = max(1, requests_per_minute)
+        self.tokens_per_minute = max(1, tokens_per_minute)
+        self.max_concurrency = max(1, max_concurrency)
+        self._requests = float(self.requests_per_minute)
+        self._tokens = float(self.tokens_per_minute)
+        self._updated = time.monotonic()
+        self._waiters: List[Tuple[int, int]] = []
+        self._seq = itertools.count()
+        self._cond = asyncio.Condition()
+        self.in_flight = 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(self.requests_per_minute, self._requests + elapsed * self.requests_per_minute / 60)
+        self._tokens = min(self.tokens_per_minute, self._tokens + elapsed * self.tokens_per_minute / 60)
+
+    def _take(self, cost: int) -> Optional[float]:
+        """가져갈 수 있으면 차감 후 0, 시간이 지나면 가능하면 대기 시간(초), 동시 호출 수 초과면 None"""
+        if self.in_flight >= self.max_concurrency:
+            return None
+        self._refill()
+        cost = min(cost, self.tokens_per_minute)
+        if self._requests >= 1 and self._tokens >= cost:
+            self._requests -= 1
+            self._tokens -= cost
+            self.in_flight += 1
+            return 0.0
+        request_wait = (1 - self._requests) * 60 / self.requests_per_minute if self._requests < 1 else 0.0
+        token_wait = (cost - self._tokens) * 60 / self.tokens_per_minute if self._tokens < cost else 0.0
+        return max(request_wait, token_wait, 0.01)
+
+    async def acquire(self, cost: int, priority: int, max_wait: float) -> None:
+        entry = (priority, next(self._seq))
+        deadline = time.monotonic() + max_wait
+        async with self._cond:
+            heapq.heappush(self._waiters, entry)
+            try:
+                while True:
+                    delay = self._take(cost) if self._waiters[0] == entry else None
+                    if delay == 0:
+                        heapq.heappop(self._waiters)
+                        self._cond.notify_all()
+                        return
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise LLMCapacityError(
+                            f"LLM capacity wait exceeded {max_wait:.1f}s "
+                            f"(in_flight={self.in_flight}, queued={len(self._waiters)})"
+                        )
+                    try:
+                        await asyncio.wait_for(self._cond.wait(), min(delay, remaining) if delay else remaining)
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                    self._cond.notify_all()
+
+    async def try_acquire(self, cost: int) -> bool:
+        """대기 없이 가져갈 수 있을 때만 차감 (hedge 요청용 - 대기열이 있으면 양보)"""
+        async with self._cond:
+            if self._waiters:
+                return False
+            return self._take(cost) == 0
+
+    async def release(self, token_correction: int = 0) -> None:
+        """호출 종료 - token_correction: 실제 사용량 - 추정치"""
+        async with self._cond:
+            self.in_flight = max(0, self.in_flight - 1)
+            self._tokens -= token_correction
+            self._cond.notify_all()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+
+# ---------------------------------------------------------------------------
+# 게이트웨이
+# ---------------------------------------------------------------------------
+
+class LLMGateway:
+    """커넥션 풀 + 호출 지점별 정책 + 한도 관리"""
+
+    def __init__(self, limiter: Optional[PriorityRateLimiter] = None):
+        self.limiter = limiter or PriorityRateLimiter(LLM_REQUESTS_PER_MINUTE, LLM_TOKENS_PER_MINUTE, LLM_MAX_CONCURRENCY)
+        self._http_client = None
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    @property
+    def http_client(self):
+        """ChatOpenAI / AsyncOpenAI 공용 httpx.AsyncClient (keep-alive 커넥션 재사용)"""
+        if self._http_client is None:
+            import httpx
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=LLM_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=LLM_HTTP_MAX_CONNECTIONS,
+                ),
+                timeout=httpx.Timeout(LLM_DEFAULT_TIMEOUT * 3, connect=5.0),
+            )
+        return self._http_client
+
+    async def aclose(self) -> None:
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    @staticmethod
+    def policy(site: str) -> CallPolicy:
+        return SITE_POLICIES.get(site, DEFAULT_POLICY)
+
+    @staticmethod
+    def _priority(policy: CallPolicy) -> int:
+        override = _priority_override.get()
+        return policy.priority if override is None else max(override, policy.priority)
+
+    def _record(self, site: str, key: str, amount: float = 1) -> None:
+        counters = self._stats.setdefault(site, {
+            "calls": 0, "errors": 0, "retries": 0, "timeouts": 0,
+            "hedged": 0, "hedge_wins": 0, "rejected": 0, "latency_sum": 0.0,
+            "prompt_tokens": 0, "cached_prompt_tokens": 0, "completion_tokens": 0,
+        })
+        counters[key] += amount
+
+    def _record_usage(self, site: str, usage: TokenUsage) -> None:
+        self._record(site, "prompt_tokens", usage.prompt)
+        self._record(site, "cached_prompt_tokens", usage.cached)
+        self._record(site, "completion_tokens", usage.completion)
+        product, stage = current_routing_context()
+        LLM_TOKENS.inc(usage.prompt, site=site, product=product, stage=stage, kind="prompt")
+        LLM_TOKENS.inc(usage.cached, site=site, product=product, stage=stage, kind="cached_prompt")
+        LLM_TOKENS.inc(usage.completion, site=site, product=product, stage=stage, kind="completion")
+
+    @staticmethod
+    def _observe_latency(site: str, started: float, status: str) -> None:
+        """llm_call_duration_seconds (상품/스테이지 라벨은 routing_scope 컨텍스트)"""
+        product, stage = current_routing_context()
+        LLM_CALL_LATENCY.observe(time.monotonic() - started, site=site, product=product, stage=stage, status=status)
+
+    def _retry_delay(self, policy: CallPolicy, attempt: int) -> float:
+        delay = min(policy.backoff * (2 ** attempt), policy.backoff_max)
+        return delay * (0.5 + random.random() / 2)
+
+    async def _acquire(self, site: str, policy: CallPolicy, estimate: int) -> None:
+        try:
+            await self.limiter.acquire(estimate, self._priority(policy), policy.max_queue_wait)
+        except LLMCapacityError:
+            self._record(site, "rejected")
+            logger.error("❌ [LLM_GATEWAY] %s rejected: capacity wait exceeded %.1fs", site, policy.max_queue_wait)
+            raise
+
+    async def call(self, site: str, invoke: Callable[[], Awaitable[T]], estimate: int = OUTPUT_TOKEN_ESTIMATE) -> T:
+        """
+        단건 호출 - 한도 대기 → (hedge 포함) 시도 → 재시도 가능한 오류면 백오프 후 재시도
+        - invoke는 호출할 때마다 새 코루틴을 만드는 함수
+        """
+        policy = self.policy(site)
+        attempt = 0
+        while True:
+            await self._acquire(site, policy, estimate)
+            used = estimate
+            started = time.monotonic()
+            try:
+                result = await self._attempt_with_hedge(site, policy, invoke, estimate)
+                usage = token_usage(result)
+                if usage:
+                    used = usage.total
+                    self._record_usage(site, usage)
+                    set_attributes(**{"llm.prompt_tokens": usage.prompt, "llm.cached_prompt_tokens": usage.cached,
+                                      "llm.completion_tokens": usage.completion})
+                self._record(site, "calls")
+                self._record(site, "latency_sum", time.monotonic() - started)
+                self._observe_latency(site, started, "ok")
+                return result
+            except Exception as e:
+                if isinstance(e, asyncio.TimeoutError):
+                    self._record(site, "timeouts")
+                if not isinstance(e, RETRYABLE_ERRORS) or attempt >= policy.max_retries:
+                    self._record(site, "errors")
+                    self._observe_latency(site, started, "timeout" if isinstance(e, asyncio.TimeoutError) else "error")
+                    raise
+                delay = self._retry_delay(policy, attempt)
+                attempt += 1
+                self._record(site, "retries")
+                add_event("llm.retry", attempt=attempt, error=type(e).__name__, delay=delay)
+                logger.debug("🔄 [LLM_GATEWAY] %s %s, retrying in %.1fs (%s/%s)", site, type(e).__name__, delay, attempt, policy.max_retries)
+            finally:
+                await self.limiter.release(used - estimate)
+            await asyncio.sleep(delay)
+
+    async def _attempt_with_hedge(self, site: str, policy: CallPolicy,
+                                  invoke: Callable[[], Awaitable[T]], estimate: int) -> T:
+        if not policy.hedge_after:
+            return await asyncio.wait_for(invoke(), policy.timeout)
+
+        primary = asyncio.ensure_future(asyncio.wait_for(invoke(), policy.timeout))
+        done, _ = await asyncio.wait({primary}, timeout=policy.hedge_after)
+        if done or not await self.limiter.try_acquire(estimate):
+            return await primary
+
+        # 꼬리 지연 - 같은 요청을 한 번 더 보내고 먼저 성공한 응답 사용
+        self._record(site, "hedged")
+        add_event("llm.hedge", after=policy.hedge_after)
+        hedge = asyncio.ensure_future(asyncio.wait_for(invoke(), policy.timeout))
+        pending = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self._record(site, "hedge_wins")
+                        return task.result()
+            raise primary.exception()
+        finally:
+            for task in (primary, hedge):
+                if not task.done():
+                    task.cancel()
+            await self.limiter.release(0)
+
+    async def stream(self, site: str, open_stream: Callable[[], AsyncIterator[T]],
+                     estimate: int = OUTPUT_TOKEN_ESTIMATE) -> AsyncIterator[T]:
+        """
+        스트리밍 호출 - 첫 chunk까지 타임아웃/재시도 적용, 이후에는 그대로 전달
+        - latency는 첫 chunk까지의 시간(TTFT), 토큰 사용량은 usage가 실린 chunk에서 집계
+        """
+        policy = self.policy(site)
+        await self._acquire(site, policy, estimate)
+        started = time.monotonic()
+        started_ns = time.time_ns()
+        first_chunk_seconds: Optional[float] = None
+        used = estimate
+        try:
+            attempt = 0
+            while True:
+                iterator = open_stream().__aiter__()
+                try:
+                    first = await asyncio.wait_for(iterator.__anext__(), policy.timeout)
+                    break
+                except StopAsyncIteration:
+                    self._record(site, "calls")
+                    return
+                except Exception as e:
+                    if hasattr(iterator, "aclose"):
+                        await iterator.aclose()
+                    if isinstance(e, asyncio.TimeoutError):
+                        self._record(site, "timeouts")
+                    if not isinstance(e, RETRYABLE_ERRORS) or attempt >= policy.max_retries:
+                        self._record(site, "errors")
+                        self._observe_latency(site, started, "timeout" if isinstance(e, asyncio.TimeoutError) else "error")
+                        raise
+                    delay = self._retry_delay(policy, attempt)
+                    attempt += 1
+                    self._record(site, "retries")
+                    logger.debug("🔄 [LLM_GATEWAY] %s stream %s, retrying in %.1fs (%s/%s)", site, type(e).__name__, delay, attempt, policy.max_retries)
+                    await asyncio.sleep(delay)
+            first_chunk_seconds = time.monotonic() - started
+            self._record(site, "latency_sum", first_chunk_seconds)
+            self._observe_latency(site, started, "ok")
+            async for chunk in _prepend(first, iterator):
+                usage = token_usage(chunk)
+                if usage:
+                    used = usage.total
+                    self._record_usage(site, usage)
+                yield chunk
+            self._record(site, "calls")
+        finally:
+            await self.limiter.release(used - estimate)
+            # 스트림은 yield 사이에 컨텍스트가 바뀔 수 있어 current span 대신 끝난 뒤 구간으로 기록
+            record_span(f"llm.{site}", started_ns, **{
+                "llm.site": site, "llm.streaming": True, "llm.time_to_first_chunk_s": first_chunk_seconds,
+                "llm.total_tokens": used,
+            })
+
+    def wrap(self, model: Any, site: Optional[str] = None) -> "GatewayChatModel":
+        return GatewayChatModel(model, self, site)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        summary = {}
+        for site, counters in self._stats.items():
+            calls, prompt_tokens = counters["calls"], counters["prompt_tokens"]
+            summary[site] = {
+                **counters,
+                "avg_latency": counters["latency_sum"] / calls if calls else 0.0,
+                # provider prefix 캐시 적중 비율 - 프롬프트 레이아웃(고정 지시문 먼저) 효과 확인용
+                "cached_prompt_ratio": counters["cached_prompt_tokens"] / prompt_tokens if prompt_tokens else 0.0,
+            }
+        return summary
+
+
+async def _prepend(first: T, iterator: AsyncIterator[T]) -> AsyncIterator[T]:
+    yield first
+    async for item in iterator:
+        yield item
+
+
+def _cached_message(content: str) -> Any:
+    """캐시된 응답 내용을 AIMessage로 복원"""
+    from langchain_core.messages import AIMessage
+    return AIMessage(content=content)
+
+
+class GatewayChatModel(Runnable):
+    """
+    LangChain 채팅 모델 래퍼 - ainvoke/astream을 게이트웨이 경유로 실행
+    - LCEL 체인(prompt | llm)에서도 그대로 사용 가능
+    - site는 호출 시 site= 인자 또는 for_site()로 지정
+    - 실제 모델은 model_router가 site(+ 상품/스테이지)로 결정 - 같은 설정의 모델 복사본을 모델명별로 재사용
+    """
+
+    def __init__(self, model: Any, gateway: LLMGateway, site: Optional[str] = None,
+                 variants: Optional[Dict[str, Any]] = None):
+        self.model = model
+        self.gateway = gateway
+        self.site = site
+        self._variants = variants if variants is not None else {}
+
+    def for_site(self, site: str) -> "GatewayChatModel":
+        return GatewayChatModel(self.model, self.gateway, site, self._variants)
+
+    def _site(self, site: Optional[str]) -> str:
+        return site or self.site or "default"
+
+    def _variant(self, model_name: str) -> Any:
+        """모델명만 바꾼 복사본 (클라이언트/커넥션 풀은 공유)"""
+        if model_name == getattr(self.model, "model_name", None):
+            return self.model
+        variant = self._variants.get(model_name)
+        if variant is None:
+            variant = self.model.model_copy(update={"model_name": model_name})
+            self._variants[model_name] = variant
+        return variant
+
+    def invoke(self, input: Any, config: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Any:
+        # 동기 호출은 한도 관리 대상이 아님 (그래프는 비동기 경로만 사용)
+        return self.model.invoke(input, config, **kwargs)
+
+    async def ainvoke(self, input: Any, config: Optional[Dict[str, Any]] = None, *,
+                      site: Optional[str] = None, **kwargs: Any) -> Any:
+        site = self._site(site)
+        model_name = model_router.resolve(site)
+        model = self._variant(model_name)
+
+        ttl = self.gateway.policy(site).cache_ttl
+        key = cache_key(model_name, model, input, kwargs) if ttl and llm_cache.enabled else None
+        estimate = estimate_tokens(input)
+        started = time.monotonic()
+        with start_span(f"llm.{site}", **{"llm.site": site, "llm.model": model_name, "llm.estimated_tokens": estimate}):
+            if key:
+                cached = await llm_cache.get(site, key, ttl)
+                if cached is not None:
+                    set_attributes(**{"llm.cache_hit": True})
+                    return _cached_message(cached)
+            result = await self.gateway.call(site, lambda: model.ainvoke(input, config, **kwargs), estimate)
+        if key:
+            content = cacheable_content(result)
+            if content is not None:
+                await llm_cache.set(site, key, content, ttl)
+
+        candidate_name = model_router.shadow_candidate(site, model_name)
+        if candidate_name:
+            candidate = self._variant(candidate_name)
+
+            async def run_candidate():
+                with background_priority():
+                    return await self.gateway.call(
+                        f"{site}:shadow", lambda: candidate.ainvoke(input, config, **kwargs), estimate
+                    )
+
+            model_router.schedule_shadow(
+                site, model_name, result, time.monotonic() - started, candidate_name, run_candidate
+            )
+        return result
+
+    async def astream(self, input: Any, config: Optional[Dict[str, Any]] = None, *,
+                      site: Optional[str] = None, **kwargs: Any) -> AsyncIterator[Any]:
+        site = self._site(site)
+        model = self._variant(model_router.resolve(site))
+        async for chunk in self.gateway.stream(
+            site, lambda: model.astream(input, config, **kwargs), estimate_tokens(input)
+        ):
+            yield chunk
+
+
+# 전역 인스턴스
+llm_gateway = LLMGateway()
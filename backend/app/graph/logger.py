@@ -1,41 +1,156 @@
 # backend/app/graph/logger.py
 """
 중앙 집중식 로깅 모듈
+- 표준 logging 기반 구조화 로그 (JSON 한 줄 또는 텍스트)
+- 비동기 출력: 호출 측은 QueueHandler로 큐에 넣기만 하고, stdout 쓰기는 QueueListener 스레드에서
+  (큐가 가득 차면 버리고 개수만 집계 - 응답 경로가 로그 출력 때문에 막히지 않음)
+- 모듈별 레벨 (LOG_MODULE_LEVELS), DEBUG 로그 샘플링 (LOG_DEBUG_SAMPLE_RATE)
+- PII 마스킹은 출력 핸들러에서 적용 (미리 컴파일한 패턴)
 - LangGraph 노드 실행 추적
-- PII 마스킹 지원
-- 비동기 래퍼 제공
+
+사용:
+    logger = logging.getLogger(__name__)
+    logger.debug("[SLOT_FILLING] fields=%d", len(fields))
 """
 import asyncio
 import functools
+import json
+import logging
+import queue
+import random
+import re
+import sys
 import time
-from typing import Any, Optional, Callable
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional, Callable, Tuple
 from functools import wraps
 
+from ..core.config import (
+    LOG_DEBUG_SAMPLE_RATE,
+    LOG_FORMAT,
+    LOG_LEVEL,
+    LOG_MODULE_LEVELS,
+    LOG_QUEUE_SIZE,
+)
+from ..core.metrics import NODE_LATENCY
+from ..core.tracing import start_span
+
+# PII 패턴 (주민등록번호, 휴대폰 번호, 이메일) - 모듈 로드 시 한 번만 컴파일
+_RRN_PATTERN = re.compile(r'\d{6}-?\d{7}')
+_PHONE_PATTERN = re.compile(r'01[0-9]-?\d{3,4}-?\d{4}')
+_EMAIL_PATTERN = re.compile(r'([a-zA-Z0-9._%+-]+)@([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})')
+
+# JSON 출력에 추가 필드로 넣지 않는 LogRecord 기본 속성
+_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class PIIMaskingFilter(logging.Filter):
+    """출력 직전에 메시지의 PII 마스킹 (출력 핸들러에 부착 → 리스너 스레드에서 실행)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.msg = mask_pii(record.getMessage())
+        record.args = None
+        return True
+
+
+class DebugSamplingFilter(logging.Filter):
+    """DEBUG 레코드는 sample_rate 비율만 통과 (INFO 이상은 모두 통과)"""
+
+    def __init__(self, sample_rate: float):
+        super().__init__()
+        self.sample_rate = sample_rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.DEBUG or self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+
+class JsonFormatter(logging.Formatter):
+    """레코드 → JSON 한 줄 (extra로 넘긴 필드 포함)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exc"] = mask_pii(self.formatException(record.exc_info))
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class DroppingQueueHandler(QueueHandler):
+    """큐가 가득 차면 기다리지 않고 버림 (버린 개수는 dropped)"""
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]"):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def _parse_module_levels(spec: str) -> Dict[str, int]:
+    """"app.agents=WARNING,app.graph.nodes.workers.scenario_logic=DEBUG" → {모듈: 레벨}"""
+    levels = {}
+    for item in spec.split(","):
+        name, _, level = item.partition("=")
+        if name.strip() and level.strip():
+            levels[name.strip()] = logging.getLevelName(level.strip().upper())
+    return {name: level for name, level in levels.items() if isinstance(level, int)}
+
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[DroppingQueueHandler] = None
+
+
+def configure_logging() -> None:
+    """
+    루트 로거 구성 (여러 번 호출해도 한 번만 적용)
+    - 루트 → DroppingQueueHandler(DEBUG 샘플링) → QueueListener → stdout 핸들러(PII 마스킹 + 포맷)
+    """
+    global _listener, _queue_handler
+    if _listener is not None:
+        return
+
+    output = logging.StreamHandler(sys.stdout)
+    output.addFilter(PIIMaskingFilter())
+    output.setFormatter(JsonFormatter() if LOG_FORMAT == "json" else logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(LOG_QUEUE_SIZE)
+    _queue_handler = DroppingQueueHandler(log_queue)
+    _queue_handler.addFilter(DebugSamplingFilter(LOG_DEBUG_SAMPLE_RATE))
+    _listener = QueueListener(log_queue, output, respect_handler_level=True)
+
+    root = logging.getLogger()
+    root.handlers = [_queue_handler]
+    root.setLevel(LOG_LEVEL)
+    for name, level in _parse_module_levels(LOG_MODULE_LEVELS).items():
+        logging.getLogger(name).setLevel(level)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """큐에 남은 로그를 모두 출력하고 리스너 종료"""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    _listener = None
+    if _queue_handler is not None and _queue_handler.dropped:
+        print(f"⚠️ [LOGGING] dropped {_queue_handler.dropped} records (queue full)")
+
+
 # TODO: deepbrain_llm_log가 설치되면 아래 주석 해제
 # from deepbrain_llm_log import LogManager
 # log = LogManager.get_logger(__name__)
-
-# 임시 로거 (개발 중)
-class DevelopmentLogger:
-    def info(self, msg: str, *args):
-        # 필수 로그만 출력 (노드 이동, 주요 이벤트)
-        if "🔄" in msg or "⏱️" in msg or "❌" in msg:
-            if args:
-                print(msg % args)
-            else:
-                print(msg)
-    
-    def error(self, msg: str, *args):
-        if args:
-            print(f"ERROR: {msg % args}")
-        else:
-            print(f"ERROR: {msg}")
-    
-    def warning(self, msg: str, *args):
-        # 경고는 필수가 아니므로 무시
-        pass
-
-log = DevelopmentLogger()
+log = logging.getLogger("app.graph")
 
 
 def node_log(node_name: str, input_info: str = "", output_info: str = "") -> None:
@@ -61,35 +176,51 @@ def node_log(node_name: str, input_info: str = "", output_info: str = "") -> Non
             log.info("🔄 [%s]", node_name)
 
 
+def _state_labels(args: tuple) -> Tuple[Optional[str], Optional[str]]:
+    """노드 입력 state → (상품, 스테이지) 메트릭 라벨"""
+    state = args[0] if args else None
+    if state is None or not hasattr(state, "get"):
+        return None, None
+    return state.get("current_product_type"), state.get("current_scenario_stage_id")
+
+
 def log_execution_time(func: Callable) -> Callable:
-    """노드 실행 시간을 측정하는 데코레이터"""
+    """노드 실행 시간을 측정하는 데코레이터 (로그 + agent_node_duration_seconds 히스토그램 + node.* span)"""
     @wraps(func)
     async def async_wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter()
         node_name = func.__name__.replace("_node", "").replace("_", " ").title()
+        product, stage = _state_labels(args)
         
         try:
-            result = await func(*args, **kwargs)
-            execution_time = time.time() - start_time
-            log.info("⏱️ [%s] completed in %.2fs", node_name, execution_time)
+            with start_span(f"node.{func.__name__}", **{"agent.product": product, "agent.stage": stage}):
+                result = await func(*args, **kwargs)
+            execution_time = time.perf_counter() - start_time
+            NODE_LATENCY.observe(execution_time, node=func.__name__, product=product, stage=stage, status="ok")
+            log.debug("⏱️ [%s] completed in %.2fs", node_name, execution_time)
             return result
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
+            NODE_LATENCY.observe(execution_time, node=func.__name__, product=product, stage=stage, status="error")
             log.error("❌ [%s] failed after %.2fs: %s", node_name, execution_time, str(e))
             raise
     
     @wraps(func)
     def sync_wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter()
         node_name = func.__name__.replace("_node", "").replace("_", " ").title()
+        product, stage = _state_labels(args)
         
         try:
-            result = func(*args, **kwargs)
-            execution_time = time.time() - start_time
-            log.info("⏱️ [%s] completed in %.2fs", node_name, execution_time)
+            with start_span(f"node.{func.__name__}", **{"agent.product": product, "agent.stage": stage}):
+                result = func(*args, **kwargs)
+            execution_time = time.perf_counter() - start_time
+            NODE_LATENCY.observe(execution_time, node=func.__name__, product=product, stage=stage, status="ok")
+            log.debug("⏱️ [%s] completed in %.2fs", node_name, execution_time)
             return result
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
+            NODE_LATENCY.observe(execution_time, node=func.__name__, product=product, stage=stage, status="error")
             log.error("❌ [%s] failed after %.2fs: %s", node_name, execution_time, str(e))
             raise
     
@@ -105,13 +236,11 @@ def mask_pii(text: str) -> str:
     실제 구현 시 deepbrain_llm_log의 마스킹 기능 사용
     """
     # 주민등록번호 패턴 마스킹
-    import re
-    text = re.sub(r'\d{6}-?\d{7}', '******-*******', text)
+    text = _RRN_PATTERN.sub('******-*******', text)
     # 전화번호 패턴 마스킹
-    text = re.sub(r'01[0-9]-?\d{3,4}-?\d{4}', '010-****-****', text)
+    text = _PHONE_PATTERN.sub('010-****-****', text)
     # 이메일 일부 마스킹
-    text = re.sub(r'([a-zA-Z0-9._%+-]+)@([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', 
-                  lambda m: f"{m.group(1)[:3]}***@{m.group(2)}", text)
+    text = _EMAIL_PATTERN.sub(lambda m: f"{m.group(1)[:3]}***@{m.group(2)}", text)
     return text
 
 
@@ -0,0 +1,196 @@
+# backend/app/graph/model_router.py
+"""
+호출 지점(site)별 모델 라우팅
+- config/model_routing.yaml의 등급(tier) / 호출 지점 / 상품·스테이지 예외 테이블로 모델명 결정
+- 턴 단위 라우팅 컨텍스트(상품, 스테이지)는 routing_scope()로 지정
+- shadow 평가: 일부 호출을 후보 등급 모델로도 백그라운드 실행하여 결과 비교 (응답에는 영향 없음)
+"""
+import asyncio
+import json
+import logging
+import os
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from ..config.config_registry import config_registry
+from ..core.config import LLM_MODEL_NAME, MODEL_ROUTING_ENABLED
+
+logger = logging.getLogger(__name__)
+
+ROUTING_CONFIG = "model_routing.yaml"
+
+# 배포 설정 모델(LLM_MODEL_NAME)을 쓰는 등급 - YAML/환경 변수로 바꾸지 않음
+STANDARD_TIER = "standard"
+
+# 비교에서 제외할 설명성 값의 최소 길이 (reasoning, interpreted_meaning 등)
+EXPLANATION_MIN_LENGTH = 40
+
+_routing_context: ContextVar[Tuple[Optional[str], Optional[str]]] = ContextVar(
+    "llm_routing_context", default=(None, None)
+)
+
+
+def current_routing_context() -> Tuple[Optional[str], Optional[str]]:
+    """이번 턴의 (상품, 스테이지) - routing_scope 밖이면 (None, None)"""
+    return _routing_context.get()
+
+
+@contextmanager
+def routing_scope(product: Optional[str], stage: Optional[str]):
+    """이 블록의 LLM 호출에 상품/스테이지별 라우팅 예외 적용"""
+    token = _routing_context.set((product, stage))
+    try:
+        yield
+    finally:
+        _routing_context.reset(token)
+
+
+class RoutingTable:
+    """model_routing.yaml 파싱 결과"""
+    __slots__ = ("tiers", "default_tier", "sites", "overrides", "shadow")
+
+    def __init__(self, data: Dict[str, Any]):
+        tiers = {str(tier): str(model) for tier, model in (data.get("tiers") or {}).items()}
+        for tier in tiers:
+            env_model = os.getenv(f"LLM_{tier.upper()}_MODEL_NAME")
+            if env_model:
+                tiers[tier] = env_model
+        tiers[STANDARD_TIER] = LLM_MODEL_NAME
+        self.tiers = tiers
+        self.default_tier = data.get("default_tier", STANDARD_TIER)
+        self.sites: Dict[str, str] = dict(data.get("sites") or {})
+        self.overrides: List[Dict[str, Any]] = [o for o in data.get("overrides") or [] if o.get("tier")]
+        self.shadow: Dict[str, Tuple[str, float]] = {
+            entry["site"]: (entry["candidate"], float(entry.get("rate", 0.0)))
+            for entry in data.get("shadow") or []
+            if entry.get("site") and entry.get("candidate")
+        }
+
+    def tier_for(self, site: str, product: Optional[str], stage: Optional[str]) -> str:
+        for override in self.overrides:
+            if override.get("site") not in (None, site):
+                continue
+            if override.get("product") not in (None, product):
+                continue
+            if override.get("stage") not in (None, stage):
+                continue
+            return override["tier"]
+        return self.sites.get(site, self.default_tier)
+
+    def model_for(self, tier: str) -> str:
+        return self.tiers.get(tier) or LLM_MODEL_NAME
+
+
+def compare_outputs(primary: Any, candidate: Any) -> List[str]:
+    """
+    두 모델 응답(JSON) 비교 - 서로 다른 키 목록
+    - 실수(신뢰도)와 긴 문자열(설명)은 모델마다 표현이 달라 비교하지 않음
+    - JSON이 아닌 생성형 응답은 비교하지 않음 (지연 시간만 기록)
+    """
+    try:
+        primary_data = json.loads(getattr(primary, "content", primary))
+        candidate_data = json.loads(getattr(candidate, "content", candidate))
+    except (TypeError, ValueError):
+        return []
+    if not isinstance(primary_data, dict) or not isinstance(candidate_data, dict):
+        return [] if primary_data == candidate_data else ["<root>"]
+
+    differences = []
+    for key in sorted(set(primary_data) | set(candidate_data)):
+        left, right = primary_data.get(key), candidate_data.get(key)
+        if isinstance(left, float) or isinstance(right, float):
+            continue
+        if isinstance(left, str) and isinstance(right, str) and max(len(left), len(right)) >= EXPLANATION_MIN_LENGTH:
+            continue
+        if left != right:
+            differences.append(f"{key}: {left!r} vs {right!r}")
+    return differences
+
+
+class ModelRouter:
+    """호출 지점 → 모델명 결정 + shadow 평가 통계"""
+
+    def __init__(self):
+        self._sites: Dict[str, Dict[str, float]] = {}
+        self._pending: set = set()
+
+    def table(self) -> Optional[RoutingTable]:
+        if not MODEL_ROUTING_ENABLED:
+            return None
+        return config_registry.derived(ROUTING_CONFIG, "routing_table", RoutingTable)
+
+    def resolve(self, site: str) -> str:
+        """현재 라우팅 컨텍스트에서 호출 지점이 사용할 모델명"""
+        table = self.table()
+        if table is None:
+            return LLM_MODEL_NAME
+        product, stage = _routing_context.get()
+        return table.model_for(table.tier_for(site, product, stage))
+
+    def shadow_candidate(self, site: str, primary_model: str) -> Optional[str]:
+        """이번 호출을 shadow 평가할 후보 모델명 (샘플링에 빠지거나 같은 모델이면 None)"""
+        table = self.table()
+        if table is None or site not in table.shadow:
+            return None
+        candidate_tier, rate = table.shadow[site]
+        if rate <= 0 or random.random() >= rate:
+            return None
+        candidate = table.model_for(candidate_tier)
+        return candidate if candidate != primary_model else None
+
+    def schedule_shadow(self, site: str, primary_model: str, primary_result: Any, primary_latency: float,
+                        candidate_model: str, run_candidate: Callable[[], Awaitable[Any]]) -> None:
+        """후보 모델 호출을 백그라운드 task로 실행 (현재 턴 응답을 기다리게 하지 않음)"""
+        try:
+            task = asyncio.get_running_loop().create_task(self._shadow(
+                site, primary_model, primary_result, primary_latency, candidate_model, run_candidate
+            ))
+        except RuntimeError:
+            return
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _shadow(self, site: str, primary_model: str, primary_result: Any, primary_latency: float,
+                      candidate_model: str, run_candidate: Callable[[], Awaitable[Any]]) -> None:
+        counters = self._site(site)
+        started = time.monotonic()
+        try:
+            candidate_result = await run_candidate()
+        except Exception as e:
+            counters["failures"] += 1
+            logger.warning("⚠️ [MODEL_SHADOW] %s %s call failed: %s", site, candidate_model, e)
+            return
+        counters["shadowed"] += 1
+        counters["primary_latency_sum"] += primary_latency
+        counters["candidate_latency_sum"] += time.monotonic() - started
+        differences = compare_outputs(primary_result, candidate_result)
+        if differences:
+            counters["disagreements"] += 1
+            # 불일치 값(사용자 정보)은 남기지 않고 키만
+            logger.debug("⚠️ [MODEL_SHADOW] %s %s vs %s disagree on: %s",
+                         site, primary_model, candidate_model, [difference.split(":", 1)[0] for difference in differences])
+
+    def _site(self, site: str) -> Dict[str, float]:
+        return self._sites.setdefault(site, {
+            "shadowed": 0, "disagreements": 0, "failures": 0,
+            "primary_latency_sum": 0.0, "candidate_latency_sum": 0.0,
+        })
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        summary = {}
+        for site, counters in self._sites.items():
+            shadowed = counters["shadowed"]
+            summary[site] = {
+                **counters,
+                "disagreement_rate": counters["disagreements"] / shadowed if shadowed else 0.0,
+                "avg_primary_latency": counters["primary_latency_sum"] / shadowed if shadowed else 0.0,
+                "avg_candidate_latency": counters["candidate_latency_sum"] / shadowed if shadowed else 0.0,
+            }
+        return summary
+
+
+# 전역 인스턴스
+model_router = ModelRouter()
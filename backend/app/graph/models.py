@@ -19,6 +19,23 @@ class ScenarioOutputModel(BaseModel):
 
 scenario_output_parser = PydanticOutputParser(pydantic_object=ScenarioOutputModel)
 
+class TurnUnderstandingModel(BaseModel):
+    """Fused per-turn understanding: routing action + intent + stage entities in one structured output."""
+    action: Literal[
+        'invoke_scenario_agent', 'invoke_qa_agent', 'invoke_web_search', 'personal_info_correction',
+        'end_conversation', 'set_product_type', 'answer_directly_chit_chat'
+    ] = Field(description="The single tool that should handle this turn.")
+    tool_input: Dict[str, Any] = Field(default_factory=dict, description="Parameters for the action (e.g., {'query': ...} or {'product_id': ...}).")
+    intent: Literal['긍정', '부정', '정보제공', '질문', '혼란', '수정요청', '기타'] = Field(description="The user's intent with respect to the current stage question.")
+    entities: Dict[str, Any] = Field(default_factory=dict, description="Values for the current stage's fields that the user explicitly stated, keyed by field key.")
+    committed: bool = Field(default=True, description="Whether the user committed to the extracted values (false for questions about an option).")
+    is_scenario_related: bool = Field(description="Whether the utterance answers or relates to the current stage question.")
+    confidence: float = Field(description="Confidence in the action and entities (0.0-1.0).")
+    interpreted_meaning: str = Field(default="", description="The utterance restated with typos corrected.")
+    direct_response: Optional[str] = Field(default=None, description="A short direct reply, only for answer_directly_chit_chat.")
+
+turn_understanding_parser = PydanticOutputParser(pydantic_object=TurnUnderstandingModel)
+
 # --- Agent Action Models ---
 
 class ActionModel(BaseModel):
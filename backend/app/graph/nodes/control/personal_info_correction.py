@@ -4,11 +4,12 @@
 """
 
 from ...state import AgentState
-from ...logger import log_node_execution
+from ...logger import log_node_execution, log_execution_time
 from ...utils import get_active_scenario_data
 from ....agents.info_modification_agent import info_modification_agent
 
 
+@log_execution_time
 async def personal_info_correction_node(state: AgentState) -> AgentState:
     """
     개인정보 수정 요청을 지능적으로 처리하는 노드
@@ -6,7 +6,7 @@ from langchain_core.messages import AIMessage
 
 from ...state import AgentState
 from ...models import ActionModel
-from ...utils import ALL_SCENARIOS_DATA
+from ...scenario_registry import scenario_registry
 from ...logger import node_log as log_node_execution, log_execution_time
 from ..workers.scenario_logic import generate_stage_response
 from ..workers.scenario_utils import get_default_choice_display
@@ -49,7 +49,9 @@ async def set_product_type_node(state: AgentState) -> AgentState:
             "is_final_turn_response": True
         })
 
-    active_scenario = ALL_SCENARIOS_DATA.get(new_product_type)
+    # 새 제품은 최신 게시 버전으로 고정
+    scenario_entry = scenario_registry.current(new_product_type)
+    active_scenario = scenario_entry.data if scenario_entry else None
     
     if not active_scenario:
         err_msg = f"Failed to load scenario for product type: {new_product_type}"
@@ -84,7 +86,7 @@ async def set_product_type_node(state: AgentState) -> AgentState:
     temp_state = {
         **state.to_dict(),
         "current_product_type": new_product_type, 
-        "active_scenario_data": active_scenario,
+        "active_scenario_ref": scenario_entry.key,
         "collected_product_info": existing_info  # 기존 정보 전달
     }
     initialized_info = initialize_default_values(temp_state)
@@ -101,9 +103,10 @@ async def set_product_type_node(state: AgentState) -> AgentState:
     if initial_stage_info.get("response_type"):
         stage_response_data = generate_stage_response(initial_stage_info, merged_info, active_scenario)
     
+    scenario_registry.pin(state.session_id, scenario_entry.key)
     state_updates = {
         "current_product_type": new_product_type,
-        "active_scenario_data": active_scenario,
+        "active_scenario_ref": scenario_entry.key,
         "active_scenario_name": active_scenario.get("scenario_name"),
         "current_scenario_stage_id": initial_stage_id,
         "collected_product_info": merged_info,  # 기존 정보 + 새 기본값
@@ -4,21 +4,36 @@
 """
 import re
 import json
+import logging
+import time
 from typing import Dict, Any, Optional
 from langchain_core.messages import AIMessage
 
 from ...state import AgentState
 from ...utils import get_active_scenario_data
 from ...chains import synthesizer_chain
+from ...history import history_manager
+from ...synthesis_policy import (
+    MODE_DIRECT,
+    MODE_EXISTING,
+    MODE_PASSTHROUGH,
+    MODE_QA_CONTINUATION,
+    decide_synthesis,
+    estimate_tokens,
+    synthesis_policy_stats
+)
 from ...logger import node_log as log_node_execution, log_execution_time
 
+logger = logging.getLogger(__name__)
+
 
 @log_execution_time
 async def synthesize_response_node(state: AgentState) -> AgentState:
     """
     응답 합성 노드
     - direct message + no worker → 바로 출력
-    - 그 외 모든 경우 → synthesizer agent 처리
+    - 워커 하나의 답변 → 그대로 출력 (synthesis_policy)
+    - 그 외 (여러 워커 결과 병합 등) → synthesizer agent 처리
     """
     # 응답 생성 헬퍼 함수
     def create_response(response_text: str, log_msg: str = "response") -> AgentState:
@@ -32,34 +47,42 @@ async def synthesize_response_node(state: AgentState) -> AgentState:
         return state.merge_update(state_updates)
     
     # 디버그 로그 추가
-    print(f"[Synthesizer] ===== START =====")
-    print(f"[Synthesizer] Incoming final_response_text_for_tts: '{state.final_response_text_for_tts}'")
-    print(f"[Synthesizer] Incoming is_final_turn_response: {state.is_final_turn_response}")
-    print(f"[Synthesizer] Incoming action_plan: {state.action_plan}")
-    
+    logger.debug("[Synthesizer] ===== START =====")
+    logger.debug("[Synthesizer] Incoming final_response_text_for_tts: '%s'", state.final_response_text_for_tts)
+    logger.debug("[Synthesizer] Incoming is_final_turn_response: %s", state.is_final_turn_response)
+    logger.debug("[Synthesizer] Incoming action_plan: %s", state.action_plan)
+    
+    # 합성 정책 - 워커 답변을 그대로 쓸 수 있으면 synthesizer LLM 생략
+    decision = decide_synthesis(state)
+    logger.debug("🎯 [SYNTHESIZER] policy=%s (%s), sources=%s, action_plan=%s", decision.mode, decision.reason, state.factual_response_sources, state.action_plan)
+
     # 1. 이미 설정된 최종 응답이 있으면 반환 (문자열 'None'은 제외)
-    if state.final_response_text_for_tts and state.final_response_text_for_tts != 'None':
-        print(f"[Synthesizer] Using existing final_response_text_for_tts: '{state.final_response_text_for_tts}'")
+    if decision.mode == MODE_EXISTING:
+        synthesis_policy_stats.record(decision)
+        logger.debug("[Synthesizer] Using existing final_response_text_for_tts: '%s'", state.final_response_text_for_tts)
         return create_response(state.final_response_text_for_tts, "existing response")
     
     # 2. QA + 시나리오 상황 최우선 처리
-    print(f"🎯 [SYNTHESIZER] factual_response: {bool(state.factual_response)}, current_stage: {state.current_scenario_stage_id}")
-    if state.factual_response and state.current_scenario_stage_id:
-        print(f"🎯 [SYNTHESIZER] QA + Scenario detected - using continuation logic")
+    if decision.mode == MODE_QA_CONTINUATION:
+        synthesis_policy_stats.record(decision)
+        logger.debug("🎯 [SYNTHESIZER] QA + Scenario detected - using continuation logic")
         qa_continuation = generate_qa_with_scenario_continuation(state)
         return create_response(qa_continuation, "QA + scenario continuation")
     
     # 3. Direct message가 있고 Worker 호출이 없는 경우 → 바로 출력
-    has_direct_message = bool(state.main_agent_direct_response)
-    has_worker_plan = bool(state.action_plan)
-    
-    print(f"🎯 [SYNTHESIZER] has_direct_message: {has_direct_message}, has_worker_plan: {has_worker_plan}")
-    
-    if has_direct_message and not has_worker_plan:
+    if decision.mode == MODE_DIRECT:
+        synthesis_policy_stats.record(decision)
         log_node_execution("Synthesizer", "Direct message with no workers - quick return")
         return create_response(state.main_agent_direct_response, "direct response (no synthesis)")
-    
-    # 3. 그 외 모든 경우 → Synthesizer Agent에서 응답 생성
+
+    # 4. 워커 하나의 답변만 있는 경우 → 그대로 출력 (워커가 이미 LLM으로 생성한 답변을 다시 생성하지 않음)
+    if decision.mode == MODE_PASSTHROUGH:
+        # 생략한 호출 추정: 히스토리 + 답변(컨텍스트) + 재생성 답변
+        history_text = history_manager.format_for_prompt(list(state.messages), state.session_id)
+        synthesis_policy_stats.record(decision, estimate_tokens(history_text, state.factual_response, state.factual_response))
+        return create_response(state.factual_response, "worker answer passthrough")
+    
+    # 5. 그 외 (여러 워커 결과 병합 등) → Synthesizer Agent에서 응답 생성
     log_node_execution("Synthesizer", "Synthesizer agent processing required")
     
     # 분석 컨텍스트 생성
@@ -67,12 +90,18 @@ async def synthesize_response_node(state: AgentState) -> AgentState:
     
     try:
         # Synthesizer chain 호출
+        synthesis_start = time.perf_counter()
         response = await synthesizer_chain.ainvoke({
             "chat_history": list(state.messages),
+            "session_id": state.session_id,
             "analysis_context": analysis_context
         })
         
         final_answer = response.content.strip()
+        history_text = history_manager.format_for_prompt(list(state.messages), state.session_id)
+        synthesis_policy_stats.record(
+            decision, estimate_tokens(history_text, analysis_context, final_answer), time.perf_counter() - synthesis_start
+        )
         
         # 응답이 비어있는 경우 폴백 처리
         if not final_answer:
@@ -317,11 +346,11 @@ def analyze_field_status(state: AgentState, scenario_data: Optional[Dict[str, An
 
 def generate_fallback_response(state: AgentState) -> str:
     """응답 생성 실패 시 폴백 응답 생성"""
-    print(f"🎯 [FALLBACK] Called with factual_response: {bool(state.factual_response)}, stage: {state.current_scenario_stage_id}")
+    logger.debug("🎯 [FALLBACK] Called with factual_response: %s, stage: %s", bool(state.factual_response), state.current_scenario_stage_id)
     
     # QA 답변 후 시나리오 진행 처리
     if state.factual_response and state.current_scenario_stage_id:
-        print(f"🎯 [FALLBACK] Calling QA continuation")
+        logger.debug("🎯 [FALLBACK] Calling QA continuation")
         return generate_qa_with_scenario_continuation(state)
     
     # 기존 우선순위: factual > direct > scenario prompt > default
@@ -359,13 +388,13 @@ def generate_qa_with_scenario_continuation(state: AgentState) -> str:
     # QA 답변 제공
     qa_response = state.factual_response
     
-    print(f"🎯 [QA_CONTINUATION] Starting with factual_response: {qa_response[:100]}...")
-    print(f"🎯 [QA_CONTINUATION] Current stage: {state.current_scenario_stage_id}")
-    print(f"🎯 [QA_CONTINUATION] Collected info: {state.collected_product_info}")
+    logger.debug("🎯 [QA_CONTINUATION] Starting with factual_response: %s...", qa_response[:100])
+    logger.debug("🎯 [QA_CONTINUATION] Current stage: %s", state.current_scenario_stage_id)
+    logger.debug("🎯 [QA_CONTINUATION] Collected info: %s", state.collected_product_info)
     
     # 현재 단계 정보 확인
     if not state.current_scenario_stage_id:
-        print(f"🎯 [QA_CONTINUATION] No current stage, returning QA only")
+        logger.debug("🎯 [QA_CONTINUATION] No current stage, returning QA only")
         return qa_response
     
     try:
@@ -385,7 +414,7 @@ def generate_qa_with_scenario_continuation(state: AgentState) -> str:
             # fields_to_collect이 없어도 현재 단계 프롬프트가 있으면 시나리오 계속 진행
             stage_prompt = get_current_stage_prompt_with_variables(state)
             if stage_prompt:
-                print(f"🎯 [QA_CONTINUATION] No fields_to_collect but stage has prompt, continuing")
+                logger.debug("🎯 [QA_CONTINUATION] No fields_to_collect but stage has prompt, continuing")
                 continuation = get_scenario_continuation_phrase(state)
                 return f"{qa_response}\n\n{continuation} {stage_prompt}"
             return qa_response
@@ -402,7 +431,7 @@ def generate_qa_with_scenario_continuation(state: AgentState) -> str:
             # 미수집 필드가 있으면 현재 단계 질문 추가
             stage_prompt = get_current_stage_prompt_with_variables(state)
             if stage_prompt:
-                print(f"🎯 [QA_CONTINUATION] Adding stage prompt after QA for missing fields: {missing_fields}")
+                logger.debug("🎯 [QA_CONTINUATION] Adding stage prompt after QA for missing fields: %s", missing_fields)
                 # 시나리오 종류에 따른 자연스러운 연결 문구
                 if "deposit_account" in str(state.active_scenario_name):
                     continuation = "그럼 다시 입출금통장 개설을 진행할게요."
@@ -416,14 +445,14 @@ def generate_qa_with_scenario_continuation(state: AgentState) -> str:
                 return f"{qa_response}\n\n{continuation} {stage_prompt}"
         else:
             # 모든 필드가 수집되었으면 다음 단계 확인
-            print(f"🎯 [QA_CONTINUATION] All fields collected for current stage")
+            logger.debug("🎯 [QA_CONTINUATION] All fields collected for current stage")
             
             # 다음 단계가 있는지 확인
             next_stage_info = get_next_stage_info(state, active_scenario_data, current_stage_info)
             if next_stage_info:
                 next_stage_prompt = get_stage_prompt_from_info(next_stage_info, state)
                 if next_stage_prompt:
-                    print(f"🎯 [QA_CONTINUATION] Moving to next stage after QA")
+                    logger.debug("🎯 [QA_CONTINUATION] Moving to next stage after QA")
                     continuation = get_scenario_continuation_phrase(state)
                     return f"{qa_response}\n\n{continuation} {next_stage_prompt}"
             
@@ -431,7 +460,7 @@ def generate_qa_with_scenario_continuation(state: AgentState) -> str:
             return qa_response
         
     except Exception as e:
-        print(f"❌ [QA_CONTINUATION] Error: {e}")
+        logger.error("❌ [QA_CONTINUATION] Error: %s", e)
         return qa_response
     
     return qa_response
@@ -460,7 +489,7 @@ def get_next_stage_info(state: AgentState, scenario_data: Dict[str, Any], curren
                 return scenario_data.get("stages", {}).get(first_transition["target"])
         
     except Exception as e:
-        print(f"❌ [GET_NEXT_STAGE] Error: {e}")
+        logger.error("❌ [GET_NEXT_STAGE] Error: %s", e)
     
     return None
 
@@ -6,7 +6,8 @@ from typing import cast, Dict, Any
 from langchain_core.messages import HumanMessage
 
 from ...state import AgentState
-from ...utils import ALL_PROMPTS, ALL_SCENARIOS_DATA, get_active_scenario_data
+from ...utils import ALL_PROMPTS, ALL_SCENARIOS_DATA
+from ...scenario_registry import scenario_registry
 from ...logger import node_log, log_execution_time
 
 
@@ -62,24 +63,27 @@ async def entry_point_node(state: AgentState) -> AgentState:
         "main_agent_routing_decision": None,
         "main_agent_direct_response": None,
         "scenario_agent_output": None,
+        "turn_understanding": None,
         "final_response_text_for_tts": None,
         "is_final_turn_response": False,
         "error_message": None,
-        "active_scenario_data": None,
         "active_knowledge_base_content": None,
         "loan_selection_is_fresh": False,
         "factual_response": None,
+        "factual_response_sources": [],
         "action_plan": [],
     }
     
     # Update state with turn defaults
     updated_state = state.merge_update(turn_defaults)
     
-    # Load active scenario data if a product is selected
-    active_scenario = get_active_scenario_data(updated_state.to_dict())
+    # 시나리오 버전 고정: 진행 중인 세션은 기존 버전 유지, 처음이면 최신 버전 사용
+    scenario_entry = scenario_registry.get_pinned(updated_state.current_product_type, updated_state.active_scenario_ref)
+    active_scenario = scenario_entry.data if scenario_entry else None
     if active_scenario:
+        scenario_registry.pin(updated_state.session_id, scenario_entry.key)
         updated_state = updated_state.merge_update({
-            "active_scenario_data": active_scenario,
+            "active_scenario_ref": scenario_entry.key,
             "active_scenario_name": active_scenario.get("scenario_name", "Unknown Product")
         })
         
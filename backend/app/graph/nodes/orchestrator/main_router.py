@@ -3,10 +3,8 @@
 메인 오케스트레이터 노드 - 사용자 입력을 분석하여 적절한 워커로 라우팅
 """
 import json
-import yaml
-import asyncio
+import logging
 import traceback
-from pathlib import Path
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from ...state import AgentState
@@ -15,12 +13,62 @@ from ...utils import (
     ALL_PROMPTS, 
     ALL_SCENARIOS_DATA, 
     get_active_scenario_data,
-    load_knowledge_base_content_async,
-    format_messages_for_prompt
+    get_compiled_scenario,
+    load_knowledge_base_content_async
 )
 from ...chains import json_llm
+from ...history import history_manager
+from ...route_classifier import ACTION_QA, ROUTING_LLM, bypass_decision, router_bypass_stats
+from ...turn_understanding import understand_turn
+from ....core.config import TURN_UNDERSTANDING_ENABLED, TURN_UNDERSTANDING_MIN_CONFIDENCE
+from ....config.config_registry import config_registry
 from ...logger import node_log as log_node_execution, log_execution_time
 
+logger = logging.getLogger(__name__)
+
+
+# service_descriptions.yaml이 없을 때 사용할 기본 설명
+DEFAULT_SERVICE_DESCRIPTIONS = """
+**디딤돌 대출** (didimdol)
+- 대상: 무주택 서민 (연소득 6-7천만원 이하)
+- 설명: 정부 지원 주택구입자금 대출, 최대 3-4억원, 연 2.15~2.75%
+
+**전세 대출** (jeonse)  
+- 대상: 무주택 세대주
+- 설명: 전세 보증금 대출, 보증금의 80-90%, 만기일시상환
+
+**입출금통장** (deposit_account)
+- 대상: 모든 고객
+- 설명: 기본 계좌, 평생계좌 서비스, 체크카드/인터넷뱅킹 동시 신청
+"""
+
+
+def format_service_descriptions(service_data: dict) -> str:
+    """business_guidance_prompt용 서비스 설명 블록 생성"""
+    service_descriptions = ""
+    for service_id in ["didimdol", "jeonse", "deposit_account"]:
+        if service_id in service_data:
+            svc = service_data[service_id]
+            service_descriptions += f"\n**{svc['name']}** ({service_id})\n"
+            service_descriptions += f"- 대상: {svc['target']}\n"
+            service_descriptions += f"- 설명: {svc['summary'].strip()}\n"
+            if 'benefits' in svc:
+                service_descriptions += f"- 주요 혜택: {', '.join(svc['benefits'][:2])}\n"
+    return service_descriptions
+
+
+RATE_LIMIT_MESSAGE = "죄송합니다. 현재 서비스 이용량이 많아 잠시 후 다시 시도해주세요."
+
+
+def _rate_limit_response(state: AgentState) -> AgentState:
+    """재시도 후에도 LLM 한도 초과 - 이번 턴을 안내 응답으로 종료"""
+    return state.merge_update({
+        "error_message": RATE_LIMIT_MESSAGE,
+        "main_agent_routing_decision": "rate_limit_error",
+        "is_final_turn_response": True,
+        "final_response_text_for_tts": RATE_LIMIT_MESSAGE
+    })
+
 
 @log_execution_time
 async def main_agent_router_node(state: AgentState) -> AgentState:
@@ -53,19 +101,53 @@ async def main_agent_router_node(state: AgentState) -> AgentState:
             "is_final_turn_response": True
         })
 
-    # Scenario stage protection - bypass LLM for specific stages
-    scenario_stages_protect = ["statement_delivery", "card_selection", "additional_services", "card_usage_alert", "security_medium_registration"]
-    if current_product_type and current_stage_id in scenario_stages_protect:
-        log_node_execution("Orchestrator", f"Scenario stage {current_stage_id} detected - routing directly to scenario_agent")
-        return state.merge_update({
-            "action_plan": ["invoke_scenario_agent"],
-            "action_plan_struct": [{
-                "action": "invoke_scenario_agent",
-                "reason": f"Processing scenario stage {current_stage_id}"
-            }],
-            "router_call_count": 0,
-            "is_final_turn_response": False
-        })
+    # 스테이지 라우팅 정책 (scenario / classifier / llm) - 라우터 LLM 생략 가능 여부
+    if current_product_type:
+        active_scenario_data = get_active_scenario_data(state.to_dict()) or {}
+        stage_info = active_scenario_data.get("stages", {}).get(str(current_stage_id), {})
+        routing_policy, bypass = bypass_decision(active_scenario_data, stage_info, user_input)
+        router_bypass_stats.record(routing_policy, bypass is not None, bypass.action if bypass else None)
+        if bypass is not None:
+            log_node_execution("Orchestrator", f"Router LLM skipped ({routing_policy}, {bypass.reason}, {bypass.confidence:.2f}) - routing to {bypass.action}")
+            action_struct = {"action": bypass.action, "reason": f"Stage {current_stage_id} routing={routing_policy} ({bypass.reason})"}
+            if bypass.action == ACTION_QA:
+                action_struct["tool_input"] = {"query": user_input}
+            return state.merge_update({
+                "action_plan": [bypass.action],
+                "action_plan_struct": [action_struct],
+                "router_call_count": 0,
+                "is_final_turn_response": False
+            })
+
+        # 턴 이해 통합 호출 - 라우팅/의도/스테이지 필드를 한 번에 (routing: llm을 명시한 스테이지는 제외)
+        explicit_policy = stage_info.get("routing") or active_scenario_data.get("default_stage_routing")
+        if TURN_UNDERSTANDING_ENABLED and explicit_policy != ROUTING_LLM:
+            try:
+                understanding = await understand_turn(
+                    user_input, current_stage_id, stage_info, active_scenario_data, get_compiled_scenario(state),
+                    state.collected_product_info, list(state.messages)[:-1], state.session_id
+                )
+            except Exception as e:
+                if e.__class__.__name__ not in ("RateLimitError", "LLMCapacityError"):
+                    raise
+                # 재시도 후에도 한도 초과 - 라우터 LLM으로 다시 시도하지 않고 사용자에게 안내
+                logger.error("❌ [Main Router] Rate limit exceeded (turn_understanding): %s", e)
+                return _rate_limit_response(state)
+            if understanding is not None and understanding.confidence >= TURN_UNDERSTANDING_MIN_CONFIDENCE:
+                log_node_execution("Orchestrator", f"Router LLM skipped (turn_understanding {understanding.source}, {understanding.confidence:.2f}) - routing to {understanding.action}")
+                state_updates = {
+                    "action_plan": [understanding.action],
+                    "action_plan_struct": [ActionModel(tool=understanding.action, tool_input=understanding.tool_input).model_dump()],
+                    "turn_understanding": understanding.to_dict(),
+                    "router_call_count": 0,
+                    "is_final_turn_response": False
+                }
+                if understanding.direct_response:
+                    state_updates["main_agent_direct_response"] = understanding.direct_response
+                return state.merge_update(state_updates)
+            if understanding is not None:
+                # 신뢰도가 낮으면 라우터 LLM이 결정 - 의도/필드 결과는 시나리오 노드에서 재확인
+                state = state.merge_update({"turn_understanding": understanding.to_dict()})
     
     # LLM 기반 대화 처리 및 Worker 결정
     prompt_key = 'business_guidance_prompt' if not current_product_type else 'task_management_prompt'
@@ -93,39 +175,11 @@ async def main_agent_router_node(state: AgentState) -> AgentState:
         
         # business_guidance_prompt에 서비스 설명 추가
         if not current_product_type:
-            # service_descriptions.yaml 로드
-            service_desc_path = Path(__file__).parent.parent.parent / "config" / "service_descriptions.yaml"
-            if service_desc_path.exists():
-                with open(service_desc_path, 'r', encoding='utf-8') as f:
-                    service_data = yaml.safe_load(f)
-                    
-                # 서비스 설명 포맷팅
-                service_descriptions = ""
-                for service_id in ["didimdol", "jeonse", "deposit_account"]:
-                    if service_id in service_data:
-                        svc = service_data[service_id]
-                        service_descriptions += f"\n**{svc['name']}** ({service_id})\n"
-                        service_descriptions += f"- 대상: {svc['target']}\n"
-                        service_descriptions += f"- 설명: {svc['summary'].strip()}\n"
-                        if 'benefits' in svc:
-                            service_descriptions += f"- 주요 혜택: {', '.join(svc['benefits'][:2])}\n"
-                
-                prompt_kwargs["service_descriptions"] = service_descriptions
-            else:
-                # 폴백: 기본 설명 사용
-                prompt_kwargs["service_descriptions"] = """
-**디딤돌 대출** (didimdol)
-- 대상: 무주택 서민 (연소득 6-7천만원 이하)
-- 설명: 정부 지원 주택구입자금 대출, 최대 3-4억원, 연 2.15~2.75%
-
-**전세 대출** (jeonse)  
-- 대상: 무주택 세대주
-- 설명: 전세 보증금 대출, 보증금의 80-90%, 만기일시상환
-
-**입출금통장** (deposit_account)
-- 대상: 모든 고객
-- 설명: 기본 계좌, 평생계좌 서비스, 체크카드/인터넷뱅킹 동시 신청
-"""
+            # service_descriptions.yaml → 포맷된 설명 블록 (config_registry 캐시, 파일 변경 시 재생성)
+            prompt_kwargs["service_descriptions"] = config_registry.derived(
+                "service_descriptions.yaml", "prompt_block", format_service_descriptions,
+                default=DEFAULT_SERVICE_DESCRIPTIONS
+            )
         
         if current_product_type:
              active_scenario_data = get_active_scenario_data(state.to_dict()) or {}
@@ -149,7 +203,7 @@ async def main_agent_router_node(state: AgentState) -> AgentState:
              
              prompt_kwargs.update({
                 "active_scenario_name": state.active_scenario_name or "Not Selected",
-                "formatted_messages_history": format_messages_for_prompt(list(state.messages)[:-1]),
+                "formatted_messages_history": history_manager.format_for_prompt(list(state.messages)[:-1], state.session_id),
                 "task_context_json": json.dumps(task_context, ensure_ascii=False, indent=2),
                 "manual_content": manual_content[:2000] if manual_content else "매뉴얼 정보 없음",
                 "available_product_types_display": available_types
@@ -171,54 +225,17 @@ async def main_agent_router_node(state: AgentState) -> AgentState:
         
         prompt_filled = prompt_template.format(**prompt_kwargs)
         
-        # Debug logging for stage-based routing issues
-        if current_stage in ["statement_delivery", "card_selection", "additional_services", "card_usage_alert", "security_medium_registration"]:
-            print(f"🔍 [DEBUG] Main Router - Current stage: '{current_stage}' is a scenario stage")
-            print(f"🔍 [DEBUG] Main Router - User input: '{user_input}'")
-            print(f"🔍 [DEBUG] Main Router - Should route to invoke_scenario_agent")
-        
-        # Add retry logic for API errors
-        max_retries = 3
-        retry_delay = 1.0
-        last_error = None
-        
-        for attempt in range(max_retries):
-            try:
-                response = await json_llm.ainvoke([HumanMessage(content=prompt_filled)])
-                raw_content = response.content.strip().replace("```json", "").replace("```", "").strip()
-                decision = parser.parse(raw_content)
-                
-                # Debug logging for decision
-                if current_stage in ["statement_delivery", "card_selection", "additional_services", "card_usage_alert", "security_medium_registration"]:
-                    print(f"🔍 [DEBUG] Main Router - LLM Decision: {[action.tool for action in decision.actions]}")
-                    if decision.actions and decision.actions[0].tool == "personal_info_correction":
-                        print(f"❌ [DEBUG] Main Router - ERROR: LLM chose personal_info_correction for scenario stage!")
-                
-                break  # Success, exit retry loop
-            except Exception as e:
-                last_error = e
-                # Check if it's a rate limit error
-                if hasattr(e, '__class__') and e.__class__.__name__ == 'RateLimitError':
-                    if attempt < max_retries - 1:
-                        print(f"🔄 [Main Router] Rate limit hit, retrying in {retry_delay}s... (attempt {attempt + 1}/{max_retries})")
-                        await asyncio.sleep(retry_delay)
-                        retry_delay *= 2  # Exponential backoff
-                        continue
-                    else:
-                        # After all retries, provide a specific error message
-                        print(f"❌ [Main Router] Rate limit exceeded after {max_retries} attempts")
-                        return state.merge_update({
-                            "error_message": "죄송합니다. 현재 서비스 이용량이 많아 잠시 후 다시 시도해주세요.",
-                            "main_agent_routing_decision": "rate_limit_error",
-                            "is_final_turn_response": True,
-                            "final_response_text_for_tts": "죄송합니다. 현재 서비스 이용량이 많아 잠시 후 다시 시도해주세요."
-                        })
-                # For non-rate-limit errors, raise immediately
-                raise e
-        else:
-            # All retries failed
-            if last_error:
-                raise last_error
+        # 재시도/백오프는 게이트웨이의 main_router 정책이 처리
+        try:
+            response = await json_llm.ainvoke([HumanMessage(content=prompt_filled)], site="main_router")
+        except Exception as e:
+            if e.__class__.__name__ not in ("RateLimitError", "LLMCapacityError"):
+                raise
+            # 재시도 후에도 한도 초과 - 사용자에게 안내
+            logger.error("❌ [Main Router] Rate limit exceeded: %s", e)
+            return _rate_limit_response(state)
+        raw_content = response.content.strip().replace("```json", "").replace("```", "").strip()
+        decision = parser.parse(raw_content)
 
         # 새로운 ActionModel 구조를 사용하도록 상태 업데이트
         action_plan_models = decision.actions
@@ -0,0 +1,124 @@
+# backend/app/graph/nodes/orchestrator/parallel_workers.py
+"""
+병렬 워커 노드 - 액션 플랜의 독립 액션을 동시에 실행 (fan-out/fan-in)
+- 각 브랜치는 같은 입력 state에서 자기 액션만 남긴 플랜으로 실행
+- 브랜치 결과는 입력 state 대비 변경분만 플랜 순서대로 병합 (merge_branch_updates)
+  · action_plan: 브랜치가 남긴 후속 액션 + 병렬 그룹 이후의 액션
+  · factual_response / factual_response_sources: 브랜치별 답변/출처를 이어 붙임 (QA + 웹 검색)
+  · messages: 브랜치가 추가한 메시지를 순서대로 덧붙임
+  · 그 외 필드: 순차 실행과 같게 뒤 액션의 값 우선
+- 턴 지연 = 워커 지연의 합 → 최댓값
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Sequence, Tuple
+
+from ...state import AgentState
+from ...router import independent_action_group
+from ...logger import node_log as log_node_execution, log_execution_time
+from ..workers.rag_worker import factual_answer_node
+from ..workers.web_worker import web_search_node
+from ..workers.scenario_agent import call_scenario_agent_node
+from ..workers.scenario_logic import process_scenario_logic_node
+
+logger = logging.getLogger(__name__)
+
+NodeFunc = Callable[[AgentState], Awaitable[AgentState]]
+
+# 액션 → 브랜치에서 차례로 실행할 노드 (그래프의 워커 흐름과 동일)
+BRANCH_NODES: Dict[str, Tuple[NodeFunc, ...]] = {
+    "invoke_scenario_agent": (call_scenario_agent_node, process_scenario_logic_node),
+    "invoke_qa_agent": (factual_answer_node,),
+    "invoke_web_search": (web_search_node,),
+}
+
+# 병합 시 무시하는 필드 (플랜은 병렬 실행 후 다시 계산)
+_MERGE_SKIP_FIELDS = frozenset({"updated_at", "action_plan", "action_plan_struct", "router_call_count"})
+FACTUAL_RESPONSE_SEPARATOR = "\n\n"
+
+
+async def _run_branch(state: AgentState, action: str, action_struct: Dict[str, Any]) -> AgentState:
+    branch_state = state.merge_update({"action_plan": [action], "action_plan_struct": [action_struct]})
+    for node in BRANCH_NODES[action]:
+        branch_state = await node(branch_state)
+    return branch_state
+
+
+def merge_branch_updates(base: Dict[str, Any], branch_results: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    브랜치 결과(model_dump) → 입력 state에 적용할 변경분 (reducer)
+
+    Args:
+        base: 병렬 실행 전 state
+        branch_results: 플랜 순서의 브랜치 결과
+    """
+    updates: Dict[str, Any] = {}
+    factual_responses: List[str] = []
+    base_messages = list(base.get("messages") or [])
+    new_messages: List[Any] = []
+    base_sources = list(base.get("factual_response_sources") or [])
+    new_sources: List[str] = []
+
+    for result in branch_results:
+        for key, value in result.items():
+            if key in _MERGE_SKIP_FIELDS or value == base.get(key):
+                continue
+            if key == "factual_response":
+                if value:
+                    factual_responses.append(value)
+            elif key == "messages":
+                new_messages.extend(list(value)[len(base_messages):])
+            elif key == "factual_response_sources":
+                new_sources.extend(list(value)[len(base_sources):])
+            else:
+                updates[key] = value
+
+    if factual_responses:
+        updates["factual_response"] = FACTUAL_RESPONSE_SEPARATOR.join(factual_responses)
+    if new_messages:
+        updates["messages"] = base_messages + new_messages
+    if new_sources:
+        updates["factual_response_sources"] = base_sources + new_sources
+    return updates
+
+
+@log_execution_time
+async def parallel_workers_node(state: AgentState) -> AgentState:
+    """
+    독립 액션 동시 실행 노드
+    - 실패한 브랜치는 로그만 남기고 제외 (다른 브랜치 결과는 유지)
+    """
+    plan = list(state.action_plan)
+    plan_struct = list(state.action_plan_struct)
+    group = independent_action_group(plan)
+    structs = [plan_struct[i] if i < len(plan_struct) else {"tool": action} for i, action in enumerate(group)]
+    log_node_execution("Parallel_Workers", f"fan-out {group}")
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(_run_branch(state, action, struct) for action, struct in zip(group, structs)),
+        return_exceptions=True
+    )
+    elapsed = time.perf_counter() - start
+
+    branch_results = []
+    follow_up_plan: List[str] = []
+    follow_up_struct: List[Dict[str, Any]] = []
+    for action, result in zip(group, results):
+        if isinstance(result, BaseException):
+            logger.error("❌ [PARALLEL_WORKERS] %s failed: %s: %s", action, type(result).__name__, result)
+            continue
+        branch_results.append(result.model_dump())
+        # 브랜치가 남긴 후속 액션 (예: 시나리오 로직 → personal_info_correction) - 자기 액션을 못 지운 경우는 제외
+        branch_plan, branch_struct = list(result.action_plan), list(result.action_plan_struct)
+        if branch_plan[:1] == [action]:
+            branch_plan, branch_struct = branch_plan[1:], branch_struct[1:]
+        follow_up_plan.extend(branch_plan)
+        follow_up_struct.extend(branch_struct)
+
+    updates = merge_branch_updates(state.model_dump(), branch_results)
+    updates["action_plan"] = follow_up_plan + plan[len(group):]
+    updates["action_plan_struct"] = follow_up_struct + plan_struct[len(group):]
+    logger.debug("⚡ [PARALLEL_WORKERS] %s actions in %.2fs (merged: %s)", len(group), elapsed, sorted(updates.keys()))
+    return state.merge_update(updates)
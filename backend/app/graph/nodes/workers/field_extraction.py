@@ -120,9 +120,6 @@ async def extract_field_value_with_llm(
     
     prompt = f"""사용자의 입력에서 {field_name} 정보를 추출하세요.
 
-사용자 입력: "{user_input}"
-현재 대화 맥락: {current_stage} 단계에서 {field_name} 정보 수집 중
-
 추출 규칙:
 1. {type_instructions.get(field_type, '값을 추출하세요.')}
 2. 명확하게 추출할 수 없으면 null을 반환하세요.
@@ -135,10 +132,13 @@ JSON 응답 형식:
     "extracted_value": 추출된 값 또는 null,
     "confidence": 0.0-1.0,
     "reasoning": "추출 이유"
-}}"""
+}}
+
+현재 대화 맥락: {current_stage} 단계에서 {field_name} 정보 수집 중
+사용자 입력: "{user_input}\""""
 
     try:
-        response = await json_llm.ainvoke([HumanMessage(content=prompt)])
+        response = await json_llm.ainvoke([HumanMessage(content=prompt)], site="field_extraction")
         result = json.loads(response.content.strip())
         
         if result.get("extracted_value") is not None and result.get("confidence", 0) > 0.6:
@@ -172,13 +172,7 @@ async def extract_any_field_value_with_llm(
             field_desc["choices"] = field.get("choices", [])
         fields_info.append(field_desc)
     
-    prompt = f"""사용자의 입력에서 다음 필드들 중 해당하는 정보를 모두 추출하세요.
-
-사용자 입력: "{user_input}"
-현재 단계: {current_stage}
-
-추출 가능한 필드들:
-{json.dumps(fields_info, ensure_ascii=False, indent=2)}
+    prompt = f"""사용자의 입력에서 아래 필드들 중 해당하는 정보를 모두 추출하세요.
 
 추출 규칙:
 1. 각 필드의 타입에 맞게 추출하세요.
@@ -194,10 +188,16 @@ JSON 응답 형식:
     }},
     "confidence": 0.0-1.0,
     "reasoning": "추출 이유"
-}}"""
+}}
+
+현재 단계: {current_stage}
+추출 가능한 필드들:
+{json.dumps(fields_info, ensure_ascii=False, indent=2)}
+
+사용자 입력: "{user_input}\""""
 
     try:
-        response = await json_llm.ainvoke([HumanMessage(content=prompt)])
+        response = await json_llm.ainvoke([HumanMessage(content=prompt)], site="field_extraction")
         result = json.loads(response.content.strip())
         
         extracted = result.get("extracted_fields", {})
@@ -2,16 +2,65 @@
 사용자 의도 매핑 관련 함수들
 """
 import json
-from typing import Dict, Any, Optional, List
+import logging
+import re
+from typing import Dict, Any, Optional, List, Tuple
 from langchain_core.messages import HumanMessage
 from ...chains import json_llm
+from ...keyword_matcher import KeywordMatcher, build_matcher, build_mapping_matcher, cached_matcher, content_key
+from ... import fast_path
+from ...fast_path import fast_path_stats
+
+logger = logging.getLogger(__name__)
+
+
+# ===== 키워드 매처 (모듈 로드 시 한 번만 컴파일) =====
+
+# card_selection 명시적 선택 키워드 (dict 순서 = 우선순위)
+CARD_KEYWORDS = {
+    "체크카드": ["체크", "체크카드"],
+    "신용카드": ["신용", "신용카드"],
+    "하이브리드": ["하이브리드", "하이브리드카드", "둘 다", "두 개", "모두"]
+}
+CARD_KEYWORD_MATCHER = build_mapping_matcher(CARD_KEYWORDS)
+CARD_POSITIVE_MATCHER = build_matcher(["응", "어", "네", "예", "좋아", "그래", "맞아", "할게", "할래"])
+
+# additional_services 폴백 키워드
+SERVICES_NEGATIVE_MATCHER = build_matcher(["아니", "안", "없", "괜찮", "됐", "필요없", "싫"])
+SERVICES_POSITIVE_MATCHER = build_matcher(["응", "어", "네", "예", "좋아", "그래"])
+SERVICES_MENTION_MATCHER = build_matcher(["인터넷", "뱅킹", "체크", "카드", "모바일"])
+
+# 정보 수정 요청 감지
+MODIFICATION_WORD_MATCHER = build_matcher(["틀려", "틀렸", "다르", "다릅", "수정", "변경", "바꿔", "바꾸", "바꿀", "잘못"])
+NAME_WORD_MATCHER = build_matcher(["이름", "성함"])
+NON_NAME_WORDS = frozenset(["이름", "성함", "번호", "전화", "연락처", "정보", "수정", "변경"])
+CONTRAST_PATTERNS = (
+    re.compile(r'(.+)이?\s*아니(?:라|고|야)'),  # X가 아니라/아니고/아니야
+    re.compile(r'(.+)이?\s*말고'),  # X 말고
+    re.compile(r'(.+)에서\s*(.+)으로'),  # X에서 Y로
+)
+DIGITS_3_4_PATTERN = re.compile(r'\d{3,4}')
+DIGITS_4_PATTERN = re.compile(r'(\d{4})')
+NAME_PATTERN = re.compile(r'([가-힣]{2,4})(?:이야|입니다|이에요|예요)?$')
+
+
+def _choices_matcher(choices: List[Any]) -> Tuple[KeywordMatcher, Dict[str, int]]:
+    """choices의 keywords 매처 + ordinal_keywords → 첫 choice 인덱스"""
+    entries = []
+    ordinal_index: Dict[str, int] = {}
+    for index, choice in enumerate(choices):
+        if isinstance(choice, dict):
+            for keyword in choice.get("keywords", []):
+                entries.append((keyword, index))
+            for ordinal in choice.get("ordinal_keywords", []):
+                ordinal_index.setdefault(ordinal, index)
+    return KeywordMatcher(entries), ordinal_index
 
 
 async def map_user_intent_to_choice(
     user_input: str,
     choices: List[Any],
     field_key: str,
-    keyword_mapping: Optional[Dict[str, List[str]]] = None,
     current_stage_info: Dict[str, Any] = None,
     collected_info: Dict[str, Any] = None
 ) -> Optional[str]:
@@ -26,58 +75,75 @@ async def map_user_intent_to_choice(
     if field_key == "card_selection" and current_stage_info and collected_info:
         return handle_card_selection_mapping(user_input, choices, current_stage_info, collected_info)
     
-    # 먼저 키워드 기반 매칭 시도
-    if keyword_mapping:
-        user_input_lower = user_input.lower()
-        for choice_value, keywords in keyword_mapping.items():
-            for keyword in keywords:
-                if keyword in user_input_lower:
-                    print(f"🎯 [KEYWORD_MATCH] Found '{keyword}' in '{user_input}' -> '{choice_value}'")
-                    # additional_services 특수 처리
-                    if field_key == "additional_services":
-                        return handle_additional_services_mapping(choice_value, field_key)
-                    return choice_value
+    # 토글형 선택지(key/label, value 없음 - additional_services 등)는 매핑할 value가 없음
+    # 추출된 boolean 필드와 단계별 규칙으로 처리되므로 키워드/LLM 매핑 생략
+    if not any(not isinstance(choice, dict) or choice.get("value") is not None for choice in choices):
+        return None
     
-    # ordinal_keywords 기반 매칭 시도
+    # choices의 keywords / ordinal_keywords 기반 매칭 시도 (choice 순서 우선)
     user_input_trimmed = user_input.strip()
-    for choice in choices:
-        if isinstance(choice, dict):
-            # 일반 keywords 확인
-            keywords = choice.get("keywords", [])
-            for keyword in keywords:
-                if keyword in user_input.lower():
-                    print(f"🎯 [KEYWORD_MATCH] Found '{keyword}' in '{user_input}' -> '{choice.get('value')}'")
-                    return choice.get("value")
-            
-            # ordinal_keywords 확인
-            ordinal_keywords = choice.get("ordinal_keywords", [])
-            if user_input_trimmed in ordinal_keywords:
-                print(f"🎯 [ORDINAL_MATCH] Found '{user_input_trimmed}' in ordinal_keywords -> '{choice.get('value')}'")
-                return choice.get("value")
+    # choices는 턴마다 새로 만든 목록이므로 내용 기준으로 캐시
+    choice_matcher, ordinal_index = cached_matcher(choices, _choices_matcher, "choices", key=content_key(choices))
+    hit = choice_matcher.first_match(user_input.lower())
+    ordinal_choice = ordinal_index.get(user_input_trimmed)
+    if hit and (ordinal_choice is None or hit.value <= ordinal_choice):
+        choice_value = choices[hit.value].get("value")
+        logger.debug("🎯 [KEYWORD_MATCH] Found '%s' in '%s' -> '%s'", hit.keyword, user_input, choice_value)
+        return choice_value
+    if ordinal_choice is not None:
+        choice_value = choices[ordinal_choice].get("value")
+        logger.debug("🎯 [ORDINAL_MATCH] Found '%s' in ordinal_keywords -> '%s'", user_input_trimmed, choice_value)
+        return choice_value
+    
+    # 발화 전체가 선택지와 정확히 일치하거나 단순 예/아니요면 LLM 매핑 생략
+    fast_result = fast_path.resolve(user_input, None, [{"key": field_key, "type": "choice", "choices": choices}])
+    fast_path_stats.record("map_user_intent_to_choice", fast_result)
+    if fast_result is not None:
+        choice_value = fast_result.fields.get(field_key)
+        logger.debug("⚡ [FAST_PATH] %s: '%s' -> %r - LLM 매핑 생략", fast_result.rule, user_input, choice_value)
+        fast_path_stats.maybe_shadow(
+            "map_user_intent_to_choice", user_input, fast_result,
+            lambda: _shadow_choice_mapping(user_input, choices, field_key)
+        )
+        if choice_value and field_key == "additional_services":
+            return handle_additional_services_mapping(choice_value, field_key)
+        return choice_value
     
     # LLM 기반 의미 매칭
     try:
-        # 선택지 정보 준비
-        choice_info = []
-        choice_values = []
-        for choice in choices:
-            if isinstance(choice, dict):
-                choice_info.append({
-                    "value": choice.get("value"),
-                    "display": choice.get("display"),
-                    "keywords": choice.get("keywords", [])
-                })
-                choice_values.append(choice.get("value", ""))
-            else:
-                choice_info.append({"value": choice, "display": choice})
-                choice_values.append(str(choice))
-        
-        prompt = f"""사용자의 입력을 주어진 선택지 중 하나에 매핑해주세요.
+        matched_value = await _llm_choice_mapping(user_input, choices)
+        if matched_value:
+            logger.debug("🎯 [LLM_CHOICE_MAPPING] Mapped '%s' to '%s'", user_input, matched_value)
+            # additional_services 특수 처리
+            if field_key == "additional_services":
+                return handle_additional_services_mapping(matched_value, field_key)
+            return matched_value
+            
+    except Exception as e:
+        logger.error("❌ [LLM_CHOICE_MAPPING] Error: %s", e)
+    
+    return None
 
-사용자 입력: "{user_input}"
 
-선택지:
-{json.dumps(choice_info, ensure_ascii=False, indent=2)}
+async def _llm_choice_mapping(user_input: str, choices: List[Any]) -> Optional[str]:
+    """LLM으로 사용자 입력을 선택지 value에 매핑 (선택지에 없는 값이면 None, 실패 시 예외)"""
+    # 선택지 정보 준비
+    choice_info = []
+    choice_values = []
+    for choice in choices:
+        if isinstance(choice, dict):
+            choice_info.append({
+                "value": choice.get("value"),
+                "display": choice.get("display"),
+                "keywords": choice.get("keywords", [])
+            })
+            choice_values.append(choice.get("value", ""))
+        else:
+            choice_info.append({"value": choice, "display": choice})
+            choice_values.append(str(choice))
+    
+    # 고정 지시문 → 선택지(단계별 고정) → 사용자 입력 순 (프롬프트 prefix 재사용)
+    prompt = f"""사용자의 입력을 주어진 선택지 중 하나에 매핑해주세요.
 
 사용자의 의도를 파악하여 가장 적절한 선택지의 value를 반환하세요.
 명확한 매칭이 없으면 null을 반환하세요.
@@ -86,43 +152,34 @@ JSON 응답 형식:
 {{"matched_value": "선택된 value" 또는 null}}
 
 주의: 반드시 제공된 선택지의 value 중 하나를 선택하거나 null을 반환하세요.
+
+선택지:
+{json.dumps(choice_info, ensure_ascii=False, indent=2)}
+
+사용자 입력: "{user_input}"
 """
 
-        response = await json_llm.ainvoke([HumanMessage(content=prompt)])
-        result = json.loads(response.content.strip())
-        matched_value = result.get("matched_value")
-        
-        if matched_value and matched_value in choice_values:
-            print(f"🎯 [LLM_CHOICE_MAPPING] Mapped '{user_input}' to '{matched_value}'")
-            # additional_services 특수 처리
-            if field_key == "additional_services":
-                return handle_additional_services_mapping(matched_value, field_key)
-            return matched_value
-            
-    except Exception as e:
-        print(f"❌ [LLM_CHOICE_MAPPING] Error: {e}")
-    
-    return None
+    response = await json_llm.ainvoke([HumanMessage(content=prompt)], site="choice_mapping")
+    result = json.loads(response.content.strip())
+    matched_value = result.get("matched_value")
+    return matched_value if matched_value and matched_value in choice_values else None
+
+
+async def _shadow_choice_mapping(user_input: str, choices: List[Any], field_key: str) -> Dict[str, Any]:
+    """fast path shadow 비교용 LLM 선택지 매핑 결과"""
+    return {"intent": None, "fields": {field_key: await _llm_choice_mapping(user_input, choices)}}
 
 
 async def map_user_intent_to_choice_enhanced(
     user_input: str,
     choices: List[Any],
     field_key: str,
-    keyword_mapping: Optional[Dict[str, List[str]]] = None,
     stage_info: Dict[str, Any] = None,
     collected_info: Dict[str, Any] = None
 ) -> Optional[str]:
     """향상된 사용자 의도 매핑 함수 - 더 정교한 매칭 로직"""
     
-    # 1. 먼저 키워드 기반 매칭 시도
-    if keyword_mapping:
-        matched = fallback_keyword_matching(user_input, keyword_mapping)
-        if matched:
-            print(f"🎯 [KEYWORD_MATCH_ENHANCED] Found match: '{user_input}' -> '{matched}'")
-            return matched
-    
-    # 2. 완화된 매칭 로직
+    # 1. 완화된 매칭 로직
     user_lower = user_input.lower().strip()
     
     # 선택지 정보 준비
@@ -140,23 +197,23 @@ async def map_user_intent_to_choice_enhanced(
                 'original': choice
             }
     
-    # 3. 완화된 키워드 매칭
+    # 2. 완화된 키워드 매칭
     for value, info in choice_map.items():
         # display 텍스트와 부분 매칭
         if info['display'] and info['display'] in user_lower:
-            print(f"🎯 [DISPLAY_MATCH] Found '{info['display']}' in user input -> '{value}'")
+            logger.debug("🎯 [DISPLAY_MATCH] Found '%s' in user input -> '%s'", info['display'], value)
             return value
         
         # keywords와 부분 매칭
         for keyword in info['keywords']:
             if keyword and keyword in user_lower:
-                print(f"🎯 [KEYWORD_PARTIAL_MATCH] Found '{keyword}' in user input -> '{value}'")
+                logger.debug("🎯 [KEYWORD_PARTIAL_MATCH] Found '%s' in user input -> '%s'", keyword, value)
                 return value
     
-    # 4. LLM 기반 매칭 (기존 로직 유지)
+    # 3. LLM 기반 매칭 (기존 로직 유지)
     return await map_user_intent_to_choice(
         user_input, choices, field_key, 
-        keyword_mapping, stage_info, collected_info
+        stage_info, collected_info
     )
 
 
@@ -183,25 +240,16 @@ def handle_card_selection_mapping(
         # 사용자가 명시적으로 다른 카드를 선택한 경우 확인
         user_lower = user_input.lower().strip()
         
-        # 각 카드 타입별 키워드
-        card_keywords = {
-            "체크카드": ["체크", "체크카드"],
-            "신용카드": ["신용", "신용카드"],
-            "하이브리드": ["하이브리드", "하이브리드카드", "둘 다", "두 개", "모두"]
-        }
-        
-        # 명시적 선택 확인
-        for card_type, keywords in card_keywords.items():
-            for keyword in keywords:
-                if keyword in user_lower:
-                    print(f"🎯 [CARD_SELECTION] Explicit choice detected: '{keyword}' -> '{card_type}'")
-                    return card_type
+        # 명시적 선택 확인 (카드 타입별 키워드: CARD_KEYWORDS)
+        hit = CARD_KEYWORD_MATCHER.first_match(user_lower)
+        if hit:
+            logger.debug("🎯 [CARD_SELECTION] Explicit choice detected: '%s' -> '%s'", hit.keyword, hit.value)
+            return hit.value
         
         # 명시적 선택이 없고 긍정 응답인 경우
-        positive_keywords = ["응", "어", "네", "예", "좋아", "그래", "맞아", "할게", "할래"]
-        if any(keyword in user_lower for keyword in positive_keywords):
+        if CARD_POSITIVE_MATCHER.contains_any(user_lower):
             default_value = current_stage_info.get("DEFAULT_SELECTION")
-            print(f"🎯 [CARD_SELECTION] Positive response, using DEFAULT_SELECTION: '{default_value}'")
+            logger.debug("🎯 [CARD_SELECTION] Positive response, using DEFAULT_SELECTION: '%s'", default_value)
             return default_value
     
     # DEFAULT_SELECTION이 없거나 적용되지 않는 경우 None 반환
@@ -235,25 +283,18 @@ def handle_additional_services_fallback(user_input: str, collected_info: Dict[st
     
     user_lower = user_input.lower().strip()
     
-    # 부정적 응답 키워드
-    negative_keywords = ["아니", "안", "없", "괜찮", "됐", "필요없", "싫"]
-    
-    # 긍정적 응답 키워드 (명시적 서비스 언급 없이)
-    positive_keywords = ["응", "어", "네", "예", "좋아", "그래"]
-    
     # 부정적 응답 확인
-    if any(keyword in user_lower for keyword in negative_keywords):
-        print("🎯 [ADDITIONAL_SERVICES] Negative response detected -> 'none'")
+    if SERVICES_NEGATIVE_MATCHER.contains_any(user_lower):
+        logger.debug("🎯 [ADDITIONAL_SERVICES] Negative response detected -> 'none'")
         collected_info["additional_services"] = "none"
         collected_info.update(apply_additional_services_values("none", collected_info))
         return True
     
     # 긍정적 응답만 있는 경우 - 기본값(both) 적용
-    if any(keyword in user_lower for keyword in positive_keywords):
+    if SERVICES_POSITIVE_MATCHER.contains_any(user_lower):
         # 명시적 서비스 언급이 없는지 확인
-        service_keywords = ["인터넷", "뱅킹", "체크", "카드", "모바일"]
-        if not any(keyword in user_lower for keyword in service_keywords):
-            print("🎯 [ADDITIONAL_SERVICES] Simple positive response -> default 'both'")
+        if not SERVICES_MENTION_MATCHER.contains_any(user_lower):
+            logger.debug("🎯 [ADDITIONAL_SERVICES] Simple positive response -> default 'both'")
             collected_info["additional_services"] = "both"
             collected_info.update(apply_additional_services_values("both", collected_info))
             return True
@@ -261,47 +302,6 @@ def handle_additional_services_fallback(user_input: str, collected_info: Dict[st
     return False
 
 
-def fallback_keyword_matching(
-    user_input: str,
-    keyword_mapping: Dict[str, List[str]]
-) -> Optional[str]:
-    """키워드 매칭의 폴백 로직 - 더 유연한 매칭"""
-    
-    user_lower = user_input.lower().strip()
-    
-    # 특수 문자 제거 및 정규화
-    import re
-    user_normalized = re.sub(r'[^가-힣a-zA-Z0-9\s]', '', user_lower)
-    
-    # 1. 정확한 매칭
-    for choice_value, keywords in keyword_mapping.items():
-        for keyword in keywords:
-            if keyword.lower() == user_normalized:
-                return choice_value
-    
-    # 2. 부분 매칭
-    for choice_value, keywords in keyword_mapping.items():
-        for keyword in keywords:
-            keyword_lower = keyword.lower()
-            # 키워드가 사용자 입력에 포함되거나
-            if keyword_lower in user_normalized:
-                return choice_value
-            # 사용자 입력이 키워드에 포함되는 경우
-            if user_normalized in keyword_lower and len(user_normalized) >= 2:
-                return choice_value
-    
-    # 3. 단어 단위 매칭
-    user_words = user_normalized.split()
-    for choice_value, keywords in keyword_mapping.items():
-        for keyword in keywords:
-            keyword_words = keyword.lower().split()
-            # 모든 키워드 단어가 사용자 입력에 있는지 확인
-            if all(kw in user_words for kw in keyword_words):
-                return choice_value
-    
-    return None
-
-
 def _is_info_modification_request(user_input: str, collected_info: Dict[str, Any]) -> bool:
     """자연스러운 정보 수정 요청인지 감지하는 헬퍼 함수"""
     if not user_input:
@@ -309,35 +309,27 @@ def _is_info_modification_request(user_input: str, collected_info: Dict[str, Any
     
     # 간단한 패턴 기반 수정 요청 감지
     # 1. 직접적인 수정 요청
-    modification_words = ["틀려", "틀렸", "다르", "다릅", "수정", "변경", "바꿔", "바꾸", "바꿀", "잘못"]
-    if any(word in user_input for word in modification_words):
+    if MODIFICATION_WORD_MATCHER.contains_any(user_input):
         return True
     
     # 2. "아니야" + 구체적인 정보 패턴
     if "아니" in user_input:
         # 전화번호 패턴
-        import re
-        if re.search(r'\d{3,4}', user_input):  # 3-4자리 숫자
+        if DIGITS_3_4_PATTERN.search(user_input):  # 3-4자리 숫자
             return True
         # 이름 변경 패턴
-        if any(word in user_input for word in ["이름", "성함"]):
+        if NAME_WORD_MATCHER.contains_any(user_input):
             return True
     
     # 3. 대조 표현 패턴 (X가 아니라 Y)
-    contrast_patterns = [
-        r'(.+)이?\s*아니(?:라|고|야)',  # X가 아니라/아니고/아니야
-        r'(.+)이?\s*말고',  # X 말고
-        r'(.+)에서\s*(.+)으로',  # X에서 Y로
-    ]
-    
-    for pattern in contrast_patterns:
-        if re.search(pattern, user_input):
+    for pattern in CONTRAST_PATTERNS:
+        if pattern.search(user_input):
             return True
     
     # 4. 기존 정보와 다른 값을 제시하는 경우
     # 전화번호
     if collected_info.get("customer_phone"):
-        phone_match = re.search(r'(\d{4})', user_input)
+        phone_match = DIGITS_4_PATTERN.search(user_input)
         if phone_match:
             new_number = phone_match.group(1)
             existing_phone = collected_info["customer_phone"]
@@ -347,13 +339,13 @@ def _is_info_modification_request(user_input: str, collected_info: Dict[str, Any
     # 이름
     if collected_info.get("customer_name"):
         # 2-4글자 한글 이름 패턴
-        name_match = re.search(r'([가-힣]{2,4})(?:이야|입니다|이에요|예요)?$', user_input)
+        name_match = NAME_PATTERN.search(user_input)
         if name_match:
             name = name_match.group(1)
             # 기존 이름과 다르고, 일반 단어가 아닌 경우
             if (len(name) >= 2 and 
                 name != collected_info["customer_name"] and 
-                name not in ["이름", "성함", "번호", "전화", "연락처", "정보", "수정", "변경"]):
+                name not in NON_NAME_WORDS):
                 return True
     
-    return False
\ No newline at end of file
+    return False
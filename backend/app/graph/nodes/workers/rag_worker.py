@@ -6,7 +6,8 @@ from langchain_core.prompts import ChatPromptTemplate
 
 from ...state import AgentState
 from ....services.rag_service import rag_service
-from ...utils import ALL_PROMPTS, format_messages_for_prompt
+from ...utils import ALL_PROMPTS
+from ...history import history_manager
 from ...chains import json_llm
 from ...models import expanded_queries_parser
 from ...logger import node_log as log_node_execution, log_execution_time
@@ -24,12 +25,15 @@ async def factual_answer_node(state: AgentState) -> AgentState:
     log_node_execution("RAG_Worker", f"query='{original_question[:30]}...'")
     
     messages = state.messages
-    chat_history = format_messages_for_prompt(list(messages)[:-1]) if len(messages) > 1 else "No previous conversation."
+    chat_history = history_manager.format_for_prompt(list(messages)[:-1], state.session_id) if len(messages) > 1 else "No previous conversation."
     scenario_name = state.active_scenario_name or "General Financial Advice"
 
     if not rag_service.is_ready():
         log_node_execution("RAG_Worker", "WARNING: RAG service not ready")
-        state_updates = {"factual_response": "죄송합니다, 현재 정보 검색 기능에 문제가 발생하여 답변을 드릴 수 없습니다. 잠시 후 다시 시도해 주세요."}
+        state_updates = {
+            "factual_response": "죄송합니다, 현재 정보 검색 기능에 문제가 발생하여 답변을 드릴 수 없습니다. 잠시 후 다시 시도해 주세요.",
+            "factual_response_sources": [*state.factual_response_sources, "rag_worker"]
+        }
         return state.merge_update(state_updates)
 
     all_queries = [original_question]
@@ -42,7 +46,7 @@ async def factual_answer_node(state: AgentState) -> AgentState:
         
         expansion_prompt = ChatPromptTemplate.from_template(expansion_prompt_template)
         
-        expansion_chain = expansion_prompt | json_llm | expanded_queries_parser
+        expansion_chain = expansion_prompt | json_llm.for_site("rag_query_expansion") | expanded_queries_parser
         expanded_result = await expansion_chain.ainvoke({
             "scenario_name": scenario_name,
             "chat_history": chat_history,
@@ -80,6 +84,7 @@ async def factual_answer_node(state: AgentState) -> AgentState:
     
     state_updates = {
         "factual_response": factual_response,
+        "factual_response_sources": [*state.factual_response_sources, "rag_worker"],
         "action_plan": updated_plan,
         "action_plan_struct": updated_struct
     }
@@ -106,7 +106,7 @@ async def generate_natural_response(
 응답:"""
 
     try:
-        response = await json_llm.ainvoke([HumanMessage(content=prompt)])
+        response = await json_llm.ainvoke([HumanMessage(content=prompt)], site="response_generation")
         response_text = response.content.strip()
         
         print(f"✅ [LLM_NATURAL_RESPONSE] Generated response")
@@ -168,7 +168,7 @@ async def generate_choice_clarification_response(
 각 옵션의 장단점이나 특징을 간단히 설명해주세요."""
 
     try:
-        response = await json_llm.ainvoke([HumanMessage(content=prompt)])
+        response = await json_llm.ainvoke([HumanMessage(content=prompt)], site="response_generation")
         return response.content.strip()
     except Exception as e:
         print(f"❌ [CHOICE_CLARIFICATION] Error: {e}")
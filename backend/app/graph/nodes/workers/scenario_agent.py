@@ -2,14 +2,20 @@
 """
 시나리오 에이전트 노드 - 사용자 입력을 시나리오별로 처리하고 의도/개체 추출
 """
+import logging
 from typing import cast
 
 from ...state import AgentState, ScenarioAgentOutput
-from ...utils import get_active_scenario_data
+from ...utils import get_active_scenario_data, get_compiled_scenario
 from ...chains import invoke_scenario_agent_logic
-from ...logger import log_node_execution
+from ...turn_understanding import turn_understanding_for, understand_turn
+from ...logger import log_node_execution, log_execution_time
+from ....core.config import TURN_UNDERSTANDING_ENABLED, TURN_UNDERSTANDING_MIN_CONFIDENCE
 
+logger = logging.getLogger(__name__)
 
+
+@log_execution_time
 async def call_scenario_agent_node(state: AgentState) -> AgentState:
     """
     시나리오 에이전트 호출 노드
@@ -27,17 +33,39 @@ async def call_scenario_agent_node(state: AgentState) -> AgentState:
     current_stage_id = state.current_scenario_stage_id or active_scenario_data.get("initial_stage_id")
     current_stage_info = active_scenario_data.get("stages", {}).get(str(current_stage_id), {})
 
+    # 턴 이해 통합 결과 재사용 (라우터에서 이미 분석했으면 추가 호출 없음)
+    understanding = turn_understanding_for(state, current_stage_id)
+    if understanding is None and TURN_UNDERSTANDING_ENABLED:
+        try:
+            understanding = await understand_turn(
+                user_input, current_stage_id, current_stage_info, active_scenario_data, get_compiled_scenario(state),
+                state.collected_product_info, list(state.messages)[:-1], state.session_id
+            )
+        except Exception as e:
+            if e.__class__.__name__ not in ("RateLimitError", "LLMCapacityError"):
+                raise
+            # 재시도 후에도 한도 초과 - 기존 NLU 호출로 다시 시도하지 않음 (NLU 실패와 같은 형태로 반환)
+            logger.error("❌ [Scenario_NLU] Rate limit exceeded (turn_understanding): %s", e)
+            output = cast(ScenarioAgentOutput, {"intent": "error_rate_limit", "entities": {}, "is_scenario_related": False})
+            return state.merge_update({"scenario_agent_output": output, "turn_understanding": None})
+    if understanding is not None and understanding.confidence >= TURN_UNDERSTANDING_MIN_CONFIDENCE:
+        output = understanding.as_scenario_output()
+        log_node_execution("Scenario_NLU", output_info=f"intent={output['intent']}, entities={list(output['entities'].keys())} (turn_understanding)")
+        return state.merge_update({"scenario_agent_output": output, "turn_understanding": understanding.to_dict()})
+
+    # 신뢰도가 낮으면 기존 NLU 경로 (시나리오 로직도 자체 분석하도록 결과 제거)
     output = await invoke_scenario_agent_logic(
         user_input=user_input,
         current_stage_prompt=current_stage_info.get("prompt", ""),
         expected_info_key=current_stage_info.get("expected_info_key"),
         messages_history=list(state.messages)[:-1],
-        scenario_name=active_scenario_data.get("scenario_name", "Consultation")
+        scenario_name=active_scenario_data.get("scenario_name", "Consultation"),
+        session_id=state.session_id
     )
     intent = output.get("intent", "N/A")
     
     entities = list(output.get("entities", {}).keys())
     log_node_execution("Scenario_NLU", output_info=f"intent={intent}, entities={entities}")
     
-    state_updates = {"scenario_agent_output": output}
+    state_updates = {"scenario_agent_output": output, "turn_understanding": None}
     return state.merge_update(state_updates)
\ No newline at end of file
@@ -3,15 +3,19 @@
 시나리오 로직 처리 노드 - 복잡한 정보 수집 및 시나리오 진행 관리
 """
 import json
+import logging
 from typing import Dict, List, Optional, Any
 from langchain_core.messages import HumanMessage
 
 from ...state import AgentState, ScenarioAgentOutput
-from ...utils import get_active_scenario_data, ALL_PROMPTS, format_transitions_for_prompt
+from ...utils import get_active_scenario_data, get_compiled_scenario, ALL_PROMPTS, format_transitions_for_prompt
 from ...chains import json_llm
 from ...models import next_stage_decision_parser
-from ...logger import log_node_execution
+from ...logger import log_node_execution, log_execution_time
 from ...simple_scenario_engine import SimpleScenarioEngine
+from ... import fast_path
+from ...fast_path import FastPathResult, fast_path_stats
+from ...turn_understanding import turn_understanding_for
 from ....agents.entity_agent import entity_agent
 from ....config.prompt_loader import load_yaml_file
 from pathlib import Path
@@ -34,6 +38,7 @@ from .scenario_utils import (
     format_korean_currency,
     format_field_value,
     get_default_choice_display,
+    get_compiled_stage,
     get_expected_field_keys,
     get_stage_relevant_fields
 )
@@ -44,7 +49,6 @@ from .intent_mapping import (
     handle_card_selection_mapping,
     apply_additional_services_values,
     handle_additional_services_fallback,
-    fallback_keyword_matching,
     _is_info_modification_request
 )
 from .response_generation import (
@@ -69,10 +73,33 @@ from .stage_response import (
     format_prompt_with_fields
 )
 
+logger = logging.getLogger(__name__)
 
-from ...chains import generative_llm, json_llm
 
+async def _llm_entity_verification(verification_prompt: str) -> bool:
+    """추출된 엔티티를 사용자가 실제로 선택(확정)했는지 LLM으로 판단"""
+    response = await json_llm.ainvoke([HumanMessage(content=verification_prompt)], site="entity_verification")
+    raw_content = response.content.strip().replace("```json", "").replace("```", "").strip()
+    decision = json.loads(raw_content)
+    return decision.get("is_confirmed", False)
 
+
+async def _shadow_entity_verification(verification_prompt: str) -> Dict[str, Any]:
+    """fast path shadow 비교용 LLM 검증 결과"""
+    return {"intent": None, "fields": {"is_confirmed": await _llm_entity_verification(verification_prompt)}}
+
+
+async def _analyze_user_intent(state: AgentState, user_input: str, current_stage_id: str,
+                               current_stage_info: Dict[str, Any], collected_info: Dict[str, Any]) -> Dict[str, Any]:
+    """의도 분석 - 이번 턴의 턴 이해 통합 결과가 있으면 재사용 (LLM 호출 없음)"""
+    understanding = turn_understanding_for(state, current_stage_id)
+    if understanding is not None:
+        logger.debug("🧠 [TURN_UNDERSTANDING] Reusing intent '%s' (%s) - analyze_user_intent 생략", understanding.intent, understanding.source)
+        return understanding.as_intent_analysis()
+    return await entity_agent.analyze_user_intent(user_input, current_stage_id, current_stage_info, collected_info)
+
+
+@log_execution_time
 async def process_scenario_logic_node(state: AgentState) -> AgentState:
     """
     시나리오 로직 처리 노드
@@ -91,6 +118,7 @@ async def process_scenario_logic_node(state: AgentState) -> AgentState:
     
     current_stage_info = active_scenario_data.get("stages", {}).get(str(current_stage_id), {})
     collected_info = state.collected_product_info.copy()
+    compiled_scenario = get_compiled_scenario(state)
     
     # 기존 추상값 정리 (stale abstract values cleanup) - 강화된 버전
     abstract_values = ["기본값", "그것", "그걸로", "디폴트", "기본", "추천", "제안", "기본값 수락"]
@@ -102,36 +130,9 @@ async def process_scenario_logic_node(state: AgentState) -> AgentState:
                 abstract in field_value for abstract in abstract_values
             )
             if is_abstract:
-                # 스테이지별 default choice로 매핑 시도
-                stage_id = None
-                if field_key == "card_selection":
-                    stage_id = "card_selection"
-                elif field_key == "security_medium":
-                    stage_id = "security_medium_registration"
-                elif field_key == "statement_delivery_method":
-                    stage_id = "statement_delivery"
-                elif field_key == "card_usage_alert":
-                    stage_id = "card_usage_alert"
-                elif field_key == "services_selected":
-                    stage_id = "select_services"
-                
-                if stage_id:
-                    stage_info = active_scenario_data.get("stages", {}).get(stage_id, {})
-                    # choice_groups나 choices에서 default choice 찾기
-                    default_value = None
-                    if stage_info.get("choice_groups"):
-                        for group in stage_info.get("choice_groups", []):
-                            for choice in group.get("choices", []):
-                                if choice.get("default", False):
-                                    default_value = choice.get("value")
-                                    break
-                            if default_value:
-                                break
-                    elif stage_info.get("choices"):
-                        for choice in stage_info.get("choices", []):
-                            if isinstance(choice, dict) and choice.get("default", False):
-                                default_value = choice.get("value")
-                                break
+                # 스테이지별 default choice로 매핑 시도 (choice 필드 → 스테이지 인덱스 사용)
+                if compiled_scenario and field_key in compiled_scenario.choice_field_stage:
+                    default_value = compiled_scenario.default_choice_for_field(field_key)
                     
                     if default_value:
                         collected_info[field_key] = default_value
@@ -150,7 +151,7 @@ async def process_scenario_logic_node(state: AgentState) -> AgentState:
                     cleaned_fields.append(f"{field_key}: '{field_value}' → REMOVED")
     
     if cleaned_fields:
-        print(f"🧹 [CLEANUP_ABSTRACT] Cleaned stale abstract values: {', '.join(cleaned_fields)}")
+        logger.debug("🧹 [CLEANUP_ABSTRACT] Cleaned stale abstract values: %s", ', '.join(cleaned_fields))
     
     scenario_output = state.scenario_agent_output
     user_input = state.stt_result or ""
@@ -236,27 +237,30 @@ async def process_multiple_info_collection(state: AgentState, active_scenario_da
             if not exact_choice_match:
                 try:
                     # Entity Agent로 정보 추출 (정확한 choice 매치가 없는 경우에만)
-                    print(f"🤖 [ENTITY_AGENT] About to call entity_agent.process_slot_filling")
-                    print(f"  current_stage_id: {current_stage_id}")
-                    print(f"  user_input: '{user_input}'")
-                    print(f"  collected_info BEFORE Entity Agent: {collected_info}")
+                    logger.debug("🤖 [ENTITY_AGENT] About to call entity_agent.process_slot_filling")
+                    logger.debug("  current_stage_id: %s", current_stage_id)
+                    logger.debug("  user_input: '%s'", user_input)
+                    logger.debug("  collected_info BEFORE Entity Agent: %s", collected_info)
                     
                     # 현재 스테이지에 관련된 필드만 필터링
                     stage_relevant_fields = get_stage_relevant_fields(current_stage_info, required_fields, current_stage_id)
-                    print(f"🤖 [ENTITY_AGENT] Filtered fields for stage: {[f['key'] for f in stage_relevant_fields]}")
+                    logger.debug("🤖 [ENTITY_AGENT] Filtered fields for stage: %s", [f['key'] for f in stage_relevant_fields])
                     
-                    # 유연한 추출 방식 사용
-                    extraction_result = await entity_agent.extract_entities_flexibly(
-                        user_input, 
-                        stage_relevant_fields,
-                        current_stage_id,
-                        current_stage_info,
-                        state.last_llm_prompt  # 이전 AI 질문 전달
-                    )
+                    # 턴 이해 통합 결과가 있으면 재사용, 없으면 유연한 추출 방식 사용
+                    understanding = turn_understanding_for(state, current_stage_id)
+                    if understanding is not None:
+                        logger.debug("🧠 [TURN_UNDERSTANDING] Reusing extraction (%s) - entity_agent 호출 생략", understanding.source)
+                        extraction_result = understanding.as_extraction_result()
+                    else:
+                        extraction_result = await entity_agent.extract_entities_flexibly(
+                            user_input, 
+                            stage_relevant_fields,
+                            current_stage_id,
+                            current_stage_info,
+                            state.last_llm_prompt  # 이전 AI 질문 전달
+                        )
                     
-                    # 의도 분석 결과를 extraction_result에 추가 (자연어 응답 생성에 활용)
-                    if hasattr(entity_agent, 'last_intent_analysis') and entity_agent.last_intent_analysis:
-                        extraction_result['intent_analysis'] = entity_agent.last_intent_analysis
+                    # 의도 분석 결과(extraction_result['intent_analysis'])는 자연어 응답 생성에 활용
                     
                     # 추출된 엔티티를 collected_info에 병합
                     if extraction_result.get("extracted_entities"):
@@ -264,13 +268,13 @@ async def process_multiple_info_collection(state: AgentState, active_scenario_da
                         extraction_result["collected_info"] = collected_info
                     
                     # Entity Agent 결과 디버깅
-                    print(f"🤖 [ENTITY_AGENT] Entity Agent completed")
-                    print(f"  extraction_result: {extraction_result}")
+                    logger.debug("🤖 [ENTITY_AGENT] Entity Agent completed")
+                    logger.debug("  extraction_result: %s", extraction_result)
                     if 'collected_info' in extraction_result:
-                        print(f"  collected_info AFTER Entity Agent: {extraction_result['collected_info']}")
+                        logger.debug("  collected_info AFTER Entity Agent: %s", extraction_result['collected_info'])
                         
                 except Exception as e:
-                    print(f"[ERROR] Entity agent process_slot_filling failed: {type(e).__name__}: {str(e)}")
+                    logger.error("[ERROR] Entity agent process_slot_filling failed: %s: %s", type(e).__name__, str(e))
                     import traceback
                     traceback.print_exc()
                     # 에러 발생 시 빈 결과 반환
@@ -294,8 +298,9 @@ async def process_multiple_info_collection(state: AgentState, active_scenario_da
             from .stage_response import generate_confirmation_summary
             summary = generate_confirmation_summary(collected_info)
             confirmation_prompt = f"지금까지 신청하신 내용을 확인해드리겠습니다.\n\n{summary}\n\n위 내용이 맞으신가요? 수정하실 부분이 있으면 말씀해주세요."
-            current_stage_info["prompt"] = confirmation_prompt
-            print(f"🎯 [FINAL_CONFIRMATION] Generated dynamic prompt with summary: {confirmation_prompt[:200]}...")
+            # 시나리오 데이터는 불변이므로 로컬 사본에 프롬프트 반영
+            current_stage_info = {**current_stage_info, "prompt": confirmation_prompt}
+            logger.debug("🎯 [FINAL_CONFIRMATION] Generated dynamic prompt with summary: %s...", confirmation_prompt[:200])
             
             # 사용자 응답이 있으면 final_confirmation 필드 설정
             if user_input:
@@ -307,7 +312,7 @@ async def process_multiple_info_collection(state: AgentState, active_scenario_da
                 # 부정 키워드 우선 체크
                 if any(keyword in user_input_lower for keyword in negative_keywords):
                     collected_info["final_confirmation"] = False
-                    print(f"🎯 [FINAL_CONFIRMATION] User declined: {user_input}")
+                    logger.debug("🎯 [FINAL_CONFIRMATION] User declined: %s", user_input)
                     # 사용자가 수정을 원하는 경우 수정 모드로 전환
                     state.correction_mode = True
                     response_data["response_type"] = "narrative"
@@ -315,20 +320,20 @@ async def process_multiple_info_collection(state: AgentState, active_scenario_da
                 # 긍정 키워드 체크
                 elif any(keyword in user_input_lower for keyword in positive_keywords):
                     collected_info["final_confirmation"] = True
-                    print(f"🎯 [FINAL_CONFIRMATION] User confirmed: {user_input}")
+                    logger.debug("🎯 [FINAL_CONFIRMATION] User confirmed: %s", user_input)
                 else:
-                    print(f"🎯 [FINAL_CONFIRMATION] Unclear response: {user_input}")
+                    logger.debug("🎯 [FINAL_CONFIRMATION] Unclear response: %s", user_input)
                     # 명확하지 않은 응답의 경우 Entity Agent에게 처리를 맡김
         
         # customer_info_check 단계에서 개인정보 확인 처리
         if current_stage_id == "customer_info_check":
             intent = scenario_output.get("intent", "") if scenario_output else ""
-            print(f"  waiting_for_additional_modifications: {state.waiting_for_additional_modifications}")
-            print(f"  collected_info has customer_name: {bool(collected_info.get('customer_name'))}")
-            print(f"  collected_info has phone_number: {bool(collected_info.get('phone_number'))}")
-            print(f"  confirm_personal_info: {collected_info.get('confirm_personal_info')}")
-            print(f"  correction_mode: {state.correction_mode}")
-            print(f"  pending_modifications: {state.pending_modifications}")
+            logger.debug("  waiting_for_additional_modifications: %s", state.waiting_for_additional_modifications)
+            logger.debug("  collected_info has customer_name: %s", bool(collected_info.get('customer_name')))
+            logger.debug("  collected_info has phone_number: %s", bool(collected_info.get('phone_number')))
+            logger.debug("  confirm_personal_info: %s", collected_info.get('confirm_personal_info'))
+            logger.debug("  correction_mode: %s", state.correction_mode)
+            logger.debug("  pending_modifications: %s", state.pending_modifications)
             # 추가 수정사항 대기 중인 경우 먼저 체크
             if state.waiting_for_additional_modifications:
                 
@@ -480,9 +485,9 @@ async def process_multiple_info_collection(state: AgentState, active_scenario_da
             
         elif current_stage_id == "ask_security_medium":
             # ask_security_medium 단계 처리
-            print(f"🔐 [SECURITY_MEDIUM] Special handling for ask_security_medium stage")
-            print(f"🔐 [SECURITY_MEDIUM] collected_info: {collected_info}")
-            print(f"🔐 [SECURITY_MEDIUM] security_medium value: {collected_info.get('security_medium', 'NOT_SET')}")
+            logger.debug("🔐 [SECURITY_MEDIUM] Special handling for ask_security_medium stage")
+            logger.debug("🔐 [SECURITY_MEDIUM] collected_info: %s", collected_info)
+            logger.debug("🔐 [SECURITY_MEDIUM] security_medium value: %s", collected_info.get('security_medium', 'NOT_SET'))
             
             # security_medium이 수집되었는지 확인
             if 'security_medium' in collected_info:
@@ -496,7 +501,7 @@ async def process_multiple_info_collection(state: AgentState, active_scenario_da
                 next_prompt = next_stage_info.get("prompt", "")
                 response_text += next_prompt
                 
-                print(f"🔐 [SECURITY_MEDIUM] Moving to next stage: {next_stage_id}")
+                logger.debug("🔐 [SECURITY_MEDIUM] Moving to next stage: %s", next_stage_id)
                 
                 update_dict = {
                     "current_scenario_stage_id": next_stage_id,
@@ -513,7 +518,7 @@ async def process_multiple_info_collection(state: AgentState, active_scenario_da
             else:
                 # security_medium이 없으면 stage response 보여주기
                 stage_response_data = generate_stage_response(current_stage_info, collected_info, active_scenario_data)
-                print(f"🔐 [SECURITY_MEDIUM] No security_medium collected, showing stage response")
+                logger.debug("🔐 [SECURITY_MEDIUM] No security_medium collected, showing stage response")
                 
                 return state.merge_update({
                     "stage_response_data": stage_response_data,
@@ -529,7 +534,7 @@ async def process_multiple_info_collection(state: AgentState, active_scenario_da
             if user_input and any(word in user_input for word in ["네", "예", "응", "어", "최대로", "최대한도로", "최고로", "좋아요", "그렇게 해주세요"]):
                 collected_info["transfer_limit_per_time"] = 5000
                 collected_info["transfer_limit_per_day"] = 10000
-                print(f"[TRANSFER_LIMIT] User confirmed maximum limits: 1회 5000만원, 1일 10000만원")
+                logger.debug("[TRANSFER_LIMIT] User confirmed maximum limits: 1회 5000만원, 1일 10000만원")
             
             # ScenarioAgent의 entities를 먼저 병합 및 필드명 매핑
             if scenario_output and hasattr(scenario_output, 'entities') and scenario_output.entities:
@@ -572,7 +577,7 @@ async def process_multiple_info_collection(state: AgentState, active_scenario_da
                             collected_info[field_key] = value
                             
                 except Exception as e:
-                    print(f"[ERROR] Entity extraction error: {e}")
+                    logger.error("[ERROR] Entity extraction error: %s", e)
             
             # 최종 필드명 매핑 재실행 (Entity Agent가 추출한 데이터도 처리)
             _handle_field_name_mapping(collected_info)
@@ -664,40 +669,40 @@ async def process_multiple_info_collection(state: AgentState, active_scenario_da
             
         elif current_stage_id == "ask_notification_settings":
             # 알림 설정 단계 처리 - Boolean 타입 단계로 올바르게 처리
-            print(f"🔥🔥🔥🔥🔥 [STAGE] === NOTIFICATION SETTINGS STAGE ENTERED ===")
-            print(f"🔥🔥🔥🔥🔥 [STAGE] User input: '{user_input}'")
-            print(f"🔥🔥🔥🔥🔥 [STAGE] Current collected_info BEFORE: {collected_info}")
+            logger.debug("🔥🔥🔥🔥🔥 [STAGE] === NOTIFICATION SETTINGS STAGE ENTERED ===")
+            logger.debug("🔥🔥🔥🔥🔥 [STAGE] User input: '%s'", user_input)
+            logger.debug("🔥🔥🔥🔥🔥 [STAGE] Current collected_info BEFORE: %s", collected_info)
             
             # === 무조건 강제 Boolean 변환 (모든 조건 무시) ===
             boolean_fields = ["important_transaction_alert", "withdrawal_alert", "overseas_ip_restriction"]
             
-            print(f"🔥🔥🔥 [FORCE] === UNCONDITIONAL BOOLEAN CONVERSION START ===")
+            logger.debug("🔥🔥🔥 [FORCE] === UNCONDITIONAL BOOLEAN CONVERSION START ===")
             for field in boolean_fields:
                 if field in collected_info and isinstance(collected_info[field], str):
                     str_value = collected_info[field].strip()
-                    print(f"🔥🔥🔥 [FORCE] Converting {field}: '{str_value}'")
+                    logger.debug("🔥🔥🔥 [FORCE] Converting %s: '%s'", field, str_value)
                     
                     if str_value in ["신청", "네", "예", "좋아요", "동의", "하겠습니다", "필요해요", "받을게요"]:
                         collected_info[field] = True
-                        print(f"🔥🔥🔥 [FORCE] ✅ {field}: '{str_value}' -> TRUE")
+                        logger.debug("🔥🔥🔥 [FORCE] ✅ %s: '%s' -> TRUE", field, str_value)
                     elif str_value in ["미신청", "아니요", "아니", "싫어요", "거부", "안할게요", "필요없어요", "안받을게요"]:
                         collected_info[field] = False  
-                        print(f"🔥🔥🔥 [FORCE] ✅ {field}: '{str_value}' -> FALSE")
+                        logger.debug("🔥🔥🔥 [FORCE] ✅ %s: '%s' -> FALSE", field, str_value)
                     else:
-                        print(f"🔥🔥🔥 [FORCE] ❌ Unknown value: {field} = '{str_value}'")
+                        logger.error("🔥🔥🔥 [FORCE] ❌ Unknown value: %s = '%s'", field, str_value)
                 elif field in collected_info:
-                    print(f"🔥🔥🔥 [FORCE] {field} = {collected_info[field]} ({type(collected_info[field]).__name__}) - already boolean")
+                    logger.debug("🔥🔥🔥 [FORCE] %s = %s (%s) - already boolean", field, collected_info[field], type(collected_info[field]).__name__)
                 else:
-                    print(f"🔥🔥🔥 [FORCE] {field} not found in collected_info")
+                    logger.debug("🔥🔥🔥 [FORCE] %s not found in collected_info", field)
             
-            print(f"🔥🔥🔥 [FORCE] === UNCONDITIONAL BOOLEAN CONVERSION END ===")
+            logger.debug("🔥🔥🔥 [FORCE] === UNCONDITIONAL BOOLEAN CONVERSION END ===")
             
             # === "네" 응답 처리: 모든 알림을 true로 설정 ===
             if user_input and any(word in user_input for word in ["네", "예", "좋아요", "모두", "전부", "다", "신청", "하겠습니다"]):
-                print(f"🔥 [YES_RESPONSE] User said yes - setting all notifications to true")
+                logger.debug("🔥 [YES_RESPONSE] User said yes - setting all notifications to true")
                 for field in boolean_fields:
                     collected_info[field] = True
-                    print(f"🔥 [YES_RESPONSE] Set {field} = True")
+                    logger.debug("🔥 [YES_RESPONSE] Set %s = True", field)
             
             # === 간단한 다음 단계 진행 로직 ===
             if user_input:
@@ -777,7 +782,7 @@ async def process_multiple_info_collection(state: AgentState, active_scenario_da
             # bullet 또는 boolean 타입이면 stage_response_data 생성
             if next_stage_info.get("response_type") in ["bullet", "boolean"]:
                 stage_response_data = generate_stage_response(next_stage_info, collected_info, active_scenario_data)
-                print(f"🎯 [STAGE_RESPONSE] Generated stage response data for {next_stage_id} (type: {next_stage_info.get('response_type')})")
+                logger.debug("🎯 [STAGE_RESPONSE] Generated stage response data for %s (type: %s)", next_stage_id, next_stage_info.get('response_type'))
             elif "response_type" in next_stage_info:
                 stage_response_data = generate_stage_response(next_stage_info, collected_info, active_scenario_data)
         
@@ -815,7 +820,9 @@ async def process_multiple_info_collection(state: AgentState, active_scenario_da
 
 async def process_single_info_collection(state: AgentState, active_scenario_data: Dict, current_stage_id: str, current_stage_info: Dict, collected_info: Dict, scenario_output: Optional[ScenarioAgentOutput], user_input: str) -> AgentState:
     """기존 단일 정보 수집 처리"""
-    print(f"🔍 PROCESS_SINGLE_INFO_COLLECTION called for stage: {current_stage_id}")
+    logger.debug("🔍 PROCESS_SINGLE_INFO_COLLECTION called for stage: %s", current_stage_id)
+    # 선택지/기본값 조회용 컴파일된 스테이지
+    compiled_stage = get_compiled_stage(current_stage_info)
     
     # narrative 타입에서 yes/no 응답 처리 (confirm_personal_info, card_password_setting 등)
     if user_input and current_stage_info.get("response_type") == "narrative":
@@ -844,11 +851,11 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
             if field_mentioned:
                 # 특정 항목 수정 요청인 경우
                 collected_info["personal_info_confirmed"] = False
-                print(f"[CONFIRM_PERSONAL_INFO] Specific field modification request detected")
+                logger.debug("[CONFIRM_PERSONAL_INFO] Specific field modification request detected")
                 state["special_response_for_modification"] = True
             elif any(word in user_lower for word in ["네", "예", "응", "어", "그래", "좋아", "맞아", "알겠", "확인"]):
                 collected_info["personal_info_confirmed"] = True
-                print(f"[CONFIRM_PERSONAL_INFO] '네' response -> personal_info_confirmed = True")
+                logger.debug("[CONFIRM_PERSONAL_INFO] '네' response -> personal_info_confirmed = True")
                 
                 # display_fields의 개인정보를 collected_info에 병합
                 if current_stage_info.get("display_fields") and isinstance(current_stage_info["display_fields"], dict):
@@ -856,22 +863,20 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                     for field_key, field_value in display_fields.items():
                         if field_key not in collected_info:  # 기존 값이 없는 경우에만 추가
                             collected_info[field_key] = field_value
-                    print(f"[CONFIRM_PERSONAL_INFO] Merged display_fields: {list(display_fields.keys())}")
+                    logger.debug("[CONFIRM_PERSONAL_INFO] Merged display_fields: %s", list(display_fields.keys()))
                     
             elif any(word in user_lower for word in ["아니", "틀려", "수정", "변경", "다르"]):
                 collected_info["personal_info_confirmed"] = False
-                print(f"[CONFIRM_PERSONAL_INFO] '아니' response -> personal_info_confirmed = False")
+                logger.debug("[CONFIRM_PERSONAL_INFO] '아니' response -> personal_info_confirmed = False")
                 # 수정 요청 시 특별한 응답 설정
                 state["special_response_for_modification"] = True
         
         # card_password_setting 단계 - LLM 기반 유연한 처리
         elif current_stage_id == "card_password_setting":
             try:
-                # EntityRecognitionAgent 임포트
-                from app.agents.entity_agent import EntityRecognitionAgent
-                entity_agent = EntityRecognitionAgent()
-                
-                intent_result = await entity_agent.analyze_user_intent(
+                # 공유 entity_agent (요청별 상태 없음)
+                intent_result = await _analyze_user_intent(
+                    state,
                     user_input,
                     current_stage_id,
                     current_stage_info,
@@ -881,20 +886,20 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                 # "똑같이 해줘" 같은 표현 처리
                 if intent_result.get("intent") == "긍정" or intent_result.get("intent") == "동일_비밀번호":
                     collected_info["card_password_same_as_account"] = True
-                    print(f"[CARD_PASSWORD] LLM detected same password request -> True")
+                    logger.debug("[CARD_PASSWORD] LLM detected same password request -> True")
                 elif intent_result.get("intent") == "다른_비밀번호" or intent_result.get("intent") == "부정":
                     collected_info["card_password_same_as_account"] = False
-                    print(f"[CARD_PASSWORD] LLM detected different password request -> False")
+                    logger.debug("[CARD_PASSWORD] LLM detected different password request -> False")
                 else:
                     # Fallback to pattern matching
                     if any(word in user_lower for word in ["네", "예", "응", "어", "그래", "좋아", "맞아", "알겠", "동일", "같게", "똑같이"]):
                         collected_info["card_password_same_as_account"] = True
-                        print(f"[CARD_PASSWORD] Pattern match '네' -> True")
+                        logger.debug("[CARD_PASSWORD] Pattern match '네' -> True")
                     elif any(word in user_lower for word in ["아니", "다르게", "따로", "별도"]):
                         collected_info["card_password_same_as_account"] = False
-                        print(f"[CARD_PASSWORD] Pattern match '아니' -> False")
+                        logger.debug("[CARD_PASSWORD] Pattern match '아니' -> False")
             except Exception as e:
-                print(f"[CARD_PASSWORD] Intent analysis failed: {e}")
+                logger.debug("[CARD_PASSWORD] Intent analysis failed: %s", e)
                 # Fallback
                 if any(word in user_lower for word in ["네", "예", "응", "어", "그래", "좋아", "맞아", "알겠", "동일", "같게"]):
                     collected_info["card_password_same_as_account"] = True
@@ -904,7 +909,7 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
         # additional_services 단계 - 새로운 LLM 기반 처리로 대체됨
         elif current_stage_id == "additional_services":
             # 이전 entity_agent 로직은 비활성화됨 - 새로운 LLM 기반 선택적 처리 사용
-            print(f"[ADDITIONAL_SERVICES] Stage processing - delegating to new LLM-based selective processing")
+            logger.debug("[ADDITIONAL_SERVICES] Stage processing - delegating to new LLM-based selective processing")
             pass
     
     # 사용자가 '네' 응답을 한 경우 기본값 처리 (모든 bullet/choice 단계)
@@ -924,7 +929,7 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
         is_ordinal = any(ord_expr in user_input for ord_expr in ordinal_expressions)
         
         if is_ordinal:
-            print(f"🎯 [ORDINAL_DETECTED] User input contains ordinal expression, skipping DEFAULT_SELECTION")
+            logger.debug("🎯 [ORDINAL_DETECTED] User input contains ordinal expression, skipping DEFAULT_SELECTION")
         
         # 순서 표현이 아닌 경우에만 긍정 응답으로 처리
         if not is_ordinal and any(word in user_lower for word in ["네", "예", "응", "어", "그래", "좋아", "맞아", "알겠", "할게"]):
@@ -934,15 +939,7 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                 # security_medium_registration 단계 특별 처리
                 if current_stage_id == "security_medium_registration":
                     # 기본 보안매체 선택
-                    default_choice = None
-                    if current_stage_info.get("choice_groups"):
-                        for group in current_stage_info.get("choice_groups", []):
-                            for choice in group.get("choices", []):
-                                if choice.get("default"):
-                                    default_choice = choice.get("value")
-                                    break
-                            if default_choice:
-                                break
+                    default_choice = compiled_stage.default_choice_value
                     
                     if default_choice:
                         # 각 필드별로 적절한 값 설정
@@ -950,26 +947,20 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                             if field_key not in collected_info:
                                 if field_key == "security_medium":
                                     collected_info[field_key] = default_choice
-                                    print(f"[DEFAULT_SELECTION] Stage {current_stage_id}: '네' response mapped {field_key} to: {default_choice}")
+                                    logger.debug("[DEFAULT_SELECTION] Stage %s: '네' response mapped %s to: %s", current_stage_id, field_key, default_choice)
                                 # 모든 보안매체에 대해 최대 이체한도 설정
                                 elif field_key == "transfer_limit_once":
                                     collected_info[field_key] = "50000000"  # 5천만원
-                                    print(f"[DEFAULT_SELECTION] Stage {current_stage_id}: '네' response mapped {field_key} to: 50000000")
+                                    logger.debug("[DEFAULT_SELECTION] Stage %s: '네' response mapped %s to: 50000000", current_stage_id, field_key)
                                 elif field_key == "transfer_limit_daily":
                                     collected_info[field_key] = "100000000"  # 1억원
-                                    print(f"[DEFAULT_SELECTION] Stage {current_stage_id}: '네' response mapped {field_key} to: 100000000")
+                                    logger.debug("[DEFAULT_SELECTION] Stage %s: '네' response mapped %s to: 100000000", current_stage_id, field_key)
                 
                 # card_selection 단계 특별 처리
                 elif current_stage_id == "card_selection":
                     # 기본 카드 선택
-                    default_choice = None
-                    default_metadata = None
-                    if current_stage_info.get("choices"):
-                        for choice in current_stage_info.get("choices", []):
-                            if choice.get("default"):
-                                default_choice = choice.get("value")
-                                default_metadata = choice.get("metadata", {})
-                                break
+                    default_choice = compiled_stage.default_choice_value
+                    default_metadata = compiled_stage.default_choice.metadata if compiled_stage.default_choice else None
                     
                     if default_choice:
                         # 각 필드별로 적절한 값 설정
@@ -977,23 +968,18 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                             if field_key not in collected_info:
                                 if field_key == "card_selection":
                                     collected_info[field_key] = default_choice
-                                    print(f"[DEFAULT_SELECTION] Stage {current_stage_id}: '네' response mapped {field_key} to: {default_choice}")
+                                    logger.debug("[DEFAULT_SELECTION] Stage %s: '네' response mapped %s to: %s", current_stage_id, field_key, default_choice)
                                 elif field_key == "card_receipt_method" and default_metadata.get("receipt_method"):
                                     collected_info[field_key] = default_metadata["receipt_method"]
-                                    print(f"[DEFAULT_SELECTION] Stage {current_stage_id}: '네' response mapped {field_key} to: {default_metadata['receipt_method']}")
+                                    logger.debug("[DEFAULT_SELECTION] Stage %s: '네' response mapped %s to: %s", current_stage_id, field_key, default_metadata['receipt_method'])
                                 elif field_key == "transit_function" and "transit_enabled" in default_metadata:
                                     collected_info[field_key] = default_metadata["transit_enabled"]
-                                    print(f"[DEFAULT_SELECTION] Stage {current_stage_id}: '네' response mapped {field_key} to: {default_metadata['transit_enabled']}")
+                                    logger.debug("[DEFAULT_SELECTION] Stage %s: '네' response mapped %s to: %s", current_stage_id, field_key, default_metadata['transit_enabled'])
                 
                 # statement_delivery 단계 특별 처리
                 elif current_stage_id == "statement_delivery":
                     # 기본 수령 방법 선택
-                    default_choice = None
-                    if current_stage_info.get("choices"):
-                        for choice in current_stage_info.get("choices", []):
-                            if choice.get("default"):
-                                default_choice = choice.get("value")
-                                break
+                    default_choice = compiled_stage.default_choice_value
                     
                     if default_choice:
                         # 각 필드별로 적절한 값 설정
@@ -1001,77 +987,49 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                             if field_key not in collected_info:
                                 if field_key == "statement_delivery_method":
                                     collected_info[field_key] = default_choice
-                                    print(f"[DEFAULT_SELECTION] Stage {current_stage_id}: '네' response mapped {field_key} to: {default_choice}")
+                                    logger.debug("[DEFAULT_SELECTION] Stage %s: '네' response mapped %s to: %s", current_stage_id, field_key, default_choice)
                                 # 모든 수령방법에 대해 발송일 10일로 설정
                                 elif field_key == "statement_delivery_date":
                                     collected_info[field_key] = "10"
-                                    print(f"[DEFAULT_SELECTION] Stage {current_stage_id}: '네' response mapped {field_key} to: 10")
-                                    print(f"🔥 [STATEMENT_DATE_DEBUG] collected_info now contains: {collected_info.get('statement_delivery_date')}")
+                                    logger.debug("[DEFAULT_SELECTION] Stage %s: '네' response mapped %s to: 10", current_stage_id, field_key)
+                                    logger.debug("🔥 [STATEMENT_DATE_DEBUG] collected_info now contains: %s", collected_info.get('statement_delivery_date'))
                 else:
                     # 다른 단계들은 기존 로직 사용
                     for field_key in fields_to_collect:
                         if field_key not in collected_info:
-                            # choice_groups에서 기본값 찾기
-                            default_value = None
-                            if current_stage_info.get("choice_groups"):
-                                for group in current_stage_info.get("choice_groups", []):
-                                    for choice in group.get("choices", []):
-                                        if choice.get("default"):
-                                            default_value = choice.get("value")
-                                            break
-                                    if default_value:
-                                        break
-                            # choices에서 기본값 찾기
-                            elif current_stage_info.get("choices"):
-                                for choice in current_stage_info.get("choices", []):
-                                    if isinstance(choice, dict) and choice.get("default"):
-                                        default_value = choice.get("value")
-                                        break
+                            # choice_groups / choices의 기본값
+                            default_value = compiled_stage.default_choice_value
                             
                             if default_value:
                                 collected_info[field_key] = default_value
-                                print(f"[DEFAULT_SELECTION] Stage {current_stage_id}: '네' response mapped {field_key} to default: {default_value}")
+                                logger.debug("[DEFAULT_SELECTION] Stage %s: '네' response mapped %s to default: %s", current_stage_id, field_key, default_value)
             
             # 기존 로직: expected_info_key를 사용하는 경우
             expected_info_key = current_stage_info.get("expected_info_key")
             if expected_info_key and expected_info_key not in collected_info:
-                # choice_groups에서 기본값 찾기
-                default_value = None
-                if current_stage_info.get("choice_groups"):
-                    for group in current_stage_info.get("choice_groups", []):
-                        for choice in group.get("choices", []):
-                            if choice.get("default"):
-                                default_value = choice.get("value")
-                                break
-                        if default_value:
-                            break
-                # choices에서 기본값 찾기
-                elif current_stage_info.get("choices"):
-                    for choice in current_stage_info.get("choices", []):
-                        if isinstance(choice, dict) and choice.get("default"):
-                            default_value = choice.get("value")
-                            break
+                # choice_groups / choices의 기본값
+                default_value = compiled_stage.default_choice_value
                 
                 if default_value:
                     collected_info[expected_info_key] = default_value
-                    print(f"[DEFAULT_SELECTION] Stage {current_stage_id}: '네' response mapped to default: {default_value}")
+                    logger.debug("[DEFAULT_SELECTION] Stage %s: '네' response mapped to default: %s", current_stage_id, default_value)
     
     # choice_exact 모드이거나 user_input이 현재 stage의 choice와 정확히 일치하는 경우 특별 처리
     if state.get("input_mode") == "choice_exact" or (user_input and (current_stage_info.get("choices") or current_stage_info.get("choice_groups"))):
         # choices 중에 정확히 일치하는지 확인
-        choices = current_stage_info.get("choices", [])
+        choices = list(current_stage_info.get("choices", []))
         # choice_groups가 있는 경우 모든 choices를 평면화
         if current_stage_info.get("choice_groups"):
             for group in current_stage_info.get("choice_groups", []):
                 group_choices = group.get("choices", [])
                 choices.extend(group_choices)
-                print(f"🎯 [CHOICE_GROUPS] Added {len(group_choices)} choices from group '{group.get('group_name', 'Unknown')}'")
+                logger.debug("🎯 [CHOICE_GROUPS] Added %s choices from group '%s'", len(group_choices), group.get('group_name', 'Unknown'))
         
         # Get the first field to collect as the primary field for this choice
         fields_to_collect = current_stage_info.get("fields_to_collect", [])
         expected_field = fields_to_collect[0] if fields_to_collect else None
-        print(f"🎯 [V3_CHOICE_PROCESSING] fields_to_collect: {fields_to_collect}")
-        print(f"🎯 [V3_CHOICE_PROCESSING] user_input: '{user_input}'")
+        logger.debug("🎯 [V3_CHOICE_PROCESSING] fields_to_collect: %s", fields_to_collect)
+        logger.debug("🎯 [V3_CHOICE_PROCESSING] user_input: '%s'", user_input)
         
         # LLM 기반 자연어 필드 추출 - 복수 필드 동시 추출 가능
         choice_mapping = None
@@ -1081,24 +1039,16 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
         if current_stage_id == "card_selection":
             choice_mapping = handle_card_selection_mapping(user_input, choices, current_stage_info, collected_info)
             if choice_mapping:
-                print(f"🎯 [CARD_SELECTION] Direct choice mapping successful: {choice_mapping}")
+                logger.debug("🎯 [CARD_SELECTION] Direct choice mapping successful: %s", choice_mapping)
         
         # 복수 필드 추출을 위한 LLM 분석 먼저 시도
         if user_input and not choice_mapping:
             # Entity Agent를 통한 의도 분석
-            from app.agents.entity_agent import EntityRecognitionAgent
-            entity_agent = EntityRecognitionAgent()
-            
-            intent_analysis = await entity_agent.analyze_user_intent(
-                user_input=user_input,
-                current_stage=current_stage_id,
-                stage_info=current_stage_info,
-                collected_info=collected_info
-            )
+            intent_analysis = await _analyze_user_intent(state, user_input, current_stage_id, current_stage_info, collected_info)
             
             # 추출된 정보가 있으면 처리
             if intent_analysis.get("extracted_info"):
-                print(f"🎯 [MULTI_FIELD_EXTRACTION] Extracted info: {intent_analysis['extracted_info']}")
+                logger.debug("🎯 [MULTI_FIELD_EXTRACTION] Extracted info: %s", intent_analysis['extracted_info'])
                 
                 # additional_services 단계에서 "~만" 패턴 특별 처리
                 if current_stage_id == "additional_services" and "만" in user_input:
@@ -1108,12 +1058,12 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                     # "~만" 패턴이 감지되면 언급되지 않은 boolean 필드를 False로 설정
                     mentioned_fields = set(extracted_info.keys())
                     if mentioned_fields:  # 최소 하나의 필드가 추출된 경우
-                        print(f"🎯 [ONLY_PATTERN] Detected '~만' pattern in additional_services")
+                        logger.debug("🎯 [ONLY_PATTERN] Detected '~만' pattern in additional_services")
                         for field in boolean_fields:
                             if field not in mentioned_fields and field in fields_to_collect:
                                 # 언급되지 않은 필드는 False로 설정
                                 intent_analysis["extracted_info"][field] = False
-                                print(f"✅ [ONLY_PATTERN] Set unmentioned field {field} = False")
+                                logger.debug("✅ [ONLY_PATTERN] Set unmentioned field %s = False", field)
                 
                 # 각 필드를 확인하고 저장
                 for field_key, field_value in intent_analysis["extracted_info"].items():
@@ -1128,39 +1078,32 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                         if isinstance(field_value, str) and any(abstract in field_value for abstract in abstract_values):
                             # card_selection의 경우 default choice로 매핑
                             if field_key == "card_selection" and choices:
-                                default_choice_value = None
-                                for choice in choices:
-                                    if isinstance(choice, dict) and choice.get("default"):
-                                        default_choice_value = choice.get("value")
-                                        break
+                                default_choice_value = compiled_stage.default_choice_value
                                 if default_choice_value:
                                     extracted_fields[field_key] = default_choice_value
                                     extracted_fields["_default_mapping_occurred"] = True  # 플래그 설정
-                                    print(f"✅ [MULTI_FIELD_MAPPED] {field_key}: '{field_value}' → '{default_choice_value}' (abstract to default)")
+                                    logger.debug("✅ [MULTI_FIELD_MAPPED] %s: '%s' → '%s' (abstract to default)", field_key, field_value, default_choice_value)
                                     
                                     # default choice의 metadata도 extracted_fields에 추가
-                                    for choice in choices:
-                                        if isinstance(choice, dict) and choice.get("value") == default_choice_value:
-                                            metadata = choice.get("metadata", {})
-                                            if metadata.get("receipt_method") and "card_receipt_method" in fields_to_collect:
-                                                extracted_fields["card_receipt_method"] = metadata["receipt_method"]
-                                                print(f"✅ [MULTI_FIELD_METADATA] card_receipt_method: '{metadata['receipt_method']}' (from metadata)")
-                                            if "transit_enabled" in metadata and "transit_function" in fields_to_collect:
-                                                extracted_fields["transit_function"] = metadata["transit_enabled"]
-                                                print(f"✅ [MULTI_FIELD_METADATA] transit_function: {metadata['transit_enabled']} (from metadata)")
-                                            break
+                                    metadata = compiled_stage.default_choice.metadata
+                                    if metadata.get("receipt_method") and "card_receipt_method" in fields_to_collect:
+                                        extracted_fields["card_receipt_method"] = metadata["receipt_method"]
+                                        logger.debug("✅ [MULTI_FIELD_METADATA] card_receipt_method: '%s' (from metadata)", metadata['receipt_method'])
+                                    if "transit_enabled" in metadata and "transit_function" in fields_to_collect:
+                                        extracted_fields["transit_function"] = metadata["transit_enabled"]
+                                        logger.debug("✅ [MULTI_FIELD_METADATA] transit_function: %s (from metadata)", metadata['transit_enabled'])
                                 else:
                                     # default가 없으면 원래 값 저장 (후속 처리에서 매핑될 것)
                                     extracted_fields[field_key] = field_value
-                                    print(f"✅ [MULTI_FIELD_STORED] {field_key}: '{field_value}' (abstract, no default found)")
+                                    logger.debug("✅ [MULTI_FIELD_STORED] %s: '%s' (abstract, no default found)", field_key, field_value)
                             else:
                                 # 다른 필드는 원래 값 저장 (후속 처리에서 매핑될 것)
                                 extracted_fields[field_key] = field_value
-                                print(f"✅ [MULTI_FIELD_STORED] {field_key}: '{field_value}' (abstract, will be mapped later)")
+                                logger.debug("✅ [MULTI_FIELD_STORED] %s: '%s' (abstract, will be mapped later)", field_key, field_value)
                         else:
                             # 일반 값은 그대로 저장
                             extracted_fields[field_key] = field_value
-                            print(f"✅ [MULTI_FIELD_STORED] {field_key}: '{field_value}'")
+                            logger.debug("✅ [MULTI_FIELD_STORED] %s: '%s'", field_key, field_value)
             
             # 추출된 필드 값을 정의된 choice 값으로 매핑
             if extracted_fields and choices:
@@ -1203,7 +1146,7 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                                     if field_value_clean in card_name_mapping:
                                         mapped_value = card_name_mapping[field_value_clean]
                                         extracted_fields[field_key] = mapped_value
-                                        print(f"✅ [MULTI_FIELD_DIRECT_MAPPED] {field_key}: '{field_value}' → '{mapped_value}' (direct mapping)")
+                                        logger.debug("✅ [MULTI_FIELD_DIRECT_MAPPED] %s: '%s' → '%s' (direct mapping)", field_key, field_value, mapped_value)
                                         break
                                     
                                     # "딥드림" + "일반" 모두 포함되는지 확인
@@ -1212,14 +1155,14 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                                         len([k for k in field_keywords if k in choice_display_clean]) >= 2):
                                         
                                         extracted_fields[field_key] = choice_value
-                                        print(f"✅ [MULTI_FIELD_CHOICE_MAPPED] {field_key}: '{field_value}' → '{choice_value}' (matched with '{choice_display}')")
+                                        logger.debug("✅ [MULTI_FIELD_CHOICE_MAPPED] %s: '%s' → '%s' (matched with '%s')", field_key, field_value, choice_value, choice_display)
                                         break
                                     
                                     # 간단한 부분 매칭도 시도
                                     elif field_value_clean in choice_display_clean or choice_display_clean in field_value_clean:
                                         if len(field_value_clean) >= 3:  # 너무 짧은 매칭 방지
                                             extracted_fields[field_key] = choice_value
-                                            print(f"✅ [MULTI_FIELD_CHOICE_MAPPED] {field_key}: '{field_value}' → '{choice_value}' (partial match with '{choice_display}')")
+                                            logger.debug("✅ [MULTI_FIELD_CHOICE_MAPPED] %s: '%s' → '%s' (partial match with '%s')", field_key, field_value, choice_value, choice_display)
                                             break
             
             # statement_delivery 단계에서 LLM이 실패하거나 날짜가 비어있는 경우 간단한 패턴 매칭 시도
@@ -1233,23 +1176,23 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                     date_value = date_match.group(1)
                     if 1 <= int(date_value) <= 31:
                         extracted_fields["statement_delivery_date"] = date_value
-                        print(f"✅ [FALLBACK_EXTRACTION] statement_delivery_date: '{date_value}' (from pattern matching)")
+                        logger.debug("✅ [FALLBACK_EXTRACTION] statement_delivery_date: '%s' (from pattern matching)", date_value)
                 else:
                     # 날짜가 명시되지 않은 경우 기본값 사용
                     default_date = current_stage_info.get("default_values", {}).get("statement_delivery_date", "10")
                     extracted_fields["statement_delivery_date"] = default_date
-                    print(f"✅ [FALLBACK_DEFAULT] statement_delivery_date: '{default_date}' (using default)")
+                    logger.debug("✅ [FALLBACK_DEFAULT] statement_delivery_date: '%s' (using default)", default_date)
                 
                 # 배송 방법 추출
                 if "이메일" in user_input:
                     extracted_fields["statement_delivery_method"] = "email"
-                    print(f"✅ [FALLBACK_EXTRACTION] statement_delivery_method: 'email'")
+                    logger.debug("✅ [FALLBACK_EXTRACTION] statement_delivery_method: 'email'")
                 elif "휴대폰" in user_input or "모바일" in user_input or "문자" in user_input:
                     extracted_fields["statement_delivery_method"] = "mobile"
-                    print(f"✅ [FALLBACK_EXTRACTION] statement_delivery_method: 'mobile'")
+                    logger.debug("✅ [FALLBACK_EXTRACTION] statement_delivery_method: 'mobile'")
                 elif "홈페이지" in user_input or "웹" in user_input:
                     extracted_fields["statement_delivery_method"] = "website"
-                    print(f"✅ [FALLBACK_EXTRACTION] statement_delivery_method: 'website'")
+                    logger.debug("✅ [FALLBACK_EXTRACTION] statement_delivery_method: 'website'")
                 
                 # 주 필드 (expected_field) 값 설정
                 if expected_field and expected_field in extracted_fields:
@@ -1264,7 +1207,7 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                     # 기본값을 true로 설정
                     if expected_field == "card_password_same_as_account":
                         choice_mapping = "true"
-                        print(f"🎯 [DEFAULT_ACCEPTANCE] '똑같이 해줘' -> {expected_field}: true")
+                        logger.debug("🎯 [DEFAULT_ACCEPTANCE] '똑같이 해줘' -> %s: true", expected_field)
         
         if not choice_mapping:
             # select_services 단계에서 명확한 키워드가 있으면 직접 매핑
@@ -1272,16 +1215,16 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                 user_lower = user_input.lower().strip()
                 if "체크카드만" in user_lower or "카드만" in user_lower:
                     choice_mapping = "card_only"
-                    print(f"🎯 [DIRECT_MAPPING] '체크카드만/카드만' detected -> card_only")
+                    logger.debug("🎯 [DIRECT_MAPPING] '체크카드만/카드만' detected -> card_only")
                 elif "계좌만" in user_lower or "통장만" in user_lower or "입출금만" in user_lower:
                     choice_mapping = "account_only"
-                    print(f"🎯 [DIRECT_MAPPING] '계좌만/통장만/입출금만' detected -> account_only")
+                    logger.debug("🎯 [DIRECT_MAPPING] '계좌만/통장만/입출금만' detected -> account_only")
                 elif "뱅킹만" in user_lower or "모바일만" in user_lower or "앱만" in user_lower or "모바일뱅킹만" in user_lower or "인터넷뱅킹만" in user_lower:
                     choice_mapping = "mobile_only"
-                    print(f"🎯 [DIRECT_MAPPING] '뱅킹만/모바일만/앱만/모바일뱅킹만/인터넷뱅킹만' detected -> mobile_only")
+                    logger.debug("🎯 [DIRECT_MAPPING] '뱅킹만/모바일만/앱만/모바일뱅킹만/인터넷뱅킹만' detected -> mobile_only")
                 elif any(word in user_lower for word in ["다", "모두", "전부", "함께"]):
                     choice_mapping = "all"
-                    print(f"🎯 [DIRECT_MAPPING] '다/모두/전부/함께' detected -> all")
+                    logger.debug("🎯 [DIRECT_MAPPING] '다/모두/전부/함께' detected -> all")
             
             # 직접 매핑이 안된 경우에만 LLM 사용
             if not choice_mapping:
@@ -1308,7 +1251,6 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                 user_input, 
                 choices, 
                 expected_field,
-                None,  # keyword_mapping
                 current_stage_info,  # stage_info
                 collected_info  # collected_info
             )
@@ -1319,11 +1261,11 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
             # 긍정 응답인 경우 DEFAULT_SELECTION 값 유지
             if user_input and any(word in user_input.lower() for word in ["네", "예", "응", "어", "좋아", "맞아", "알겠"]):
                 already_default_selected = True
-                print(f"🎯 [DEFAULT_PROTECTED] {expected_field} already set by DEFAULT_SELECTION: '{collected_info[expected_field]}', skipping LLM mapping")
+                logger.debug("🎯 [DEFAULT_PROTECTED] %s already set by DEFAULT_SELECTION: '%s', skipping LLM mapping", expected_field, collected_info[expected_field])
         
         # DEFAULT_SELECTION으로 값이 설정된 경우 확인 응답 생성
         if already_default_selected:
-            print(f"🎯 [DEFAULT_SELECTION_CONFIRMATION] Generating confirmation response for DEFAULT_SELECTION")
+            logger.debug("🎯 [DEFAULT_SELECTION_CONFIRMATION] Generating confirmation response for DEFAULT_SELECTION")
             
             # card_selection 단계 특별 확인 응답
             if current_stage_id == "card_selection":
@@ -1348,7 +1290,7 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                 else:
                     confirmation_response = f"네, {card_name}를 {receipt_method_display}으로 신청해드리겠습니다."
                     
-                print(f"🎯 [DEFAULT_SELECTION_CONFIRMATION] Generated card_selection confirmation: {confirmation_response}")
+                logger.debug("🎯 [DEFAULT_SELECTION_CONFIRMATION] Generated card_selection confirmation: %s", confirmation_response)
             
             # 다른 단계들의 기본 확인 응답
             else:
@@ -1366,7 +1308,7 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                     field_key=expected_field,
                     stage_info=current_stage_info
                 )
-                print(f"🎯 [DEFAULT_SELECTION_CONFIRMATION] Generated generic confirmation: {confirmation_response}")
+                logger.debug("🎯 [DEFAULT_SELECTION_CONFIRMATION] Generated generic confirmation: %s", confirmation_response)
             
             # 다음 단계 확인
             next_step = current_stage_info.get("next_step")
@@ -1377,10 +1319,10 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                     # expected_field 값에 따른 분기 처리
                     field_value = collected_info[expected_field]
                     next_stage_id = next_step.get(field_value, next_step.get("default", current_stage_id))
-                    print(f"🎯 [DEFAULT_SELECTION_NEXT] {expected_field}='{field_value}' -> next_stage: {next_stage_id}")
+                    logger.debug("🎯 [DEFAULT_SELECTION_NEXT] %s='%s' -> next_stage: %s", expected_field, field_value, next_stage_id)
                 elif isinstance(next_step, str):
                     next_stage_id = next_step
-                    print(f"🎯 [DEFAULT_SELECTION_NEXT] Direct next_stage: {next_stage_id}")
+                    logger.debug("🎯 [DEFAULT_SELECTION_NEXT] Direct next_stage: %s", next_stage_id)
             else:
                 # next_step이 없으면 transitions나 default_next_stage_id 사용
                 transitions = current_stage_info.get("transitions", [])
@@ -1400,25 +1342,25 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                 else:
                     next_stage_id = current_stage_id  # 기본값은 현재 단계 유지
                     
-                print(f"🎯 [DEFAULT_SELECTION_NEXT] Determined next_stage: {next_stage_id}")
+                logger.debug("🎯 [DEFAULT_SELECTION_NEXT] Determined next_stage: %s", next_stage_id)
             
             # 단계 전환 및 응답 데이터 준비
             if next_stage_id and next_stage_id != current_stage_id:
                 # 다음 단계로 전환
                 next_stage_info = active_scenario_data.get("stages", {}).get(next_stage_id, {})
-                print(f"🎯 [DEFAULT_SELECTION_TRANSITION] {current_stage_id} -> {next_stage_id}")
+                logger.debug("🎯 [DEFAULT_SELECTION_TRANSITION] %s -> %s", current_stage_id, next_stage_id)
                 
                 # stage_response_data 생성
                 stage_response_data = None
                 if "response_type" in next_stage_info:
                     stage_response_data = generate_stage_response(next_stage_info, collected_info, active_scenario_data)
-                    print(f"🎯 [DEFAULT_SELECTION_STAGE_RESPONSE] Generated stage response data for {next_stage_id}")
+                    logger.debug("🎯 [DEFAULT_SELECTION_STAGE_RESPONSE] Generated stage response data for %s", next_stage_id)
                     
                     # 확인 메시지를 stage_response_data의 prompt에 추가
                     if stage_response_data and confirmation_response:
                         original_prompt = stage_response_data.get("prompt", "")
                         stage_response_data["prompt"] = f"{confirmation_response}\n\n{original_prompt}" if original_prompt else confirmation_response
-                        print(f"🎯 [DEFAULT_SELECTION_STAGE_RESPONSE] Added confirmation to stage prompt")
+                        logger.debug("🎯 [DEFAULT_SELECTION_STAGE_RESPONSE] Added confirmation to stage prompt")
                 
                 # 응답 프롬프트 준비
                 next_stage_prompt = next_stage_info.get("prompt", "")
@@ -1448,7 +1390,7 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
             
             else:
                 # 현재 단계에 머무는 경우 - 단순 확인 응답만 제공
-                print(f"🎯 [DEFAULT_SELECTION_STAY] Staying at current stage {current_stage_id}")
+                logger.debug("🎯 [DEFAULT_SELECTION_STAY] Staying at current stage %s", current_stage_id)
                 
                 update_dict = {
                     "current_scenario_stage_id": current_stage_id,
@@ -1471,14 +1413,13 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                 user_input, 
                 choices, 
                 expected_field,
-                None,  # keyword_mapping
                 current_stage_info,  # stage_info
                 collected_info  # collected_info
             )
         
         # extracted_fields가 있으면 choice_mapping 없어도 처리
         if extracted_fields and not choice_mapping:
-            print(f"🎯 [V3_EXTRACTED_FIELDS] Processing extracted fields without choice_mapping")
+            logger.debug("🎯 [V3_EXTRACTED_FIELDS] Processing extracted fields without choice_mapping")
             
             # 수정 의도가 명확한 경우 (날짜 변경 등)
             is_modification_intent = any(keyword in user_input.lower() for keyword in ["바꿀래", "변경", "수정", "바꿔", "로 할래", "로 해줘"])
@@ -1490,7 +1431,7 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                 for field_key, field_value in extracted_fields.items():
                     # 빈 문자열은 건너뛰기
                     if field_value == "" or field_value is None:
-                        print(f"🎯 [V3_EXTRACTED_SKIPPED] {field_key}: empty value, skipping")
+                        logger.debug("🎯 [V3_EXTRACTED_SKIPPED] %s: empty value, skipping", field_key)
                         continue
                     
                     if field_key in fields_to_collect:
@@ -1498,7 +1439,7 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                         if (current_stage_id == "security_medium_registration" and 
                             field_key in collected_info and
                             field_value in ["등록", "네", "응", "예", "좋아"]):
-                            print(f"🎯 [V3_EXTRACTED_SKIPPED] {field_key}: keeping default value '{collected_info[field_key]}' (ignoring extracted '{field_value}')")
+                            logger.debug("🎯 [V3_EXTRACTED_SKIPPED] %s: keeping default value '%s' (ignoring extracted '%s')", field_key, collected_info[field_key], field_value)
                             continue
                         
                         # Boolean 필드 특별 처리 (additional_services 등)
@@ -1506,15 +1447,15 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                             # boolean 필드는 True/False만 가능
                             if isinstance(field_value, bool):
                                 collected_info[field_key] = field_value
-                                print(f"✅ [V3_BOOLEAN_STORED] {field_key}: {field_value}")
+                                logger.debug("✅ [V3_BOOLEAN_STORED] %s: %s", field_key, field_value)
                             elif isinstance(field_value, str):
                                 # 문자열 "True"/"False"를 boolean으로 변환 (한국어 포함)
                                 if field_value.lower() in ["true", "yes", "1", "네", "예", "응", "맞아", "그래"]:
                                     collected_info[field_key] = True
-                                    print(f"✅ [V3_BOOLEAN_CONVERTED] {field_key}: '{field_value}' → True")
+                                    logger.debug("✅ [V3_BOOLEAN_CONVERTED] %s: '%s' → True", field_key, field_value)
                                 elif field_value.lower() in ["false", "no", "0", "아니", "아니요", "아니야", "싫어", "안해"]:
                                     collected_info[field_key] = False
-                                    print(f"✅ [V3_BOOLEAN_CONVERTED] {field_key}: '{field_value}' → False")
+                                    logger.debug("✅ [V3_BOOLEAN_CONVERTED] %s: '%s' → False", field_key, field_value)
                                 else:
                                     # 기본값 사용 (보통 True)
                                     default_value = True
@@ -1523,7 +1464,7 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                                             default_value = choice.get("default", True)
                                             break
                                     collected_info[field_key] = default_value
-                                    print(f"✅ [V3_BOOLEAN_DEFAULT] {field_key}: using default {default_value}")
+                                    logger.debug("✅ [V3_BOOLEAN_DEFAULT] %s: using default %s", field_key, default_value)
                             continue  # boolean 필드는 여기서 처리 완료
                         
                         # metadata 필드는 choice validation 스킵 (card_receipt_method, transit_function 등)
@@ -1531,15 +1472,15 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                         if field_key in metadata_fields:
                             # 이미 올바른 값이 설정되어 있으면 유지 (메타데이터로부터 설정된 값)
                             if field_key in collected_info and collected_info[field_key] not in ["기본값", "기본", "디폴트"]:
-                                print(f"✅ [V3_METADATA_FIELD_KEPT] {field_key}: keeping existing value '{collected_info[field_key]}' (already set from metadata)")
+                                logger.debug("✅ [V3_METADATA_FIELD_KEPT] %s: keeping existing value '%s' (already set from metadata)", field_key, collected_info[field_key])
                             else:
                                 # metadata 필드는 그대로 저장
                                 collected_info[field_key] = field_value
-                                print(f"✅ [V3_METADATA_FIELD_STORED] {field_key}: '{field_value}' (metadata field, no choice validation)")
+                                logger.debug("✅ [V3_METADATA_FIELD_STORED] %s: '%s' (metadata field, no choice validation)", field_key, field_value)
                             continue
                         
                         # 추출된 값이 유효한 choice인지 확인
-                        print(f"🔍 [V3_CHOICE_CHECK] {field_key}: Checking choices... choices_count={len(choices) if choices else 0}")
+                        logger.debug("🔍 [V3_CHOICE_CHECK] %s: Checking choices... choices_count=%s", field_key, len(choices) if choices else 0)
                         if choices:
                             valid_choice_values = []
                             default_choice_value = None
@@ -1553,7 +1494,7 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                                 else:
                                     valid_choice_values.append(str(choice))
                             
-                            print(f"🔍 [V3_CHOICE_VALIDATION] {field_key}: field_value='{field_value}', valid_choices={valid_choice_values}, default_choice='{default_choice_value}'")
+                            logger.debug("🔍 [V3_CHOICE_VALIDATION] %s: field_value='%s', valid_choices=%s, default_choice='%s'", field_key, field_value, valid_choice_values, default_choice_value)
                             
                             # 추출된 값이 유효한 choice가 아닌 경우
                             if field_value not in valid_choice_values:
@@ -1575,12 +1516,12 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                                     # 3. 원본 user_input도 체크 (그걸로 발급해줘 같은 경우)
                                     elif user_input and any(abstract in user_input for abstract in abstract_values):
                                         is_abstract = True
-                                        print(f"🎯 [V3_ABSTRACT_FROM_INPUT] Found abstract value in user_input: '{user_input}'")
+                                        logger.debug("🎯 [V3_ABSTRACT_FROM_INPUT] Found abstract value in user_input: '%s'", user_input)
                                 
                                 if is_abstract and default_choice_value:
                                     collected_info[field_key] = default_choice_value
                                     default_mapping_occurred = True  # default mapping 발생 표시
-                                    print(f"✅ [V3_DEFAULT_MAPPED] {field_key}: '{field_value}' → '{default_choice_value}' (mapped to default)")
+                                    logger.debug("✅ [V3_DEFAULT_MAPPED] %s: '%s' → '%s' (mapped to default)", field_key, field_value, default_choice_value)
                                     
                                     # default choice의 metadata도 자동으로 채우기
                                     for choice in choices:
@@ -1590,21 +1531,21 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                                                 # 필드명 매핑
                                                 if meta_key == "receipt_method" and "card_receipt_method" in fields_to_collect:
                                                     collected_info["card_receipt_method"] = "즉시발급" if meta_value == "즉시발급" else "배송"
-                                                    print(f"✅ [V3_METADATA_MAPPED] card_receipt_method: '{meta_value}'")
+                                                    logger.debug("✅ [V3_METADATA_MAPPED] card_receipt_method: '%s'", meta_value)
                                                 elif meta_key == "transit_enabled" and "transit_function" in fields_to_collect:
                                                     collected_info["transit_function"] = meta_value
-                                                    print(f"✅ [V3_METADATA_MAPPED] transit_function: {meta_value}")
+                                                    logger.debug("✅ [V3_METADATA_MAPPED] transit_function: %s", meta_value)
                                                 elif meta_key == "transfer_limit_once" and "transfer_limit_once" in fields_to_collect:
                                                     collected_info["transfer_limit_once"] = meta_value
-                                                    print(f"✅ [V3_METADATA_MAPPED] transfer_limit_once: {meta_value}")
+                                                    logger.debug("✅ [V3_METADATA_MAPPED] transfer_limit_once: %s", meta_value)
                                                 elif meta_key == "transfer_limit_daily" and "transfer_limit_daily" in fields_to_collect:
                                                     collected_info["transfer_limit_daily"] = meta_value
-                                                    print(f"✅ [V3_METADATA_MAPPED] transfer_limit_daily: {meta_value}")
+                                                    logger.debug("✅ [V3_METADATA_MAPPED] transfer_limit_daily: %s", meta_value)
                                     continue
                                 
                                 # 이미 값이 있으면 기존 값 유지
                                 elif field_key in collected_info:
-                                    print(f"🎯 [V3_EXTRACTED_INVALID] {field_key}: '{field_value}' is not a valid choice, keeping existing value '{collected_info[field_key]}'")
+                                    logger.debug("🎯 [V3_EXTRACTED_INVALID] %s: '%s' is not a valid choice, keeping existing value '%s'", field_key, field_value, collected_info[field_key])
                                     continue
                                 else:
                                     # 유사한 값을 올바른 choice 값으로 매핑 시도
@@ -1618,16 +1559,16 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                                             if field_value_str in ordinal_keywords:
                                                 mapped_value = choice.get("value")
                                                 collected_info[field_key] = mapped_value
-                                                print(f"✅ [V3_ORDINAL_MAPPED] {field_key}: '{field_value}' → '{mapped_value}' (ordinal keyword match)")
+                                                logger.debug("✅ [V3_ORDINAL_MAPPED] %s: '%s' → '%s' (ordinal keyword match)", field_key, field_value, mapped_value)
                                                 
                                                 # metadata도 자동으로 채우기
                                                 metadata = choice.get("metadata", {})
                                                 if metadata.get("transfer_limit_once") and "transfer_limit_once" in fields_to_collect:
                                                     collected_info["transfer_limit_once"] = metadata["transfer_limit_once"]
-                                                    print(f"✅ [V3_METADATA_MAPPED] transfer_limit_once: {metadata['transfer_limit_once']}")
+                                                    logger.debug("✅ [V3_METADATA_MAPPED] transfer_limit_once: %s", metadata['transfer_limit_once'])
                                                 if metadata.get("transfer_limit_daily") and "transfer_limit_daily" in fields_to_collect:
                                                     collected_info["transfer_limit_daily"] = metadata["transfer_limit_daily"]
-                                                    print(f"✅ [V3_METADATA_MAPPED] transfer_limit_daily: {metadata['transfer_limit_daily']}")
+                                                    logger.debug("✅ [V3_METADATA_MAPPED] transfer_limit_daily: %s", metadata['transfer_limit_daily'])
                                                 break
                                     
                                     if mapped_value:
@@ -1652,16 +1593,16 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                                             if isinstance(target_choice, dict):
                                                 mapped_value = target_choice.get("value")
                                                 collected_info[field_key] = mapped_value
-                                                print(f"✅ [V3_ORDINAL_MAPPED] {field_key}: '{field_value}' → '{mapped_value}' (ordinal position {index+1})")
+                                                logger.debug("✅ [V3_ORDINAL_MAPPED] %s: '%s' → '%s' (ordinal position %s)", field_key, field_value, mapped_value, index + 1)
                                                 
                                                 # metadata도 자동으로 채우기
                                                 metadata = target_choice.get("metadata", {})
                                                 if metadata.get("transfer_limit_once") and "transfer_limit_once" in fields_to_collect:
                                                     collected_info["transfer_limit_once"] = metadata["transfer_limit_once"]
-                                                    print(f"✅ [V3_METADATA_MAPPED] transfer_limit_once: {metadata['transfer_limit_once']}")
+                                                    logger.debug("✅ [V3_METADATA_MAPPED] transfer_limit_once: %s", metadata['transfer_limit_once'])
                                                 if metadata.get("transfer_limit_daily") and "transfer_limit_daily" in fields_to_collect:
                                                     collected_info["transfer_limit_daily"] = metadata["transfer_limit_daily"]
-                                                    print(f"✅ [V3_METADATA_MAPPED] transfer_limit_daily: {metadata['transfer_limit_daily']}")
+                                                    logger.debug("✅ [V3_METADATA_MAPPED] transfer_limit_daily: %s", metadata['transfer_limit_daily'])
                                                 continue
                                     
                                     # card_usage_alert 특별 매핑
@@ -1682,12 +1623,12 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                                         if str(field_value).lower() in alert_mapping:
                                             mapped_value = alert_mapping[str(field_value).lower()]
                                             collected_info[field_key] = mapped_value
-                                            print(f"✅ [V3_EXTRACTED_MAPPED] {field_key}: '{field_value}' → '{mapped_value}' (similar value mapping)")
+                                            logger.debug("✅ [V3_EXTRACTED_MAPPED] %s: '%s' → '%s' (similar value mapping)", field_key, field_value, mapped_value)
                                             continue
                                     
                                     # 매핑 실패 시 그냥 저장 (fallback)
                                     if not mapped_value:
-                                        print(f"⚠️ [V3_EXTRACTED_FALLBACK] {field_key}: '{field_value}' is not a valid choice but no existing value, storing anyway")
+                                        logger.warning("⚠️ [V3_EXTRACTED_FALLBACK] %s: '%s' is not a valid choice but no existing value, storing anyway", field_key, field_value)
                             
                         
                         # 이미 default mapping으로 올바른 값이 설정된 경우 덮어쓰지 않음
@@ -1704,18 +1645,18 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                                 for abstract in abstract_values
                             )
                             if not is_abstract:
-                                print(f"🔒 [V3_EXTRACTED_PROTECTED] {field_key}: keeping existing value '{existing_value}' (not overwriting with '{field_value}')")
+                                logger.debug("🔒 [V3_EXTRACTED_PROTECTED] %s: keeping existing value '%s' (not overwriting with '%s')", field_key, existing_value, field_value)
                                 continue
                         
                         collected_info[field_key] = field_value
-                        print(f"✅ [V3_EXTRACTED_STORED] {field_key}: '{field_value}' (from extracted_fields)")
+                        logger.debug("✅ [V3_EXTRACTED_STORED] %s: '%s' (from extracted_fields)", field_key, field_value)
                 
                 # statement_delivery 단계에서 기본값 설정
                 if current_stage_id == "statement_delivery":
                     # 날짜가 없으면 기존 값 유지 또는 기본값 설정
                     if "statement_delivery_date" not in collected_info:
                         collected_info["statement_delivery_date"] = "10"
-                        print(f"✅ [V3_EXTRACTED_STORED] Set default statement_delivery_date: 10")
+                        logger.debug("✅ [V3_EXTRACTED_STORED] Set default statement_delivery_date: 10")
                     
                     # 방법이 없으면 기존 값 유지 또는 기본값 설정
                     if "statement_delivery_method" not in collected_info:
@@ -1724,7 +1665,7 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                             collected_info["statement_delivery_method"] = "mobile"
                         else:
                             collected_info["statement_delivery_method"] = "mobile"  # 기본값
-                        print(f"✅ [V3_EXTRACTED_STORED] Set default statement_delivery_method: mobile")
+                        logger.debug("✅ [V3_EXTRACTED_STORED] Set default statement_delivery_method: mobile")
                 
                 # 확인 응답 생성
                 if current_stage_id == "statement_delivery":
@@ -1733,7 +1674,7 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                     if not date or date == "":
                         date = current_stage_info.get("default_values", {}).get("statement_delivery_date", "10")
                         collected_info["statement_delivery_date"] = date
-                        print(f"✅ [V3_DEFAULT_DATE] Using default date: {date}")
+                        logger.debug("✅ [V3_DEFAULT_DATE] Using default date: %s", date)
                     method = collected_info.get("statement_delivery_method", "mobile")
                     method_display = "이메일" if method == "email" else "휴대폰" if method == "mobile" else "홈페이지"
                     confirmation_response = f"네, {method_display}로 매월 {date}일에 받아보시겠습니다."
@@ -1849,7 +1790,7 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                 else:
                     confirmation_response = "네, 확인했습니다."
                 
-                print(f"🎯 [V3_EXTRACTED_CONFIRMED] Generated confirmation: {confirmation_response}")
+                logger.debug("🎯 [V3_EXTRACTED_CONFIRMED] Generated confirmation: %s", confirmation_response)
                 
                 # 다음 단계 확인
                 # V3 시나리오의 next_step 처리
@@ -1863,14 +1804,14 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                         for field in fields_to_collect:
                             if field not in collected_info or collected_info.get(field) is None:
                                 required_fields_collected = False
-                                print(f"[V3_NEXT_STEP] Required field '{field}' not collected")
+                                logger.debug("[V3_NEXT_STEP] Required field '%s' not collected", field)
                                 break
                         
                         if required_fields_collected:
                             next_stage_id = next_step
-                            print(f"[V3_NEXT_STEP] All required fields collected, moving to {next_stage_id}")
+                            logger.debug("[V3_NEXT_STEP] All required fields collected, moving to %s", next_stage_id)
                         else:
-                            print(f"[V3_NEXT_STEP] Required fields not collected, staying at {current_stage_id}")
+                            logger.debug("[V3_NEXT_STEP] Required fields not collected, staying at %s", current_stage_id)
                     else:
                         # next_step이 dict인 경우 - 단계별 분기 처리
                         if current_stage_id == "additional_services":
@@ -1881,19 +1822,19 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                             if all_fields_collected:
                                 services_selected = collected_info.get("services_selected", "all")
                                 next_stage_id = next_step.get(services_selected, next_step.get("all", current_stage_id))
-                                print(f"[V3_NEXT_STEP] additional_services completed, services_selected='{services_selected}' -> {next_stage_id}")
+                                logger.debug("[V3_NEXT_STEP] additional_services completed, services_selected='%s' -> %s", services_selected, next_stage_id)
                             else:
                                 next_stage_id = current_stage_id
-                                print(f"[V3_NEXT_STEP] additional_services not all fields collected, staying at {current_stage_id}")
+                                logger.debug("[V3_NEXT_STEP] additional_services not all fields collected, staying at %s", current_stage_id)
                         elif current_stage_id == "security_medium_registration":
                             # security_medium 값에 따라 다음 단계 결정
                             security_medium = collected_info.get("security_medium")
                             if security_medium:
                                 next_stage_id = next_step.get(security_medium, current_stage_id)
-                                print(f"[V3_NEXT_STEP] security_medium_registration completed, security_medium='{security_medium}' -> {next_stage_id}")
+                                logger.debug("[V3_NEXT_STEP] security_medium_registration completed, security_medium='%s' -> %s", security_medium, next_stage_id)
                             else:
                                 next_stage_id = current_stage_id
-                                print(f"[V3_NEXT_STEP] security_medium_registration - no security_medium, staying at {current_stage_id}")
+                                logger.debug("[V3_NEXT_STEP] security_medium_registration - no security_medium, staying at %s", current_stage_id)
                         else:
                             next_stage_id = current_stage_id
                 
@@ -1903,19 +1844,19 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                     next_stage_info = active_scenario_data.get("stages", {}).get(str(next_stage_id), {})
                     next_stage_prompt = next_stage_info.get("prompt", "")
                     
-                    print(f"🎯 [V3_STAGE_TRANSITION] {current_stage_id} -> {next_stage_id}")
+                    logger.debug("🎯 [V3_STAGE_TRANSITION] %s -> %s", current_stage_id, next_stage_id)
                     
                     # stage_response_data 생성
                     stage_response_data = None
                     if "response_type" in next_stage_info:
                         stage_response_data = generate_stage_response(next_stage_info, collected_info, active_scenario_data)
-                        print(f"🎯 [V3_STAGE_RESPONSE] Generated stage response data for {next_stage_id}")
+                        logger.debug("🎯 [V3_STAGE_RESPONSE] Generated stage response data for %s", next_stage_id)
                         
                         # 확인 메시지를 stage_response_data의 prompt에 추가
                         if stage_response_data and confirmation_response:
                             original_prompt = stage_response_data.get("prompt", "")
                             stage_response_data["prompt"] = f"{confirmation_response}\n\n{original_prompt}" if original_prompt else confirmation_response
-                            print(f"🎯 [V3_STAGE_RESPONSE] Added confirmation to prompt: {confirmation_response}")
+                            logger.debug("🎯 [V3_STAGE_RESPONSE] Added confirmation to prompt: %s", confirmation_response)
                     
                     final_response = f"{confirmation_response} {next_stage_prompt}" if next_stage_prompt else confirmation_response
                     
@@ -1949,7 +1890,7 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                             services_selected = collected_info.get("services_selected", "all")
                             next_stage_id = "card_selection" if services_selected == "all" else "final_confirmation"
                             
-                            print(f"🎯 [ADDITIONAL_SERVICES_COMPLETE] All fields collected, moving to {next_stage_id}")
+                            logger.debug("🎯 [ADDITIONAL_SERVICES_COMPLETE] All fields collected, moving to %s", next_stage_id)
                             
                             # 다음 스테이지 정보 가져오기
                             next_stage_info = active_scenario_data.get("stages", {}).get(str(next_stage_id), {})
@@ -1959,7 +1900,7 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                             stage_response_data = None
                             if "response_type" in next_stage_info:
                                 stage_response_data = generate_stage_response(next_stage_info, collected_info, active_scenario_data)
-                                print(f"🎯 [STAGE_RESPONSE] Generated stage response data for {next_stage_id}")
+                                logger.debug("🎯 [STAGE_RESPONSE] Generated stage response data for %s", next_stage_id)
                                 
                                 # 확인 메시지를 stage_response_data의 prompt에 추가
                                 if stage_response_data and confirmation_response:
@@ -2003,7 +1944,7 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                     return state.merge_update(update_dict)
         
         if choice_mapping:
-            print(f"🎯 [V3_CHOICE_MAPPING] Mapped '{user_input}' to '{choice_mapping}'")
+            logger.debug("🎯 [V3_CHOICE_MAPPING] Mapped '%s' to '%s'", user_input, choice_mapping)
             if expected_field:
                 entities = {expected_field: choice_mapping}
                 intent = "정보제공"
@@ -2019,32 +1960,32 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                 if current_stage_id == "additional_services" and choice_mapping in ["all_true", "all_false", "important_only", "withdrawal_only", "overseas_only", "exclude_important", "exclude_withdrawal", "exclude_overseas"]:
                     # 복합 필드 값 설정
                     collected_info = apply_additional_services_values(choice_mapping, collected_info)
-                    print(f"✅ [V3_CHOICE_STORED] Applied additional_services mapping: '{choice_mapping}'")
+                    logger.debug("✅ [V3_CHOICE_STORED] Applied additional_services mapping: '%s'", choice_mapping)
                 # security_medium_registration 단계의 특별 처리
                 elif current_stage_id == "security_medium_registration":
                     # 보안매체 선택
                     collected_info[expected_field] = choice_mapping
-                    print(f"✅ [V3_CHOICE_STORED] {expected_field}: '{choice_mapping}'")
+                    logger.debug("✅ [V3_CHOICE_STORED] %s: '%s'", expected_field, choice_mapping)
                     
                     # 모든 보안매체에 대해 최대 이체한도 설정 (사용자가 수정 요청하지 않은 경우)
                     if "transfer_limit_once" not in collected_info:
                         collected_info["transfer_limit_once"] = "50000000"  # 5천만원
-                        print(f"✅ [V3_CHOICE_STORED] Set default transfer_limit_once: 50000000")
+                        logger.debug("✅ [V3_CHOICE_STORED] Set default transfer_limit_once: 50000000")
                     if "transfer_limit_daily" not in collected_info:
                         collected_info["transfer_limit_daily"] = "100000000"  # 1억원
-                        print(f"✅ [V3_CHOICE_STORED] Set default transfer_limit_daily: 100000000")
+                        logger.debug("✅ [V3_CHOICE_STORED] Set default transfer_limit_daily: 100000000")
                         
                 # statement_delivery 단계의 특별 처리  
                 elif current_stage_id == "statement_delivery":
                     # 명세서 수령방법 선택
                     collected_info[expected_field] = choice_mapping
-                    print(f"✅ [V3_CHOICE_STORED] {expected_field}: '{choice_mapping}'")
+                    logger.debug("✅ [V3_CHOICE_STORED] %s: '%s'", expected_field, choice_mapping)
                     
                     # 추출된 다른 필드들도 저장 (예: statement_delivery_date)
                     for field_key, field_value in extracted_fields.items():
                         if field_key != expected_field and field_key in fields_to_collect:
                             collected_info[field_key] = field_value
-                            print(f"✅ [V3_CHOICE_STORED] {field_key}: '{field_value}' (from multi-field extraction)")
+                            logger.debug("✅ [V3_CHOICE_STORED] %s: '%s' (from multi-field extraction)", field_key, field_value)
                     
                     # 날짜가 추출되지 않았지만 사용자 입력에 숫자가 있으면 추출 시도
                     if "statement_delivery_date" not in collected_info:
@@ -2056,19 +1997,19 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                             # 1-31 범위 검증
                             if 1 <= int(date_value) <= 31:
                                 collected_info["statement_delivery_date"] = date_value
-                                print(f"✅ [V3_CHOICE_STORED] Extracted statement_delivery_date from input: {date_value}")
+                                logger.debug("✅ [V3_CHOICE_STORED] Extracted statement_delivery_date from input: %s", date_value)
                             else:
                                 collected_info["statement_delivery_date"] = "10"
-                                print(f"✅ [V3_CHOICE_STORED] Invalid date {date_value}, using default: 10")
+                                logger.debug("✅ [V3_CHOICE_STORED] Invalid date %s, using default: 10", date_value)
                         else:
                             collected_info["statement_delivery_date"] = "10"
-                            print(f"✅ [V3_CHOICE_STORED] Set default statement_delivery_date: 10")
+                            logger.debug("✅ [V3_CHOICE_STORED] Set default statement_delivery_date: 10")
                         
                 # card_selection 단계의 특별 처리
                 elif current_stage_id == "card_selection":
                     # choice_mapping만 반환되므로 collected_info에 저장하고 metadata도 채우기
                     collected_info[expected_field] = choice_mapping
-                    print(f"✅ [V3_CHOICE_STORED] {expected_field}: '{choice_mapping}'")
+                    logger.debug("✅ [V3_CHOICE_STORED] %s: '%s'", expected_field, choice_mapping)
                     
                     # metadata에서 추가 필드 채우기
                     if choices:
@@ -2078,10 +2019,10 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                                 for meta_key, meta_value in metadata.items():
                                     if meta_key == "receipt_method" and "card_receipt_method" in fields_to_collect:
                                         collected_info["card_receipt_method"] = "즉시발급" if meta_value == "즉시발급" else "배송"
-                                        print(f"✅ [V3_METADATA_MAPPED] card_receipt_method: '{meta_value}'")
+                                        logger.debug("✅ [V3_METADATA_MAPPED] card_receipt_method: '%s'", meta_value)
                                     elif meta_key == "transit_enabled" and "transit_function" in fields_to_collect:
                                         collected_info["transit_function"] = meta_value
-                                        print(f"✅ [V3_METADATA_MAPPED] transit_function: {meta_value}")
+                                        logger.debug("✅ [V3_METADATA_MAPPED] transit_function: %s", meta_value)
                                 break
                     
                     # 추출된 다른 필드들도 저장 (단, 이미 choice mapping으로 올바르게 설정된 값은 덮어쓰지 않음)
@@ -2101,15 +2042,15 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                                     for abstract in abstract_values
                                 )
                                 if not is_abstract:
-                                    print(f"🔒 [V3_CHOICE_PROTECTED] {field_key}: keeping existing value '{existing_value}' (not overwriting with '{field_value}')")
+                                    logger.debug("🔒 [V3_CHOICE_PROTECTED] %s: keeping existing value '%s' (not overwriting with '%s')", field_key, existing_value, field_value)
                                     continue
                             
                             collected_info[field_key] = field_value
-                            print(f"✅ [V3_CHOICE_STORED] {field_key}: '{field_value}' (from multi-field extraction)")
+                            logger.debug("✅ [V3_CHOICE_STORED] %s: '%s' (from multi-field extraction)", field_key, field_value)
                 else:
                     # 일반적인 필드 저장
                     collected_info[expected_field] = choice_mapping
-                    print(f"✅ [V3_CHOICE_STORED] {expected_field}: '{choice_mapping}'")
+                    logger.debug("✅ [V3_CHOICE_STORED] %s: '%s'", expected_field, choice_mapping)
                     
                     # 추출된 다른 필드들도 저장 (단, 이미 choice mapping으로 올바르게 설정된 값은 덮어쓰지 않음)
                     for field_key, field_value in extracted_fields.items():
@@ -2128,11 +2069,11 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                                     for abstract in abstract_values
                                 )
                                 if not is_abstract:
-                                    print(f"🔒 [V3_CHOICE_PROTECTED] {field_key}: keeping existing value '{existing_value}' (not overwriting with '{field_value}')")
+                                    logger.debug("🔒 [V3_CHOICE_PROTECTED] %s: keeping existing value '%s' (not overwriting with '%s')", field_key, existing_value, field_value)
                                     continue
                             
                             collected_info[field_key] = field_value
-                            print(f"✅ [V3_CHOICE_STORED] {field_key}: '{field_value}' (from multi-field extraction)")
+                            logger.debug("✅ [V3_CHOICE_STORED] %s: '%s' (from multi-field extraction)", field_key, field_value)
                 
                 # 자연스러운 확인 응답 생성
                 # statement_delivery 단계에서는 날짜도 함께 확인
@@ -2142,7 +2083,7 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                     if not date or date == "":
                         date = current_stage_info.get("default_values", {}).get("statement_delivery_date", "10")
                         collected_info["statement_delivery_date"] = date
-                        print(f"✅ [V3_CHOICE_DEFAULT_DATE] Using default date: {date}")
+                        logger.debug("✅ [V3_CHOICE_DEFAULT_DATE] Using default date: %s", date)
                     method_display = "이메일" if choice_mapping == "email" else "휴대폰" if choice_mapping == "mobile" else "홈페이지"
                     confirmation_response = f"네, {method_display}로 매월 {date}일에 받아보시겠습니다."
                 else:
@@ -2160,7 +2101,7 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                         stage_info=current_stage_info
                     )
                 
-                print(f"🎯 [V3_CHOICE_CONFIRMED] Generated confirmation: {confirmation_response}")
+                logger.debug("🎯 [V3_CHOICE_CONFIRMED] Generated confirmation: %s", confirmation_response)
                 
                 # 다음 단계 확인
                 next_step = current_stage_info.get("next_step")
@@ -2171,7 +2112,7 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                         # services_selected 값에 따른 분기
                         if expected_field == "services_selected":
                             next_stage_id = next_step.get(choice_mapping, next_step.get("all", current_stage_id))
-                            print(f"🎯 [V3_NEXT_STAGE] {expected_field}='{choice_mapping}' -> next_stage: {next_stage_id}")
+                            logger.debug("🎯 [V3_NEXT_STAGE] %s='%s' -> next_stage: %s", expected_field, choice_mapping, next_stage_id)
                         # additional_services 단계 특별 처리 - services_selected 기준으로 분기
                         elif current_stage_id == "additional_services":
                             # 먼저 필수 필드가 모두 수집되었는지 확인
@@ -2181,18 +2122,18 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                             if missing_fields:
                                 # 필수 필드가 누락된 경우 현재 단계 유지
                                 next_stage_id = current_stage_id
-                                print(f"🎯 [V3_NEXT_STAGE] additional_services - missing fields: {missing_fields}, staying at {current_stage_id}")
+                                logger.debug("🎯 [V3_NEXT_STAGE] additional_services - missing fields: %s, staying at %s", missing_fields, current_stage_id)
                             else:
                                 # 모든 필드가 수집된 경우 다음 단계로 진행
                                 services_selected = collected_info.get("services_selected", "all")
                                 next_stage_id = next_step.get(services_selected, next_step.get("all", current_stage_id))
-                                print(f"🎯 [V3_NEXT_STAGE] additional_services - all fields collected, services_selected='{services_selected}' -> next_stage: {next_stage_id}")
+                                logger.debug("🎯 [V3_NEXT_STAGE] additional_services - all fields collected, services_selected='%s' -> next_stage: %s", services_selected, next_stage_id)
                         else:
                             next_stage_id = next_step.get(choice_mapping, current_stage_id)
                     else:
                         # 단순 문자열인 경우
                         next_stage_id = next_step
-                        print(f"🎯 [V3_NEXT_STAGE] Direct transition -> {next_stage_id}")
+                        logger.debug("🎯 [V3_NEXT_STAGE] Direct transition -> %s", next_stage_id)
                 
                 # 다음 단계로 진행하는 경우
                 if next_stage_id != current_stage_id:
@@ -2200,19 +2141,19 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                     next_stage_info = active_scenario_data.get("stages", {}).get(str(next_stage_id), {})
                     next_stage_prompt = next_stage_info.get("prompt", "")
                     
-                    print(f"🎯 [V3_STAGE_TRANSITION] {current_stage_id} -> {next_stage_id}")
+                    logger.debug("🎯 [V3_STAGE_TRANSITION] %s -> %s", current_stage_id, next_stage_id)
                     
                     # stage_response_data 생성 (개인정보 표시 등을 위해 필요)
                     stage_response_data = None
                     if "response_type" in next_stage_info:
                         stage_response_data = generate_stage_response(next_stage_info, collected_info, active_scenario_data)
-                        print(f"🎯 [V3_STAGE_RESPONSE] Generated stage response data for {next_stage_id}")
+                        logger.debug("🎯 [V3_STAGE_RESPONSE] Generated stage response data for %s", next_stage_id)
                         
                         # 확인 메시지를 stage_response_data의 prompt에 추가
                         if stage_response_data and confirmation_response:
                             original_prompt = stage_response_data.get("prompt", "")
                             stage_response_data["prompt"] = f"{confirmation_response}\n\n{original_prompt}" if original_prompt else confirmation_response
-                            print(f"🎯 [V3_STAGE_RESPONSE] Added confirmation to prompt: {confirmation_response}")
+                            logger.debug("🎯 [V3_STAGE_RESPONSE] Added confirmation to prompt: %s", confirmation_response)
                     
                     # 확인 메시지와 다음 단계 프롬프트를 함께 표시
                     final_response = f"{confirmation_response} {next_stage_prompt}" if next_stage_prompt else confirmation_response
@@ -2247,7 +2188,7 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                             services_selected = collected_info.get("services_selected", "all")
                             next_stage_id = "card_selection" if services_selected == "all" else "final_confirmation"
                             
-                            print(f"🎯 [ADDITIONAL_SERVICES_COMPLETE] All fields collected, moving to {next_stage_id}")
+                            logger.debug("🎯 [ADDITIONAL_SERVICES_COMPLETE] All fields collected, moving to %s", next_stage_id)
                             
                             # 다음 스테이지 정보 가져오기
                             next_stage_info = active_scenario_data.get("stages", {}).get(str(next_stage_id), {})
@@ -2257,7 +2198,7 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                             stage_response_data = None
                             if "response_type" in next_stage_info:
                                 stage_response_data = generate_stage_response(next_stage_info, collected_info, active_scenario_data)
-                                print(f"🎯 [STAGE_RESPONSE] Generated stage response data for {next_stage_id}")
+                                logger.debug("🎯 [STAGE_RESPONSE] Generated stage response data for %s", next_stage_id)
                                 
                                 # 확인 메시지를 stage_response_data의 prompt에 추가
                                 if stage_response_data and confirmation_response:
@@ -2304,7 +2245,7 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
             if current_stage_id == "additional_services":
                 handled = handle_additional_services_fallback(user_input, collected_info)
                 if handled:
-                    print(f"🎯 [ADDITIONAL_SERVICES_FALLBACK] Successfully processed: {user_input}")
+                    logger.debug("🎯 [ADDITIONAL_SERVICES_FALLBACK] Successfully processed: %s", user_input)
                     update_dict = {
                         "final_response_text_for_tts": "네, 설정해드렸습니다.",
                         "is_final_turn_response": True,
@@ -2333,7 +2274,7 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                     has_card_mention = any(keyword in state.last_llm_prompt for keyword in card_keywords)
                     if has_card_mention:
                         has_clear_context = True
-                        print(f"🎯 [V3_CONTEXT] Clear card reference found in previous prompt, treating pronoun as contextual")
+                        logger.debug("🎯 [V3_CONTEXT] Clear card reference found in previous prompt, treating pronoun as contextual")
                 
                 # 다른 단계에서도 선택지가 명확히 제시된 경우
                 elif choices and len(choices) <= 3:  # 선택지가 적은 경우
@@ -2342,7 +2283,7 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
                         choice_str = str(choice.get("display", choice.get("value", ""))) if isinstance(choice, dict) else str(choice)
                         if choice_str and choice_str in state.last_llm_prompt:
                             has_clear_context = True
-                            print(f"🎯 [V3_CONTEXT] Clear choice reference found in previous prompt")
+                            logger.debug("🎯 [V3_CONTEXT] Clear choice reference found in previous prompt")
                             break
             
             # 문맥이 명확한 경우 ambiguous로 처리하지 않음
@@ -2351,7 +2292,7 @@ async def process_single_info_collection(state: AgentState, active_scenario_data
             
             if is_ambiguous_reference or (scenario_output and not scenario_output.get("is_scenario_related")):
                 # 애매한 지시어나 무관한 발화인 경우 명확한 선택 유도 응답 생성
-                print(f"🎯 [V3_AMBIGUOUS] Ambiguous reference or deviation detected: '{user_input}'")
+                logger.debug("🎯 [V3_AMBIGUOUS] Ambiguous reference or deviation detected: '%s'", user_input)
                 
                 # 선택지 명확화 유도 응답 생성
                 clarification_response = await generate_choice_clarification_response(
@@ -2412,10 +2353,26 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
             )
             
             try:
-                response = await json_llm.ainvoke([HumanMessage(content=verification_prompt)])
-                raw_content = response.content.strip().replace("```json", "").replace("```", "").strip()
-                decision = json.loads(raw_content)
-                is_confirmed = decision.get("is_confirmed", False)
+                # 단답("네", "16일", 정확한 선택지)이면 선택 확정 여부를 LLM에 묻지 않음
+                fast_result = fast_path.resolve(user_input, current_stage_info)
+                if not fast_path.confirms_entities(fast_result, entities):
+                    fast_result = None
+                fast_path_stats.record("entity_verification", fast_result)
+                understanding = turn_understanding_for(state, current_stage_id)
+                if fast_result is not None:
+                    logger.debug("⚡ [FAST_PATH] %s: '%s' confirms %s - LLM 검증 생략", fast_result.rule, user_input, entities)
+                    fast_path_stats.maybe_shadow(
+                        "entity_verification", user_input,
+                        FastPathResult(fast_result.intent, {"is_confirmed": True}, fast_result.confidence, fast_result.rule),
+                        lambda: _shadow_entity_verification(verification_prompt)
+                    )
+                    is_confirmed = True
+                elif understanding is not None:
+                    # 턴 이해 통합 호출이 선택 확정 여부(committed)도 판단
+                    logger.debug("🧠 [TURN_UNDERSTANDING] committed=%s - LLM 검증 생략", understanding.committed)
+                    is_confirmed = understanding.committed
+                else:
+                    is_confirmed = await _llm_entity_verification(verification_prompt)
                 
                 if is_confirmed:
                     # Validate entities against field choices
@@ -2428,22 +2385,22 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
                             mapped_value = _map_entity_to_valid_choice(key, value, current_stage_info)
                             if mapped_value:
                                 collected_info[key] = mapped_value
-                                print(f"✅ [ENTITY_MAPPING] {key}: '{value}' -> '{mapped_value}'")
+                                logger.debug("✅ [ENTITY_MAPPING] %s: '%s' -> '%s'", key, value, mapped_value)
                             else:
                                 is_valid, error_msg = engine.validate_field_value(key, value)
                                 if is_valid:
                                     collected_info[key] = value
                                 else:
-                                    print(f"❌ [VALIDATION_ERROR] {key}: {error_msg}")
+                                    logger.error("❌ [VALIDATION_ERROR] %s: %s", key, error_msg)
                                     # validation 에러가 있어도 무한루프를 방지하기 위해 기본값 사용
                                     default_value = _get_default_value_for_field(key, current_stage_info)
                                     if default_value:
                                         collected_info[key] = default_value
-                                        print(f"🔄 [FALLBACK] {key}: using default '{default_value}'")
+                                        logger.debug("🔄 [FALLBACK] %s: using default '%s'", key, default_value)
                     
                     # validation_errors는 이제 사용하지 않음 (무한루프 방지)
                 else:
-                    print(f"--- Entity verification FAILED. Not updating collected info. ---")
+                    logger.debug("--- Entity verification FAILED. Not updating collected info. ---")
             except Exception as e:
                 pass
 
@@ -2455,7 +2412,7 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
                     mapped_value = _map_entity_to_valid_choice(key, value, current_stage_info)
                     if mapped_value:
                         collected_info[key] = mapped_value
-                        print(f"✅ [ENTITY_MAPPING] {key}: '{value}' -> '{mapped_value}'")
+                        logger.debug("✅ [ENTITY_MAPPING] %s: '%s' -> '%s'", key, value, mapped_value)
                     else:
                         # 기본 validation 시도
                         engine = SimpleScenarioEngine(active_scenario_data)
@@ -2463,20 +2420,20 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
                         if is_valid:
                             collected_info[key] = value
                         else:
-                            print(f"❌ [VALIDATION_ERROR] {key}: {error_msg}")
+                            logger.error("❌ [VALIDATION_ERROR] %s: %s", key, error_msg)
                             # validation 에러가 있어도 무한루프를 방지하기 위해 기본값 사용
                             default_value = _get_default_value_for_field(key, current_stage_info)
                             if default_value:
                                 collected_info[key] = default_value
-                                print(f"🔄 [FALLBACK] {key}: using default '{default_value}'")
+                                logger.debug("🔄 [FALLBACK] %s: using default '%s'", key, default_value)
 
     
     # customer_info_check 단계에서 수정 요청 특별 처리
     if current_stage_id == "customer_info_check":
-        print(f"🔍 SINGLE_INFO: customer_info_check processing")
-        print(f"  user_input: {user_input}")
-        print(f"  collected_info keys: {list(collected_info.keys())}")
-        print(f"  scenario_output: {scenario_output}")
+        logger.debug("🔍 SINGLE_INFO: customer_info_check processing")
+        logger.debug("  user_input: %s", user_input)
+        logger.debug("  collected_info keys: %s", list(collected_info.keys()))
+        logger.debug("  scenario_output: %s", scenario_output)
         # customer_info_check 단계 진입 시 default 값 설정
         display_fields = current_stage_info.get("display_fields", [])
         if display_fields:
@@ -2499,7 +2456,7 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
         
         # 긍정적 확인이면 바로 다음 단계로 진행
         if is_positive_confirmation:
-            print(f"🔍 SINGLE_INFO: Positive confirmation detected")
+            logger.debug("🔍 SINGLE_INFO: Positive confirmation detected")
             collected_info["confirm_personal_info"] = True
             
             # 시나리오 JSON에서 정의된 다음 단계로 이동
@@ -2513,7 +2470,7 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
                     next_stage_id = transition.get("next_stage_id", default_next)
                     break
             
-            print(f"🔍 SINGLE_INFO: Transitioning to {next_stage_id}")
+            logger.debug("🔍 SINGLE_INFO: Transitioning to %s", next_stage_id)
             next_stage_info = active_scenario_data.get("stages", {}).get(next_stage_id, {})
             
             # ask_security_medium 스테이지라면 stage_response_data 생성
@@ -2563,9 +2520,9 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
         
         # 위 조건 중 하나라도 해당하면 correction mode로 진입
         if is_negative_response or is_direct_info_provision or has_new_info:
-            print(f"  - Negative response: {is_negative_response}")
-            print(f"  - Direct info provision: {is_direct_info_provision}")
-            print(f"  - Has new info: {has_new_info}")
+            logger.debug("  - Negative response: %s", is_negative_response)
+            logger.debug("  - Direct info provision: %s", is_direct_info_provision)
+            logger.debug("  - Has new info: %s", has_new_info)
             
             return state.merge_update({
                 "correction_mode": True,
@@ -2577,7 +2534,7 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
     
     # ask_security_medium 단계에서 "네" 응답 처리
     if current_stage_id == "ask_security_medium":
-        print(f"🔐 [SECURITY_MEDIUM] Processing with input: '{user_input}'")
+        logger.debug("🔐 [SECURITY_MEDIUM] Processing with input: '%s'", user_input)
         
         expected_info_key = current_stage_info.get("expected_info_key")
         
@@ -2586,17 +2543,17 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
             # 기본값: '신한 OTP' (scenario의 default_choice 사용)
             default_security_medium = current_stage_info.get("default_choice", "신한 OTP")
             collected_info[expected_info_key] = default_security_medium
-            print(f"🔐 [SECURITY_MEDIUM] Set {expected_info_key} = {default_security_medium} (user said yes)")
+            logger.debug("🔐 [SECURITY_MEDIUM] Set %s = %s (user said yes)", expected_info_key, default_security_medium)
             
         # 부정 응답 처리
         elif expected_info_key and user_input and any(word in user_input.lower() for word in ["아니", "안", "싫", "필요없"]):
             # 부정 응답인 경우 보안카드를 기본으로 설정
             collected_info[expected_info_key] = "보안카드"
-            print(f"🔐 [SECURITY_MEDIUM] Set {expected_info_key} = 보안카드 (user said no)")
+            logger.debug("🔐 [SECURITY_MEDIUM] Set %s = 보안카드 (user said no)", expected_info_key)
     
     # additional_services 단계에서 "네" 응답 처리 - 더 엄격한 조건
     if current_stage_id == "additional_services":
-        print(f"[ADDITIONAL_SERVICES] Processing with input: '{user_input}'")
+        logger.debug("[ADDITIONAL_SERVICES] Processing with input: '%s'", user_input)
         
         service_fields = ["important_transaction_alert", "withdrawal_alert", "overseas_ip_restriction"]
         has_specific_selections = any(field in collected_info for field in service_fields)
@@ -2619,20 +2576,20 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
                         field_key = choice.get("key")
                         if field_key and choice.get("default", False):
                             collected_info[field_key] = True
-                            print(f"[ADDITIONAL_SERVICES] Set {field_key} = True (from choice default)")
+                            logger.debug("[ADDITIONAL_SERVICES] Set %s = True (from choice default)", field_key)
                 else:
                     # 기존 방식: default_values 사용
                     default_values = current_stage_info.get("default_values", {})
                     for field in service_fields:
                         if field in default_values:
                             collected_info[field] = default_values[field]
-                            print(f"[ADDITIONAL_SERVICES] Set {field} = {default_values[field]}")
+                            logger.debug("[ADDITIONAL_SERVICES] Set %s = %s", field, default_values[field])
             else:
-                print(f"[ADDITIONAL_SERVICES] Skipping default processing - user input contains specific mentions or not simple yes")
+                logger.debug("[ADDITIONAL_SERVICES] Skipping default processing - user input contains specific mentions or not simple yes")
     
     # ask_notification_settings 단계에서 "네" 응답 처리 (Entity Agent 결과가 없는 경우에만)
     if current_stage_id == "ask_notification_settings":
-        print(f"🔔 [NOTIFICATION] Processing with input: '{user_input}'")
+        logger.debug("🔔 [NOTIFICATION] Processing with input: '%s'", user_input)
         
         # Entity Agent가 구체적인 선택을 추출하지 못한 경우에만 "네" 처리
         notification_fields = ["important_transaction_alert", "withdrawal_alert", "overseas_ip_restriction"]
@@ -2641,24 +2598,24 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
         if (not has_specific_selections and user_input and 
             any(word in user_input for word in ["네", "예", "응", "어", "좋아요", "모두", "전부", "다", "신청", "하겠습니다"])):
             # Entity Agent가 선택을 추출하지 못하고 사용자가 일반적인 동의 표현을 한 경우에만 모든 알림을 true로 설정
-            print(f"🔔 [NOTIFICATION] No specific selections found, user said yes - setting all notifications to true")
+            logger.debug("🔔 [NOTIFICATION] No specific selections found, user said yes - setting all notifications to true")
             for field in notification_fields:
                 collected_info[field] = True
-                print(f"🔔 [NOTIFICATION] Set {field} = True")
+                logger.debug("🔔 [NOTIFICATION] Set %s = True", field)
         elif has_specific_selections:
-            print(f"🔔 [NOTIFICATION] Specific selections found, keeping Entity Agent results")
+            logger.debug("🔔 [NOTIFICATION] Specific selections found, keeping Entity Agent results")
     
     # 체크카드 관련 단계에서 "네" 응답 처리 (Entity Agent 결과가 없는 경우에만)
     check_card_stages = ["ask_card_receive_method", "ask_card_type", "ask_statement_method", "ask_card_usage_alert", "ask_card_password"]
     if current_stage_id in check_card_stages:
-        print(f"💳 [CHECK_CARD] Processing {current_stage_id} with input: '{user_input}'")
+        logger.debug("💳 [CHECK_CARD] Processing %s with input: '%s'", current_stage_id, user_input)
         
         expected_info_key = current_stage_info.get("expected_info_key")
         
         
         # Entity Agent가 구체적인 선택을 추출한 경우에는 그 값을 우선시
         if expected_info_key and expected_info_key in collected_info:
-            print(f"💳 [CHECK_CARD] Entity Agent found specific value for {expected_info_key}: {collected_info[expected_info_key]}")
+            logger.debug("💳 [CHECK_CARD] Entity Agent found specific value for %s: %s", expected_info_key, collected_info[expected_info_key])
         elif (expected_info_key and user_input and 
               any(word in user_input for word in ["네", "예", "응", "어", "좋아요", "그래요", "하겠습니다"])):
             # Entity Agent가 값을 추출하지 못하고 사용자가 일반적인 동의 표현을 한 경우에만 기본값 설정
@@ -2672,12 +2629,12 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
             
             if expected_info_key in default_values:
                 collected_info[expected_info_key] = default_values[expected_info_key]
-                print(f"💳 [CHECK_CARD] No specific selection found, set {expected_info_key} = {default_values[expected_info_key]} (user said yes)")
+                logger.debug("💳 [CHECK_CARD] No specific selection found, set %s = %s (user said yes)", expected_info_key, default_values[expected_info_key])
         
     
     # select_services 단계에서 선택이 없는 경우 재질문
     if current_stage_id == "select_services" and 'services_selected' not in collected_info and user_input:
-        print(f"🎯 [SELECT_SERVICES] No service selected, generating clarification response")
+        logger.debug("🎯 [SELECT_SERVICES] No service selected, generating clarification response")
         
         # 재질문 응답 생성
         clarification_response = await generate_choice_clarification_response(
@@ -2706,20 +2663,20 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
     
     # ask_withdrawal_account 단계 특별 처리
     if current_stage_id == "ask_withdrawal_account":
-        print(f"🏦 [WITHDRAWAL_ACCOUNT] Processing user input: '{user_input}'")
-        print(f"🏦 [WITHDRAWAL_ACCOUNT] Current collected_info: {collected_info}")
-        print(f"🏦 [WITHDRAWAL_ACCOUNT] withdrawal_account_registration value: {collected_info.get('withdrawal_account_registration', 'NOT_SET')}")
+        logger.debug("🏦 [WITHDRAWAL_ACCOUNT] Processing user input: '%s'", user_input)
+        logger.debug("🏦 [WITHDRAWAL_ACCOUNT] Current collected_info: %s", collected_info)
+        logger.debug("🏦 [WITHDRAWAL_ACCOUNT] withdrawal_account_registration value: %s", collected_info.get('withdrawal_account_registration', 'NOT_SET'))
         
         # Entity Agent가 처리하지 못한 경우에만 폴백 처리
         if 'withdrawal_account_registration' not in collected_info and user_input:
             # "아니요" 응답 처리 - 부정 패턴을 먼저 확인
             if any(word in user_input for word in ["아니", "아니요", "안", "필요없", "괜찮", "나중에", "안할", "미신청"]):
                 collected_info["withdrawal_account_registration"] = False
-                print(f"🏦 [WITHDRAWAL_ACCOUNT] Fallback: Set withdrawal_account_registration = False")
+                logger.debug("🏦 [WITHDRAWAL_ACCOUNT] Fallback: Set withdrawal_account_registration = False")
             # "네" 응답 처리 - 짧은 응답 포함
             elif any(word in user_input for word in ["네", "예", "어", "응", "그래", "좋아", "좋아요", "등록", "추가", "신청", "하겠습니다", "도와", "부탁", "해줘", "해주세요", "알겠", "할게"]):
                 collected_info["withdrawal_account_registration"] = True
-                print(f"🏦 [WITHDRAWAL_ACCOUNT] Fallback: Set withdrawal_account_registration = True")
+                logger.debug("🏦 [WITHDRAWAL_ACCOUNT] Fallback: Set withdrawal_account_registration = True")
     
     # 스테이지 전환 로직 결정
     transitions = current_stage_info.get("transitions", [])
@@ -2728,29 +2685,29 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
     # V3 시나리오의 next_step 처리
     if current_stage_info.get("next_step"):
         next_step = current_stage_info.get("next_step")
-        print(f"[V3_NEXT_STEP] Stage: {current_stage_id}, next_step: {next_step}")
+        logger.debug("[V3_NEXT_STEP] Stage: %s, next_step: %s", current_stage_id, next_step)
         # next_step이 dict 타입인 경우 (값에 따른 분기)
         if isinstance(next_step, dict):
             # V3 시나리오 호환: fields_to_collect 또는 expected_info_key 사용
             expected_field_keys = get_expected_field_keys(current_stage_info)
             main_field_key = expected_field_keys[0] if expected_field_keys else None
-            print(f"[V3_NEXT_STEP] main_field_key: {main_field_key}, collected_info: {collected_info}")
+            logger.debug("[V3_NEXT_STEP] main_field_key: %s, collected_info: %s", main_field_key, collected_info)
             
             # select_services 처리 - services_selected 값에 따라 JSON의 next_step 분기 사용
             if current_stage_id == "select_services":
                 services_selected = collected_info.get("services_selected")
                 # services_selected가 None이면 현재 단계 유지 (재질문)
                 if services_selected is None:
-                    print(f"[V3_NEXT_STEP] select_services - No service selected, staying in current stage")
+                    logger.debug("[V3_NEXT_STEP] select_services - No service selected, staying in current stage")
                     next_stage_id = current_stage_id  # 현재 단계 유지
                 else:
-                    print(f"[V3_NEXT_STEP] select_services branching - services_selected: {services_selected}")
+                    logger.debug("[V3_NEXT_STEP] select_services branching - services_selected: %s", services_selected)
                     next_stage_id = next_step.get(services_selected, next_step.get("all", "completion"))
             # confirm_personal_info 특별 처리 - 중첩된 next_step 구조
             elif current_stage_id == "confirm_personal_info":
                 personal_info_confirmed = collected_info.get("personal_info_confirmed")
                 services_selected = collected_info.get("services_selected")
-                print(f"[V3_NEXT_STEP] confirm_personal_info - confirmed: {personal_info_confirmed} (type: {type(personal_info_confirmed)}), services: {services_selected}")
+                logger.debug("[V3_NEXT_STEP] confirm_personal_info - confirmed: %s (type: %s), services: %s", personal_info_confirmed, type(personal_info_confirmed), services_selected)
                 
                 # boolean 값을 문자열로 변환하여 next_step과 매핑
                 if personal_info_confirmed == True:
@@ -2760,24 +2717,24 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
                 else:
                     # 정보가 수집되지 않았으면 현재 스테이지 유지
                     next_stage_id = current_stage_id
-                    print(f"[V3_NEXT_STEP] No personal_info_confirmed value, staying at {current_stage_id}")
+                    logger.debug("[V3_NEXT_STEP] No personal_info_confirmed value, staying at %s", current_stage_id)
                     confirmed_key = None
                 
                 if confirmed_key:
-                    print(f"[V3_NEXT_STEP] Using key '{confirmed_key}' for next_step lookup")
+                    logger.debug("[V3_NEXT_STEP] Using key '%s' for next_step lookup", confirmed_key)
                     if confirmed_key == "true":
                         # true인 경우 services_selected에 따라 분기
                         true_next = next_step.get("true", {})
-                        print(f"[V3_NEXT_STEP] true_next structure: {true_next}")
+                        logger.debug("[V3_NEXT_STEP] true_next structure: %s", true_next)
                         if isinstance(true_next, dict):
                             next_stage_id = true_next.get(services_selected, true_next.get("all", "security_medium_registration"))
-                            print(f"[V3_NEXT_STEP] Selected next_stage_id: {next_stage_id} for services: {services_selected}")
+                            logger.debug("[V3_NEXT_STEP] Selected next_stage_id: %s for services: %s", next_stage_id, services_selected)
                         else:
                             next_stage_id = true_next
                     elif confirmed_key == "false":
                         # 개인정보 수정 요청에 대한 특별한 응답 처리
                         if state.get("special_response_for_modification"):
-                            print(f"[V3_NEXT_STEP] Special response for personal info modification")
+                            logger.debug("[V3_NEXT_STEP] Special response for personal info modification")
                             return state.merge_update({
                                 "final_response_text_for_tts": "[은행 고객정보 변경] 화면으로 이동해드리겠습니다.",
                                 "is_final_turn_response": True,
@@ -2787,11 +2744,11 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
                                 "special_response_for_modification": False  # 플래그 리셋
                             })
                         next_stage_id = next_step.get("false", "customer_info_update")
-                        print(f"[V3_NEXT_STEP] False branch - next_stage_id: {next_stage_id}")
+                        logger.debug("[V3_NEXT_STEP] False branch - next_stage_id: %s", next_stage_id)
             # additional_services 특별 처리 - services_selected 값에 따라 분기
             elif current_stage_id == "additional_services":
                 services_selected = collected_info.get("services_selected")
-                print(f"[V3_NEXT_STEP] additional_services branching - services_selected: {services_selected}")
+                logger.debug("[V3_NEXT_STEP] additional_services branching - services_selected: %s", services_selected)
                 
                 # services_selected 값에 따라 적절한 다음 단계 결정
                 if services_selected in ["all", "card_only"]:
@@ -2802,16 +2759,16 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
                     # 기본값: all 처리 (card_selection으로 이동)
                     next_stage_id = next_step.get("all", "card_selection")
                     
-                print(f"[V3_NEXT_STEP] additional_services - next_stage_id: {next_stage_id}")
+                logger.debug("[V3_NEXT_STEP] additional_services - next_stage_id: %s", next_stage_id)
             elif main_field_key and main_field_key in collected_info:
                 collected_value = collected_info[main_field_key]
-                print(f"[V3_NEXT_STEP] collected_value: {collected_value} for field: {main_field_key}")
+                logger.debug("[V3_NEXT_STEP] collected_value: %s for field: %s", collected_value, main_field_key)
                 next_stage_id = next_step.get(collected_value, default_next)
-                print(f"[V3_NEXT_STEP] next_stage_id: {next_stage_id}")
+                logger.debug("[V3_NEXT_STEP] next_stage_id: %s", next_stage_id)
             else:
                 # 정보가 수집되지 않았으면 현재 스테이지 유지
                 next_stage_id = current_stage_id
-                print(f"[V3_NEXT_STEP] No info collected, staying at {current_stage_id}")
+                logger.debug("[V3_NEXT_STEP] No info collected, staying at %s", current_stage_id)
         else:
             # next_step이 string인 경우
             # 필수 필드가 수집되었는지 확인
@@ -2821,20 +2778,20 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
             for field in fields_to_collect:
                 if field not in collected_info or collected_info.get(field) is None:
                     required_fields_collected = False
-                    print(f"[V3_NEXT_STEP] Required field '{field}' not collected")
+                    logger.debug("[V3_NEXT_STEP] Required field '%s' not collected", field)
                     break
             
             if required_fields_collected:
                 # 모든 필수 필드가 수집된 경우에만 다음 단계로 이동
                 next_stage_id = next_step
-                print(f"[V3_NEXT_STEP] All required fields collected, moving to {next_stage_id}")
+                logger.debug("[V3_NEXT_STEP] All required fields collected, moving to %s", next_stage_id)
             else:
                 # 필수 필드가 수집되지 않았으면 현재 단계에 머무름
                 next_stage_id = current_stage_id
-                print(f"[V3_NEXT_STEP] Required fields not collected, staying at {current_stage_id}")
+                logger.debug("[V3_NEXT_STEP] Required fields not collected, staying at %s", current_stage_id)
         
         # V3 시나리오에서 next_step을 사용한 경우 바로 처리하고 반환
-        print(f"[V3_NEXT_STEP] Final next_stage_id: {next_stage_id}")
+        logger.debug("[V3_NEXT_STEP] Final next_stage_id: %s", next_stage_id)
         determined_next_stage_id = next_stage_id
         
         # 스테이지 변경 시 로그
@@ -2848,13 +2805,13 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
         stage_response_data = None
         if "response_type" in next_stage_info:
             stage_response_data = generate_stage_response(next_stage_info, collected_info, active_scenario_data)
-            print(f"🎯 [V3_STAGE_RESPONSE] Generated stage response data for {determined_next_stage_id}")
+            logger.debug("🎯 [V3_STAGE_RESPONSE] Generated stage response data for %s", determined_next_stage_id)
         
         # 응답 프롬프트 준비 (dynamic_prompt도 고려)
         if next_stage_info.get("dynamic_prompt"):
             # dynamic_prompt가 있는 경우 stage_response_data에서 가져오기 (이미 변수 치환됨)
             next_stage_prompt = stage_response_data.get("prompt", "") if stage_response_data else ""
-            print(f"🎯 [V3_DYNAMIC_PROMPT_TRANSITION] Using dynamic prompt for {determined_next_stage_id}: '{next_stage_prompt[:100]}...'")
+            logger.debug("🎯 [V3_DYNAMIC_PROMPT_TRANSITION] Using dynamic prompt for %s: '%s...'", determined_next_stage_id, next_stage_prompt[:100])
         else:
             next_stage_prompt = next_stage_info.get("prompt", "")
         
@@ -2883,10 +2840,10 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
             # bullet 타입인 경우 prompt도 함께 설정
             if next_stage_info.get("response_type") == "bullet" and next_stage_prompt:
                 update_dict["final_response_text_for_tts"] = next_stage_prompt
-                print(f"🎯 [V3_BULLET_PROMPT] Set final_response_text_for_tts: '{next_stage_prompt[:100]}...'")
+                logger.debug("🎯 [V3_BULLET_PROMPT] Set final_response_text_for_tts: '%s...'", next_stage_prompt[:100])
             elif next_stage_prompt:  # 다른 response_type이라도 prompt가 있으면 설정
                 update_dict["final_response_text_for_tts"] = next_stage_prompt
-                print(f"🎯 [V3_PROMPT] Set final_response_text_for_tts: '{next_stage_prompt[:100]}...'")
+                logger.debug("🎯 [V3_PROMPT] Set final_response_text_for_tts: '%s...'", next_stage_prompt[:100])
             # last_llm_prompt 저장
             update_dict = create_update_dict_with_last_prompt(update_dict, stage_response_data)
             return state.merge_update(update_dict)
@@ -2912,16 +2869,15 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
                 user_lower = user_input.lower().strip()
                 if any(word in user_lower for word in ["네", "예", "응", "어", "그래", "좋아", "맞아", "알겠", "동일", "같게", "똑같이"]):
                     extracted_value = True
-                    print(f"🎯 [BOOLEAN_EXTRACTION] {main_field_key}: '{user_input}' -> True (positive)")
+                    logger.debug("🎯 [BOOLEAN_EXTRACTION] %s: '%s' -> True (positive)", main_field_key, user_input)
                 elif any(word in user_lower for word in ["아니", "다르게", "따로", "별도", "안", "싫어"]):
                     extracted_value = False
-                    print(f"🎯 [BOOLEAN_EXTRACTION] {main_field_key}: '{user_input}' -> False (negative)")
+                    logger.debug("🎯 [BOOLEAN_EXTRACTION] %s: '%s' -> False (negative)", main_field_key, user_input)
                 else:
                     # LLM으로 fallback
                     try:
-                        from app.agents.entity_agent import EntityRecognitionAgent
-                        entity_agent = EntityRecognitionAgent()
-                        intent_result = await entity_agent.analyze_user_intent(
+                        intent_result = await _analyze_user_intent(
+                            state,
                             user_input,
                             current_stage_id,
                             current_stage_info,
@@ -2933,9 +2889,9 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
                             extracted_value = False
                         else:
                             extracted_value = None
-                        print(f"🎯 [LLM_BOOLEAN_EXTRACTION] {main_field_key}: '{user_input}' -> {extracted_value} (intent: {intent_result.get('intent')})")
+                        logger.debug("🎯 [LLM_BOOLEAN_EXTRACTION] %s: '%s' -> %s (intent: %s)", main_field_key, user_input, extracted_value, intent_result.get('intent'))
                     except Exception as e:
-                        print(f"❌ [LLM_BOOLEAN_EXTRACTION] Failed: {e}")
+                        logger.error("❌ [LLM_BOOLEAN_EXTRACTION] Failed: %s", e)
                         extracted_value = None
             else:
                 # 일반 필드는 기존 방식으로 처리
@@ -2966,7 +2922,7 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
             
             if extracted_value is not None:
                 collected_info[main_field_key] = extracted_value
-                print(f"🎯 [FIELD_EXTRACTION_SUCCESS] {main_field_key}: '{user_input}' -> {extracted_value}")
+                logger.debug("🎯 [FIELD_EXTRACTION_SUCCESS] %s: '%s' -> %s", main_field_key, user_input, extracted_value)
             
             # 여전히 정보가 수집되지 않았으면 현재 스테이지 유지
             if main_field_key not in collected_info:
@@ -2989,7 +2945,7 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
         # ask_card_receive_method 특별 처리
         if current_stage_id == "ask_card_receive_method" and "card_receive_method" in collected_info:
             card_method = collected_info.get("card_receive_method")
-            print(f"📦 [CARD_DELIVERY] Processing card delivery method: {card_method}")
+            logger.debug("📦 [CARD_DELIVERY] Processing card delivery method: %s", card_method)
             
             # 배송 방법에 따른 분기
             if card_method == "즉시수령":
@@ -3001,16 +2957,16 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
             else:
                 next_stage_id = default_next
                 
-            print(f"📦 [CARD_DELIVERY] Next stage: {next_stage_id}")
+            logger.debug("📦 [CARD_DELIVERY] Next stage: %s", next_stage_id)
         # confirm_home_address 특별 처리
         elif current_stage_id == "confirm_home_address":
             # 사용자의 확인 응답 처리
             if user_input and any(word in user_input.lower() for word in ["네", "예", "맞아요", "맞습니다"]):
                 next_stage_id = "ask_card_type"
-                print(f"📦 [ADDRESS_CONFIRM] Home address confirmed, proceeding to card type")
+                logger.debug("📦 [ADDRESS_CONFIRM] Home address confirmed, proceeding to card type")
             elif user_input and any(word in user_input.lower() for word in ["아니요", "아니", "틀려요", "다른", "수정"]):
                 next_stage_id = "update_home_address"
-                print(f"📦 [ADDRESS_CONFIRM] Home address needs update")
+                logger.debug("📦 [ADDRESS_CONFIRM] Home address needs update")
             else:
                 next_stage_id = default_next
         # confirm_work_address 특별 처리
@@ -3018,10 +2974,10 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
             # 사용자의 확인 응답 처리
             if user_input and any(word in user_input.lower() for word in ["네", "예", "맞아요", "맞습니다"]):
                 next_stage_id = "ask_card_type"
-                print(f"📦 [ADDRESS_CONFIRM] Work address confirmed, proceeding to card type")
+                logger.debug("📦 [ADDRESS_CONFIRM] Work address confirmed, proceeding to card type")
             elif user_input and any(word in user_input.lower() for word in ["아니요", "아니", "틀려요", "다른", "수정"]):
                 next_stage_id = "update_work_address"
-                print(f"📦 [ADDRESS_CONFIRM] Work address needs update")
+                logger.debug("📦 [ADDRESS_CONFIRM] Work address needs update")
             else:
                 next_stage_id = default_next
         else:
@@ -3038,14 +2994,19 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
                 formatted_transitions=format_transitions_for_prompt(transitions, current_stage_info.get("prompt", "")),
                 default_next_stage_id=default_next
             )
-            response = await json_llm.ainvoke([HumanMessage(content=llm_prompt)])
+            response = await json_llm.ainvoke([HumanMessage(content=llm_prompt)], site="stage_transition")
             decision_data = next_stage_decision_parser.parse(response.content)
             next_stage_id = decision_data.chosen_next_stage_id
 
     # --- 로직 전용 스테이지 처리 루프 ---
+    compiled_scenario = get_compiled_scenario(state)
+    visited_logic_stages = set()
     while True:
         if not next_stage_id or str(next_stage_id).startswith("END"):
             break  # 종료 상태에 도달하면 루프 탈출
+        if next_stage_id in visited_logic_stages:
+            logger.warning("⚠️ [LogicStage] transition cycle detected at %s - stopping", next_stage_id)
+            break
 
         next_stage_info = active_scenario_data.get("stages", {}).get(str(next_stage_id), {})
         
@@ -3054,6 +3015,14 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
             break
         
         # `prompt`가 없는 로직 전용 스테이지인 경우, 자동으로 다음 단계 진행
+        # 전이에 condition이 선언되어 있으면(또는 전이가 없으면) LLM 없이 로컬 평가
+        visited_logic_stages.add(next_stage_id)
+        compiled_next_stage = compiled_scenario.stage(next_stage_id) if compiled_scenario else None
+        if compiled_next_stage and not compiled_next_stage.transitions_need_llm:
+            resolved_stage_id = compiled_next_stage.evaluate_transitions(collected_info)
+            logger.debug("⚡ [LogicStage] %s -> %s (declarative)", next_stage_id, resolved_stage_id)
+            next_stage_id = resolved_stage_id
+            continue
         
         current_stage_id_for_prompt = str(next_stage_id)
         
@@ -3070,7 +3039,7 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
             formatted_transitions=format_transitions_for_prompt(next_stage_info.get("transitions", []), next_stage_info.get("prompt", "")),
             default_next_stage_id=next_stage_info.get("default_next_stage_id", "None")
         )
-        response = await json_llm.ainvoke([HumanMessage(content=llm_prompt)])
+        response = await json_llm.ainvoke([HumanMessage(content=llm_prompt)], site="stage_transition")
         decision_data = next_stage_decision_parser.parse(response.content)
         
         next_stage_id = decision_data.chosen_next_stage_id # 다음 스테이지 ID를 갱신하고 루프 계속
@@ -3097,7 +3066,7 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
     
     # END_SCENARIO에 도달한 경우 end_conversation을 action_plan에 추가
     if str(determined_next_stage_id).startswith("END_SCENARIO"):
-        print(f"🔚 [ScenarioLogic] END_SCENARIO detected. Adding end_conversation to action plan.")
+        logger.debug("🔚 [ScenarioLogic] END_SCENARIO detected. Adding end_conversation to action plan.")
         updated_plan.append("end_conversation")
         updated_struct.append({
             "action": "end_conversation",
@@ -3113,7 +3082,7 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
         current_stage_info = active_scenario_data.get("stages", {}).get(str(current_stage_id), {})
         if current_stage_info.get("response_type") in ["bullet", "boolean"]:
             stage_response_data = generate_stage_response(current_stage_info, collected_info, active_scenario_data)
-            print(f"🎯 [STAY_CURRENT_STAGE] Generated stage response data for current stage {current_stage_id} (type: {current_stage_info.get('response_type')})")
+            logger.debug("🎯 [STAY_CURRENT_STAGE] Generated stage response data for current stage %s (type: %s)", current_stage_id, current_stage_info.get('response_type'))
             # 현재 단계에 머무는 경우 prompt도 설정
             if current_stage_info.get("prompt") or current_stage_info.get("dynamic_prompt"):
                 if current_stage_info.get("dynamic_prompt"):
@@ -3122,7 +3091,7 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
                 else:
                     current_prompt = current_stage_info.get("prompt", "")
                 next_stage_prompt = current_prompt
-                print(f"🎯 [STAY_CURRENT_STAGE] Set prompt for current stage: '{current_prompt[:100]}...')")
+                logger.debug("🎯 [STAY_CURRENT_STAGE] Set prompt for current stage: '%s...')", current_prompt[:100])
     
     # 스테이지별 확인 메시지 추가
     confirmation_msg = ""
@@ -3197,7 +3166,7 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
             # dynamic_prompt가 있는 경우 generate_stage_response에서 처리된 결과 사용
             temp_stage_response = generate_stage_response(next_stage_info, collected_info, active_scenario_data)
             next_stage_prompt = temp_stage_response.get("prompt", "") if temp_stage_response else ""
-            print(f"🎯 [DYNAMIC_PROMPT_FALLBACK] Generated dynamic prompt for {determined_next_stage_id}: '{next_stage_prompt[:100]}...'")
+            logger.debug("🎯 [DYNAMIC_PROMPT_FALLBACK] Generated dynamic prompt for %s: '%s...'", determined_next_stage_id, next_stage_prompt[:100])
         else:
             next_stage_prompt = next_stage_info.get("prompt", "")
         
@@ -3217,7 +3186,7 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
             if stage_response_data and confirmation_msg:
                 original_prompt = stage_response_data.get("prompt", "")
                 stage_response_data["prompt"] = f"{confirmation_msg}\n\n{original_prompt}" if original_prompt else confirmation_msg
-                print(f"🎯 [STAGE_RESPONSE] Added confirmation to prompt: {confirmation_msg}")
+                logger.debug("🎯 [STAGE_RESPONSE] Added confirmation to prompt: %s", confirmation_msg)
     
     # stage_response_data가 있으면 일반 텍스트 대신 stage_response만 사용
     if stage_response_data:
@@ -3251,13 +3220,13 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
                         next_stage_info
                     )
                     update_dict["final_response_text_for_tts"] = natural_response
-                    print(f"🎯 [NATURAL_RESPONSE] Generated: '{natural_response[:100]}...'")
+                    logger.debug("🎯 [NATURAL_RESPONSE] Generated: '%s...'", natural_response[:100])
                 except Exception as e:
-                    print(f"🎯 [NATURAL_RESPONSE] Failed, using template: {e}")
+                    logger.debug("🎯 [NATURAL_RESPONSE] Failed, using template: %s", e)
                     update_dict["final_response_text_for_tts"] = effective_prompt
             else:
                 update_dict["final_response_text_for_tts"] = effective_prompt
-                print(f"🎯 [STAGE_RESPONSE_WITH_TEXT] Set final_response_text_for_tts: '{effective_prompt[:100]}...'")
+                logger.debug("🎯 [STAGE_RESPONSE_WITH_TEXT] Set final_response_text_for_tts: '%s...'", effective_prompt[:100])
         # 현재 단계에 머무는 경우의 prompt 처리
         elif determined_next_stage_id == current_stage_id and stage_response_data:
             current_stage_info = active_scenario_data.get("stages", {}).get(str(current_stage_id), {})
@@ -3265,10 +3234,10 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
                 default_choice = get_default_choice_display(current_stage_info)
                 current_prompt = current_stage_info["dynamic_prompt"].replace("{default_choice}", default_choice)
                 update_dict["final_response_text_for_tts"] = current_prompt
-                print(f"🎯 [CURRENT_STAGE_DYNAMIC_PROMPT] Set final_response_text_for_tts: '{current_prompt[:100]}...'")
+                logger.debug("🎯 [CURRENT_STAGE_DYNAMIC_PROMPT] Set final_response_text_for_tts: '%s...'", current_prompt[:100])
             elif current_stage_info.get("prompt"):
                 update_dict["final_response_text_for_tts"] = current_stage_info.get("prompt")
-                print(f"🎯 [CURRENT_STAGE_PROMPT] Set final_response_text_for_tts: '{current_stage_info.get('prompt')[:100]}...')")
+                logger.debug("🎯 [CURRENT_STAGE_PROMPT] Set final_response_text_for_tts: '%s...')", current_stage_info.get('prompt')[:100])
     else:
         update_dict = {
             "collected_product_info": collected_info, 
@@ -3300,14 +3269,14 @@ You MUST respond in JSON format with a single key "is_confirmed" (boolean). Exam
                     # 확인 메시지를 기존 응답 앞에 추가
                     combined_response = f"{confirmation_message}\n\n{existing_response}"
                     update_dict["final_response_text_for_tts"] = combined_response
-                    print(f"[CONFIRMATION] Added confirmation message: '{confirmation_message}'")
+                    logger.debug("[CONFIRMATION] Added confirmation message: '%s'", confirmation_message)
                 else:
                     # 기존 응답이 없으면 확인 메시지만 설정
                     update_dict["final_response_text_for_tts"] = confirmation_message
-                    print(f"[CONFIRMATION] Set confirmation message only: '{confirmation_message}'")
+                    logger.debug("[CONFIRMATION] Set confirmation message only: '%s'", confirmation_message)
     
     except Exception as e:
-        print(f"[CONFIRMATION] Error generating confirmation message: {e}")
+        logger.error("[CONFIRMATION] Error generating confirmation message: %s", e)
         # 에러가 발생해도 기본 플로우는 계속 진행
     
     return state.merge_update(update_dict)
@@ -2,8 +2,11 @@
 시나리오 처리를 위한 유틸리티 함수들
 """
 from typing import Dict, Any, Optional, List
-from pathlib import Path
-import yaml
+
+from ...scenario_registry import scenario_registry
+from ....config.config_registry import config_registry
+from ...scenario_model import CompiledStage
+from ...keyword_matcher import KeywordMatcher
 
 
 def create_update_dict_with_last_prompt(update_dict: Dict[str, Any], stage_response_data: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -21,35 +24,44 @@ def create_update_dict_with_last_prompt(update_dict: Dict[str, Any], stage_respo
     return update_dict
 
 
+def _build_guidance_index(guidance_responses: Dict[str, Any]) -> Dict[str, KeywordMatcher]:
+    """스테이지별 키워드 매처 (소문자 키워드 → 응답) - YAML 로드 시 한 번만 생성"""
+    index = {}
+    for stage_id, stage_responses in (guidance_responses or {}).items():
+        if not isinstance(stage_responses, dict):
+            continue
+        entries = []
+        for keywords, response in stage_responses.items():
+            # questions: { 주제: { keywords: [...], response: "..." } } 형식
+            if keywords == "questions" and isinstance(response, dict):
+                for question in response.values():
+                    if isinstance(question, dict) and question.get("response"):
+                        for keyword in question.get("keywords", []):
+                            entries.append((str(keyword).strip().lower(), question["response"]))
+                continue
+            # "키워드": "응답" 형식
+            keyword_list = [keywords] if isinstance(keywords, str) else keywords
+            for keyword in keyword_list:
+                entries.append((keyword.strip().lower(), response))
+        index[stage_id] = KeywordMatcher(entries)
+    return index
+
+
 def find_scenario_guidance(user_input: str, current_stage: str) -> Optional[str]:
     """현재 단계의 미리 정의된 시나리오 유도 응답 찾기"""
     try:
-        # 시나리오 유도 응답 로드
-        scenario_guidance_path = Path(__file__).parent.parent.parent.parent / "config" / "scenario_guidance_responses.yaml"
+        # 시나리오 유도 응답 키워드 인덱스 (config_registry 캐시, 파일 변경 시 재생성)
+        guidance_index = config_registry.derived(
+            "scenario_guidance_responses.yaml", "guidance_index", _build_guidance_index, default={}
+        )
         
-        if not scenario_guidance_path.exists():
+        stage_matcher = guidance_index.get(current_stage)
+        if stage_matcher is None:
             return None
-            
-        with open(scenario_guidance_path, 'r', encoding='utf-8') as f:
-            guidance_responses = yaml.safe_load(f)
         
-        # 현재 단계의 응답들
-        stage_responses = guidance_responses.get(current_stage, {})
-        
-        # 사용자 입력과 매칭되는 키워드 찾기
-        user_input_lower = user_input.lower().strip()
-        
-        for keywords, response in stage_responses.items():
-            if isinstance(keywords, str):
-                keyword_list = [keywords]
-            else:
-                keyword_list = keywords.split(",") if isinstance(keywords, str) else keywords
-                
-            for keyword in keyword_list:
-                if keyword.strip().lower() in user_input_lower:
-                    return response
-        
-        return None
+        # 사용자 입력과 매칭되는 키워드 찾기 (등록 순서상 첫 키워드의 응답)
+        hit = stage_matcher.first_match(user_input.lower().strip())
+        return hit.value if hit else None
     except Exception as e:
         print(f"❌ [SCENARIO_GUIDANCE] Error loading guidance responses: {e}")
         return None
@@ -105,21 +117,19 @@ def format_field_value(field_key: str, value: Any, field_type: str) -> str:
     return str(value)
 
 
+def get_compiled_stage(stage_info: Dict[str, Any]) -> CompiledStage:
+    """stage dict에 대응하는 CompiledStage (레지스트리에 없는 로컬 사본이면 즉석 컴파일)"""
+    compiled_stage = scenario_registry.compiled_stage(stage_info)
+    if compiled_stage is None:
+        compiled_stage = CompiledStage(stage_info.get("stage_id", ""), stage_info or {})
+    return compiled_stage
+
+
 def get_default_choice_display(stage_info: Dict[str, Any]) -> str:
     """기본 선택지의 표시 텍스트 가져오기"""
     if stage_info.get("response_type") == "bullet":
-        # choice_groups 구조 처리 (V3 시나리오)
-        if stage_info.get("choice_groups"):
-            for group in stage_info.get("choice_groups", []):
-                for choice in group.get("choices", []):
-                    if isinstance(choice, dict) and choice.get("default"):
-                        return choice.get("display", choice.get("value", ""))
-        
-        # 기존 choices 구조 처리 (V1/V2 시나리오)
-        choices = stage_info.get("choices", [])
-        for choice in choices:
-            if isinstance(choice, dict) and choice.get("default"):
-                return choice.get("display", choice.get("value", ""))
+        # choice_groups(V3) → choices(V1/V2) 순서로 컴파일된 default choice
+        return get_compiled_stage(stage_info).default_choice_display
     return ""
 
 
@@ -146,23 +156,24 @@ def get_expected_field_keys(stage_info: Dict[str, Any]) -> List[str]:
     return list(set(field_keys))
 
 
+# 특정 스테이지와 필드 매핑 (모듈 로드 시 한 번만 생성)
+STAGE_FIELD_MAPPING = {
+    "ask_notification_settings": frozenset([
+        "transfer_limit_per_time", "transfer_limit_per_day",
+        "important_transaction_alert", "withdrawal_alert", 
+        "overseas_ip_restriction", "limit_account_agreement"
+    ]),
+    "ask_transfer_limit": frozenset([
+        "transfer_limit_per_time", "transfer_limit_per_day"
+    ]),
+    # 다른 스테이지들도 필요 시 추가
+}
+
+
 def get_stage_relevant_fields(current_stage_info: Dict, required_fields: List[Dict], current_stage_id: str) -> List[Dict]:
     """현재 스테이지와 관련된 필드들만 필터링"""
-    # 특정 스테이지와 필드 매핑
-    stage_field_mapping = {
-        "ask_notification_settings": [
-            "transfer_limit_per_time", "transfer_limit_per_day",
-            "important_transaction_alert", "withdrawal_alert", 
-            "overseas_ip_restriction", "limit_account_agreement"
-        ],
-        "ask_transfer_limit": [
-            "transfer_limit_per_time", "transfer_limit_per_day"
-        ],
-        # 다른 스테이지들도 필요 시 추가
-    }
-    
     # 현재 스테이지에 해당하는 필드 목록
-    relevant_field_keys = stage_field_mapping.get(current_stage_id, [])
+    relevant_field_keys = STAGE_FIELD_MAPPING.get(current_stage_id)
     
     # 해당하는 필드들만 필터링
     if relevant_field_keys:
@@ -2,7 +2,7 @@
 스테이지 응답 생성 관련 함수들
 """
 from typing import Dict, Any, List
-from .scenario_utils import get_default_choice_display, format_korean_currency, format_field_value
+from .scenario_utils import get_default_choice_display, get_compiled_stage, format_korean_currency, format_field_value
 from .response_generation import generate_final_confirmation_prompt
 from .scenario_helpers import replace_template_variables
 
@@ -262,15 +262,8 @@ def generate_stage_response(stage_info: Dict[str, Any], collected_info: Dict[str
             response_data["choice_groups"] = choice_groups
             response_data["choiceGroups"] = choice_groups  # camelCase for frontend compatibility
             
-            # choice_groups에서 default choice 찾아서 top-level에 설정
-            default_choice_value = None
-            for group in choice_groups:
-                for item in group.get("items", []):
-                    if item.get("default"):
-                        default_choice_value = item.get("value")
-                        break
-                if default_choice_value:
-                    break
+            # choice_groups의 default choice를 top-level에 설정 (컴파일된 인덱스 사용)
+            default_choice_value = get_compiled_stage(stage_info).default_choice_value
             
             if default_choice_value:
                 response_data["default_choice"] = default_choice_value
@@ -282,11 +275,7 @@ def generate_stage_response(stage_info: Dict[str, Any], collected_info: Dict[str
             print(f"🎯 [CHOICE_GROUPS] Transformed {len(choice_groups)} groups with {sum(len(g['items']) for g in choice_groups)} total choices for frontend")
         # choices에서 default choice 찾기 (choice_groups가 없는 경우)
         if not stage_info.get("choice_groups") and stage_info.get("choices"):
-            default_choice_value = None
-            for choice in stage_info.get("choices", []):
-                if isinstance(choice, dict) and choice.get("default"):
-                    default_choice_value = choice.get("value")
-                    break
+            default_choice_value = get_compiled_stage(stage_info).default_choice_value
             
             if default_choice_value:
                 response_data["default_choice"] = default_choice_value
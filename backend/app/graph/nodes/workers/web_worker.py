@@ -23,7 +23,10 @@ async def web_search_node(state: AgentState) -> AgentState:
     log_node_execution("Web_Worker", f"query='{query[:30]}...'")
     
     if not query:
-        state_updates = {"factual_response": "무엇에 대해 검색할지 알려주세요."}
+        state_updates = {
+            "factual_response": "무엇에 대해 검색할지 알려주세요.",
+            "factual_response_sources": [*state.factual_response_sources, "web_worker"]
+        }
         return state.merge_update(state_updates)
 
     # 1. Perform web search
@@ -36,7 +39,7 @@ async def web_search_node(state: AgentState) -> AgentState:
             ("human", "User Question: {query}\n\nWeb Search Results:\n---\n{search_results}\n---\n\nSynthesized Answer:")
         ])
         
-        synthesis_chain = synthesis_prompt | generative_llm
+        synthesis_chain = synthesis_prompt | generative_llm.for_site("web_synthesis")
         response = await synthesis_chain.ainvoke({"query": query, "search_results": search_results})
         final_answer = response.content.strip()
         log_node_execution("Web_Worker", f"synthesized answer length: {len(final_answer)}")
@@ -59,6 +62,7 @@ async def web_search_node(state: AgentState) -> AgentState:
     
     state_updates = {
         "factual_response": final_answer,
+        "factual_response_sources": [*state.factual_response_sources, "web_worker"],
         "action_plan": updated_plan,
         "action_plan_struct": updated_struct
     }
@@ -0,0 +1,196 @@
+# backend/app/graph/route_classifier.py
+"""
+메인 라우터 LLM 생략 (스테이지별 라우팅 정책 + 로컬 분류기)
+- 시나리오 JSON의 스테이지 "routing" (없으면 시나리오의 "default_stage_routing", 그것도 없으면 llm)
+  · scenario:   항상 invoke_scenario_agent (라우터 LLM 호출 없음)
+  · classifier: 로컬 분류기 먼저 - 신뢰도가 ROUTER_BYPASS_MIN_CONFIDENCE 이상이면 그 결정 사용, 아니면 LLM
+  · llm:        항상 라우터 LLM (task_management_prompt)
+- 로컬 분류기
+  · 현재 스테이지에 대한 답(fast path 단답 / 선택지 표현 포함) → invoke_scenario_agent
+  · 시나리오를 벗어난 질문(의문형) → invoke_qa_agent (rag_worker)
+  · 정정/종료/상품 변경 등 제어 표현이 있거나 애매하면 None → 라우터 LLM
+"""
+import logging
+import re
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from ..core.config import ROUTER_BYPASS_MIN_CONFIDENCE
+from . import fast_path
+from .keyword_matcher import KeywordHit, KeywordMatcher, build_matcher, cached_matcher
+from .scenario_model import CompiledStage
+from .scenario_registry import scenario_registry
+
+logger = logging.getLogger(__name__)
+
+ROUTING_SCENARIO = "scenario"
+ROUTING_CLASSIFIER = "classifier"
+ROUTING_LLM = "llm"
+ROUTING_POLICIES = (ROUTING_SCENARIO, ROUTING_CLASSIFIER, ROUTING_LLM)
+
+ACTION_SCENARIO = "invoke_scenario_agent"
+ACTION_QA = "invoke_qa_agent"
+
+# 라우터 LLM이 판단해야 하는 표현 (정보 수정 / 상담 종료 / 상품 변경 / 상담원 연결)
+CONTROL_KEYWORDS = (
+    "수정", "바꿔", "바꾸", "변경", "틀렸", "틀려", "잘못",
+    "그만", "종료", "끝내", "끝낼", "취소", "나중에 다시",
+    "말고", "대신", "다른 상품", "상담원", "직원",
+)
+# 의문형 어미/표현 (발화 끝 또는 내부)
+QUESTION_KEYWORDS = (
+    "뭐예요", "뭔가요", "뭐에요", "무엇", "어떻게", "어떤", "얼마", "언제", "어디", "왜",
+    "인가요", "나요", "까요", "을까", "ㄹ까", "는지", "은지", "건지",
+    "알려줘", "알려주세요", "알려 주세요", "궁금", "설명해", "차이",
+)
+_QUESTION_END_PATTERN = re.compile(r"(\?|가요|나요|까요|알려\s?줘|알려\s?주세요|설명해\s?줘|설명해\s?주세요)\s*$")
+
+# 분류 결과별 신뢰도
+STRONG_QUESTION_CONFIDENCE = 0.9
+WEAK_QUESTION_CONFIDENCE = 0.75
+CHOICE_MENTION_CONFIDENCE = 0.85
+
+
+class RouteDecision(NamedTuple):
+    """로컬 분류 결과"""
+    action: str
+    confidence: float
+    reason: str
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r"\s+", " ", (text or "").lower()).strip()
+
+
+def _choice_mention_matcher(compiled_stage: CompiledStage) -> KeywordMatcher:
+    """스테이지 선택지의 value/display/keywords → 매처 (두 글자 이상만 - "다", "응" 같은 한 글자는 오탐)"""
+    entries = []
+    for choice in compiled_stage.choices:
+        for alias in (choice.value, choice.display, *choice.keywords):
+            alias = _normalize(str(alias))
+            if len(alias) >= 2:
+                entries.append((alias, choice.value))
+    return KeywordMatcher(entries)
+
+
+def _choice_hit(stage_info: Dict[str, Any], text: str) -> Optional[KeywordHit]:
+    """발화에 포함된 현재 스테이지 선택지 표현 (가장 왼쪽) - 없으면 None"""
+    compiled_stage = scenario_registry.compiled_stage(stage_info)
+    if compiled_stage is not None:
+        # 레지스트리의 CompiledStage는 버전이 살아 있는 동안 유지되므로 매처도 재사용
+        if not compiled_stage.choices:
+            return None
+        return cached_matcher(compiled_stage, _choice_mention_matcher, "route_choice_mentions").leftmost_match(text)
+    # 레지스트리에 게시되지 않은 stage dict (로컬 사본 등) - 이번 호출용으로만 컴파일
+    compiled_stage = CompiledStage(stage_info.get("stage_id", ""), stage_info)
+    if not compiled_stage.choices:
+        return None
+    return _choice_mention_matcher(compiled_stage).leftmost_match(text)
+
+
+_control_matcher = build_matcher(CONTROL_KEYWORDS)
+_question_matcher = build_matcher(QUESTION_KEYWORDS)
+
+
+def stage_routing_policy(scenario_data: Optional[Dict[str, Any]], stage_info: Optional[Dict[str, Any]]) -> str:
+    """스테이지 라우팅 정책 (scenario / classifier / llm)"""
+    policy = (stage_info or {}).get("routing") or (scenario_data or {}).get("default_stage_routing") or ROUTING_LLM
+    if policy not in ROUTING_POLICIES:
+        logger.warning("⚠️ [ROUTE_CLASSIFIER] Unknown routing policy '%s' - using llm", policy)
+        return ROUTING_LLM
+    return policy
+
+
+def _scenario_qa_matcher(qa_keywords: Any) -> KeywordMatcher:
+    return build_matcher(_normalize(str(keyword)) for keyword in qa_keywords)
+
+
+def classify_turn(user_input: str, stage_info: Optional[Dict[str, Any]],
+                  scenario_data: Optional[Dict[str, Any]] = None) -> Optional[RouteDecision]:
+    """발화를 로컬 규칙으로 라우팅 - 애매하면 None (시나리오의 qa_keywords도 질문 표현으로 사용)"""
+    text = _normalize(user_input)
+    if not text or not stage_info:
+        return None
+    if _control_matcher.contains_any(text):
+        return None
+
+    # 현재 스테이지에 대한 단답 (예/아니요, 정확한 선택지, 숫자/날짜/연락처)
+    rule_result = fast_path.resolve(user_input, stage_info)
+    if rule_result is not None:
+        return RouteDecision(ACTION_SCENARIO, rule_result.confidence, f"fast_path:{rule_result.rule}")
+
+    choice_hit = _choice_hit(stage_info, text)
+
+    # 스테이지에 예상 질문(additional_questions)으로 등록된 표현은 문형과 무관하게 질문
+    additional_questions = stage_info.get("additional_questions") or ()
+    strong_question = "?" in text or _QUESTION_END_PATTERN.search(text) is not None or any(
+        _normalize(question) in text for question in additional_questions
+    )
+    qa_keywords = (scenario_data or {}).get("qa_keywords")
+    weak_question = _question_matcher.contains_any(text) or bool(
+        qa_keywords and cached_matcher(qa_keywords, _scenario_qa_matcher, "route_qa_keywords").contains_any(text)
+    )
+    if strong_question or weak_question:
+        if choice_hit is not None:
+            # "체크카드로 할까요?" - 선택지에 대한 되물음일 수 있음
+            return None
+        confidence = STRONG_QUESTION_CONFIDENCE if strong_question else WEAK_QUESTION_CONFIDENCE
+        return RouteDecision(ACTION_QA, confidence, "off_script_question")
+
+    if choice_hit is not None:
+        return RouteDecision(ACTION_SCENARIO, CHOICE_MENTION_CONFIDENCE, f"choice_mention:{choice_hit.keyword}")
+    return None
+
+
+def bypass_decision(scenario_data: Optional[Dict[str, Any]], stage_info: Optional[Dict[str, Any]],
+                    user_input: str) -> Tuple[str, Optional[RouteDecision]]:
+    """(정책, 라우터 LLM 없이 사용할 결정) - 결정이 None이면 라우터 LLM 호출"""
+    policy = stage_routing_policy(scenario_data, stage_info)
+    if policy == ROUTING_SCENARIO:
+        return policy, RouteDecision(ACTION_SCENARIO, 1.0, "stage_policy")
+    if policy == ROUTING_CLASSIFIER:
+        decision = classify_turn(user_input, stage_info, scenario_data)
+        if decision is not None and decision.confidence >= ROUTER_BYPASS_MIN_CONFIDENCE:
+            return policy, decision
+    return policy, None
+
+
+class RouterBypassStats:
+    """라우팅 정책별 턴 수 / 생략한 라우터 LLM 호출 수"""
+
+    def __init__(self, log_every: int = 50):
+        self.log_every = log_every
+        self._policies: Dict[str, Dict[str, int]] = {}
+        self._turns = 0
+
+    def record(self, policy: str, bypassed: bool, action: Optional[str] = None) -> None:
+        counters = self._policies.setdefault(policy, {"turns": 0, "llm_calls": 0, "saved": 0, "to_scenario": 0, "to_qa": 0})
+        counters["turns"] += 1
+        if bypassed:
+            counters["saved"] += 1
+            if action == ACTION_SCENARIO:
+                counters["to_scenario"] += 1
+            elif action == ACTION_QA:
+                counters["to_qa"] += 1
+        else:
+            counters["llm_calls"] += 1
+        self._turns += 1
+        if self.log_every and self._turns % self.log_every == 0:
+            self.log_summary()
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        summary = {}
+        for policy, counters in self._policies.items():
+            turns = counters["turns"]
+            summary[policy] = {**counters, "saved_per_turn": counters["saved"] / turns if turns else 0.0}
+        return summary
+
+    def log_summary(self) -> None:
+        for policy, stats in self.summary().items():
+            logger.info(
+                "📊 [ROUTER_BYPASS] %s: saved %s/%s router calls (%.2f/turn, scenario=%s, qa=%s)",
+                policy, stats['saved'], stats['turns'], stats['saved_per_turn'], stats['to_scenario'], stats['to_qa']
+            )
+
+
+# 전역 인스턴스
+router_bypass_stats = RouterBypassStats()
@@ -2,6 +2,8 @@
 """
 라우팅 로직 - 액션 플랜에 따라 적절한 워커 노드로 라우팅
 """
+from typing import List
+
 from .state import AgentState
 from .logger import node_log as log_node_execution
 
@@ -16,6 +18,21 @@ WORKER_ROUTING_MAP = {
     "personal_info_correction": "personal_info_correction_node"
 }
 
+# 서로 의존하지 않는 액션 - 연속으로 2개 이상이면 parallel_workers에서 동시 실행 (fan-out/fan-in)
+# (상품 변경/종료/개인정보 수정은 이후 액션의 문맥을 바꾸므로 순차 실행)
+INDEPENDENT_ACTIONS = frozenset({"invoke_scenario_agent", "invoke_qa_agent", "invoke_web_search"})
+PARALLEL_NODE = "parallel_workers"
+
+
+def independent_action_group(plan: List[str]) -> List[str]:
+    """플랜 앞부분의 연속된 독립 액션 (같은 액션이 다시 나오면 거기서 끊음)"""
+    group: List[str] = []
+    for action in plan:
+        if action not in INDEPENDENT_ACTIONS or action in group:
+            break
+        group.append(action)
+    return group
+
 
 def execute_plan_router(state: AgentState) -> str:
     """
@@ -39,11 +56,16 @@ def execute_plan_router(state: AgentState) -> str:
         log_node_execution("Router", f"MAX_ITERATIONS_REACHED ({router_count}) → force_synthesize")
         return "synthesize_response_node"
 
-    next_action = plan[0] 
-    target_node = WORKER_ROUTING_MAP.get(next_action, "synthesize_response_node")
-    
     # router_call_count를 state에 업데이트 (다음 노드에서 사용)
     state["router_call_count"] = router_count
+
+    group = independent_action_group(plan)
+    if len(group) > 1:
+        log_node_execution("Router", f"{group} → parallel (#{router_count})")
+        return PARALLEL_NODE
+
+    next_action = plan[0] 
+    target_node = WORKER_ROUTING_MAP.get(next_action, "synthesize_response_node")
     
     log_node_execution("Router", f"{next_action} → {target_node.replace('_node', '').replace('_worker', '')} (#{router_count})")
     return target_node
@@ -0,0 +1,213 @@
+# backend/app/graph/scenario_model.py
+"""
+컴파일된 시나리오 모델
+- 시나리오 JSON을 로드 시점에 한 번 컴파일하여 O(1) 인덱스 제공
+  · stage → fields / field → stage, group
+  · choice value → display / 스테이지별 default choice
+  · 스테이지 전이 테이블 (next_step / transitions / default_next_stage_id)
+  · transitions의 선언적 condition (show_when 문법) 컴파일 - 로직 전용 스테이지는 LLM 없이 전이
+  · 필드 show_when 조건 / 의존성 그래프
+- 매 턴마다 choice_groups/choices 등 중첩 dict를 순회하던 hot path 대체용
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+from .show_when import CompiledCondition, FieldDependencyGraph, compile_show_when, get_field_graph
+
+
+class CompiledChoice:
+    """선택지 하나"""
+    __slots__ = ("value", "display", "is_default", "is_toggle", "group_name", "keywords", "ordinal_keywords", "metadata", "raw")
+
+    def __init__(self, raw: Any, group_name: Optional[str] = None):
+        self.is_toggle = False
+        if isinstance(raw, dict):
+            # {"key": ..., "label": ...} 형태는 개별 boolean 필드 토글 (additional_services 등)
+            self.is_toggle = "value" not in raw and "key" in raw
+            self.value = raw.get("value", raw.get("key", ""))
+            self.display = raw.get("display", raw.get("label", self.value))
+            self.is_default = bool(raw.get("default", False))
+            self.keywords = tuple(raw.get("keywords", ()))
+            self.ordinal_keywords = tuple(raw.get("ordinal_keywords", ()))
+            self.metadata = raw.get("metadata") or {}
+        else:
+            # V1/V2 시나리오의 문자열 선택지
+            self.value = str(raw)
+            self.display = str(raw)
+            self.is_default = False
+            self.keywords = ()
+            self.ordinal_keywords = ()
+            self.metadata = {}
+        self.group_name = group_name
+        self.raw = raw
+
+
+class CompiledStage:
+    """스테이지 하나와 그 인덱스"""
+    __slots__ = (
+        "stage_id", "raw", "response_type", "fields_to_collect", "choice_field",
+        "choices", "choice_by_value", "default_choice", "next_step_table",
+        "default_next_stage_id", "transitions", "transition_conditions",
+        "transitions_need_llm", "is_final",
+    )
+
+    def __init__(self, stage_id: str, raw: Dict[str, Any]):
+        self.stage_id = stage_id
+        self.raw = raw
+        self.response_type = raw.get("response_type")
+        self.fields_to_collect: Tuple[str, ...] = tuple(raw.get("fields_to_collect") or ())
+
+        # choice_groups(V3) 우선, 그 다음 choices(V1/V2) 순서로 평면화
+        choices: List[CompiledChoice] = []
+        for group in raw.get("choice_groups") or ():
+            for choice in group.get("choices", ()):
+                choices.append(CompiledChoice(choice, group.get("group_name")))
+        for choice in raw.get("choices") or ():
+            choices.append(CompiledChoice(choice))
+        self.choices: Tuple[CompiledChoice, ...] = tuple(choices)
+        self.choice_by_value: Dict[str, CompiledChoice] = {}
+        for choice in self.choices:
+            self.choice_by_value.setdefault(str(choice.value), choice)
+        self.default_choice: Optional[CompiledChoice] = next((c for c in self.choices if c.is_default and not c.is_toggle), None)
+
+        # 선택지가 채우는 대표 필드: stage_id와 같은 이름의 필드 > 첫 번째 수집 필드 > expected_info_key
+        if stage_id in self.fields_to_collect:
+            self.choice_field = stage_id
+        elif self.fields_to_collect:
+            self.choice_field = self.fields_to_collect[0]
+        else:
+            self.choice_field = raw.get("expected_info_key")
+
+        # 전이 테이블
+        next_step = raw.get("next_step")
+        self.next_step_table: Dict[str, Any] = dict(next_step) if isinstance(next_step, dict) else {}
+        if isinstance(next_step, str):
+            self.default_next_stage_id = next_step
+        else:
+            self.default_next_stage_id = raw.get("default_next_stage_id")
+        self.transitions: Tuple[Dict[str, Any], ...] = tuple(raw.get("transitions") or ())
+        # condition(show_when 문법)이 있는 전이는 로컬 평가, condition_description만 있는 전이가 하나라도 있으면 LLM 판단
+        self.transition_conditions: Tuple[Tuple[str, CompiledCondition], ...] = tuple(
+            (t["next_stage_id"], compile_show_when(t["condition"]))
+            for t in self.transitions if t.get("condition") and t.get("next_stage_id")
+        )
+        self.transitions_need_llm = len(self.transition_conditions) < len(self.transitions)
+        self.is_final = bool(raw.get("is_final")) or (not next_step and not self.default_next_stage_id and not self.transitions)
+
+    @property
+    def default_choice_value(self) -> Optional[str]:
+        return self.default_choice.value if self.default_choice else None
+
+    @property
+    def default_choice_display(self) -> str:
+        return self.default_choice.display if self.default_choice else ""
+
+    def next_stage_for(self, value: Any) -> Optional[str]:
+        """next_step 테이블에서 선택 값에 해당하는 다음 스테이지 (중첩 dict는 그대로 반환하지 않음)"""
+        if isinstance(value, bool):
+            value = str(value).lower()
+        target = self.next_step_table.get(str(value)) if value is not None else None
+        if isinstance(target, str):
+            return target
+        return self.default_next_stage_id
+
+    def evaluate_transitions(self, collected_info: Dict[str, Any]) -> Optional[str]:
+        """선언된 condition을 순서대로 평가하여 처음 일치하는 다음 스테이지 (없으면 default_next_stage_id)"""
+        for next_stage_id, condition in self.transition_conditions:
+            if condition(collected_info):
+                return next_stage_id
+        return self.default_next_stage_id
+
+
+class CompiledScenario:
+    """시나리오 전체 컴파일 결과"""
+    __slots__ = (
+        "product_type", "version", "raw", "initial_stage_id", "stages",
+        "field_defs", "stage_fields", "field_stage", "field_group",
+        "choice_display", "choice_field_stage", "field_list", "field_graph",
+    )
+
+    def __init__(self, raw: Dict[str, Any], product_type: Optional[str] = None, version: Optional[int] = None):
+        self.product_type = product_type
+        self.version = version
+        self.raw = raw
+        self.initial_stage_id = raw.get("initial_stage_id")
+        self.stages: Dict[str, CompiledStage] = {
+            stage_id: CompiledStage(stage_id, stage_raw)
+            for stage_id, stage_raw in (raw.get("stages") or {}).items()
+        }
+
+        # 필드 정의: required_info_fields(V1/V2) 또는 slot_fields(V3)
+        field_list = raw.get("required_info_fields") or raw.get("slot_fields") or []
+        self.field_list = field_list
+        self.field_defs: Dict[str, Dict[str, Any]] = {f["key"]: f for f in field_list if isinstance(f, dict) and f.get("key")}
+
+        # field → stage: fields_to_collect / expected_info_key 우선, 없으면 필드 정의의 stage
+        self.field_stage: Dict[str, str] = {}
+        for stage in self.stages.values():
+            for key in stage.fields_to_collect:
+                self.field_stage.setdefault(key, stage.stage_id)
+            expected = stage.raw.get("expected_info_key")
+            if expected:
+                self.field_stage.setdefault(expected, stage.stage_id)
+        for key, field in self.field_defs.items():
+            if field.get("stage"):
+                self.field_stage.setdefault(key, field["stage"])
+
+        # stage → fields (필드 정의 순서 유지)
+        stage_fields: Dict[str, List[Dict[str, Any]]] = {}
+        for key, field in self.field_defs.items():
+            stage_id = self.field_stage.get(key)
+            if stage_id:
+                stage_fields.setdefault(stage_id, []).append(field)
+        self.stage_fields: Dict[str, Tuple[Dict[str, Any], ...]] = {k: tuple(v) for k, v in stage_fields.items()}
+
+        # field → group: slot_groups(V3) / field_groups(V1/V2) / 필드 정의의 group
+        self.field_group: Dict[str, str] = {}
+        for group in raw.get("slot_groups") or ():
+            for field in group.get("fields", ()):
+                field_id = field.get("field_id") if isinstance(field, dict) else field
+                if field_id:
+                    self.field_group.setdefault(field_id, group.get("group_id"))
+        for group in raw.get("field_groups") or ():
+            for field_id in group.get("fields", ()):
+                self.field_group.setdefault(field_id, group.get("id"))
+        for key, field in self.field_defs.items():
+            if field.get("group"):
+                self.field_group.setdefault(key, field["group"])
+
+        # choice value → display, 대표 choice 필드 → stage
+        self.choice_display: Dict[str, str] = {}
+        self.choice_field_stage: Dict[str, str] = {}
+        for stage in self.stages.values():
+            for choice in stage.choices:
+                self.choice_display.setdefault(str(choice.value), choice.display)
+            if stage.choice_field and any(not c.is_toggle for c in stage.choices):
+                self.choice_field_stage.setdefault(stage.choice_field, stage.stage_id)
+
+        # show_when 조건 컴파일 + 필드 의존성 그래프
+        self.field_graph: FieldDependencyGraph = get_field_graph(field_list)
+
+    def stage(self, stage_id: Optional[str]) -> Optional[CompiledStage]:
+        return self.stages.get(str(stage_id)) if stage_id else None
+
+    def fields_for_stage(self, stage_id: str) -> Tuple[Dict[str, Any], ...]:
+        return self.stage_fields.get(stage_id, ())
+
+    def stage_for_field(self, field_key: str) -> Optional[str]:
+        return self.field_stage.get(field_key)
+
+    def group_for_field(self, field_key: str) -> Optional[str]:
+        return self.field_group.get(field_key)
+
+    def display_for_choice(self, value: Any, default: Optional[str] = None) -> Optional[str]:
+        return self.choice_display.get(str(value), default)
+
+    def default_choice_for_field(self, field_key: str) -> Optional[str]:
+        """대표 choice 필드의 default 값 (스테이지에 default가 없으면 None)"""
+        stage = self.stages.get(self.choice_field_stage.get(field_key, ""))
+        return stage.default_choice_value if stage else None
+
+
+def compile_scenario(raw: Dict[str, Any], product_type: Optional[str] = None, version: Optional[int] = None) -> CompiledScenario:
+    """시나리오 JSON → CompiledScenario"""
+    return CompiledScenario(raw, product_type, version)
@@ -0,0 +1,214 @@
+# backend/app/graph/scenario_registry.py
+"""
+버전 관리되는 불변(immutable) 시나리오 레지스트리
+- 시나리오 JSON은 로드 시 한 번 동결(freeze)되어 버전 id와 함께 게시(publish)
+- 세션은 시나리오 전체가 아닌 (product_type, version) 참조만 보관
+- 핫 리로드는 새 버전을 원자적으로 게시하고, 진행 중인 세션은 기존 버전을 계속 사용
+- 세션이 고정(pin)한 버전은 세션이 해제(release)될 때까지 정리하지 않음
+- 게시 시점에 CompiledScenario(인덱스)도 함께 생성
+"""
+import json
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .scenario_model import CompiledScenario, CompiledStage, compile_scenario
+from .show_when import release_field_graph
+
+logger = logging.getLogger(__name__)
+
+# 제품별로 보관할 버전 수 (세션이 고정한 버전은 이와 별도로 해제될 때까지 유지)
+MAX_RETAINED_VERSIONS = 5
+
+
+def _readonly(self, *args, **kwargs):
+    raise TypeError("Scenario data is immutable. Publish a new version via scenario_registry instead.")
+
+
+class FrozenDict(dict):
+    """변경 불가 dict - json 직렬화/isinstance(dict) 호환"""
+    __slots__ = ()
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        # 불변 객체이므로 복사 없이 공유
+        return self
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+class FrozenList(list):
+    """변경 불가 list - json 직렬화/isinstance(list) 호환"""
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+def freeze(value: Any) -> Any:
+    """중첩된 dict/list 구조를 재귀적으로 동결"""
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(v) for v in value)
+    return value
+
+
+class ScenarioVersion:
+    """게시된 시나리오 한 버전"""
+    __slots__ = ("product_type", "version", "data", "compiled", "source_path", "published_at")
+
+    def __init__(self, product_type: str, version: int, data: FrozenDict,
+                 source_path: Optional[Path] = None):
+        self.product_type = product_type
+        self.version = version
+        self.data = data
+        self.compiled: CompiledScenario = compile_scenario(data, product_type, version)
+        self.source_path = source_path
+        self.published_at = datetime.now()
+
+    @property
+    def key(self) -> Tuple[str, int]:
+        return (self.product_type, self.version)
+
+
+class ScenarioRegistry:
+    """제품별 시나리오 버전 저장소"""
+
+    def __init__(self, max_retained_versions: int = MAX_RETAINED_VERSIONS):
+        self.max_retained_versions = max_retained_versions
+        self._lock = threading.Lock()
+        # 제품별 현재 버전 (읽기는 lock 없이 dict 조회 한 번으로 끝남)
+        self._current: Dict[str, ScenarioVersion] = {}
+        self._versions: Dict[Tuple[str, int], ScenarioVersion] = {}
+        self._next_version: Dict[str, int] = {}
+        # id(동결된 stage dict) → CompiledStage (stage_info만 전달받는 함수용 O(1) 조회)
+        self._stage_index: Dict[int, CompiledStage] = {}
+        # session_id → 고정한 (product_type, version) - 정리 대상에서 제외
+        self._session_refs: Dict[str, Tuple[str, int]] = {}
+
+    def publish(self, product_type: str, data: Dict[str, Any],
+                source_path: Optional[Path] = None) -> ScenarioVersion:
+        """새 버전을 동결하여 원자적으로 게시"""
+        frozen = freeze(data)
+        with self._lock:
+            version_no = self._next_version.get(product_type, 1)
+            self._next_version[product_type] = version_no + 1
+            entry = ScenarioVersion(product_type, version_no, frozen, source_path)
+            for compiled_stage in entry.compiled.stages.values():
+                self._stage_index[id(compiled_stage.raw)] = compiled_stage
+            self._versions[entry.key] = entry
+            self._current[product_type] = entry
+            self._evict_old_versions(product_type)
+        return entry
+
+    def load_file(self, product_type: str, file_path: Path) -> ScenarioVersion:
+        """JSON 파일을 읽어 새 버전으로 게시 (파싱 실패 시 기존 버전 유지)"""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return self.publish(product_type, data, file_path)
+
+    def current(self, product_type: Optional[str]) -> Optional[ScenarioVersion]:
+        """제품의 최신 버전"""
+        if not product_type:
+            return None
+        return self._current.get(product_type)
+
+    def get(self, product_type: Optional[str], version: Optional[int] = None) -> Optional[ScenarioVersion]:
+        """
+        (product_type, version) 조회
+        - version이 없거나 이미 정리된 버전이면 최신 버전 반환
+        """
+        if not product_type:
+            return None
+        if version is not None:
+            entry = self._versions.get((product_type, version))
+            if entry is not None:
+                return entry
+            # 고정된 버전은 정리되지 않으므로 여기 오는 것은 고정 없이 남은 참조 (재시작 전 세션 등)
+            logger.warning("⚠️ [SCENARIO_REGISTRY] %s v%s not found, falling back to latest", product_type, version)
+        return self._current.get(product_type)
+
+    def get_pinned(self, product_type: Optional[str], ref: Optional[Tuple[str, int]]) -> Optional[ScenarioVersion]:
+        """
+        세션이 고정한 (product_type, version) 참조로 조회
+        - 참조가 다른 제품의 것이면 (제품 전환 직후) 최신 버전 반환
+        """
+        version = ref[1] if ref and ref[0] == product_type else None
+        return self.get(product_type, version)
+
+    def pin(self, session_id: Optional[str], ref: Tuple[str, int]) -> None:
+        """세션이 사용하는 버전 기록 - release 전까지 정리하지 않음"""
+        if not session_id or self._session_refs.get(session_id) == ref:
+            return
+        with self._lock:
+            previous = self._session_refs.get(session_id)
+            self._session_refs[session_id] = ref
+            if previous is not None:
+                self._evict_old_versions(previous[0])
+
+    def release(self, session_id: str) -> None:
+        """세션 종료 - 고정했던 버전이 보관 범위 밖이면 정리"""
+        with self._lock:
+            previous = self._session_refs.pop(session_id, None)
+            if previous is not None:
+                self._evict_old_versions(previous[0])
+
+    def resolve(self, product_type: Optional[str], ref: Optional[Tuple[str, int]] = None) -> Optional[Dict[str, Any]]:
+        """세션 참조에 해당하는 동결된 시나리오 데이터"""
+        entry = self.get_pinned(product_type, ref)
+        return entry.data if entry else None
+
+    def compiled(self, product_type: Optional[str], ref: Optional[Tuple[str, int]] = None) -> Optional[CompiledScenario]:
+        """세션 참조에 해당하는 컴파일된 시나리오"""
+        entry = self.get_pinned(product_type, ref)
+        return entry.compiled if entry else None
+
+    def compiled_stage(self, stage_info: Optional[Dict[str, Any]]) -> Optional[CompiledStage]:
+        """
+        레지스트리에 게시된 stage dict에 대응하는 CompiledStage
+        - 로컬 사본 등 게시되지 않은 dict이면 None (호출 측에서 직접 계산)
+        """
+        if not stage_info:
+            return None
+        compiled_stage = self._stage_index.get(id(stage_info))
+        return compiled_stage if compiled_stage is not None and compiled_stage.raw is stage_info else None
+
+    def current_version(self, product_type: Optional[str]) -> Optional[int]:
+        entry = self.current(product_type)
+        return entry.version if entry else None
+
+    def product_types(self):
+        return list(self._current.keys())
+
+    def _evict_old_versions(self, product_type: str) -> None:
+        """보관 범위 밖의 버전 중 고정한 세션이 없는 버전만 정리 (lock 안에서 호출)"""
+        pinned = set(self._session_refs.values())
+        versions = sorted(v for (p, v) in self._versions if p == product_type)
+        for old in versions[:-self.max_retained_versions]:
+            if (product_type, old) in pinned:
+                continue
+            entry = self._versions.pop((product_type, old), None)
+            if entry is not None:
+                for compiled_stage in entry.compiled.stages.values():
+                    self._stage_index.pop(id(compiled_stage.raw), None)
+                release_field_graph(entry.compiled.field_list)
+
+
+# 전역 인스턴스
+scenario_registry = ScenarioRegistry()
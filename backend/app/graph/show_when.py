@@ -0,0 +1,313 @@
+# backend/app/graph/show_when.py
+"""
+슬롯 필링 show_when 조건식 컴파일러
+- 조건 문자열을 로드 시점에 한 번 파싱하여 클로저로 컴파일 (문자열 → 컴파일 결과 캐시)
+- 연산자 우선순위: ( ) > ! > ==, != > && > ||
+- 필드 의존성 그래프(FieldDependencyGraph): collected_info가 바뀐 키에 의존하는 필드만 재평가
+
+지원하는 표현식:
+- field == value / field != value   (value: 'text', "text", true, false, 숫자, 단어)
+- field == null / field != null
+- field                              (field != null 과 동일)
+- !cond, cond1 && cond2, cond1 || cond2, (cond)
+"""
+import logging
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+Predicate = Callable[[Dict[str, Any]], bool]
+
+_MISSING = object()
+
+_TOKEN_PATTERN = re.compile(r"""
+    \s*(?:
+        (?P<op>&&|\|\||==|!=|!|\(|\))
+      | (?P<str>'[^']*'|"[^"]*")
+      | (?P<word>[^\s()!=&|'"]+)
+    )""", re.VERBOSE)
+
+_TRUE_STRINGS = frozenset(['true', '1', 'yes', 'y', '네', '예', '신청', '가입', '필요', '할게요'])
+_FALSE_STRINGS = frozenset(['false', '0', 'no', 'n', '아니요', '아니오', '미신청', '미가입', '안해요', '필요없어요'])
+
+
+class ShowWhenSyntaxError(ValueError):
+    """show_when 조건식 파싱 실패"""
+
+
+def normalize_bool_value(value):
+    """다양한 타입의 값을 boolean으로 정규화"""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        lowered = value.lower()
+        # True로 처리할 값들
+        if lowered in _TRUE_STRINGS:
+            return True
+        # False로 처리할 값들
+        elif lowered in _FALSE_STRINGS:
+            return False
+    if isinstance(value, (int, float)):
+        return bool(value)
+    return False
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == '' or value is False
+
+
+def _as_compare_str(value: Any) -> str:
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value) if value is not None else ''
+
+
+def _tokenize(expression: str) -> List[Tuple[str, str]]:
+    tokens = []
+    pos = 0
+    length = len(expression)
+    while pos < length:
+        if expression[pos:].strip() == "":
+            break
+        match = _TOKEN_PATTERN.match(expression, pos)
+        if not match or match.end() == pos:
+            raise ShowWhenSyntaxError(f"unexpected character at {pos}: {expression[pos:]!r}")
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        pos = match.end()
+    return tokens
+
+
+def _compile_comparison(field: str, op: str, literal_kind: str, literal: str) -> Predicate:
+    """단일 비교식을 클로저로 컴파일 (기존 evaluate_single_condition과 동일한 의미)"""
+    negate = op == '!='
+
+    if literal_kind == 'word' and literal == 'null':
+        if negate:
+            return lambda info: not _is_empty(info.get(field))
+        return lambda info: _is_empty(info.get(field))
+
+    expected = literal[1:-1] if literal_kind == 'str' else literal
+    lowered = expected.lower()
+
+    if lowered in ('true', 'false'):
+        # boolean 값 처리 - 통합된 정규화 함수 사용
+        expected_bool = lowered == 'true'
+        if negate:
+            return lambda info: normalize_bool_value(info.get(field)) is not expected_bool
+        return lambda info: normalize_bool_value(info.get(field)) is expected_bool
+
+    # 문자열 비교 (boolean 값은 'true'/'false'로 정규화)
+    if negate:
+        return lambda info: _as_compare_str(info.get(field)) != expected
+    return lambda info: _as_compare_str(info.get(field)) == expected
+
+
+class _Parser:
+    """재귀 하강 파서 - or_expr := and_expr ('||' and_expr)*"""
+
+    def __init__(self, tokens: List[Tuple[str, str]]):
+        self.tokens = tokens
+        self.pos = 0
+        self.fields: List[str] = []
+
+    def parse(self) -> Predicate:
+        predicate = self._or_expr()
+        if self.pos != len(self.tokens):
+            raise ShowWhenSyntaxError(f"unexpected token {self.tokens[self.pos][1]!r}")
+        return predicate
+
+    def _peek(self) -> Optional[Tuple[str, str]]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _take(self) -> Tuple[str, str]:
+        token = self._peek()
+        if token is None:
+            raise ShowWhenSyntaxError("unexpected end of expression")
+        self.pos += 1
+        return token
+
+    def _accept_op(self, op: str) -> bool:
+        token = self._peek()
+        if token is not None and token == ('op', op):
+            self.pos += 1
+            return True
+        return False
+
+    def _or_expr(self) -> Predicate:
+        operands = [self._and_expr()]
+        while self._accept_op('||'):
+            operands.append(self._and_expr())
+        if len(operands) == 1:
+            return operands[0]
+        operands = tuple(operands)
+        return lambda info: any(p(info) for p in operands)
+
+    def _and_expr(self) -> Predicate:
+        operands = [self._unary()]
+        while self._accept_op('&&'):
+            operands.append(self._unary())
+        if len(operands) == 1:
+            return operands[0]
+        operands = tuple(operands)
+        return lambda info: all(p(info) for p in operands)
+
+    def _unary(self) -> Predicate:
+        if self._accept_op('!'):
+            operand = self._unary()
+            return lambda info: not operand(info)
+        if self._accept_op('('):
+            inner = self._or_expr()
+            if not self._accept_op(')'):
+                raise ShowWhenSyntaxError("missing ')'")
+            return inner
+        return self._comparison()
+
+    def _comparison(self) -> Predicate:
+        kind, field = self._take()
+        if kind != 'word':
+            raise ShowWhenSyntaxError(f"expected field name, got {field!r}")
+        self.fields.append(field)
+        token = self._peek()
+        if token in (('op', '=='), ('op', '!=')):
+            self.pos += 1
+            literal_kind, literal = self._take()
+            if literal_kind == 'op':
+                raise ShowWhenSyntaxError(f"expected value after {token[1]}, got {literal!r}")
+            return _compile_comparison(field, token[1], literal_kind, literal)
+        # 값 없이 필드만 쓴 경우: field != null
+        return lambda info: not _is_empty(info.get(field))
+
+
+class CompiledCondition:
+    """컴파일된 show_when 조건 - 호출 시 collected_info로 평가"""
+    __slots__ = ("source", "fields", "_predicate")
+
+    def __init__(self, source: str, fields: FrozenSet[str], predicate: Predicate):
+        self.source = source
+        self.fields = fields
+        self._predicate = predicate
+
+    def __call__(self, collected_info: Dict[str, Any]) -> bool:
+        try:
+            return bool(self._predicate(collected_info))
+        except Exception as e:
+            logger.warning("Error evaluating show_when expression '%s': %s", self.source, e)
+            return True  # 에러 시 기본적으로 표시
+
+
+ALWAYS_VISIBLE = CompiledCondition("", frozenset(), lambda info: True)
+
+
+@lru_cache(maxsize=1024)
+def compile_show_when(show_when: Optional[str]) -> CompiledCondition:
+    """show_when 문자열 → CompiledCondition (동일 문자열은 한 번만 파싱)"""
+    expression = (show_when or "").strip()
+    if not expression:
+        return ALWAYS_VISIBLE
+    try:
+        parser = _Parser(_tokenize(expression))
+        predicate = parser.parse()
+    except ShowWhenSyntaxError as e:
+        logger.warning("Error compiling show_when expression '%s': %s", show_when, e)
+        return CompiledCondition(expression, frozenset(), ALWAYS_VISIBLE._predicate)
+    return CompiledCondition(expression, frozenset(parser.fields), predicate)
+
+
+class FieldDependencyGraph:
+    """
+    필드 목록의 show_when 의존성 그래프
+    - 필드별 컴파일된 조건 / parent_field 기반 depth를 미리 계산
+    - 의존 키 → 해당 키를 참조하는 필드 인덱스 역색인
+    - 직전 평가 결과를 보관하여 바뀐 키에 의존하는 필드만 재평가
+    """
+
+    def __init__(self, fields: Sequence[Dict[str, Any]]):
+        self.fields = fields
+        self.keys: Tuple[Optional[str], ...] = tuple(f.get("key") for f in fields)
+        self.conditions: Tuple[CompiledCondition, ...] = tuple(compile_show_when(f.get("show_when")) for f in fields)
+
+        dependents: Dict[str, List[int]] = {}
+        for index, condition in enumerate(self.conditions):
+            for dep in condition.fields:
+                dependents.setdefault(dep, []).append(index)
+        self.dependents: Dict[str, Tuple[int, ...]] = {k: tuple(v) for k, v in dependents.items()}
+        self.conditional_indices: Tuple[int, ...] = tuple(i for i, c in enumerate(self.conditions) if c is not ALWAYS_VISIBLE)
+
+        # parent_field 기반 depth (순환 참조는 0으로 처리)
+        parent_of = {f.get("key"): f.get("parent_field") for f in fields if f.get("key")}
+        self.depths: Tuple[int, ...] = tuple(self._depth(f.get("parent_field"), parent_of) for f in fields)
+
+        # 직전 평가: (collected_info 스냅샷, 표시 여부 튜플)
+        self._last: Optional[Tuple[Dict[str, Any], Tuple[bool, ...]]] = None
+
+    @staticmethod
+    def _depth(parent: Optional[str], parent_of: Dict[str, Optional[str]]) -> int:
+        depth = 0
+        seen = set()
+        while parent and parent in parent_of and parent not in seen:
+            seen.add(parent)
+            depth += 1
+            parent = parent_of[parent]
+        return depth if not (parent and parent in seen) else 0
+
+    def depth_of(self, field_key: str) -> int:
+        for key, depth in zip(self.keys, self.depths):
+            if key == field_key:
+                return depth
+        return 0
+
+    def affected_indices(self, changed_keys) -> FrozenSet[int]:
+        """바뀐 키에 의존하는 필드 인덱스"""
+        affected = set()
+        for key in changed_keys:
+            affected.update(self.dependents.get(key, ()))
+        return frozenset(affected)
+
+    def visibility(self, collected_info: Dict[str, Any]) -> Tuple[bool, ...]:
+        """필드별 표시 여부 (직전 평가 대비 바뀐 키에 의존하는 필드만 재평가)"""
+        last = self._last
+        if last is None:
+            visible = tuple(condition(collected_info) for condition in self.conditions)
+        else:
+            last_info, last_visible = last
+            changed = [
+                key for key in (set(last_info) | set(collected_info))
+                if key in self.dependents and last_info.get(key, _MISSING) != collected_info.get(key, _MISSING)
+            ]
+            if not changed:
+                return last_visible
+            updated = list(last_visible)
+            for index in self.affected_indices(changed):
+                updated[index] = self.conditions[index](collected_info)
+            visible = tuple(updated)
+        self._last = ({key: collected_info[key] for key in self.dependents if key in collected_info}, visible)
+        return visible
+
+    def visible_fields(self, collected_info: Dict[str, Any]) -> List[Tuple[Dict[str, Any], int]]:
+        """표시되는 (필드, depth) 목록 - 원래 필드 순서 유지"""
+        visible = self.visibility(collected_info)
+        return [(field, depth) for field, depth, shown in zip(self.fields, self.depths, visible) if shown]
+
+
+# id(필드 목록) → FieldDependencyGraph (필드 목록은 동결된 시나리오 데이터 또는 모듈 상수)
+_graph_cache: Dict[int, FieldDependencyGraph] = {}
+
+
+def get_field_graph(fields: Sequence[Dict[str, Any]]) -> FieldDependencyGraph:
+    """필드 목록에 대한 의존성 그래프 (같은 목록 객체면 재사용)"""
+    graph = _graph_cache.get(id(fields))
+    if graph is None or graph.fields is not fields:
+        graph = FieldDependencyGraph(fields)
+        _graph_cache[id(fields)] = graph
+    return graph
+
+
+def release_field_graph(fields: Sequence[Dict[str, Any]]) -> None:
+    """정리된 시나리오 버전의 그래프 해제"""
+    graph = _graph_cache.get(id(fields))
+    if graph is not None and graph.fields is fields:
+        del _graph_cache[id(fields)]
@@ -6,6 +6,12 @@ import json
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from ..data.deposit_account_fields import get_deposit_account_fields
+from .keyword_matcher import build_matcher
+
+
+# 긍정/부정 응답 키워드 매처
+POSITIVE_RESPONSE_MATCHER = build_matcher(["네", "예", "좋아요", "그래요", "맞아요", "신청", "원해요", "할게요", "하겠어요"])
+NEGATIVE_RESPONSE_MATCHER = build_matcher(["아니요", "아니에요", "안", "필요없", "괜찮", "나중에", "안할"])
 
 
 class SimpleScenarioEngine:
@@ -90,17 +96,14 @@ class SimpleScenarioEngine:
     
     def _is_positive_response(self, response: str) -> bool:
         """긍정적 응답 판단"""
-        positive_keywords = ["네", "예", "좋아요", "그래요", "맞아요", "신청", "원해요", "할게요", "하겠어요"]
-        negative_keywords = ["아니요", "아니에요", "안", "필요없", "괜찮", "나중에", "안할"]
-        
         response_lower = response.lower().strip()
         
         # 부정 키워드 우선 체크
-        if any(keyword in response_lower for keyword in negative_keywords):
+        if NEGATIVE_RESPONSE_MATCHER.contains_any(response_lower):
             return False
         
         # 긍정 키워드 체크
-        if any(keyword in response_lower for keyword in positive_keywords):
+        if POSITIVE_RESPONSE_MATCHER.contains_any(response_lower):
             return True
         
         # 애매한 경우 False (재질의 유도)
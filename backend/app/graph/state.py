@@ -1,10 +1,12 @@
 # backend/app/graph/state.py
 
-from typing import Dict, Optional, Sequence, Literal, Any, List, Union, cast
+from typing import Dict, Optional, Sequence, Literal, Any, List, Tuple, Union, cast
 from langchain_core.messages import BaseMessage
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 from datetime import datetime
 
+from .scenario_registry import scenario_registry
+
 
 PRODUCT_TYPES = Literal["didimdol", "jeonse", "deposit_account"]
 
@@ -64,7 +66,8 @@ class AgentState(BaseModel):
     loan_selection_is_fresh: Optional[bool] = None
     
     # --- Dynamic Data (Loaded per turn) ---
-    active_scenario_data: Optional[Dict] = None
+    # 시나리오 본문은 state에 복사하지 않고 (product_type, version) 참조만 보관
+    active_scenario_ref: Optional[Tuple[str, int]] = None
     active_knowledge_base_content: Optional[str] = None
     active_scenario_name: Optional[str] = None
     
@@ -73,7 +76,9 @@ class AgentState(BaseModel):
     main_agent_routing_decision: Optional[str] = None
     main_agent_direct_response: Optional[str] = None
     factual_response: Optional[str] = None
+    factual_response_sources: List[str] = Field(default_factory=list)  # factual_response를 만든 워커 (synthesis_policy)
     scenario_agent_output: Optional[ScenarioAgentOutput] = None
+    turn_understanding: Optional[Dict[str, Any]] = None  # 턴 이해 통합 호출 결과 (turn_understanding.TurnUnderstanding.to_dict)
     stage_response_data: Optional[Dict[str, Any]] = None  # Stage response type data
     
     # --- Conversation History & Final Response ---
@@ -102,6 +107,13 @@ class AgentState(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
     
+    @property
+    def active_scenario_data(self) -> Optional[Dict]:
+        """고정된 버전의 시나리오 데이터 (불변, scenario_registry에서 조회)"""
+        if not self.current_product_type:
+            return None
+        return scenario_registry.resolve(self.current_product_type, self.active_scenario_ref)
+    
     @field_validator('messages', mode='before')
     @classmethod
     def validate_messages(cls, v):
@@ -0,0 +1,121 @@
+# backend/app/graph/synthesis_policy.py
+"""
+응답 합성 정책 - 워커 답변을 그대로 최종 응답으로 쓸지, synthesizer LLM으로 다시 생성할지 결정
+- existing:        워커/시나리오가 이미 최종 응답을 설정
+- qa_continuation: QA 답변 + 시나리오 다음 질문 (템플릿 조합, LLM 없음)
+- direct:          라우터 direct_response만 있고 워커 호출 없음
+- passthrough:     워커 하나의 답변(factual_response)만 있음 → 그대로 클라이언트로 (synthesizer 생략)
+- synthesize:      여러 워커 결과 병합 등 나머지 → synthesizer_chain
+결정은 집계하여 생략한 synthesizer 호출의 토큰/지연을 추정 (실제 synthesize 호출의 평균값 기준)
+"""
+import logging
+from typing import Any, Dict, NamedTuple, Optional
+
+from ..core.config import SYNTHESIS_PASSTHROUGH_ENABLED
+
+logger = logging.getLogger(__name__)
+
+MODE_EXISTING = "existing"
+MODE_QA_CONTINUATION = "qa_continuation"
+MODE_DIRECT = "direct"
+MODE_PASSTHROUGH = "passthrough"
+MODE_SYNTHESIZE = "synthesize"
+
+# 토큰 수 추정용 (한국어 위주 텍스트의 대략적인 문자/토큰 비율)
+CHARS_PER_TOKEN = 2.0
+# 실제 synthesize 호출이 아직 없을 때 사용할 호출당 지연 추정값 (초)
+DEFAULT_SYNTHESIS_LATENCY = 1.5
+
+
+class SynthesisDecision(NamedTuple):
+    """합성 방식 결정"""
+    mode: str
+    reason: str
+
+
+def decide_synthesis(state: Any) -> SynthesisDecision:
+    """state → 합성 방식 (synthesize_response_node의 분기 순서와 동일)"""
+    final_text = state.get("final_response_text_for_tts")
+    if final_text and final_text != 'None':
+        return SynthesisDecision(MODE_EXISTING, "final response already set")
+
+    factual_response = state.get("factual_response")
+    if factual_response and state.get("current_scenario_stage_id"):
+        return SynthesisDecision(MODE_QA_CONTINUATION, "factual response during scenario")
+
+    direct_response = state.get("main_agent_direct_response")
+    if direct_response and not state.get("action_plan"):
+        return SynthesisDecision(MODE_DIRECT, "direct response without workers")
+
+    sources = state.get("factual_response_sources") or []
+    if SYNTHESIS_PASSTHROUGH_ENABLED and factual_response and not direct_response and len(sources) <= 1:
+        return SynthesisDecision(MODE_PASSTHROUGH, f"single worker answer ({sources[0] if sources else 'unknown'})")
+
+    if factual_response and len(sources) > 1:
+        return SynthesisDecision(MODE_SYNTHESIZE, f"multi-worker merge ({', '.join(sources)})")
+    return SynthesisDecision(MODE_SYNTHESIZE, "no final answer from workers")
+
+
+def estimate_tokens(*texts: Optional[str]) -> int:
+    return int(sum(len(text) for text in texts if text) / CHARS_PER_TOKEN)
+
+
+class SynthesisPolicyStats:
+    """합성 방식별 턴 수, synthesizer 실측 평균, 생략으로 절약한 토큰/지연 추정"""
+
+    def __init__(self, log_every: int = 50):
+        self.log_every = log_every
+        self._modes: Dict[str, int] = {}
+        self._synthesized = 0
+        self._synthesis_tokens = 0
+        self._synthesis_seconds = 0.0
+        self._saved_tokens = 0
+        self._turns = 0
+
+    def _average_tokens(self, fallback: int) -> int:
+        return int(self._synthesis_tokens / self._synthesized) if self._synthesized else fallback
+
+    def _average_seconds(self) -> float:
+        return self._synthesis_seconds / self._synthesized if self._synthesized else DEFAULT_SYNTHESIS_LATENCY
+
+    def record(self, decision: SynthesisDecision, estimated_tokens: int = 0, elapsed: Optional[float] = None) -> None:
+        """
+        Args:
+            decision: 합성 방식
+            estimated_tokens: synthesize - 실제 프롬프트+응답 추정 토큰, passthrough - 생략한 호출의 추정 토큰
+            elapsed: synthesize 호출 소요 시간 (초)
+        """
+        self._modes[decision.mode] = self._modes.get(decision.mode, 0) + 1
+        if decision.mode == MODE_SYNTHESIZE and elapsed is not None:
+            self._synthesized += 1
+            self._synthesis_tokens += estimated_tokens
+            self._synthesis_seconds += elapsed
+        elif decision.mode == MODE_PASSTHROUGH:
+            saved = self._average_tokens(estimated_tokens)
+            self._saved_tokens += saved
+            logger.debug("⚡ [SYNTHESIS_POLICY] passthrough (%s) - synthesizer 생략 (~%s tokens, ~%.2fs)", decision.reason, saved, self._average_seconds())
+        self._turns += 1
+        if self.log_every and self._turns % self.log_every == 0:
+            self.log_summary()
+
+    def summary(self) -> Dict[str, Any]:
+        passthrough = self._modes.get(MODE_PASSTHROUGH, 0)
+        return {
+            "modes": dict(self._modes),
+            "synthesizer_calls": self._synthesized,
+            "avg_synthesis_seconds": self._average_seconds(),
+            "saved_calls": passthrough,
+            "saved_tokens_estimate": self._saved_tokens,
+            "saved_seconds_estimate": passthrough * self._average_seconds(),
+        }
+
+    def log_summary(self) -> None:
+        stats = self.summary()
+        logger.info(
+            "📊 [SYNTHESIS_POLICY] modes=%s, saved %s synthesizer calls (~%s tokens, ~%.1fs)",
+            stats['modes'], stats['saved_calls'], stats['saved_tokens_estimate'], stats['saved_seconds_estimate']
+        )
+
+
+# 전역 인스턴스
+synthesis_policy_stats = SynthesisPolicyStats()
@@ -0,0 +1,206 @@
+# backend/app/graph/turn_understanding.py
+"""
+턴 이해 (라우터 → 시나리오 NLU → 시나리오 로직 의도 분석/추출 체인을 한 번의 호출로)
+- 하나의 구조화 호출(turn_understanding 프롬프트)이 라우팅 action, 의도, 현재 스테이지 필드 값, 신뢰도를 함께 반환
+- 결과는 state.turn_understanding(dict)에 보관 → 시나리오 NLU 노드 / 시나리오 로직이 같은 턴·스테이지이면 재사용
+- 단답/정확한 선택지/숫자·날짜·연락처는 fast path로 결정 (LLM 호출 없음)
+"""
+import json
+import logging
+from typing import Any, Dict, List, Optional, Sequence
+
+from langchain_core.messages import BaseMessage, HumanMessage
+
+from .chains import json_llm
+from .fast_path import INTENT_NEGATIVE, INTENT_POSITIVE, fast_path_stats
+from . import fast_path
+from .history import history_manager
+from .models import turn_understanding_parser
+from .scenario_model import CompiledScenario, CompiledStage
+from .utils import ALL_PROMPTS
+
+logger = logging.getLogger(__name__)
+
+ACTION_SCENARIO = "invoke_scenario_agent"
+
+# 의도 → 시나리오 NLU 의도 (scenario_agent_output.intent 형식)
+SCENARIO_INTENTS = {
+    "긍정": "확인_긍정",
+    "부정": "확인_부정",
+    "질문": "질문_추가정보",
+    "수정요청": "REQUEST_MODIFY",
+    "혼란": "의견없음",
+    "기타": "의견없음",
+}
+
+
+class TurnUnderstanding:
+    """한 턴의 이해 결과"""
+    __slots__ = (
+        "stage_id", "user_input", "action", "tool_input", "intent", "entities", "committed",
+        "is_scenario_related", "confidence", "interpreted_meaning", "direct_response", "source",
+    )
+
+    def __init__(self, stage_id: Optional[str], user_input: str, action: str, intent: str,
+                 entities: Dict[str, Any], confidence: float, is_scenario_related: bool = True,
+                 committed: bool = True, tool_input: Optional[Dict[str, Any]] = None,
+                 interpreted_meaning: str = "", direct_response: Optional[str] = None, source: str = "llm"):
+        self.stage_id = stage_id
+        self.user_input = user_input
+        self.action = action
+        self.tool_input = tool_input or {}
+        self.intent = intent
+        self.entities = entities
+        self.committed = committed
+        self.is_scenario_related = is_scenario_related
+        self.confidence = confidence
+        self.interpreted_meaning = interpreted_meaning or user_input
+        self.direct_response = direct_response
+        self.source = source
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TurnUnderstanding":
+        return cls(**{name: data.get(name) for name in cls.__slots__ if name in data})
+
+    def matches(self, stage_id: Optional[str], user_input: Optional[str]) -> bool:
+        """같은 턴(발화)·같은 스테이지에 대한 결과인지 - 스테이지가 바뀌면 다시 분석"""
+        return str(self.stage_id) == str(stage_id) and self.user_input == (user_input or "")
+
+    def as_scenario_output(self) -> Dict[str, Any]:
+        """ScenarioAgentOutput 형식 (call_scenario_agent_node 결과)"""
+        if self.intent == "정보제공":
+            field_key = next(iter(self.entities), "")
+            intent = f"정보제공_{field_key}" if field_key else "정보제공"
+        else:
+            intent = SCENARIO_INTENTS.get(self.intent, "의견없음")
+        return {"intent": intent, "entities": dict(self.entities), "is_scenario_related": self.is_scenario_related}
+
+    def as_intent_analysis(self) -> Dict[str, Any]:
+        """EntityRecognitionAgent.analyze_user_intent 결과 형식"""
+        return {
+            "intent": self.intent,
+            "confidence": self.confidence,
+            "extracted_info": dict(self.entities),
+            "clarification_needed": self.confidence < 0.6,
+            "scenario_deviation": not self.is_scenario_related,
+            "deviation_topic": "",
+            "interpreted_meaning": self.interpreted_meaning,
+            "suggested_response": self.direct_response or "",
+            "turn_understanding": self.source,
+        }
+
+    def as_extraction_result(self) -> Dict[str, Any]:
+        """EntityRecognitionAgent.extract_entities_flexibly 결과 형식"""
+        return {
+            "extracted_entities": dict(self.entities),
+            "confidence": self.confidence,
+            "typo_corrections": {},
+            "ambiguous_fields": [],
+            "reasoning": f"turn_understanding ({self.source})",
+            "intent_analysis": self.as_intent_analysis(),
+        }
+
+
+def stage_field_defs(compiled_scenario: Optional[CompiledScenario], stage_info: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """현재 스테이지에서 추출할 필드 정의 (fields_to_collect > info_groups > expected_info_key, 다중 수집 스테이지는 전체)"""
+    keys = list(stage_info.get("fields_to_collect") or stage_info.get("info_groups") or ())
+    if not keys and stage_info.get("expected_info_key"):
+        keys = [stage_info["expected_info_key"]]
+    field_defs = compiled_scenario.field_defs if compiled_scenario else {}
+    if not keys and stage_info.get("collect_multiple_info") and compiled_scenario:
+        return [field for field in compiled_scenario.field_list if isinstance(field, dict) and field.get("key")]
+    return [field_defs.get(key) or {"key": key} for key in keys]
+
+
+def _field_lines(fields: Sequence[Dict[str, Any]], compiled_stage: Optional[CompiledStage]) -> str:
+    lines = []
+    for field in fields:
+        line = f"- {field['key']} ({field.get('display_name', field['key'])}): {field.get('type', 'text')}"
+        choices = [c.get("value", c.get("key")) if isinstance(c, dict) else c for c in field.get("choices") or ()]
+        if not choices and compiled_stage is not None and compiled_stage.choice_field == field["key"]:
+            choices = [choice.value for choice in compiled_stage.choices if not choice.is_toggle]
+        if choices:
+            line += f", 선택지: {choices}"
+        if field.get("unit"):
+            line += f", 단위: {field['unit']}"
+        lines.append(line)
+    return "\n".join(lines) or "- (없음)"
+
+
+def _fast_understanding(user_input: str, stage_id: Optional[str], stage_info: Dict[str, Any],
+                        fields: Sequence[Dict[str, Any]]) -> Optional[TurnUnderstanding]:
+    result = fast_path.resolve(user_input, stage_info, fields or None)
+    fast_path_stats.record("turn_understanding", result)
+    if result is None:
+        return None
+    intent = "정보제공" if result.fields and result.intent not in (INTENT_POSITIVE, INTENT_NEGATIVE) else result.intent
+    return TurnUnderstanding(stage_id, user_input, ACTION_SCENARIO, intent, dict(result.fields),
+                             result.confidence, source=f"fast_path:{result.rule}")
+
+
+async def understand_turn(user_input: str, stage_id: Optional[str], stage_info: Dict[str, Any],
+                          scenario_data: Dict[str, Any], compiled_scenario: Optional[CompiledScenario],
+                          collected_info: Dict[str, Any], messages_history: Sequence[BaseMessage],
+                          session_id: Optional[str] = None) -> Optional[TurnUnderstanding]:
+    """
+    한 번의 구조화 호출로 턴 이해 - 실패하면 None (호출 측은 기존 라우터/NLU 경로 사용)
+    """
+    if not user_input:
+        return None
+    fields = stage_field_defs(compiled_scenario, stage_info)
+    fast_result = _fast_understanding(user_input, stage_id, stage_info, fields)
+    if fast_result is not None:
+        # 엔티티 값(이름/연락처 등)은 남기지 않고 필드명만
+        logger.debug("⚡ [TURN_UNDERSTANDING] %s: %s fields=%s - LLM 호출 생략",
+                     fast_result.source, fast_result.intent, sorted(fast_result.entities))
+        return fast_result
+
+    prompt_template = ALL_PROMPTS.get('scenario_agent', {}).get('turn_understanding', '')
+    if not json_llm or not prompt_template:
+        return None
+    compiled_stage = compiled_scenario.stage(stage_id) if compiled_scenario else None
+    prompt = prompt_template.format(
+        format_instructions=turn_understanding_parser.get_format_instructions(),
+        scenario_name=scenario_data.get("scenario_name", "Consultation"),
+        stage_name=stage_info.get("stage_name", stage_id),
+        stage_prompt=stage_info.get("prompt", ""),
+        field_lines=_field_lines(fields, compiled_stage),
+        collected_keys=json.dumps(sorted(collected_info.keys()), ensure_ascii=False),
+        formatted_messages_history=history_manager.format_for_prompt(messages_history, session_id),
+        user_input=user_input,
+    )
+    try:
+        response = await json_llm.ainvoke([HumanMessage(content=prompt)], site="turn_understanding")
+        raw_content = response.content.strip().replace("```json", "").replace("```", "").strip()
+        parsed = turn_understanding_parser.parse(raw_content)
+    except Exception as e:
+        if e.__class__.__name__ in ("RateLimitError", "LLMCapacityError"):
+            raise
+        logger.error("❌ [TURN_UNDERSTANDING] failed: %s", e)
+        return None
+
+    # 현재 스테이지 필드가 아닌 키는 버림 (필드 목록이 없으면 그대로)
+    field_keys = {field["key"] for field in fields}
+    entities = {key: value for key, value in parsed.entities.items()
+                if value is not None and (not field_keys or key in field_keys)}
+    understanding = TurnUnderstanding(
+        stage_id, user_input, parsed.action, parsed.intent, entities, parsed.confidence,
+        is_scenario_related=parsed.is_scenario_related, committed=parsed.committed,
+        tool_input=parsed.tool_input, interpreted_meaning=parsed.interpreted_meaning,
+        direct_response=parsed.direct_response,
+    )
+    logger.debug("🧠 [TURN_UNDERSTANDING] action=%s, intent=%s, fields=%s, confidence=%.2f",
+                 understanding.action, understanding.intent, sorted(understanding.entities), understanding.confidence)
+    return understanding
+
+
+def turn_understanding_for(state: Any, stage_id: Optional[str]) -> Optional[TurnUnderstanding]:
+    """state에 보관된 이번 턴·스테이지의 이해 결과 (없거나 다른 스테이지/발화면 None)"""
+    data = state.get("turn_understanding")
+    if not data:
+        return None
+    understanding = TurnUnderstanding.from_dict(data)
+    return understanding if understanding.matches(stage_id, state.get("stt_result")) else None
@@ -1,11 +1,13 @@
 # backend/app/graph/utils.py
 import json
-import yaml
 from pathlib import Path
 from typing import Dict, Optional, Sequence, Literal, Any, List, cast
 
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
 from .state import AgentState, PRODUCT_TYPES
+from .scenario_registry import scenario_registry
+from .scenario_model import CompiledScenario
+from ..config.config_registry import config_registry
 
 # --- Paths and Settings ---
 APP_DIR = Path(__file__).resolve().parent.parent
@@ -33,36 +35,60 @@ PROMPT_FILES = {
 
 # --- Data Caching ---
 ALL_PROMPTS: Dict[str, Dict[str, str]] = {}
+# 최신 게시 버전의 읽기 전용 뷰 (버전 고정이 필요하면 scenario_registry 사용)
 ALL_SCENARIOS_DATA: Dict[PRODUCT_TYPES, Dict] = {}
 ALL_KNOWLEDGE_BASES: Dict[str, Optional[str]] = {}
 
 # --- Loading Functions ---
+def _refresh_prompts(agent_name: str):
+    """Returns a config_registry listener that swaps in reloaded prompts for one agent."""
+    def listener(data: Any) -> None:
+        ALL_PROMPTS[agent_name] = data or {}
+    return listener
+
 def load_all_prompts_sync() -> None:
-    """Loads all agent prompts from YAML files into memory."""
+    """Loads all agent prompts from YAML files via the shared config registry."""
     global ALL_PROMPTS
     try:
         for agent_name, file_path in PROMPT_FILES.items():
-            with open(file_path, 'r', encoding='utf-8') as f:
-                ALL_PROMPTS[agent_name] = yaml.safe_load(f)
+            if agent_name not in ALL_PROMPTS:
+                config_registry.on_change(file_path, _refresh_prompts(agent_name))
+            ALL_PROMPTS[agent_name] = config_registry.get(file_path, required=True)
         print("--- All agent prompts loaded successfully. ---")
     except Exception as e:
         print(f"CRITICAL ERROR loading prompt files: {e}")
         raise
 
+def _publish_scenario(product_type: PRODUCT_TYPES, file_path: Path, data: Optional[Dict] = None) -> Dict:
+    """Publishes a scenario as a new immutable registry version and refreshes the latest view."""
+    if data is None:
+        entry = scenario_registry.load_file(product_type, file_path)
+    else:
+        entry = scenario_registry.publish(product_type, data, file_path)
+    ALL_SCENARIOS_DATA[product_type] = entry.data
+    return entry.data
+
 def load_all_scenarios_sync() -> None:
-    """Loads all scenario JSON files into memory."""
+    """Loads all scenario JSON files into the versioned scenario registry."""
     global ALL_SCENARIOS_DATA
     try:
+        # 모든 파일을 먼저 파싱한 뒤 게시 (하나라도 실패하면 기존 버전 유지)
+        parsed: Dict[PRODUCT_TYPES, Dict] = {}
         for product_type, file_path in SCENARIO_FILES.items():
             with open(file_path, 'r', encoding='utf-8') as f:
-                ALL_SCENARIOS_DATA[product_type] = json.load(f)
+                parsed[product_type] = json.load(f)
+        for product_type, data in parsed.items():
+            _publish_scenario(product_type, SCENARIO_FILES[product_type], data)
         print("--- All product scenarios loaded successfully. ---")
     except Exception as e:
         print(f"CRITICAL ERROR loading scenario files: {e}")
         raise
 
 def reload_scenario_data(product_type: Optional[PRODUCT_TYPES] = None) -> bool:
-    """Reloads scenario data from JSON files. If product_type is specified, only reloads that product."""
+    """Reloads scenario data from JSON files. If product_type is specified, only reloads that product.
+
+    Each reload publishes a new registry version; sessions pinned to an older version keep using it.
+    """
     global ALL_SCENARIOS_DATA
     try:
         if product_type:
@@ -70,10 +96,8 @@ def reload_scenario_data(product_type: Optional[PRODUCT_TYPES] = None) -> bool:
             if product_type in SCENARIO_FILES:
                 file_path = SCENARIO_FILES[product_type]
                 print(f"🔄 Reloading scenario from: {file_path}")
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    new_data = json.load(f)
-                    ALL_SCENARIOS_DATA[product_type] = new_data
-                print(f"✅ Scenario for '{product_type}' reloaded successfully.")
+                new_data = _publish_scenario(product_type, file_path)
+                print(f"✅ Scenario for '{product_type}' reloaded successfully (v{scenario_registry.current_version(product_type)}).")
                 print(f"📊 Loaded {len(new_data.get('stages', {}))} stages")
                 # Debug: Show card selection stage choices
                 if 'stages' in new_data and 'card_selection' in new_data['stages']:
@@ -121,10 +145,23 @@ async def load_knowledge_base_content_async(product_type: str) -> Optional[str]:
     return content if content and not content.startswith("ERROR_") else None
 
 # --- Formatting and Utility Functions ---
+INTERNAL_LOG_PREFIXES = ("Main Agent Plan:",)
+
+def is_internal_log_message(message: BaseMessage) -> bool:
+    """Returns True for internal bookkeeping SystemMessages that must not be sent to the LLM."""
+    return isinstance(message, SystemMessage) and str(message.content).startswith(INTERNAL_LOG_PREFIXES)
+
 def format_messages_for_prompt(messages: Sequence[BaseMessage], max_history: int = 5) -> str:
-    """Formats a sequence of messages for inclusion in a prompt."""
+    """Formats a sequence of messages for inclusion in a prompt.
+
+    Stateless fallback; graph nodes should prefer history.history_manager.format_for_prompt,
+    which prepends the rolling session summary.
+    """
     history_str = []
-    relevant_messages = [m for m in messages if isinstance(m, (HumanMessage, AIMessage, SystemMessage))][-(max_history * 2):]
+    relevant_messages = [
+        m for m in messages
+        if isinstance(m, (HumanMessage, AIMessage, SystemMessage)) and not is_internal_log_message(m)
+    ][-(max_history * 2):]
     for msg in relevant_messages:
         role = "System"
         if isinstance(msg, HumanMessage): role = "User"
@@ -147,9 +184,14 @@ def format_transitions_for_prompt(transitions: List[Dict[str, Any]], current_sta
     return "\n".join(formatted_list)
 
 def get_active_scenario_data(state: AgentState) -> Optional[Dict]:
-    """Retrieves the active scenario data based on the current product type in the state."""
+    """Retrieves the (immutable) scenario data pinned by the state's product type and scenario version."""
+    product_type = state.get("current_product_type")
+    return scenario_registry.resolve(product_type, state.get("active_scenario_ref")) if product_type else None
+
+def get_compiled_scenario(state: AgentState) -> Optional[CompiledScenario]:
+    """Retrieves the precompiled scenario model (stage/field/choice indexes) pinned by the state."""
     product_type = state.get("current_product_type")
-    return ALL_SCENARIOS_DATA.get(product_type) if product_type else None
+    return scenario_registry.compiled(product_type, state.get("active_scenario_ref")) if product_type else None
 
 async def get_active_knowledge_base(state: AgentState) -> Optional[str]:
     """Retrieves the active knowledge base content based on the current product type."""
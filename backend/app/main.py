@@ -1,17 +1,31 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from contextlib import asynccontextmanager
 import asyncio
 
 from .api.V1 import chat as chat_router_v1
 from .core.config import OPENAI_API_KEY, GOOGLE_APPLICATION_CREDENTIALS
 from .services.rag_service import rag_service
+from .graph.llm_gateway import llm_gateway
+from .graph.model_router import model_router
+from .graph.llm_cache import llm_cache
+from .graph.route_classifier import router_bypass_stats
+from .graph.synthesis_policy import synthesis_policy_stats
+from .services.web_search_service import web_search_service
+from .core.metrics import metrics_registry, CONTENT_TYPE
+from .core.tracing import setup_tracing, shutdown_tracing
+from .graph.logger import configure_logging, shutdown_logging
 import os
 
+# 로그 출력은 큐 → 백그라운드 스레드 (graph/logger.py)
+configure_logging()
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     print("--- Server Starting Up ---")
+    setup_tracing()
     try:
         # RAG 서비스를 비동기적으로 초기화합니다.
         # force_recreate=True로 설정하면 서버가 시작될 때마다 DB를 새로 만듭니다.
@@ -27,6 +41,16 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     print("--- Server Shutting Down ---")
+    print(f"LLM gateway stats: {llm_gateway.stats()}")
+    print(f"Model shadow stats: {model_router.summary()}")
+    print(f"LLM cache stats: {llm_cache.stats()}")
+    print(f"Router bypass stats: {router_bypass_stats.summary()}")
+    print(f"Synthesis policy stats: {synthesis_policy_stats.summary()}")
+    print(f"Web search stats: {web_search_service.stats()}")
+    await llm_gateway.aclose()
+    await web_search_service.aclose()
+    shutdown_tracing()
+    shutdown_logging()
 
 
 app = FastAPI(
@@ -63,4 +87,9 @@ app.include_router(chat_router_v1.router, prefix="/api/v1/chat", tags=["Chat Ser
 async def root():
     return {"message": "디딤돌 음성 상담 에이전트 API"}
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus 스크레이프 엔드포인트"""
+    return PlainTextResponse(metrics_registry.render(), media_type=CONTENT_TYPE)
+
 # LangGraph 에이전트 및 기타 서비스 초기화는 각 모듈에서 처리
\ No newline at end of file
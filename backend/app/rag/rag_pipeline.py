@@ -14,6 +14,7 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.documents import Document
 
 from ..core.config import OPENAI_API_KEY
+from ..core.tracing import set_attributes, start_span
 from ..graph.chains import generative_llm
 from .models import RetrievedDocument, ProcessedDocument, RAGOutput
 
@@ -180,17 +181,19 @@ class RAGPipeline:
         print(f"Expanded queries: {user_questions[1:]}")
 
         # 1. 여러 질문으로 동시에 문서 검색
-        tasks = [self.retriever.ainvoke(q) for q in user_questions]
-        results_from_all_queries = await asyncio.gather(*tasks)
-
-        # 2. 검색된 문서에서 중복 제거
-        unique_docs = {}
-        for doc_list in results_from_all_queries:
-            for doc in doc_list:
-                if doc.page_content not in unique_docs:
-                    unique_docs[doc.page_content] = doc
-        
-        retrieved_docs: List[Document] = list(unique_docs.values())
+        with start_span("rag.retrieve", **{"rag.query_count": len(user_questions)}):
+            tasks = [self.retriever.ainvoke(q) for q in user_questions]
+            results_from_all_queries = await asyncio.gather(*tasks)
+
+            # 2. 검색된 문서에서 중복 제거
+            unique_docs = {}
+            for doc_list in results_from_all_queries:
+                for doc in doc_list:
+                    if doc.page_content not in unique_docs:
+                        unique_docs[doc.page_content] = doc
+
+            retrieved_docs: List[Document] = list(unique_docs.values())
+            set_attributes(**{"rag.document_count": len(retrieved_docs)})
         print(f"Retrieved {len(retrieved_docs)} unique documents.")
         
         if not retrieved_docs:
@@ -226,7 +229,7 @@ async def main():
     retriever = manager.get_retriever(search_type="hybrid", k=5)
     print("Retriever created.")
 
-    rag_pipeline = RAGPipeline(retriever=retriever, llm=generative_llm)
+    rag_pipeline = RAGPipeline(retriever=retriever, llm=generative_llm.for_site("rag_answer"))
     print("RAG Pipeline created.")
 
     test_question = "디딤돌 대출 금리 알려줘"
@@ -244,9 +247,6 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
-    # 'generative_llm'이 이 컨텍스트에서 정의되어 있지 않으므로, 직접 초기화 필요
-    from ..graph.chains import generative_llm
     if not generative_llm:
          raise ImportError("Could not import or initialize 'generative_llm'.")
     asyncio.run(main()) 
\ No newline at end of file
@@ -3,13 +3,27 @@ from google.cloud import speech
 from google.cloud import texttospeech as tts
 import os
 import asyncio
+import logging
 import base64
-from typing import Callable, Optional, AsyncGenerator, Union, List, Awaitable # Added List and Awaitable
+import time
+from typing import Callable, Optional, AsyncGenerator, Union, List, Awaitable, Tuple # Added List and Awaitable
 import queue # 동기 큐
 import webrtcvad
 import numpy as np
 
 from ..core.config import GOOGLE_APPLICATION_CREDENTIALS
+from ..core.metrics import STT_FIRST_INTERIM_LATENCY, STT_FINAL_LATENCY, TTS_FIRST_BYTE_LATENCY
+from ..core.tracing import add_event, start_span
+
+logger = logging.getLogger(__name__)
+
+# 세션의 현재 (상품, 스테이지) - 음성 단계 메트릭 라벨
+LabelsProvider = Callable[[], Tuple[Optional[str], Optional[str]]]
+
+
+def _metric_labels(labels_provider: Optional[LabelsProvider]) -> dict:
+    product, stage = labels_provider() if labels_provider else (None, None)
+    return {"product": product, "stage": stage}
 
 # Google Cloud 인증 정보 설정
 GOOGLE_SERVICES_AVAILABLE = False
@@ -35,13 +49,19 @@ class StreamSTTService:
                  on_epd_detected: Optional[Callable[[], Awaitable[None]]] = None, # Awaitable로 타입 수정
                  language_code: str = "ko-KR",
                  audio_encoding: speech.RecognitionConfig.AudioEncoding = speech.RecognitionConfig.AudioEncoding.LINEAR16,
-                 sample_rate_hertz: int = 16000): # VAD 권장 샘플레이트: 8000, 16000, 32000
+                 sample_rate_hertz: int = 16000, # VAD 권장 샘플레이트: 8000, 16000, 32000
+                 labels_provider: Optional[LabelsProvider] = None):
         
         self._is_active = False # 스트림 활성화 상태
         self.session_id = session_id
+        # 발화 지연 메트릭: 발화 시작(VAD) → 첫 interim / final
+        self.labels_provider = labels_provider
+        self._utterance_started_at: Optional[float] = None
+        self._utterance_started_ns: Optional[int] = None  # 턴 트레이스 시작 시각 (wall clock)
+        self._first_interim_observed = False
 
         if not GOOGLE_SERVICES_AVAILABLE:
-            print(f"StreamSTTService ({self.session_id}) 초기화 실패: Google 서비스 사용 불가.")
+            logger.warning("StreamSTTService (%s) 초기화 실패: Google 서비스 사용 불가.", self.session_id)
             return
 
         # --- VAD 인스턴스 생성 및 설정 ---
@@ -86,11 +106,11 @@ class StreamSTTService:
         self.SILENCE_FRAMES_TRIGGER = 25 # 25프레임(750ms) 연속 묵음이면 EPD로 간주 (로깅용)
         self._speech_frames_buffer = [] # 음성 시작점 보정을 위한 버퍼
 
-        print(f"StreamSTTService ({self.session_id}) initialized. Encoding: {audio_encoding.name}, Sample Rate: {sample_rate_hertz}, VAD Silence Trigger: {self.SILENCE_FRAMES_TRIGGER * self.frame_duration_ms}ms")
+        logger.debug("StreamSTTService (%s) initialized. Encoding: %s, Sample Rate: %s, VAD Silence Trigger: %sms", self.session_id, audio_encoding.name, sample_rate_hertz, self.SILENCE_FRAMES_TRIGGER * self.frame_duration_ms)
 
     async def _request_generator(self):
         if not GOOGLE_SERVICES_AVAILABLE: 
-            print(f"STT request generator ({self.session_id}): Google 서비스 사용 불가, 생성기 중단.")
+            logger.debug("STT request generator (%s): Google 서비스 사용 불가, 생성기 중단.", self.session_id)
             return
         try:
             yield speech.StreamingRecognizeRequest(streaming_config=self.streaming_config)
@@ -101,50 +121,50 @@ class StreamSTTService:
                 try:
                     current_timeout = initial_audio_timeout if not first_chunk_received else 0.2 
                     if not first_chunk_received:
-                        print(f"STT request generator ({self.session_id}): Waiting for first audio chunk (max {current_timeout}s)...")
+                        logger.debug("STT request generator (%s): Waiting for first audio chunk (max %ss)...", self.session_id, current_timeout)
                     chunk = await asyncio.wait_for(self._audio_queue.get(), timeout=current_timeout)
                     if not first_chunk_received:
-                        print(f"STT request generator ({self.session_id}): First audio chunk received.")
+                        logger.debug("STT request generator (%s): First audio chunk received.", self.session_id)
                         first_chunk_received = True
                     if chunk is None: 
                         self._stop_event.set() 
-                        print(f"STT request generator ({self.session_id}): Termination signal received from queue.")
+                        logger.debug("STT request generator (%s): Termination signal received from queue.", self.session_id)
                         break 
                     yield speech.StreamingRecognizeRequest(audio_content=chunk)
                     self._audio_queue.task_done()
                 except asyncio.TimeoutError:
                     if not first_chunk_received:
-                        print(f"STT request generator ({self.session_id}): Timeout waiting for the first audio chunk. Stopping stream.")
+                        logger.warning("STT request generator (%s): Timeout waiting for the first audio chunk. Stopping stream.", self.session_id)
                         if self.on_error: 
                             await self.on_error("음성 데이터가 수신되지 않아 STT를 시작할 수 없습니다 (초기 타임아웃).")
                         self._stop_event.set() 
                         break 
                     continue 
                 except asyncio.CancelledError:
-                    print(f"STT request generator ({self.session_id}): Task was cancelled.")
+                    logger.debug("STT request generator (%s): Task was cancelled.", self.session_id)
                     self._stop_event.set()
                     break 
                 except Exception as e:
-                    print(f"STT request generator ({self.session_id}) error in loop: {type(e).__name__} - {e}")
+                    logger.error("STT request generator (%s) error in loop: %s - %s", self.session_id, type(e).__name__, e)
                     if self.on_error:
                          await self.on_error(f"STT 스트림 요청 생성 중 오류: {e}")
                     self._stop_event.set()
                     break 
-            print(f"STT request generator ({self.session_id}) loop finished. Stop event: {self._stop_event.is_set()}")
+            logger.debug("STT request generator (%s) loop finished. Stop event: %s", self.session_id, self._stop_event.is_set())
         except Exception as e: 
-            print(f"STT request generator ({self.session_id}) initial setup error: {type(e).__name__} - {e}")
+            logger.error("STT request generator (%s) initial setup error: %s - %s", self.session_id, type(e).__name__, e)
             if self.on_error:
                 await self.on_error(f"STT 스트림 초기 설정 오류: {e}")
             self._stop_event.set() 
         finally:
-            print(f"STT request generator ({self.session_id}) fully terminated.")
+            logger.debug("STT request generator (%s) fully terminated.", self.session_id)
 
     async def _process_responses(self):
         if not GOOGLE_SERVICES_AVAILABLE or not self._is_active:
-            print(f"STT response processing ({self.session_id}): Not starting, Google services unavailable or not active.")
+            logger.debug("STT response processing (%s): Not starting, Google services unavailable or not active.", self.session_id)
             return
 
-        print(f"STT stream ({self.session_id}): Starting to listen for responses.")
+        logger.debug("STT stream (%s): Starting to listen for responses.", self.session_id)
         try:
             if not hasattr(self, 'client') or not hasattr(self, 'streaming_config'):
                  if self.on_error: await self.on_error("STT 서비스가 올바르게 초기화되지 않았습니다.")
@@ -155,42 +175,63 @@ class StreamSTTService:
             )
             async for response in responses:
                 if self._stop_event.is_set(): 
-                    print(f"STT response processing ({self.session_id}): Stop event detected, breaking loop.")
+                    logger.debug("STT response processing (%s): Stop event detected, breaking loop.", self.session_id)
                     break 
                 if not response.results: continue
                 result = response.results[0]
                 if not result.alternatives: continue
                 transcript = result.alternatives[0].transcript
                 if result.is_final:
-                    print(f"STT Final ({self.session_id}): {transcript}")
+                    logger.debug("STT Final (%s): %s", self.session_id, transcript)
+                    self._observe_transcript_latency(final=True)
                     if self.on_final_result:
                         await self.on_final_result(transcript)
                     if self.on_epd_detected: 
                         await self.on_epd_detected()
                 else:
+                    self._observe_transcript_latency(final=False)
                     if self.on_interim_result:
                         await self.on_interim_result(transcript)
         except asyncio.CancelledError:
-            print(f"STT response processing task ({self.session_id}) was cancelled.")
+            logger.debug("STT response processing task (%s) was cancelled.", self.session_id)
         except Exception as e: 
             error_msg = f"STT stream API error ({self.session_id}): {type(e).__name__} - {e}"
-            print(error_msg)
+            logger.error(error_msg)
             if self.on_error:
                 await self.on_error(error_msg)
         finally:
             self._is_active = False 
             if not self._stop_event.is_set():
                 self._stop_event.set() 
-            print(f"STT stream ({self.session_id}): Response listening loop fully ended.")
+            logger.debug("STT stream (%s): Response listening loop fully ended.", self.session_id)
+
+    def _observe_transcript_latency(self, final: bool) -> None:
+        """발화 시작 시점 기준 첫 interim / final 까지 시간 기록 (final이면 다음 발화를 위해 초기화)"""
+        if self._utterance_started_at is None:
+            return
+        elapsed = time.monotonic() - self._utterance_started_at
+        labels = _metric_labels(self.labels_provider)
+        if not self._first_interim_observed:
+            self._first_interim_observed = True
+            STT_FIRST_INTERIM_LATENCY.observe(elapsed, **labels)
+        if final:
+            STT_FINAL_LATENCY.observe(elapsed, **labels)
+            self._utterance_started_at = None
+            self._first_interim_observed = False
+
+    def pop_utterance_started_ns(self) -> Optional[int]:
+        """마지막 발화의 시작 시각 (time_ns) - final 결과 콜백에서 턴 span 시작 시각으로 사용"""
+        started_ns, self._utterance_started_ns = self._utterance_started_ns, None
+        return started_ns
 
     async def start_stream(self):
         if not GOOGLE_SERVICES_AVAILABLE:
             await self.on_error("STT 서비스를 시작할 수 없습니다 (Google 서비스 비활성).") # await 추가
             return
         if self._processing_task and not self._processing_task.done():
-            print(f"STT stream ({self.session_id}): Stream already running.")
+            logger.debug("STT stream (%s): Stream already running.", self.session_id)
             return
-        print(f"STT stream ({self.session_id}): Starting processing task.")
+        logger.debug("STT stream (%s): Starting processing task.", self.session_id)
         self._stop_event.clear()
         self._is_active = True
         while not self._audio_queue.empty(): self._audio_queue.get_nowait(); self._audio_queue.task_done()
@@ -198,7 +239,7 @@ class StreamSTTService:
             self._processing_task = asyncio.create_task(self._process_responses())
         except RuntimeError as e:
             if "no running event loop" in str(e) or "Cannot schedule new futures" in str(e):
-                print(f"STT stream ({self.session_id}): Cannot create task - event loop issue: {e}")
+                logger.debug("STT stream (%s): Cannot create task - event loop issue: %s", self.session_id, e)
                 self._is_active = False
                 return
             raise
@@ -207,7 +248,7 @@ class StreamSTTService:
         if not GOOGLE_SERVICES_AVAILABLE or not self._is_active or self._stop_event.is_set():
             return
         if not self._processing_task or self._processing_task.done():
-            print(f"STT stream ({self.session_id}): Dropping audio chunk, stream task not healthy.")
+            logger.warning("STT stream (%s): Dropping audio chunk, stream task not healthy.", self.session_id)
             return
 
         self._internal_buffer += chunk
@@ -225,51 +266,54 @@ class StreamSTTService:
                     if not is_speech:
                         self._silence_frames_after_speech += 1
                         if self._silence_frames_after_speech >= self.SILENCE_FRAMES_TRIGGER:
-                            print(f"VAD ({self.session_id}): Potential end of speech detected after {self._silence_frames_after_speech * self.frame_duration_ms}ms of silence.")
+                            logger.debug("VAD (%s): Potential end of speech detected after %sms of silence.", self.session_id, self._silence_frames_after_speech * self.frame_duration_ms)
                             self._is_speech_active = False
                             self._silence_frames_after_speech = 0
                     else: # is_speech
                         self._silence_frames_after_speech = 0
                 elif is_speech: # not _is_speech_active and is_speech
                     self._is_speech_active = True
-                    print(f"VAD ({self.session_id}): Start of speech detected.")
+                    if self._utterance_started_at is None:
+                        self._utterance_started_at = time.monotonic()
+                        self._utterance_started_ns = time.time_ns()
+                    logger.debug("VAD (%s): Start of speech detected.", self.session_id)
                 
                 # 모든 오디오 프레임을 Google로 전송
                 self._audio_queue.put_nowait(frame_to_process)
 
             except asyncio.QueueFull:
-                print(f"STT audio queue full for session {self.session_id}. Dropping frame.")
+                logger.warning("STT audio queue full for session %s. Dropping frame.", self.session_id)
             except Exception as e:
-                print(f"Error during VAD processing or queueing ({self.session_id}): {e}")
+                logger.error("Error during VAD processing or queueing (%s): %s", self.session_id, e)
 
     async def stop_stream(self):
         if not GOOGLE_SERVICES_AVAILABLE or not self._is_active:
             self._is_active = False 
             return
         if not self._stop_event.is_set():
-            print(f"STT stream ({self.session_id}): Attempting to stop.")
+            logger.debug("STT stream (%s): Attempting to stop.", self.session_id)
             self._stop_event.set()
             try:
                 await self._audio_queue.put(None) 
             except Exception as e: 
-                print(f"Error sending stop signal to STT queue ({self.session_id}): {e}")
+                logger.error("Error sending stop signal to STT queue (%s): %s", self.session_id, e)
         if self._processing_task and not self._processing_task.done():
-            print(f"STT stream ({self.session_id}): Waiting for processing task to complete.")
+            logger.debug("STT stream (%s): Waiting for processing task to complete.", self.session_id)
             try:
                 await asyncio.wait_for(self._processing_task, timeout=2.0)
             except asyncio.TimeoutError:
-                print(f"STT stream ({self.session_id}): Timeout waiting for task. Forcing cancellation.")
+                logger.warning("STT stream (%s): Timeout waiting for task. Forcing cancellation.", self.session_id)
                 self._processing_task.cancel()
             except RuntimeError as e:
                 if "Cannot schedule new futures" in str(e) or "no running event loop" in str(e):
-                    print(f"STT stream ({self.session_id}): Event loop closing, cannot wait for task")
+                    logger.debug("STT stream (%s): Event loop closing, cannot wait for task", self.session_id)
                 else:
-                    print(f"STT stream ({self.session_id}): RuntimeError during task shutdown: {e}")
+                    logger.warning("STT stream (%s): RuntimeError during task shutdown: %s", self.session_id, e)
             except Exception as e:
-                print(f"STT stream ({self.session_id}): Error during task shutdown: {e}")
+                logger.error("STT stream (%s): Error during task shutdown: %s", self.session_id, e)
         self._processing_task = None
         self._is_active = False
-        print(f"STT stream ({self.session_id}): Stopped.")
+        logger.debug("STT stream (%s): Stopped.", self.session_id)
 
 # --- TTS 스트리밍 서비스 클래스 ---
 class StreamTTSService:
@@ -282,11 +326,13 @@ class StreamTTSService:
                  voice_name: str = "ko-KR-Chirp3-HD-Orus", # Updated voice model
                  audio_encoding: tts.AudioEncoding = tts.AudioEncoding.MP3, 
                  speaking_rate: float = 1.2,
-                 pitch: float = 0.0):
+                 pitch: float = 0.0,
+                 labels_provider: Optional[LabelsProvider] = None):
         
         self.session_id = session_id
+        self.labels_provider = labels_provider
         if not GOOGLE_SERVICES_AVAILABLE:
-            print(f"StreamTTSService ({self.session_id}) 초기화 실패: Google 서비스 사용 불가.")
+            logger.warning("StreamTTSService (%s) 초기화 실패: Google 서비스 사용 불가.", self.session_id)
             # Consider calling on_error or raising an exception if services are critical
             return
 
@@ -304,7 +350,7 @@ class StreamTTSService:
         # Increased chunk size for potentially smoother delivery of MP3
         self.simulated_chunk_size_bytes = 32768 # <--- 변경된 기본값 (예: 32KB)
 
-        print(f"StreamTTSService ({self.session_id}) initialized. Voice: {voice_name}, Encoding: {audio_encoding.name}, Speaking Rate: {speaking_rate}, Chunk Size: {self.simulated_chunk_size_bytes}") #
+        logger.debug("StreamTTSService (%s) initialized. Voice: %s, Encoding: %s, Speaking Rate: %s, Chunk Size: %s", self.session_id, voice_name, audio_encoding.name, speaking_rate, self.simulated_chunk_size_bytes) #
 
     async def _generate_and_stream_audio(self, text: str):
         if not GOOGLE_SERVICES_AVAILABLE: 
@@ -312,42 +358,47 @@ class StreamTTSService:
             if self.on_stream_complete: await self.on_stream_complete()
             return
         try:
-            print(f"TTS stream ({self.session_id}): Synthesizing for text: '{text[:50]}...'")
+            logger.debug("TTS stream (%s): Synthesizing for text: '%s...'", self.session_id, text[:50])
+            requested_at = time.monotonic()
             synthesis_input = tts.SynthesisInput(text=text)
-            response = await self.client.synthesize_speech(
-                request={"input": synthesis_input, "voice": self.voice_params, "audio_config": self.audio_config}
-            )
+            with start_span("tts.synthesize", **{"tts.chars": len(text)}):
+                response = await self.client.synthesize_speech(
+                    request={"input": synthesis_input, "voice": self.voice_params, "audio_config": self.audio_config}
+                )
             audio_content = response.audio_content
-            print(f"TTS stream ({self.session_id}): Synthesis complete, size: {len(audio_content)} bytes for '{text[:30]}...'")
+            logger.debug("TTS stream (%s): Synthesis complete, size: %s bytes for '%s...'", self.session_id, len(audio_content), text[:30])
 
             if not audio_content:
-                 print(f"TTS stream ({self.session_id}): No audio content received for '{text[:30]}...'")
+                 logger.debug("TTS stream (%s): No audio content received for '%s...'", self.session_id, text[:30])
                  if self.on_error: await self.on_error(f"TTS 오디오 생성 실패: '{text[:30]}...'")
                  if self.on_stream_complete: await self.on_stream_complete()
                  return
 
             for i in range(0, len(audio_content), self.simulated_chunk_size_bytes):
                 if self._current_tts_task and self._current_tts_task.cancelled():
-                    print(f"TTS stream ({self.session_id}): Cancelled during chunking for '{text[:30]}...'")
+                    logger.debug("TTS stream (%s): Cancelled during chunking for '%s...'", self.session_id, text[:30])
                     break
                 chunk = audio_content[i:i + self.simulated_chunk_size_bytes]
                 encoded_chunk = base64.b64encode(chunk).decode('utf-8')
                 if self.on_audio_chunk:
                     await self.on_audio_chunk(encoded_chunk)
+                if i == 0:
+                    TTS_FIRST_BYTE_LATENCY.observe(time.monotonic() - requested_at, **_metric_labels(self.labels_provider))
+                    add_event("tts.first_audio_chunk", bytes=len(chunk))
                 # Reduced sleep or make it configurable for faster streaming if network allows
                 await asyncio.sleep(0.02) 
             
             if not (self._current_tts_task and self._current_tts_task.cancelled()):
                  if self.on_stream_complete:
                     await self.on_stream_complete()
-            print(f"TTS stream ({self.session_id}): Finished streaming for '{text[:30]}...'")
+            logger.debug("TTS stream (%s): Finished streaming for '%s...'", self.session_id, text[:30])
 
         except asyncio.CancelledError:
-            print(f"TTS generation task ({self.session_id}): Was cancelled for '{text[:30]}...'")
+            logger.debug("TTS generation task (%s): Was cancelled for '%s...'", self.session_id, text[:30])
             # on_stream_complete is called in finally
         except Exception as e:
             error_msg = f"TTS synthesis/streaming error for session {self.session_id}, text '{text[:30]}...': {type(e).__name__} - {e}"
-            print(error_msg)
+            logger.error(error_msg)
             if self.on_error: 
                 await self.on_error(error_msg)
         finally:
@@ -362,7 +413,7 @@ class StreamTTSService:
                  # To avoid double calls, only call if not already called.
                  # The main call is after the for loop in the try block.
                  pass
-             print(f"TTS stream ({self.session_id}): Audio generation/streaming task for '{text[:30]}...' finished.")
+             logger.debug("TTS stream (%s): Audio generation/streaming task for '%s...' finished.", self.session_id, text[:30])
 
 
     async def start_tts_stream(self, text_to_speak: str):
@@ -374,13 +425,13 @@ class StreamTTSService:
         # Stop any currently running TTS task for a *previous text segment*
         await self.stop_tts_stream() 
         
-        print(f"TTS stream ({self.session_id}): Queueing TTS task for text: '{text_to_speak[:50]}...'")
+        logger.debug("TTS stream (%s): Queueing TTS task for text: '%s...'", self.session_id, text_to_speak[:50])
         # Create and store the task for the current text_to_speak
         try:
             self._current_tts_task = asyncio.create_task(self._generate_and_stream_audio(text_to_speak))
         except RuntimeError as e:
             if "no running event loop" in str(e) or "Cannot schedule new futures" in str(e):
-                print(f"TTS stream ({self.session_id}): Cannot create task - event loop issue: {e}")
+                logger.debug("TTS stream (%s): Cannot create task - event loop issue: %s", self.session_id, e)
                 if self.on_error: 
                     await self.on_error("TTS 작업을 시작할 수 없습니다.")
                 if self.on_stream_complete: 
@@ -392,9 +443,9 @@ class StreamTTSService:
             # Await the completion of the current sentence's TTS streaming
             await self._current_tts_task
         except asyncio.CancelledError:
-            print(f"TTS stream ({self.session_id}): Task for '{text_to_speak[:30]}...' was cancelled during start_tts_stream.")
+            logger.debug("TTS stream (%s): Task for '%s...' was cancelled during start_tts_stream.", self.session_id, text_to_speak[:30])
         except Exception as e:
-            print(f"TTS stream ({self.session_id}): Error awaiting task in start_tts_stream for '{text_to_speak[:30]}...': {e}")
+            logger.error("TTS stream (%s): Error awaiting task in start_tts_stream for '%s...': %s", self.session_id, text_to_speak[:30], e)
             if self.on_error: await self.on_error(f"TTS 작업 실행 중 오류: {e}")
             if self.on_stream_complete: await self.on_stream_complete() # Ensure cleanup
 
@@ -404,26 +455,26 @@ class StreamTTSService:
 
         task_to_stop = self._current_tts_task
         if task_to_stop and not task_to_stop.done():
-            print(f"TTS stream ({self.session_id}): Attempting to cancel active TTS task.")
+            logger.debug("TTS stream (%s): Attempting to cancel active TTS task.", self.session_id)
             task_to_stop.cancel()
             try:
                 await task_to_stop 
             except asyncio.CancelledError:
-                print(f"TTS stream ({self.session_id}): Active TTS task successfully cancelled.")
+                logger.debug("TTS stream (%s): Active TTS task successfully cancelled.", self.session_id)
             except RuntimeError as e:
                 if "Cannot schedule new futures" in str(e) or "no running event loop" in str(e):
-                    print(f"TTS stream ({self.session_id}): Event loop closing, cannot wait for task")
+                    logger.debug("TTS stream (%s): Event loop closing, cannot wait for task", self.session_id)
                 else:
-                    print(f"TTS stream ({self.session_id}): RuntimeError during TTS task cancellation: {e}")
+                    logger.warning("TTS stream (%s): RuntimeError during TTS task cancellation: %s", self.session_id, e)
             except Exception as e:
-                print(f"TTS stream ({self.session_id}): Error during TTS task cancellation: {e}")
+                logger.error("TTS stream (%s): Error during TTS task cancellation: %s", self.session_id, e)
             finally:
                 if self._current_tts_task is task_to_stop: # Ensure we only nullify if it's the same task
                     self._current_tts_task = None
         else: 
             if self._current_tts_task is task_to_stop:
                  self._current_tts_task = None
-        print(f"TTS stream ({self.session_id}): Stop TTS stream completed.")
+        logger.debug("TTS stream (%s): Stop TTS stream completed.", self.session_id)
 
 
 # --- 단건 처리 함수 (기존 제공된 파일 참고, 비상용 또는 초기 테스트용) ---
@@ -432,7 +483,7 @@ async def transcribe_audio_bytes_non_streaming(audio_bytes: bytes,
                                  encoding: speech.RecognitionConfig.AudioEncoding = speech.RecognitionConfig.AudioEncoding.WEBM_OPUS
                                  ) -> str:
     if not GOOGLE_SERVICES_AVAILABLE:
-        print("STT (단건) 서비스 사용 불가: Google Credentials 누락.")
+        logger.debug("STT (단건) 서비스 사용 불가: Google Credentials 누락.")
         return "음성 인식을 위한 서비스 설정을 찾을 수 없습니다."
     client = speech.SpeechClient() 
     audio = speech.RecognitionAudio(content=audio_bytes)
@@ -442,21 +493,21 @@ async def transcribe_audio_bytes_non_streaming(audio_bytes: bytes,
         language_code="ko-KR",
         enable_automatic_punctuation=True,
     )
-    print(f"Google STT (단건) 요청 중... 샘플레이트: {sample_rate_hertz}, 인코딩: {encoding.name}")
+    logger.debug("Google STT (단건) 요청 중... 샘플레이트: %s, 인코딩: %s", sample_rate_hertz, encoding.name)
     try:
         response = await asyncio.to_thread(client.recognize, config=config, audio=audio)
         transcript = ""
         for result in response.results:
             transcript += result.alternatives[0].transcript
-        print(f"STT (단건) 결과: {transcript}")
+        logger.debug("STT (단건) 결과: %s", transcript)
         return transcript
     except Exception as e:
-        print(f"Google STT (단건) Error: {e}")
+        logger.error("Google STT (단건) Error: %s", e)
         return "" 
 
 async def synthesize_text_to_audio_bytes_non_streaming(text: str) -> bytes:
     if not GOOGLE_SERVICES_AVAILABLE:
-        print("TTS (단건) 서비스 사용 불가: Google Credentials 누락.")
+        logger.debug("TTS (단건) 서비스 사용 불가: Google Credentials 누락.")
         return b"TTS service credentials missing."
     client = tts.TextToSpeechAsyncClient() 
     synthesis_input = tts.SynthesisInput(text=text)
@@ -468,13 +519,13 @@ async def synthesize_text_to_audio_bytes_non_streaming(text: str) -> bytes:
         audio_encoding=tts.AudioEncoding.MP3,
         speaking_rate=1.2 # <--- 단건 처리 함수에도 반영
     )
-    print(f"Google TTS (단건) 요청 중 (텍스트: {text[:30]}...)")
+    logger.debug("Google TTS (단건) 요청 중 (텍스트: %s...)", text[:30])
     try:
         response = await client.synthesize_speech(
             request={"input": synthesis_input, "voice": voice, "audio_config": audio_config}
         )
-        print("Google TTS (단건) 응답 수신 완료.")
+        logger.debug("Google TTS (단건) 응답 수신 완료.")
         return response.audio_content
     except Exception as e:
-        print(f"Google TTS (단건) Error: {e}")
+        logger.error("Google TTS (단건) Error: %s", e)
         return b""
\ No newline at end of file
@@ -1,15 +1,19 @@
 # backend/app/services/openai_services.py
+from typing import Optional
+
 from openai import AsyncOpenAI, APIError # APIError 추가
 from ..core.config import OPENAI_API_KEY, LLM_MODEL_NAME
+from ..graph.llm_gateway import estimate_tokens, llm_gateway
 
 if not OPENAI_API_KEY:
     print("OpenAI 서비스 경고: OPENAI_API_KEY가 설정되지 않았습니다. OpenAI 서비스 기능이 비활성화될 수 있습니다.")
 
 # 전역 클라이언트 인스턴스 (애플리케이션 생애주기 동안 재사용)
 # 단, OPENAI_API_KEY가 없을 경우 None으로 유지하고, 사용 시점에서 확인
+# 커넥션 풀은 llm_gateway와 공유하고, 재시도는 게이트웨이가 담당
 aclient: Optional[AsyncOpenAI] = None
 if OPENAI_API_KEY:
-    aclient = AsyncOpenAI(api_key=OPENAI_API_KEY)
+    aclient = AsyncOpenAI(api_key=OPENAI_API_KEY, http_client=llm_gateway.http_client, max_retries=0)
 else:
     print("OpenAI AsyncClient가 초기화되지 않았습니다. API 키를 확인하세요.")
 
@@ -21,9 +25,10 @@ async def get_llm_response_non_streaming(messages: list, model: str = LLM_MODEL_
     
     print(f"OpenAI LLM ({model}) 요청 중 (Non-streaming)... 첫 메시지: {messages[0] if messages else '없음'}")
     try:
-        response = await aclient.chat.completions.create(
-            model=model,
-            messages=messages,
+        response = await llm_gateway.call(
+            "openai_direct",
+            lambda: aclient.chat.completions.create(model=model, messages=messages),
+            estimate_tokens(messages),
         )
         content = response.choices[0].message.content
         print(f"LLM 응답 (Non-streaming): {content[:70]}...")
@@ -49,12 +54,13 @@ async def stream_llm_response_langchain(messages: list, model: str = LLM_MODEL_N
 
     print(f"OpenAI LLM ({model}) 스트리밍 요청 중... 첫 메시지: {messages[0] if messages else '없음'}")
     try:
-        stream = await aclient.chat.completions.create(
-            model=model,
-            messages=messages,
-            stream=True,
-        )
-        async for chunk in stream:
+        async def open_stream():
+            async for chunk in await aclient.chat.completions.create(
+                model=model, messages=messages, stream=True, stream_options={"include_usage": True}
+            ):
+                yield chunk
+
+        async for chunk in llm_gateway.stream("openai_direct", open_stream, estimate_tokens(messages)):
             if chunk.choices and chunk.choices[0].delta and chunk.choices[0].delta.content is not None:
                 yield chunk.choices[0].delta.content
     except APIError as e:
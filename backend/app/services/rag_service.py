@@ -44,7 +44,7 @@ class RAGService:
             if not generative_llm:
                 raise ValueError("Generative LLM is not available.")
                 
-            self.rag_pipeline = RAGPipeline(retriever=retriever, llm=generative_llm)
+            self.rag_pipeline = RAGPipeline(retriever=retriever, llm=generative_llm.for_site("rag_answer"))
             
             self._initialized = True
             print("--- RAG Service Initialized Successfully ---\n")
@@ -1,21 +1,128 @@
 # backend/app/services/web_search_service.py
+"""
+웹 검색 서비스
+- Tavily REST API를 공유 httpx.AsyncClient로 호출 (keep-alive 커넥션 재사용, 이벤트 루프를 막지 않음)
+- 검색 전체에 하드 데드라인 (WEB_SEARCH_TIMEOUT) - 초과하면 안내 문구 반환
+- 정규화한 쿼리 기준 TTL 결과 캐시 (같은 질문 반복 시 HTTP 호출 없음)
+- 백엔드는 처음 검색할 때 생성 - API 키가 없어도 import 시 예외 없이 검색만 비활성화
+- WEB_SEARCH_BACKEND=local 이면 네트워크 없이 고정 결과를 돌려주는 로컬 백엔드 (테스트/개발용)
+"""
+import asyncio
+import logging
 import os
-from tavily import TavilyClient
-from typing import List, Dict, Any
+import time
+from typing import Any, Dict, List, Optional
+
+from ..core.config import (
+    WEB_SEARCH_BACKEND,
+    WEB_SEARCH_CACHE_MAX_ENTRIES,
+    WEB_SEARCH_CACHE_TTL,
+    WEB_SEARCH_DEPTH,
+    WEB_SEARCH_TIMEOUT,
+)
+from ..core.tracing import start_span
+from ..graph.llm_cache import LRUCache, normalize_text
+
+logger = logging.getLogger(__name__)
+
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+
+SEARCH_ERROR_TEXT = "웹 검색 중 오류가 발생했습니다."
+SEARCH_TIMEOUT_TEXT = "웹 검색이 지연되어 결과를 가져오지 못했습니다."
+SEARCH_UNAVAILABLE_TEXT = "현재 웹 검색을 사용할 수 없습니다."
+
+
+class WebSearchUnavailable(Exception):
+    """검색 백엔드를 만들 수 없음 (API 키 없음 등)"""
+
+
+class TavilySearchBackend:
+    """Tavily REST API 비동기 클라이언트"""
+
+    def __init__(self, api_key: str, search_depth: str = WEB_SEARCH_DEPTH, timeout: float = WEB_SEARCH_TIMEOUT):
+        import httpx
+        self._api_key = api_key
+        self.search_depth = search_depth
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+            timeout=httpx.Timeout(timeout, connect=min(timeout, 3.0)),
+        )
+
+    async def search(self, query: str, max_results: int) -> List[Dict[str, Any]]:
+        response = await self._client.post(
+            TAVILY_SEARCH_URL,
+            json={"api_key": self._api_key, "query": query, "search_depth": self.search_depth, "max_results": max_results},
+            headers={"Authorization": f"Bearer {self._api_key}"},
+        )
+        response.raise_for_status()
+        return response.json().get("results", [])
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+class LocalSearchBackend:
+    """네트워크 없이 고정 결과를 돌려주는 백엔드 (테스트/개발용) - delay로 지연 재현"""
+
+    def __init__(self, results: Optional[List[Dict[str, Any]]] = None, delay: float = 0.0):
+        self.results = results
+        self.delay = delay
+        self.calls = 0
+
+    async def search(self, query: str, max_results: int) -> List[Dict[str, Any]]:
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        results = self.results if self.results is not None else [
+            {"title": f"Local result for '{query}'", "url": "http://localhost/search", "content": f"'{query}'에 대한 로컬 검색 결과입니다."}
+        ]
+        return results[:max_results]
+
+    async def aclose(self) -> None:
+        return None
+
+
+def _create_backend(api_key: Optional[str]) -> Any:
+    if WEB_SEARCH_BACKEND == "local":
+        return LocalSearchBackend()
+    if not api_key:
+        raise WebSearchUnavailable("Tavily API key is not set. Please set the TAVILY_API_KEY environment variable.")
+    return TavilySearchBackend(api_key)
+
 
 class WebSearchService:
     """
-    Tavily API를 사용하여 웹 검색을 수행하는 서비스 클래스입니다.
+    웹 검색을 수행하는 서비스 클래스입니다.
     """
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, backend: Any = None,
+                 timeout: float = WEB_SEARCH_TIMEOUT, cache_ttl: float = WEB_SEARCH_CACHE_TTL):
         """
-        Tavily 클라이언트를 초기화합니다.
         API 키가 제공되지 않으면 환경 변수 'TAVILY_API_KEY'에서 로드합니다.
+        백엔드는 첫 검색 시 생성합니다 (backend를 넘기면 그대로 사용).
         """
-        api_key = api_key or os.environ.get("TAVILY_API_KEY")
-        if not api_key:
-            raise ValueError("Tavily API key is not set. Please set the TAVILY_API_KEY environment variable.")
-        self.client = TavilyClient(api_key=api_key)
+        self._api_key = api_key or os.environ.get("TAVILY_API_KEY")
+        self._backend = backend
+        self._unavailable_reason: Optional[str] = None
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self._cache = LRUCache(WEB_SEARCH_CACHE_MAX_ENTRIES)
+        self._stats = {"searches": 0, "cache_hits": 0, "timeouts": 0, "errors": 0}
+
+    def _get_backend(self) -> Any:
+        if self._backend is None and self._unavailable_reason is None:
+            try:
+                self._backend = _create_backend(self._api_key)
+            except (WebSearchUnavailable, ImportError) as e:
+                self._unavailable_reason = str(e)
+                logger.warning("⚠️ [WEB_SEARCH] Web search disabled: %s", e)
+        return self._backend
+
+    def is_available(self) -> bool:
+        return self._get_backend() is not None
+
+    @staticmethod
+    def _cache_key(query: str, max_results: int) -> str:
+        return f"{max_results}:{normalize_text(query).lower()}"
 
     def _format_results(self, results: List[Dict[str, Any]]) -> str:
         """
@@ -23,14 +130,14 @@ class WebSearchService:
         """
         if not results:
             return "검색 결과가 없습니다."
-        
+
         formatted_string = ""
         for i, result in enumerate(results, 1):
             formatted_string += f"--- Result {i} ---\n"
             formatted_string += f"Title: {result.get('title', 'N/A')}\n"
             formatted_string += f"Source: {result.get('url', 'N/A')}\n"
             formatted_string += f"Content: {result.get('content', 'N/A')}\n\n"
-        
+
         return formatted_string.strip()
 
     def _format_search_results(self, results: List[Dict[str, Any]]) -> str:
@@ -39,13 +146,13 @@ class WebSearchService:
         """
         if not results:
             return "검색 결과를 찾을 수 없습니다."
-        
+
         formatted_string = ""
         for result in results:
             title = result.get('title', '')
             url = result.get('url', '')
             content = result.get('content', '')
-            
+
             if title:
                 formatted_string += f"{title}\n"
             if url:
@@ -53,33 +160,54 @@ class WebSearchService:
             if content:
                 formatted_string += f"{content}\n"
             formatted_string += "\n"
-        
+
         return formatted_string
 
     async def asearch(self, query: str, max_results: int = 3) -> str:
         """
         주어진 쿼리에 대해 웹 검색을 비동기적으로 수행하고,
-        가장 관련성 높은 결과를 요약하여 반환합니다.
+        가장 관련성 높은 결과를 요약하여 반환합니다. (캐시 → 데드라인 내 검색)
         """
-        print(f"Performing web search for: '{query}'")
-        try:
-            # `search` 메소드는 동기적으로 작동하므로, 비동기 컨텍스트에서 직접 호출
-            # Tavily 라이브러리가 aiohttp 등을 사용하지 않는 경우, 이 방식이 일반적입니다.
-            # 실제 비동기 I/O 바운드 라이브러리를 사용한다면 `await`을 사용합니다.
-            response = self.client.search(
-                query=query,
-                search_depth="advanced", # 더 깊은 분석을 위해 advanced 사용
-                max_results=max_results
-            )
-            
-            # 검색 결과에서 URL과 내용을 추출하여 LLM이 요약하도록 전달
-            context_for_summary = self._format_results(response.get("results", []))
-            
-            return context_for_summary
+        backend = self._get_backend()
+        if backend is None:
+            return SEARCH_UNAVAILABLE_TEXT
+
+        cache_key = self._cache_key(query, max_results)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._stats["cache_hits"] += 1
+            logger.debug("⚡ [WEB_SEARCH] cache hit: '%s'", query)
+            return cached
 
+        logger.debug("Performing web search for: '%s'", query)
+        self._stats["searches"] += 1
+        start = time.perf_counter()
+        try:
+            with start_span("web_search", **{"web_search.max_results": max_results, "web_search.timeout": self.timeout}):
+                results = await asyncio.wait_for(backend.search(query, max_results), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            self._stats["timeouts"] += 1
+            logger.error("❌ [WEB_SEARCH] timed out after %.1fs: '%s'", self.timeout, query)
+            return SEARCH_TIMEOUT_TEXT
         except Exception as e:
-            print(f"An error occurred during web search: {e}")
-            return "웹 검색 중 오류가 발생했습니다."
+            self._stats["errors"] += 1
+            logger.error("An error occurred during web search: %s", e)
+            return SEARCH_ERROR_TEXT
+
+        # 검색 결과에서 URL과 내용을 추출하여 LLM이 요약하도록 전달
+        context_for_summary = self._format_results(results)
+        if results:
+            self._cache.set(cache_key, context_for_summary, self.cache_ttl)
+        logger.debug("🔎 [WEB_SEARCH] %s results in %.2fs", len(results), time.perf_counter() - start)
+        return context_for_summary
+
+    def stats(self) -> Dict[str, int]:
+        return {**self._stats, "cached_queries": len(self._cache)}
+
+    async def aclose(self) -> None:
+        if self._backend is not None:
+            await self._backend.aclose()
+            self._backend = None
 
 # 어플리케이션 전체에서 공유될 싱글톤 인스턴스
-web_search_service = WebSearchService() 
\ No newline at end of file
+web_search_service = WebSearchService()
@@ -2,7 +2,7 @@
 import { defineStore } from "pinia";
 import { v4 as uuidv4 } from "uuid";
 import { useSlotFillingStore } from "./slotFillingStore";
-import type { SlotFillingUpdate } from "@/types/slotFilling";
+import type { SlotFillingUpdate, SlotFillingDelta } from "@/types/slotFilling";
 import type { StageResponseMessage } from "@/types/stageResponse";
 
 interface Message {
@@ -254,6 +254,21 @@ export const useChatStore = defineStore("chat", {
                 this.error = "정보 수집 상태 업데이트 중 오류가 발생했습니다.";
               }
               break;
+            case "slot_filling_delta":
+              try {
+                const slotFillingStore = useSlotFillingStore();
+                const delta = data as SlotFillingDelta;
+                console.log(`Slot filling delta received: seq=${delta.seq}, ops=${delta.ops?.length || 0}`);
+                if (!slotFillingStore.applySlotFillingDelta(delta)) {
+                  // 기준 상태가 없거나 시퀀스가 어긋나면 전체 상태 재요청
+                  this.webSocket?.send(
+                    JSON.stringify({ type: "slot_filling_resync", seq: delta.seq })
+                  );
+                }
+              } catch (error) {
+                console.error("Error processing slot filling delta:", error);
+              }
+              break;
             case "field_modification_response":
               try {
                 const slotFillingStore = useSlotFillingStore();
@@ -1,6 +1,6 @@
 import { defineStore } from 'pinia'
 import { ref, computed, watch, nextTick, onUnmounted } from 'vue'
-import type { SlotFillingState, SlotFillingUpdate, SmartField, FieldGroup, CurrentStageInfo } from '@/types/slotFilling'
+import type { SlotFillingState, SlotFillingUpdate, SlotFillingDelta, SlotFillingPatchOp, SmartField, FieldGroup, CurrentStageInfo } from '@/types/slotFilling'
 
 // 디버그 모드 활성화 여부
 const DEBUG_MODE = import.meta.env.DEV
@@ -32,6 +32,10 @@ export const useSlotFillingStore = defineStore('slotFilling', () => {
     check_card: number
   }>({ total: 20, basic_info: 7, electronic_banking: 6, check_card: 7 })
   
+  // 델타 동기화 상태 (서버가 마지막으로 보낸 전체 payload와 시퀀스 번호)
+  const syncedMessage = ref<SlotFillingUpdate | null>(null)
+  const syncedSeq = ref<number | null>(null)
+
   // 성능 최적화 관련 상태
   const lastUpdateHash = ref<string>('')
   const updateDebounceTimer = ref<ReturnType<typeof setTimeout> | null>(null)
@@ -235,8 +239,61 @@ export const useSlotFillingStore = defineStore('slotFilling', () => {
     return JSON.stringify(hashData)
   }
 
+  // JSON Pointer 토큰 복원 (RFC 6901)
+  const parsePointer = (path: string): string[] =>
+    path.split('/').slice(1).map(token => token.replace(/~1/g, '/').replace(/~0/g, '~'))
+
+  // JSON-patch 연산 적용 (target을 직접 수정)
+  const applyPatchOp = (target: any, op: SlotFillingPatchOp) => {
+    const tokens = parsePointer(op.path)
+    const last = tokens.pop()
+    if (last === undefined) {
+      throw new Error(`Invalid patch path: ${op.path}`)
+    }
+    let parent = target
+    for (const token of tokens) {
+      parent = parent?.[token]
+      if (parent === undefined || parent === null) {
+        throw new Error(`Patch path not found: ${op.path}`)
+      }
+    }
+    if (op.op === 'remove') {
+      if (Array.isArray(parent)) {
+        parent.splice(Number(last), 1)
+      } else {
+        delete parent[last]
+      }
+    } else {
+      parent[last] = op.value
+    }
+  }
+
+  // 델타 적용 - 시퀀스가 맞지 않거나 적용 실패 시 false (호출 측에서 resync 요청)
+  const applySlotFillingDelta = (delta: SlotFillingDelta): boolean => {
+    if (!syncedMessage.value || syncedSeq.value !== delta.baseSeq) {
+      console.warn('[SlotFilling] Delta sequence mismatch:', { expected: syncedSeq.value, baseSeq: delta.baseSeq })
+      return false
+    }
+    try {
+      const next = JSON.parse(JSON.stringify(syncedMessage.value))
+      delta.ops.forEach(op => applyPatchOp(next, op))
+      next.seq = delta.seq
+      updateSlotFilling(next as SlotFillingUpdate)
+      return true
+    } catch (error) {
+      console.error('[SlotFilling] Failed to apply delta:', error)
+      syncedMessage.value = null
+      syncedSeq.value = null
+      return false
+    }
+  }
+
   // Actions
   const updateSlotFilling = (message: SlotFillingUpdate) => {
+    // 델타 적용 기준 상태 저장
+    syncedMessage.value = message
+    syncedSeq.value = message.seq ?? null
+
     // DEBUG: 업데이트 시작 로그
     console.log('🔥🔥🔥 [SlotFilling] UPDATE SLOT FILLING CALLED!')
     console.log('[SlotFilling] ===== UPDATE SLOT FILLING START =====')
@@ -358,6 +415,8 @@ export const useSlotFillingStore = defineStore('slotFilling', () => {
       // 캐시 클리어
       fieldVisibilityCache.value.clear()
       lastUpdateHash.value = ''
+      syncedMessage.value = null
+      syncedSeq.value = null
       
       productType.value = null
       requiredFields.value = []
@@ -576,6 +635,7 @@ export const useSlotFillingStore = defineStore('slotFilling', () => {
 
     // Actions
     updateSlotFilling,
+    applySlotFillingDelta,
     clearSlotFilling,
     updateFieldValue,
     removeFieldValue,
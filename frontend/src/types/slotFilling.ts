@@ -59,6 +59,24 @@ export interface SlotFillingUpdate {
     electronic_banking: number
     check_card: number
   }
+  seq?: number  // 동기화 시퀀스 번호
+  full?: boolean  // 전체 상태 여부
+}
+
+// JSON-patch 연산 (RFC 6902 subset)
+export interface SlotFillingPatchOp {
+  op: 'add' | 'replace' | 'remove'
+  path: string
+  value?: any
+}
+
+// 직전 상태(baseSeq) 대비 변경분
+export interface SlotFillingDelta {
+  type: 'slot_filling_delta'
+  productType: string | null
+  seq: number
+  baseSeq: number
+  ops: SlotFillingPatchOp[]
 }
 
 // 하위 호환성을 위한 별칭
@@ -67,6 +85,8 @@ export type RequiredField = SmartField
 // WebSocket Message Types
 export enum SlotFillingMessageType {
   UPDATE = 'slot_filling_update',
+  DELTA = 'slot_filling_delta',
+  RESYNC_REQUEST = 'slot_filling_resync',
   MODIFICATION_REQUEST = 'field_modification_request',
   MODIFICATION_RESPONSE = 'field_modification_response',
   STAGE_CHANGED = 'stage_changed'